@@ -0,0 +1,87 @@
+"""Benchmark: per-file sync_file transactions vs one sync_files transaction.
+
+Usage:
+    python benchmarks/bulk_sync.py [--files 800]
+
+Run from the repository root (or with lenspr installed).
+
+Simulates a branch switch: every file of a synthetic graph gets new source
+for half of its functions, one function renamed and one deleted, then
+the change set is written back either with one sync_file call per file
+(as incremental syncs did) or with a single sync_files call.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Allow running from a checkout without installing the package
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from lenspr import database  # noqa: E402
+from lenspr.models import Edge, EdgeType, Node, NodeType  # noqa: E402
+
+
+def make_file(m: int, n_funcs: int, revision: int) -> tuple[list[Node], list[Edge]]:
+    path = f"pkg/mod{m}.py"
+    names = [f"func_{i}" for i in range(n_funcs)]
+    if revision:
+        names[0] = "func_renamed"
+        del names[-1]
+    nodes = [
+        Node(
+            id=f"pkg.mod{m}.{name}", type=NodeType.FUNCTION, name=name,
+            qualified_name=f"pkg.mod{m}.{name}", file_path=path,
+            start_line=i * 3 + 1, end_line=i * 3 + 2,
+            source_code=f"def {name}():\n    return {revision if i % 2 else 0}",
+        )
+        for i, name in enumerate(names)
+    ]
+    edges = [
+        Edge(
+            id=f"{a.id}->{b.id}", from_node=a.id, to_node=b.id,
+            type=EdgeType.CALLS, line_number=a.start_line + 1,
+        )
+        for a, b in zip(nodes, nodes[1:], strict=False)
+    ]
+    return nodes, edges
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--files", type=int, default=800)
+    parser.add_argument("--funcs", type=int, default=15)
+    args = parser.parse_args()
+
+    before = {f"pkg/mod{m}.py": make_file(m, args.funcs, 0) for m in range(args.files)}
+    after = {f"pkg/mod{m}.py": make_file(m, args.funcs, 1) for m in range(args.files)}
+    print(f"{args.files} files x {args.funcs} functions")
+
+    for label in ("sync_file per file", "sync_files"):
+        with tempfile.TemporaryDirectory() as tmp:
+            lens_dir = Path(tmp) / ".lens"
+            database.init_database(lens_dir)
+            db = lens_dir / "graph.db"
+            pool = database.ConnectionPool([db])
+            database.save_graph(
+                [n for nodes, _ in before.values() for n in nodes],
+                [e for _, edges in before.values() for e in edges],
+                db,
+            )
+            start = time.perf_counter()
+            if label == "sync_files":
+                database.sync_files(after, db)
+            else:
+                for rel, (nodes, edges) in after.items():
+                    database.sync_file(rel, nodes, edges, db)
+            elapsed = time.perf_counter() - start
+            pool.close()
+        print(f"  {label:<24} {elapsed * 1000:>9.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
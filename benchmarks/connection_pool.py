@@ -0,0 +1,93 @@
+"""Benchmark: per-call SQLite connections vs the LensContext pool.
+
+Usage:
+    python benchmarks/connection_pool.py [--modules 200] [--calls 2000]
+
+Run from the repository root (or with lenspr installed).
+
+Generates a synthetic project, indexes it, then times the database reads
+behind the navigation tools (node lookup, batched related-node fetch,
+search, change history) with the context's connection pool closed (a
+connection per call) and open (one long-lived connection per thread).
+Tool handlers are not called directly so the per-call filesystem
+staleness check does not drown out the database cost.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+# Allow running from a checkout without installing the package
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from lenspr import database  # noqa: E402
+from lenspr.context import LensContext  # noqa: E402
+from lenspr.tracker import get_history  # noqa: E402
+
+
+def write_project(root: Path, n_modules: int) -> None:
+    for m in range(n_modules):
+        lines = [f"from mod{(m + 1) % n_modules} import f0 as next_f0", ""]
+        for f in range(10):
+            callee = f"f{f + 1}()" if f < 9 else "next_f0()"
+            lines += [f"def f{f}():", f"    return {callee}", ""]
+        (root / f"mod{m}.py").write_text("\n".join(lines))
+
+
+def _timed(label: str, calls: int, fn: Callable[[], object]) -> None:
+    start = time.perf_counter()
+    for _ in range(calls):
+        fn()
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<28} {elapsed * 1000:>9.1f} ms  ({elapsed / calls * 1e6:>7.1f} us/call)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--modules", type=int, default=200)
+    parser.add_argument("--calls", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        write_project(root, args.modules)
+        database.init_database(root / ".lens")
+        ctx = LensContext(project_root=root, lens_dir=root / ".lens")
+        ctx.full_sync()
+
+        rng = random.Random(args.seed)
+        ids = [f"mod{rng.randrange(args.modules)}.f{rng.randrange(10)}" for _ in range(64)]
+        db = ctx.graph_db
+        cases: list[tuple[str, Callable[[], object]]] = [
+            ("get_node", lambda: database.get_node(rng.choice(ids), db)),
+            ("get_nodes_by_ids (8 ids)", lambda: database.get_nodes_by_ids(
+                rng.sample(ids, 8), db, include_source=False)),
+            ("search_nodes", lambda: database.search_nodes("f3", db)),
+            ("get_history", lambda: get_history(ctx.history_db, limit=20)),
+        ]
+
+        print(f"Synthetic project: {args.modules} modules, {args.calls} calls per tool")
+        pool = ctx.connections
+        pool.close()
+        print("\nconnection per call:")
+        for label, fn in cases:
+            _timed(label, args.calls, fn)
+
+        ctx.connections = database.ConnectionPool(
+            (ctx.graph_db, ctx.history_db, ctx.session_db)
+        )
+        print("\npooled connections:")
+        for label, fn in cases:
+            _timed(label, args.calls, fn)
+        ctx.connections.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""Benchmark: lean graph load from graph.db vs from the binary snapshot.
+
+Usage:
+    python benchmarks/graph_snapshot.py [--nodes 100000] [--edges 400000]
+
+Run from the repository root (or with lenspr installed).
+
+Saves a synthetic graph to graph.db, then times what a fresh process pays
+for its first ``get_graph()``: ``load_graph_lean`` + ``build_lean_graph``
+against ``read_snapshot``, plus the cost of writing the snapshot.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Allow running from a checkout without installing the package
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from lenspr import database  # noqa: E402
+from lenspr import graph as graph_ops  # noqa: E402
+from lenspr.graph_snapshot import read_snapshot, write_snapshot  # noqa: E402
+from lenspr.models import Edge, EdgeType, Node, NodeType  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--nodes", type=int, default=100_000)
+    parser.add_argument("--edges", type=int, default=400_000)
+    args = parser.parse_args()
+
+    rng = random.Random(1)
+    n = args.nodes
+    nodes = [
+        Node(
+            id=f"pkg.mod{i // 50}.f{i}", type=NodeType.FUNCTION, name=f"f{i}",
+            qualified_name=f"pkg.mod{i // 50}.f{i}", file_path=f"pkg/mod{i // 50}.py",
+            start_line=i % 50 * 3 + 1, end_line=i % 50 * 3 + 2, source_code="",
+            signature=f"def f{i}(a, b)",
+        )
+        for i in range(n)
+    ]
+    edges = []
+    for k in range(args.edges):
+        u = rng.randrange(n)
+        v = min(n - 1, max(0, u + rng.randint(-200, 200)))
+        edges.append(Edge(
+            id=f"e{k}", from_node=nodes[u].id, to_node=nodes[v].id,
+            type=EdgeType.CALLS, line_number=u % 50 * 3 + 2,
+        ))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        lens_dir = Path(tmp) / ".lens"
+        database.init_database(lens_dir)
+        db = lens_dir / "graph.db"
+        database.save_graph(nodes, edges, db)
+        generation = database.get_graph_generation(db)
+        snapshot = lens_dir / "graph.snapshot"
+
+        start = time.perf_counter()
+        graph = graph_ops.build_lean_graph(*database.load_graph_lean(db))
+        sql_s = time.perf_counter() - start
+        print(f"{graph.number_of_nodes()} nodes, {graph.number_of_edges()} edges")
+        print(f"  {'load_graph_lean + build':<28} {sql_s * 1000:>9.0f} ms")
+
+        start = time.perf_counter()
+        write_snapshot(graph, generation, snapshot)
+        print(f"  {'write_snapshot':<28} {(time.perf_counter() - start) * 1000:>9.0f} ms"
+              f"  ({snapshot.stat().st_size / 2**20:.1f} MiB)")
+
+        start = time.perf_counter()
+        read_snapshot(snapshot, generation)
+        print(f"  {'read_snapshot':<28} {(time.perf_counter() - start) * 1000:>9.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
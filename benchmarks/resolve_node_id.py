@@ -0,0 +1,83 @@
+"""Benchmark: fuzzy node-ID resolution as the graph grows.
+
+Usage:
+    python benchmarks/resolve_node_id.py [--sizes 10000 100000 1000000]
+
+Run from the repository root (or with lenspr installed).
+
+Writes synthetic graphs of increasing size straight to graph.db, then
+times resolve_node_id for the exact, suffix and contains strategies
+next to the ``LIKE`` scans it used to run.  Indexed lookups should stay
+flat while the scans grow with the node count.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+# Allow running from a checkout without installing the package
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from lenspr import database  # noqa: E402
+from lenspr.models import Node, NodeType  # noqa: E402
+
+
+def synthetic_nodes(n_nodes: int) -> list[Node]:
+    nodes = []
+    for i in range(n_nodes):
+        name = f"handler_{i}"
+        node_id = f"pkg{i % 97}.mod{i // 40}.{name}"
+        nodes.append(Node(
+            id=node_id, type=NodeType.FUNCTION, name=name, qualified_name=node_id,
+            file_path=f"pkg{i % 97}/mod{i // 40}.py", start_line=1, end_line=2,
+            source_code=f"def {name}():\n    return {i}\n",
+        ))
+    return nodes
+
+
+def _timed(label: str, repeat: int, fn: Callable[[], object]) -> None:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    elapsed = (time.perf_counter() - start) / repeat
+    print(f"  {label:<34} {elapsed * 1e6:>10.1f} us")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    for size in args.sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            lens_dir = Path(tmp) / ".lens"
+            database.init_database(lens_dir)
+            db = lens_dir / "graph.db"
+            database.save_graph(synthetic_nodes(size), [], db)
+            pool = database.ConnectionPool([db])
+            probe = size // 2
+            mid = f"pkg{probe % 97}.mod{probe // 40}.handler_{probe}"
+
+            print(f"\n{size:,} nodes:")
+            _timed("exact", args.repeat, lambda: database.resolve_node_id(mid, db))
+            _timed("suffix", args.repeat, lambda: database.resolve_node_id(
+                f"mod{probe // 40}.handler_{probe}", db))
+            _timed("contains", args.repeat, lambda: database.resolve_node_id(
+                f"{probe // 40}.handler_{probe}", db))
+
+            conn = pool.get(db)
+            _timed("LIKE '%.q' scan (old suffix step)", args.repeat, lambda: conn.execute(
+                "SELECT id FROM nodes WHERE id LIKE ? ORDER BY length(id)",
+                (f"%.mod{probe // 40}.handler_{probe}",),
+            ).fetchall())
+            pool.close()
+
+
+if __name__ == "__main__":
+    main()
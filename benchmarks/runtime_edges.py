@@ -0,0 +1,96 @@
+"""Benchmark: set-based save_runtime_edges vs the per-edge merge loop.
+
+Usage:
+    python benchmarks/runtime_edges.py [--edges 100000]
+
+Run from the repository root (or with lenspr installed).
+
+Builds a graph with N static call edges from callers with --fanout
+callees each, then merges N traced edges (half confirming static edges,
+half runtime-only) with save_runtime_edges and with the per-edge
+SELECT + UPDATE/INSERT loop it replaced, which ran without a
+(from_node, to_node) index: each lookup walked every edge of the caller.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sqlite3
+import sys
+import tempfile
+import time
+import uuid
+from pathlib import Path
+
+# Allow running from a checkout without installing the package
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from lenspr import database  # noqa: E402
+from lenspr.models import Edge, EdgeType  # noqa: E402
+
+
+def per_edge_merge(edges: list[tuple[str, str, int]], db_path: Path) -> None:
+    with sqlite3.connect(db_path) as conn:
+        for from_node, to_node, call_count in edges:
+            existing = conn.execute(
+                "SELECT id, source FROM edges WHERE from_node = ? AND to_node = ? LIMIT 1",
+                (from_node, to_node),
+            ).fetchone()
+            if existing:
+                eid, source = existing
+                new_source = "both" if source == "static" else source
+                conn.execute(
+                    "UPDATE edges SET source = ?, metadata = json_set("
+                    "COALESCE(metadata, '{}'), '$.runtime_calls', ?) WHERE id = ?",
+                    (new_source, call_count, eid),
+                )
+            else:
+                conn.execute(
+                    """INSERT INTO edges
+                    (id, from_node, to_node, type, line_number, column,
+                     confidence, source, untracked_reason, metadata)
+                    VALUES (?, ?, ?, 'calls', NULL, NULL, 'resolved', 'runtime', '', ?)""",
+                    (f"rt_{uuid.uuid4().hex[:12]}", from_node, to_node,
+                     json.dumps({"runtime_calls": call_count})),
+                )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--edges", type=int, default=100_000)
+    parser.add_argument("--fanout", type=int, default=200)
+    args = parser.parse_args()
+
+    n, fanout = args.edges, args.fanout
+    static = [
+        Edge(id=f"e{i}", from_node=f"caller{i // fanout}",
+             to_node=f"callee{i % fanout}", type=EdgeType.CALLS)
+        for i in range(n)
+    ]
+    traced = [
+        (e.from_node, e.to_node, 3) for e in static[: n // 2]
+    ] + [
+        (f"caller{i // fanout}", f"runtime_callee{i % fanout}", 1) for i in range(n // 2)
+    ]
+    print(f"{n} static edges, {len(traced)} traced edges")
+
+    for label in ("per-edge loop", "save_runtime_edges"):
+        with tempfile.TemporaryDirectory() as tmp:
+            lens_dir = Path(tmp) / ".lens"
+            database.init_database(lens_dir)
+            db = lens_dir / "graph.db"
+            database.save_graph([], static, db)
+            if label == "per-edge loop":
+                with sqlite3.connect(db) as conn:
+                    conn.execute("DROP INDEX idx_edges_pair")
+            start = time.perf_counter()
+            if label == "per-edge loop":
+                per_edge_merge(traced, db)
+            else:
+                database.save_runtime_edges(traced, db)
+            print(f"  {label:<22} {time.perf_counter() - start:>8.2f} s")
+
+
+if __name__ == "__main__":
+    main()
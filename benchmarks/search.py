@@ -0,0 +1,97 @@
+"""Benchmark: trigram full-text index vs LIKE scans for lens_search/lens_grep.
+
+Usage:
+    python benchmarks/search.py [--modules 300]
+
+Run from the repository root (or with lenspr installed).
+
+Generates a synthetic project, indexes it, then times node search through
+the index against the equivalent ``LIKE '%q%'`` scan, and lens_grep with a
+selective literal (index prefilter) against a pattern with no required
+literal (reads every file).  Also reports the cost of a full save_graph,
+which maintains the index through triggers.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+# Allow running from a checkout without installing the package
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from lenspr import database  # noqa: E402
+from lenspr.context import LensContext  # noqa: E402
+from lenspr.tools.navigation import handle_grep  # noqa: E402
+
+
+def write_project(root: Path, n_modules: int) -> None:
+    for m in range(n_modules):
+        lines = [f'"""Module {m}."""', ""]
+        for f in range(20):
+            lines += [
+                f"def handler_{m}_{f}(request, payload):",
+                f'    """Handle request kind {f} for module {m}."""',
+                f"    value = payload.get('field_{f}', {m * f})",
+                "    return process(request, value)",
+                "",
+            ]
+        (root / f"mod{m}.py").write_text("\n".join(lines))
+
+
+def _timed(label: str, repeat: int, fn: Callable[[], object]) -> object:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = fn()
+    elapsed = (time.perf_counter() - start) / repeat
+    print(f"  {label:<44} {elapsed * 1000:>9.2f} ms")
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--modules", type=int, default=300)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        write_project(root, args.modules)
+        database.init_database(root / ".lens")
+        ctx = LensContext(project_root=root, lens_dir=root / ".lens")
+        ctx.full_sync()
+        db = ctx.graph_db
+        nodes, edges = database.load_graph(db)
+        print(f"Synthetic project: {args.modules} modules, {len(nodes):,} nodes\n")
+
+        def like_scan(query: str) -> list:
+            with database.connect(db) as conn:
+                return conn.execute(
+                    """SELECT * FROM nodes WHERE name LIKE ?1 OR source_code LIKE ?1
+                       OR docstring LIKE ?1 ORDER BY file_path, start_line""",
+                    (f"%{query}%",),
+                ).fetchall()
+
+        query = "handler_1234_7"
+        _timed("search (LIKE scan)", args.repeat, lambda: like_scan(query))
+        _timed("search (trigram index, ranked)", args.repeat,
+               lambda: database.search_nodes(query, db))
+        _timed("search (trigram index, limit 50)", args.repeat,
+               lambda: database.search_nodes("request", db, limit=50))
+
+        ctx.ensure_synced()
+        _timed("grep with literal (index prefilter)", args.repeat,
+               lambda: handle_grep({"pattern": r"field_7', 1234\b"}, ctx))
+        _timed("grep without literal (reads every file)", args.repeat,
+               lambda: handle_grep({"pattern": r"\d{5}\*"}, ctx))
+
+        _timed("save_graph (rewrite + index triggers)", 1,
+               lambda: database.save_graph(nodes, edges, db))
+
+
+if __name__ == "__main__":
+    main()
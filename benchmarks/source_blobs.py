@@ -0,0 +1,123 @@
+"""Benchmark: graph.db size and read cost with node source in blobs vs inline.
+
+Usage:
+    python benchmarks/source_blobs.py [--modules 300]
+
+Run from the repository root (or with lenspr installed).
+
+Builds synthetic nodes the way the parsers do (a module node holding the
+file text, functions and classes holding their line slices), saves them,
+then rewrites the same graph with every source inline, as graphs stored
+before source blobs did.  Reports the database size, load_graph,
+get_node and a source search for both layouts.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+# Allow running from a checkout without installing the package
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from lenspr import database  # noqa: E402
+from lenspr.models import Node, NodeType  # noqa: E402
+
+
+def make_nodes(n_modules: int) -> list[Node]:
+    nodes = []
+    for m in range(n_modules):
+        lines = [f'"""Module {m}."""', "", f"class Service{m}:"]
+        spans = []
+        for f in range(20):
+            start = len(lines) + 1
+            lines += [
+                f"    def handler_{f}(self, request, payload):",
+                f'        """Handle request kind {f} for module {m}."""',
+                f"        value = payload.get('field_{f}', {m * f})",
+                "        return self.process(request, value)",
+                "",
+            ]
+            spans.append((f"handler_{f}", start, start + 3))
+        text = "\n".join(lines)
+
+        def node(nid: str, ntype: NodeType, start: int, end: int, source: str) -> Node:
+            return Node(
+                id=nid, type=ntype, name=nid.rsplit(".", 1)[-1], qualified_name=nid,
+                file_path=f"mod{m}.py", start_line=start, end_line=end,
+                source_code=source,
+            )
+
+        nodes.append(node(f"mod{m}", NodeType.MODULE, 1, len(lines), text))
+        nodes.append(node(
+            f"mod{m}.Service{m}", NodeType.CLASS, 3, len(lines) - 1,
+            "\n".join(lines[2:len(lines) - 1]),
+        ))
+        for name, start, end in spans:
+            nodes.append(node(
+                f"mod{m}.Service{m}.{name}", NodeType.METHOD, start, end,
+                "\n".join(lines[start - 1:end]),
+            ))
+    return nodes
+
+
+def _inline_sources(db: Path) -> None:
+    with database.connect(db) as conn:
+        conn.execute(
+            f"UPDATE nodes SET source_code = {database._source_sql('nodes')},"
+            " source_blob = NULL"
+        )
+        conn.execute("DELETE FROM source_blobs")
+    conn.execute("VACUUM")
+
+
+def _timed(label: str, repeat: int, fn: Callable[[], object]) -> None:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    elapsed = (time.perf_counter() - start) / repeat
+    print(f"  {label:<28} {elapsed * 1000:>9.2f} ms")
+
+
+def _report(db: Path, node_id: str, repeat: int) -> None:
+    print(f"  {'graph.db size':<28} {db.stat().st_size / 1024:>9.0f} KiB")
+    _timed("load_graph", repeat, lambda: database.load_graph(db))
+    database._BLOB_CACHE.clear()
+    _timed("get_node (x100)", repeat, lambda: [
+        database.get_node(node_id, db) for _ in range(100)
+    ])
+    _timed("search_nodes(code)", repeat, lambda: database.search_nodes(
+        "field_7', 42", db, "code",
+    ))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--modules", type=int, default=300)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    nodes = make_nodes(args.modules)
+    node_id = nodes[len(nodes) // 2].id
+    with tempfile.TemporaryDirectory() as tmp:
+        lens_dir = Path(tmp) / ".lens"
+        database.init_database(lens_dir)
+        db = lens_dir / "graph.db"
+        database.save_graph(nodes, [], db)
+        with database.connect(db) as conn:
+            conn.execute("VACUUM")
+
+        print(f"{len(nodes)} nodes in {args.modules} files")
+        print("source blobs:")
+        _report(db, node_id, args.repeat)
+        _inline_sources(db)
+        print("inline source:")
+        _report(db, node_id, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
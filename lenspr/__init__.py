@@ -22,10 +22,11 @@ Usage:
 from __future__ import annotations
 
 import json
+from collections.abc import Iterable
 from datetime import UTC, datetime
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
-from lenspr.context import LensContext
 from lenspr.models import (
     Change,
     Edge,
@@ -41,12 +42,25 @@ from lenspr.models import (
 from lenspr.parsers.base import ProgressCallback
 from lenspr.stats import ParseStats
 
+if TYPE_CHECKING:
+    from lenspr.context import LensContext
+
 __version__ = "0.1.0"
 
 # Module-level context — set by init()
 _ctx: LensContext | None = None
 
 
+def __getattr__(name: str) -> Any:
+    # LensContext pulls in the parsers and the graph layer: import it when
+    # it is first used rather than with the package
+    if name == "LensContext":
+        from lenspr.context import LensContext
+
+        return LensContext
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 def _require_ctx() -> LensContext:
     if _ctx is None:
         raise NotInitializedError(
@@ -60,6 +74,7 @@ def init(
     force: bool = False,
     progress_callback: ProgressCallback | None = None,
     collect_stats: bool = False,
+    jobs: int | None = None,
 ) -> tuple[LensContext, ParseStats | None]:
     """
     Initialize LensPR on a project.
@@ -71,11 +86,15 @@ def init(
         force: If True, reinitialize even if .lens/ already exists.
         progress_callback: Optional callback(current, total, file_path) for progress.
         collect_stats: If True, collect and return detailed parsing statistics.
+        jobs: Number of parser processes. None reads ``LENSPR_JOBS``
+            (default 1); 0 uses every CPU.
 
     Returns:
         Tuple of (LensContext, ParseStats | None).
     """
     global _ctx
+    from lenspr import database
+    from lenspr.context import LensContext
 
     root = Path(project_path).resolve()
     if not root.is_dir():
@@ -88,16 +107,13 @@ def init(
         _ctx = LensContext(root, lens_dir)
 
         # Auto-reinitialize if database is empty or parser version changed
-        g = _ctx.get_graph()
-        if g.number_of_nodes() == 0 or _ctx._needs_full_sync:
+        if not database.has_nodes(_ctx.graph_db) or _ctx._needs_full_sync:
             force = True  # Fall through to reinitialize
         else:
             return _ctx, None
 
     # Initialize fresh
-    from lenspr.database import init_database
-
-    init_database(lens_dir)
+    database.init_database(lens_dir)
 
     # Write config
     config = {
@@ -112,33 +128,46 @@ def init(
     config_path = lens_dir / "config.json"
     config_path.write_text(json.dumps(config, indent=2))
 
-    # Clear stale resolve cache on force reinit — old cached resolutions
-    # can return wrong results after project structure changes
-    resolve_cache = lens_dir / "resolve_cache.db"
-    if force and resolve_cache.exists():
-        resolve_cache.unlink()
+    # Clear stale caches on force reinit — old cached resolutions (including
+    # the cross-file edges stored in per-file parse results) can return
+    # wrong results after project structure changes
+    if force:
+        for cache_name in ("resolve_cache.db", "parse_cache.db"):
+            for suffix in ("", "-wal", "-shm"):
+                (lens_dir / f"{cache_name}{suffix}").unlink(missing_ok=True)
 
     # Create context and do initial parse
     _ctx = LensContext(root, lens_dir)
-    _, stats = _ctx.full_sync(progress_callback, collect_stats)
+    _, stats = _ctx.full_sync(progress_callback, collect_stats, jobs=jobs)
 
     return _ctx, stats
 
 
-def sync(full: bool = False) -> SyncResult:
+def sync(full: bool = False, jobs: int | None = None) -> SyncResult:
     """
     Resync graph with current file state.
 
     Uses incremental sync by default (only reparses changed files).
-    Pass full=True to force a complete reparse.
+    Pass full=True to force a complete reparse; ``jobs`` sets the number of
+    parser processes for it (see ``init``).
     """
     ctx = _require_ctx()
     if full:
-        result, _ = ctx.full_sync()
+        result, _ = ctx.full_sync(jobs=jobs)
         return result
     return ctx.incremental_sync()
 
 
+def sync_paths(paths: Iterable[Path | str]) -> SyncResult:
+    """
+    Resync only the given files or directories (e.g. from a file watcher).
+
+    Created, modified, deleted and renamed paths are all handled; pass
+    both sides of a rename. The rest of the tree is not scanned.
+    """
+    return _require_ctx().sync_paths(paths)
+
+
 def get_system_prompt(enabled_tools: set[str] | None = None) -> str:
     """Generate system prompt for Claude with current project state.
 
@@ -10,6 +10,7 @@ Tools read pre-computed data — no computation at query time.
 
 from __future__ import annotations
 
+from bisect import bisect_left
 from collections import defaultdict
 from pathlib import Path
 
@@ -146,16 +147,31 @@ def compute_all_metrics(
     for edge in edges:
         outgoing[edge.from_node].append(edge)
 
+    # Parent -> children map (Node.parent_id), so each class walks only its
+    # own subtree instead of every node in the project
+    children: dict[str, list[Node]] = defaultdict(list)
+    for n in nodes:
+        if n.parent_id is not None:
+            children[n.parent_id].append(n)
+
+    def _methods_under(class_id: str) -> list[Node]:
+        """Methods anywhere below a class (nested classes included)."""
+        found: list[Node] = []
+        stack = [class_id]
+        while stack:
+            for child in children.get(stack.pop(), ()):
+                if child.type == NodeType.METHOD:
+                    found.append(child)
+                stack.append(child.id)
+        return found
+
     # Compute metrics for each class
     class_method_counts: list[int] = []
 
     for node in nodes:
         if node.type == NodeType.CLASS:
             # Count methods
-            methods = [
-                n for n in nodes
-                if n.type == NodeType.METHOD and n.id.startswith(node.id + ".")
-            ]
+            methods = _methods_under(node.id)
             method_count = len(methods)
             class_method_counts.append(method_count)
 
@@ -231,8 +247,8 @@ def compute_all_metrics(
         for node_id, metrics in node_metrics.items():
             if "method_count" in metrics:
                 count = metrics["method_count"]
-                # Calculate percentile rank
-                rank = sum(1 for c in class_method_counts if c < count)
+                # Percentile rank: classes with fewer methods
+                rank = bisect_left(sorted_counts, count)
                 metrics["percentile_rank"] = round(rank / n * 100, 1)
 
     return node_metrics, project_metrics
@@ -27,11 +27,19 @@ def main() -> None:
         "--skip-deps", action="store_true",
         help="Skip auto-installing npm dependencies for JS/TS packages"
     )
+    p_init.add_argument(
+        "--jobs", "-j", type=int, default=None, metavar="N",
+        help="Parse with N processes (default: $LENSPR_JOBS or 1; 0 = all CPUs)"
+    )
 
     # -- sync --
     p_sync = subparsers.add_parser("sync", help="Resync graph with filesystem changes")
     p_sync.add_argument("path", nargs="?", default=".", help="Project root (default: cwd)")
     p_sync.add_argument("--full", action="store_true", help="Force full reparse")
+    p_sync.add_argument(
+        "--jobs", "-j", type=int, default=None, metavar="N",
+        help="Parse with N processes (default: $LENSPR_JOBS or 1; 0 = all CPUs)"
+    )
 
     # -- status --
     p_status = subparsers.add_parser("status", help="Show graph statistics")
@@ -48,6 +56,9 @@ def main() -> None:
         choices=["name", "code", "docstring", "all"],
         help="Where to search (default: all)",
     )
+    p_search.add_argument(
+        "--limit", type=int, default=50, help="Maximum results (default: 50)",
+    )
 
     # -- impact --
     p_impact = subparsers.add_parser("impact", help="Check impact of changing a node")
@@ -246,6 +257,7 @@ def cmd_init(args: argparse.Namespace) -> None:
             force=args.force,
             progress_callback=_cli_progress,
             collect_stats=True,
+            jobs=args.jobs,
         )
     except lenspr.LensError as e:
         print(f"\nError: {e}", file=sys.stderr)
@@ -275,7 +287,7 @@ def _print_init_summary(ctx, stats, path: Path) -> None:
     unparsed_count = sum(stats.unparsed_extensions.values()) if stats else 0
     skipped_in_dirs = stats.total_skipped if stats else 0
     total_project = stats.total_project_files if stats else 0
-    other_files = total_project - code_files - skipped_in_dirs
+    other_files = total_project - code_files
 
     # Per-language file counts
     lang_files: dict[str, int] = {}
@@ -353,7 +365,7 @@ def _print_init_summary(ctx, stats, path: Path) -> None:
         line = ", ".join(parts)
         if remaining > 0:
             line += f", +{remaining} more"
-        print(f"  Skipped directories:      {skipped_in_dirs:,} files")
+        print(f"  Skipped directories:      {skipped_in_dirs:,}")
         print(f"    {line}")
         print()
 
@@ -440,6 +452,11 @@ def _print_init_summary(ctx, stats, path: Path) -> None:
 
     if stats:
         print(f"  Parse time: {stats.total_time_ms / 1000:.1f}s")
+        if stats.jedi_goto_saved:
+            print(
+                f"  Jedi:       {stats.jedi_goto_calls:,} goto calls"
+                f" ({stats.jedi_goto_saved:,} saved by batching)"
+            )
     print(f"  Database:   .lens/graph.db ({db_size_str})")
     print()
 
@@ -460,18 +477,21 @@ def cmd_sync(args: argparse.Namespace) -> None:
 
     path = str(Path(args.path).resolve())
     try:
-        lenspr.init(path)  # Returns tuple now, but we don't need stats here
-        result = lenspr.sync(full=args.full)
+        lenspr.init(path, jobs=args.jobs)  # Returns tuple now, but we don't need stats here
+        result = lenspr.sync(full=args.full, jobs=args.jobs)
     except lenspr.LensError as e:
         print(f"Error: {e}", file=sys.stderr)
         sys.exit(1)
 
-    print(f"Sync complete: +{len(result.added)} ~{len(result.modified)} -{len(result.deleted)}")
+    line = f"Sync complete: +{len(result.added)} ~{len(result.modified)} -{len(result.deleted)}"
+    if result.touched_unchanged:
+        line += f" ({result.touched_unchanged} touched files unchanged)"
+    print(line)
 
 
 def cmd_status(args: argparse.Namespace) -> None:
     import lenspr
-    from lenspr.graph import get_structure
+    from lenspr import database
 
     path = str(Path(args.path).resolve())
     try:
@@ -480,14 +500,13 @@ def cmd_status(args: argparse.Namespace) -> None:
         print(f"Error: {e}", file=sys.stderr)
         sys.exit(1)
 
-    ctx = lenspr.get_context()
-    g = ctx.get_graph()
-    result = get_structure(g)
+    # Counted in graph.db: no need to load the graph for three totals
+    counts = database.get_graph_counts(lenspr.get_context().graph_db)
 
     print(f"Project: {path}")
-    print(f"  Nodes: {g.number_of_nodes()}")
-    print(f"  Edges: {g.number_of_edges()}")
-    print(f"  Files: {result['pagination']['total_files']}")
+    print(f"  Nodes: {counts['nodes']}")
+    print(f"  Edges: {counts['edges']}")
+    print(f"  Files: {counts['files']}")
 
 
 def cmd_search(args: argparse.Namespace) -> None:
@@ -499,6 +518,7 @@ def cmd_search(args: argparse.Namespace) -> None:
         result = lenspr.handle_tool("lens_search", {
             "query": args.query,
             "search_in": args.search_in,
+            "limit": args.limit,
         })
     except lenspr.LensError as e:
         print(f"Error: {e}", file=sys.stderr)
@@ -536,6 +556,7 @@ def cmd_watch(args: argparse.Namespace) -> None:
         )
         sys.exit(1)
 
+    import threading
     import time
 
     import lenspr
@@ -550,7 +571,8 @@ def cmd_watch(args: argparse.Namespace) -> None:
 
     class SyncHandler(FileSystemEventHandler):  # type: ignore[misc]
         def __init__(self) -> None:
-            self._pending = False
+            self._changed: set[str] = set()
+            self._lock = threading.Lock()
 
         def _should_track(self, file_path: str) -> bool:
             """Check if file should trigger a sync."""
@@ -565,17 +587,34 @@ def cmd_watch(args: argparse.Namespace) -> None:
                 return False
             return is_supported_file(file_path)
 
+        def _track(self, file_path: str, is_directory: bool = False) -> None:
+            # Directories only arrive here when moved or deleted: sync_paths
+            # drops (or rescans) every file below them
+            if is_directory or self._should_track(file_path):
+                with self._lock:
+                    self._changed.add(file_path)
+
+        def take_changed(self) -> set[str]:
+            with self._lock:
+                changed, self._changed = self._changed, set()
+            return changed
+
         def on_modified(self, event: object) -> None:
-            if hasattr(event, "src_path") and self._should_track(event.src_path):  # type: ignore[union-attr]
-                self._pending = True
+            if hasattr(event, "src_path") and not getattr(event, "is_directory", False):
+                self._track(event.src_path)  # type: ignore[union-attr]
 
         def on_created(self, event: object) -> None:
-            if hasattr(event, "src_path") and self._should_track(event.src_path):  # type: ignore[union-attr]
-                self._pending = True
+            self.on_modified(event)
 
         def on_deleted(self, event: object) -> None:
-            if hasattr(event, "src_path") and self._should_track(event.src_path):  # type: ignore[union-attr]
-                self._pending = True
+            if hasattr(event, "src_path"):
+                self._track(event.src_path, getattr(event, "is_directory", False))  # type: ignore[union-attr]
+
+        def on_moved(self, event: object) -> None:
+            # A rename deletes the source and creates the destination
+            self.on_deleted(event)
+            if hasattr(event, "dest_path"):
+                self._track(event.dest_path, getattr(event, "is_directory", False))  # type: ignore[union-attr]
 
     handler = SyncHandler()
     observer = Observer()
@@ -590,10 +629,10 @@ def cmd_watch(args: argparse.Namespace) -> None:
     try:
         while True:
             time.sleep(1)
-            if handler._pending:
-                handler._pending = False
+            changed = handler.take_changed()
+            if changed:
                 try:
-                    result = lenspr.sync()
+                    result = lenspr.sync_paths(changed)
                     print(
                         f"Synced: +{len(result.added)} "
                         f"~{len(result.modified)} "
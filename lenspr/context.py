@@ -5,34 +5,52 @@ from __future__ import annotations
 import fcntl
 import json
 import logging
+import os
 import threading
+import time
+from collections import Counter
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from contextlib import contextmanager
 from datetime import UTC
+from functools import partial
 from pathlib import Path
-
-import networkx as nx
+from typing import TYPE_CHECKING, Any
 
 from lenspr import database
-from lenspr import graph as graph_ops
 from lenspr.architecture import compute_all_metrics
-from lenspr.models import Node, SyncResult
+from lenspr.line_index import LineIndex
+from lenspr.models import GraphDelta, Node, SyncResult
 from lenspr.parsers.base import ProgressCallback
 from lenspr.parsers.multi import (
     MultiParser,
-    normalize_edges_by_ids,
+    normalize_edges_with_db,
 )
 from lenspr.patcher import PatchBuffer
+from lenspr.scanner import FileScanner, content_hash, hash_files, load_exclude_patterns
+from lenspr.staleness import ChangeTracker, stamps_unchanged
 from lenspr.stats import ParseStats
 
+if TYPE_CHECKING:
+    import networkx as nx
+
+    from lenspr.csr_graph import CSRGraph
+
 logger = logging.getLogger(__name__)
 
 
+def _untouched_node_ids(db_path: Path, exclude: set[str], candidates: set[str]) -> set[str]:
+    """Node IDs among ``candidates`` stored in graph.db, minus ``exclude``."""
+    return database.get_existing_node_ids(candidates, db_path) - exclude
+
+
 class LensContext:
     """
     Central access point for all LensPR operations on a project.
 
     Manages:
-    - Database paths (graph.db, history.db, resolve_cache.db)
-    - Lazy-loaded NetworkX graph (invalidated on mutation)
+    - Database paths (graph.db, history.db, resolve_cache.db, parse_cache.db)
+    - Lazy-loaded NetworkX graph, lean by default (patched on sync, copied
+      first while other threads read it; rebuilt on other mutations)
     - Patch buffer for batched file modifications
     - Parser instance
     """
@@ -41,18 +59,55 @@ class LensContext:
     # On mismatch with config.json, ensure_synced() auto-triggers a full resync.
     PARSER_VERSION = "2"
 
-    def __init__(self, project_root: Path, lens_dir: Path | None = None) -> None:
+    def __init__(
+        self,
+        project_root: Path,
+        lens_dir: Path | None = None,
+        lean_graph: bool = True,
+    ) -> None:
         self.project_root = project_root.resolve()
         self.lens_dir = lens_dir or (self.project_root / ".lens")
         self.graph_db = self.lens_dir / "graph.db"
         self.history_db = self.lens_dir / "history.db"
         self.session_db = self.lens_dir / "session.db"
         self.resolve_cache_db = self.lens_dir / "resolve_cache.db"
+        self.parse_cache_db = self.lens_dir / "parse_cache.db"
         self.config_path = self.lens_dir / "config.json"
+        # Lean graph as of a graph.db generation, for fast startup
+        self.snapshot_path = self.lens_dir / "graph.snapshot"
         self.patch_buffer = PatchBuffer()
+        # Reusable per-thread connections for the databases tools hit on
+        # every call (caches are only touched by syncs)
+        self.connections = database.ConnectionPool(
+            (self.graph_db, self.history_db, self.session_db)
+        )
 
         self._graph: nx.DiGraph | None = None
+        # Lean graphs keep source/docstrings/annotations in SQLite only
+        # (see graph.build_lean_graph).
+        self.lean_graph = lean_graph
+        self.graph_load_seconds: float | None = None
+        # CSR snapshot of _graph for traversal-heavy tools: (source graph, csr)
+        self._csr: tuple[nx.DiGraph, CSRGraph] | None = None
+        # Per-file node line spans of _graph: (source graph, index)
+        self._line_index: tuple[nx.DiGraph, LineIndex] | None = None
+        # Last reachability query on that snapshot: (csr, entry points, reachable)
+        self._reachable: tuple[CSRGraph, frozenset[str], set[str]] | None = None
+        # graph.db write generation the cached graph reflects
+        self._graph_generation = 0
+        # Serializes building _graph when concurrent readers find it unloaded
+        self._graph_load_lock = threading.Lock()
+        # Threads inside graph_reader(), by thread id -> nesting depth
+        self._graph_readers: Counter[int] = Counter()
+        self._readers_lock = threading.Lock()
         self._parser = MultiParser()
+        # (config.json mtime and size, its exclude_patterns, scanner built from them)
+        self._scanner: tuple[tuple[int, int] | None, list[str], FileScanner] | None = None
+        # Paths a file watcher saw change (see lenspr.staleness)
+        self.change_tracker = ChangeTracker()
+        # Directory stamps of the last scan that matched the stored
+        # fingerprints: (scanner that took them, stamps)
+        self._dir_stamps: tuple[FileScanner, dict[str, int]] | None = None
         self._lock = threading.Lock()
         self._lock_path = self.lens_dir / ".lock"
 
@@ -82,45 +137,227 @@ class LensContext:
         return self.lens_dir.exists() and self.graph_db.exists()
 
     def get_graph(self) -> nx.DiGraph:
-        """Get NetworkX graph, building from SQLite if needed."""
-        if self._graph is None:
+        """Get NetworkX graph, building from SQLite if needed.
+
+        Lean graphs load from the binary snapshot when it was written at
+        graph.db's current generation; otherwise they are built from SQLite
+        and the snapshot is rewritten for the next process.
+        """
+        nx_graph = self._graph
+        if nx_graph is not None:
+            return nx_graph
+        with self._graph_load_lock:
+            # Another reader may have loaded it while this one waited
+            nx_graph = self._graph
+            if nx_graph is None:
+                nx_graph = self._load_graph()
+        return nx_graph
+
+    def _load_graph(self) -> nx.DiGraph:
+        # NetworkX is only imported once a tool needs the graph
+        from lenspr import graph as graph_ops
+        from lenspr import graph_snapshot
+
+        start = time.perf_counter()
+        # Read first: a write racing the load makes the next patch rebuild
+        self._graph_generation = database.get_graph_generation(self.graph_db)
+        nx_graph: nx.DiGraph | None
+        if self.lean_graph:
+            nx_graph = graph_snapshot.read_snapshot(
+                self.snapshot_path, self._graph_generation,
+            )
+            if nx_graph is None:
+                node_rows, edge_rows = database.load_graph_lean(self.graph_db)
+                nx_graph = graph_ops.build_lean_graph(node_rows, edge_rows)
+                self._graph = nx_graph
+                self._save_snapshot()
+        else:
             nodes, edges = database.load_graph(self.graph_db)
-            self._graph = graph_ops.build_graph(nodes, edges)
-        return self._graph
+            nx_graph = graph_ops.build_graph(nodes, edges)
+        self._graph = nx_graph
+        self.graph_load_seconds = time.perf_counter() - start
+        return nx_graph
+
+    @contextmanager
+    def graph_reader(self) -> Iterator[None]:
+        """Mark the calling thread as reading the graph for the block.
+
+        While another thread is inside this block, a sync does not patch
+        the cached graph in place: it patches a copy and swaps it in, so a
+        graph ``get_graph()`` returned never changes under its reader.
+        """
+        ident = threading.get_ident()
+        with self._readers_lock:
+            self._graph_readers[ident] += 1
+        try:
+            yield
+        finally:
+            with self._readers_lock:
+                self._graph_readers[ident] -= 1
+                if not self._graph_readers[ident]:
+                    del self._graph_readers[ident]
+
+    def get_csr_graph(self) -> CSRGraph:
+        """Get an array-backed snapshot of the graph (see ``lenspr.csr_graph``).
+
+        Built lazily from ``get_graph()`` and rebuilt whenever that graph is
+        replaced or patched.
+        """
+        from lenspr.csr_graph import CSRGraph
+
+        nx_graph = self.get_graph()
+        csr = self._csr
+        if csr is None or csr[0] is not nx_graph:
+            csr = (nx_graph, CSRGraph.from_networkx(nx_graph))
+            self._csr = csr
+        return csr[1]
+
+    def get_line_index(self) -> LineIndex:
+        """Get the per-file line-interval index of the graph's nodes.
+
+        Built lazily from ``get_graph()`` and refreshed file by file when a
+        sync patches that graph.
+        """
+        nx_graph = self.get_graph()
+        line_index = self._line_index
+        if line_index is None or line_index[0] is not nx_graph:
+            line_index = (nx_graph, LineIndex.from_graph(nx_graph))
+            self._line_index = line_index
+        return line_index[1]
+
+    def get_reachable(self, entry_points: Iterable[str]) -> set[str]:
+        """Nodes reachable from ``entry_points``, cached until the graph changes.
+
+        Dead-code, vibecheck and fix-plan all ask for the same auto-detected
+        entry points; the result is tied to the CSR snapshot, which is
+        dropped whenever the graph is invalidated or patched. Callers must
+        not mutate the returned set.
+        """
+        from lenspr import graph as graph_ops
+
+        csr = self.get_csr_graph()
+        key = frozenset(entry_points)
+        cached = self._reachable
+        if cached is None or cached[0] is not csr or cached[1] != key:
+            cached = (csr, key, graph_ops.reachable_from(csr, key))
+            self._reachable = cached
+        return cached[2]
+
+    def _save_snapshot(self) -> None:
+        """Write the cached lean graph's snapshot (best effort)."""
+        if self._graph is None or not self.lean_graph:
+            return
+        from lenspr import graph_snapshot
+
+        try:
+            graph_snapshot.write_snapshot(
+                self._graph, self._graph_generation, self.snapshot_path,
+            )
+        except OSError as e:
+            logger.warning("Could not write graph snapshot: %s", e)
 
     def invalidate_graph(self) -> None:
         """Clear cached NetworkX graph. Called after any mutation."""
         self._graph = None
+        self._csr = None
+        self._line_index = None
+        self._reachable = None
+
+    def _apply_graph_deltas(self, deltas: list[GraphDelta]) -> None:
+        """Patch the cached graph with sync deltas instead of reloading it.
+
+        Falls back to invalidation (full rebuild on next ``get_graph``) if
+        patching fails or graph.db saw a write the graph did not, e.g. from
+        another process. Each write bumps graph.db's generation, so the
+        deltas must continue exactly from the generation the graph is at.
+
+        While other threads are inside ``graph_reader()``, the deltas are
+        applied to a copy that replaces the cached graph.
+        """
+        nx_graph = self._graph
+        if nx_graph is None:
+            return
+
+        self._csr = None
+        self._reachable = None
+        ident = threading.get_ident()
+        with self._readers_lock:
+            if not any(reader != ident for reader in self._graph_readers):
+                # Readers starting now wait until the patch is complete
+                self._patch_graph(nx_graph, deltas, in_place=True)
+                return
+        self._patch_graph(nx_graph.copy(), deltas, in_place=False)
+
+    def _patch_graph(
+        self, nx_graph: nx.DiGraph, deltas: list[GraphDelta], in_place: bool,
+    ) -> None:
+        """Apply ``deltas`` to ``nx_graph`` and make it the cached graph."""
+        from lenspr import graph as graph_ops
+
+        generation = self._graph_generation
+        try:
+            for delta in deltas:
+                if delta.base_generation != generation:
+                    logger.info("graph.db changed outside this sync, rebuilding graph")
+                    self.invalidate_graph()
+                    return
+                graph_ops.apply_delta(nx_graph, delta)
+                generation = delta.base_generation + 1
+        except Exception as e:
+            logger.warning("Graph patch failed, rebuilding: %s", e)
+            self.invalidate_graph()
+            return
+        self._graph = nx_graph
+        self._graph_generation = generation
+        if self._line_index is None:
+            return
+        if not in_place:
+            # Tied to the graph the readers still hold
+            self._line_index = None
+            return
+        self._line_index[1].refresh(nx_graph, {
+            nid
+            for delta in deltas
+            for nid in (*delta.removed_node_ids, *(n.id for n in delta.nodes))
+        })
 
     def has_pending_changes(self) -> bool:
-        """Check if any files have changed since last sync."""
+        """Check if any files have changed since last sync.
+
+        While no directory stamp of the last matching scan moved, no file
+        was added, removed or renamed: only the fingerprinted files are
+        ``stat()``ed. Otherwise the tree is scanned again.
+        """
         old_fingerprints = self._load_fingerprints()
         if not old_fingerprints:
             return False  # No fingerprints = no way to compare
 
-        extensions = set(self._parser.get_file_extensions())
-        skip_dirs = {
-            "__pycache__", ".git", ".lens", ".venv", "venv", "env",
-            "node_modules", ".mypy_cache", ".pytest_cache", ".ruff_cache",
-        }
-
-        for file_path in self.project_root.rglob("*"):
-            if not file_path.is_file():
-                continue
-            if any(part in skip_dirs for part in file_path.parts):
-                continue
-            if file_path.suffix not in extensions:
-                continue
-
-            rel = str(file_path.relative_to(self.project_root))
-            stat = file_path.stat()
+        scanner = self.file_scanner()
+        if (
+            self._dir_stamps is not None
+            and self._dir_stamps[0] is scanner
+            and stamps_unchanged(self.project_root, self._dir_stamps[1])
+        ):
+            root = str(self.project_root)
+            for rel, old in old_fingerprints.items():
+                try:
+                    st = os.stat(os.path.join(root, rel))
+                except OSError:
+                    return True  # Deleted file
+                if st.st_mtime != old.get("mtime") or st.st_size != old.get("size"):
+                    return True  # Changed file
+            return False
 
-            if rel not in old_fingerprints:
-                return True  # New file
+        stamps: dict[str, int] = {}
+        current = self._scan_fingerprints(stamps)
+        if current.keys() != old_fingerprints.keys():
+            return True  # New or deleted file
+        for rel, fp in current.items():
             old = old_fingerprints[rel]
-            if stat.st_mtime != old.get("mtime") or stat.st_size != old.get("size"):
+            if fp["mtime"] != old.get("mtime") or fp["size"] != old.get("size"):
                 return True  # Changed file
 
+        self._dir_stamps = (scanner, stamps)
         return False
 
     def ensure_synced(self) -> None:
@@ -143,14 +380,20 @@ class LensContext:
                 ) from e
             return
 
-        if not self.has_pending_changes():
+        if self.change_tracker.is_watching():
+            # The watcher reports every change: nothing to scan
+            if self.change_tracker.is_clean():
+                return
+            sync = self.sync_dirty
+        elif self.has_pending_changes():
+            sync = self.incremental_sync
+        else:
             return
 
         try:
-            result = self.incremental_sync()
+            result = sync()
             total = len(result.added) + len(result.modified) + len(result.deleted)
             if total > 0:
-                self.invalidate_graph()
                 logger.info(
                     "Auto-synced before read: +%d ~%d -%d",
                     len(result.added), len(result.modified), len(result.deleted)
@@ -161,6 +404,21 @@ class LensContext:
                 "Run `lenspr init --force` to rebuild the graph from scratch."
             ) from e
 
+    def sync_dirty(self) -> SyncResult:
+        """
+        Sync the paths the change tracker collected since the last sync.
+
+        With nothing collected, waits for a sync already in progress.
+        """
+        paths, rescan, generation = self.change_tracker.take()
+        try:
+            result = self.incremental_sync() if rescan else self.sync_paths(paths)
+        except Exception:
+            self.change_tracker.restore(paths, rescan)
+            raise
+        self.change_tracker.mark_synced(generation)
+        return result
+
     def reparse_file(self, file_path: Path) -> None:
         """
         Reparse a single file and update the database.
@@ -177,6 +435,10 @@ class LensContext:
         with open(self._lock_path, "w") as lock_file:
             fcntl.flock(lock_file, fcntl.LOCK_EX)
             try:
+                # Fingerprint before parsing: a later write then shows up
+                # as a change
+                fingerprint = self._fingerprint(file_path)
+
                 # Parse fresh
                 new_nodes: list[Node] = []
                 new_edges: list = []
@@ -185,11 +447,11 @@ class LensContext:
                         file_path, self.project_root
                     )
 
-                # Normalize new edges using all node IDs from DB + new nodes
+                # Normalize new edges against the DB suffix index + new nodes
                 if new_edges:
-                    all_node_ids = database.get_all_node_ids(self.graph_db)
-                    all_node_ids.update(n.id for n in new_nodes)
-                    normalize_edges_by_ids(new_edges, all_node_ids)
+                    normalize_edges_with_db(
+                        new_edges, {n.id for n in new_nodes}, self.graph_db,
+                    )
 
                 # Compute metrics for classes in this file
                 if new_nodes:
@@ -199,8 +461,11 @@ class LensContext:
                             node.metrics = node_metrics[node.id]
 
                 # Granular sync: only touches changed nodes' edges
-                database.sync_file(rel_path, new_nodes, new_edges, self.graph_db)
-                self.invalidate_graph()
+                delta = database.sync_file(
+                    rel_path, new_nodes, new_edges, self.graph_db,
+                    file_state={rel_path: fingerprint},
+                )
+                self._apply_graph_deltas([delta])
             finally:
                 fcntl.flock(lock_file, fcntl.LOCK_UN)
 
@@ -208,6 +473,7 @@ class LensContext:
         self,
         progress_callback: ProgressCallback | None = None,
         collect_stats: bool = False,
+        jobs: int | None = None,
     ) -> tuple[SyncResult, ParseStats | None]:
         """
         Full reparse of the project + hash-based diff.
@@ -215,18 +481,20 @@ class LensContext:
         Args:
             progress_callback: Optional callback(current, total, file_path) for progress.
             collect_stats: If True, collect and return detailed parsing statistics.
+            jobs: Parser worker processes (None = ``LENSPR_JOBS`` or sequential).
 
         Returns:
             Tuple of (SyncResult, ParseStats | None).
         Thread-safe and process-safe via locking.
         """
         with self._lock:
-            return self._full_sync_locked(progress_callback, collect_stats)
+            return self._full_sync_locked(progress_callback, collect_stats, jobs)
 
     def _full_sync_locked(
         self,
         progress_callback: ProgressCallback | None = None,
         collect_stats: bool = False,
+        jobs: int | None = None,
     ) -> tuple[SyncResult, ParseStats | None]:
         with open(self._lock_path, "w") as lock_file:
             fcntl.flock(lock_file, fcntl.LOCK_EX)
@@ -235,9 +503,19 @@ class LensContext:
                 old_nodes, _ = database.load_graph(self.graph_db)
                 old_index = {n.id: n for n in old_nodes}
 
+                # Fingerprint before parsing: a file written meanwhile
+                # then shows up as a change
+                file_state = self._scan_fingerprints()
+                hashes = hash_files([self.project_root / rel for rel in file_state])
+                for fp, digest in zip(file_state.values(), hashes, strict=True):
+                    fp["hash"] = digest
+
                 # Full reparse
                 new_nodes, new_edges, stats = self._parser.parse_project(
-                    self.project_root, progress_callback, collect_stats
+                    self.project_root, progress_callback, collect_stats,
+                    jobs=jobs, cache_db=self.parse_cache_db,
+                    cache_version=LensContext.PARSER_VERSION,
+                    scanner=self.file_scanner(),
                 )
 
                 # Deduplicate nodes by ID (keep last occurrence)
@@ -277,11 +555,16 @@ class LensContext:
                 ]
 
                 # Save new graph
-                database.save_graph(unique_nodes, new_edges, self.graph_db)
+                database.save_graph(
+                    unique_nodes, new_edges, self.graph_db, file_state=file_state,
+                )
 
                 # Save project metrics
                 database.save_project_metrics(project_metrics, self.graph_db)
                 self.invalidate_graph()
+                if self.lean_graph:
+                    # Rebuild now so the snapshot matches the new graph
+                    self.get_graph()
 
                 # Update config
                 self._update_config()
@@ -304,40 +587,13 @@ class LensContext:
         old_fingerprints = self._load_fingerprints()
         if not old_fingerprints:
             logger.info("No previous fingerprints, falling back to full sync")
-            return self._full_sync_locked()
+            result, _ = self._full_sync_locked()
+            return result
 
         # Scan current files
-        extensions = set(self._parser.get_file_extensions())
-        current_files: dict[str, dict[str, float | int]] = {}
-        skip_dirs = {
-            "__pycache__", ".git", ".lens", ".venv", "venv", "env",
-            "node_modules", ".mypy_cache", ".pytest_cache", ".ruff_cache",
-            "dist", "build", ".eggs", ".tox", "site-packages",
-        }
-        skip_toplevel_only = {"lib"}
-        venv_suffixes = ("-env", "-venv", "_env", "_venv")
-
-        def should_skip(path: Path) -> bool:
-            rel = path.relative_to(self.project_root)
-            for idx, part in enumerate(rel.parts):
-                if part in skip_dirs:
-                    return True
-                if part in skip_toplevel_only and idx == 0:
-                    return True
-                if any(part.endswith(s) for s in venv_suffixes):
-                    return True
-            return False
-
-        for file_path in sorted(self.project_root.rglob("*")):
-            if not file_path.is_file():
-                continue
-            if should_skip(file_path):
-                continue
-            if file_path.suffix not in extensions:
-                continue
-            rel = str(file_path.relative_to(self.project_root))
-            stat = file_path.stat()
-            current_files[rel] = {"mtime": stat.st_mtime, "size": stat.st_size}
+        scanner = self.file_scanner()
+        stamps: dict[str, int] = {}
+        current_files = self._scan_fingerprints(stamps)
 
         # Find changed, added, deleted files
         changed_files: list[str] = []
@@ -360,13 +616,139 @@ class LensContext:
         files_to_reparse = changed_files + added_files
         if not files_to_reparse and not deleted_files:
             logger.info("No files changed, nothing to sync")
+            self._dir_stamps = (scanner, stamps)
             return SyncResult(added=[], modified=[], deleted=[])
 
         logger.info(
             "Incremental sync: %d changed, %d added, %d deleted",
             len(changed_files), len(added_files), len(deleted_files),
         )
+        result = self._sync_changes_locked(
+            {rel: current_files[rel] for rel in files_to_reparse},
+            old_fingerprints, deleted_files,
+        )
+        self._dir_stamps = (scanner, stamps)
+        return result
+
+    def sync_paths(self, paths: Iterable[Path | str]) -> SyncResult:
+        """
+        Sync only the given paths, as reported by a file watcher.
+
+        Each path may be a file or a directory (relative paths are taken
+        from the project root). Existing ones are reparsed if their
+        fingerprint changed; missing ones (deleted, or the source of a
+        rename) drop their nodes and every file fingerprinted below them.
+        Nothing else in the tree is scanned.
+
+        Falls back to full_sync if no previous fingerprints exist.
+        """
+        with self._lock:
+            return self._sync_paths_locked(paths)
+
+    def _sync_paths_locked(self, paths: Iterable[Path | str]) -> SyncResult:
+        old_fingerprints = self._load_fingerprints()
+        if not old_fingerprints:
+            logger.info("No previous fingerprints, falling back to full sync")
+            result, _ = self._full_sync_locked()
+            return result
+
+        scanner = self.file_scanner()
+        extensions = set(self._parser.get_file_extensions())
+        current: dict[str, dict[str, Any]] = {}
+        gone: set[str] = set()
+        for path in paths:
+            path = Path(path)
+            if not path.is_absolute():
+                path = self.project_root / path
+            try:
+                rel = path.relative_to(self.project_root).as_posix()
+            except ValueError:
+                continue  # Outside the project
+            if rel == ".":
+                # The root itself: nothing narrower to sync
+                return self._incremental_sync_locked()
+
+            if path.is_dir():
+                for entry in scanner.scan(extensions, start=rel):
+                    current[entry.path] = {"mtime": entry.mtime, "size": entry.size}
+                # Files below it that are no longer there (or now ignored)
+                gone.update(r for r in old_fingerprints if r.startswith(rel + "/"))
+                continue
+            try:
+                st = path.stat()
+            except OSError:
+                st = None
+            if (
+                st is not None
+                and path.suffix.lower() in extensions
+                and not scanner.is_ignored(rel)
+            ):
+                current[rel] = {"mtime": st.st_mtime, "size": st.st_size}
+            else:
+                gone.add(rel)
+                gone.update(r for r in old_fingerprints if r.startswith(rel + "/"))
+
+        changed = {
+            rel: fp for rel, fp in current.items()
+            if rel not in old_fingerprints
+            or fp["mtime"] != old_fingerprints[rel].get("mtime")
+            or fp["size"] != old_fingerprints[rel].get("size")
+        }
+        deleted = {rel for rel in gone if rel in old_fingerprints and rel not in current}
+        if not changed and not deleted:
+            return SyncResult(added=[], modified=[], deleted=[])
+
+        logger.info("Path sync: %d changed, %d deleted", len(changed), len(deleted))
+        return self._sync_changes_locked(changed, old_fingerprints, sorted(deleted))
+
+    def _sync_changes_locked(
+        self,
+        changed: dict[str, dict[str, Any]],
+        old_fingerprints: Mapping[str, Mapping[str, Any]],
+        deleted_files: list[str],
+    ) -> SyncResult:
+        """Reparse changed files whose content hash moved, drop deleted ones.
+
+        Args:
+            changed: New or changed files (mtime or size differs) -> their
+                current fingerprint; a content hash is added to each.
+            old_fingerprints: Stored fingerprints (see ``_load_fingerprints``).
+            deleted_files: Files to remove from the graph.
+        """
+        file_state: dict[str, dict[str, Any] | None] = dict.fromkeys(deleted_files)
+        files_to_reparse: list[str] = []
+        # Hash before parsing: a file written meanwhile shows up as a change
+        hashes = hash_files([self.project_root / rel for rel in changed])
+        for (rel, fp), digest in zip(changed.items(), hashes, strict=True):
+            fp["hash"] = digest
+            file_state[rel] = fp
+            old = old_fingerprints.get(rel)
+            if digest is None or old is None or digest != old.get("hash"):
+                files_to_reparse.append(rel)
+        touched_unchanged = len(changed) - len(files_to_reparse)
+        if touched_unchanged:
+            logger.info(
+                "%d touched files have unchanged content, not reparsed", touched_unchanged,
+            )
+
+        if not files_to_reparse and not deleted_files:
+            database.save_file_state(file_state, self.graph_db)
+            return SyncResult(touched_unchanged=touched_unchanged)
+        result = self._sync_files_locked(files_to_reparse, deleted_files, file_state)
+        result.touched_unchanged = touched_unchanged
+        return result
 
+    def _sync_files_locked(
+        self,
+        files_to_reparse: list[str],
+        deleted_files: list[str],
+        file_state: Mapping[str, Mapping[str, Any] | None],
+    ) -> SyncResult:
+        """Reparse and delete files (relative paths) in one write transaction.
+
+        ``file_state`` (new fingerprints by path, None to drop) is stored in
+        that same transaction.
+        """
         with open(self._lock_path, "w") as lock_file:
             fcntl.flock(lock_file, fcntl.LOCK_EX)
             try:
@@ -380,25 +762,27 @@ class LensContext:
                 if hasattr(self._parser, "set_project_root"):
                     self._parser.set_project_root(self.project_root)
 
-                # Pass 1: Parse all changed files
-                parsed: dict[str, tuple[list[Node], list]] = {}
-                for rel in files_to_reparse:
-                    fp = self.project_root / rel
-                    if fp.exists():
-                        nodes, edges = self._parser.parse_file(
-                            fp, self.project_root
-                        )
-                        parsed[rel] = (nodes, edges)
-                    else:
-                        parsed[rel] = ([], [])
-
-                # Normalize all new edges at once (need full node ID set)
-                all_node_ids = database.get_all_node_ids(self.graph_db)
-                for nodes, _ in parsed.values():
-                    all_node_ids.update(n.id for n in nodes)
-                for _, edges in parsed.values():
-                    if edges:
-                        normalize_edges_by_ids(edges, all_node_ids)
+                # Pass 1: Parse all changed files (parse cache skips touched-only ones).
+                # Nodes of untouched files let the resolver skip Jedi for
+                # targets that already are node IDs; they are looked up per
+                # target rather than loading every ID in the graph.
+                old_ids = set(old_index)
+                parsed: dict[str, tuple[list[Node], list]] = {
+                    rel: ([], []) for rel in files_to_reparse
+                }
+                parsed.update(self._parse_files(
+                    [
+                        self.project_root / rel for rel in files_to_reparse
+                        if (self.project_root / rel).exists()
+                    ],
+                    id_lookup=partial(_untouched_node_ids, self.graph_db, old_ids),
+                ))
+
+                # Normalize all new edges at once against the DB suffix index
+                new_ids = {n.id for nodes, _ in parsed.values() for n in nodes}
+                new_edges = [e for _, edges in parsed.values() for e in edges]
+                if new_edges:
+                    normalize_edges_with_db(new_edges, new_ids, self.graph_db)
 
                 # Compute metrics for each file's classes
                 for nodes, edges in parsed.values():
@@ -408,15 +792,15 @@ class LensContext:
                             if node.id in node_metrics:
                                 node.metrics = node_metrics[node.id]
 
-                # Pass 2: Granular sync each file
-                for rel, (nodes, edges) in parsed.items():
-                    database.sync_file(rel, nodes, edges, self.graph_db)
-
-                # Handle deleted files
-                for rel in deleted_files:
-                    database.sync_file(rel, [], [], self.graph_db)
-
-                self.invalidate_graph()
+                # Pass 2: Granular sync of every file (deleted ones with no
+                # nodes) in a single write transaction
+                deltas = database.sync_files(
+                    {**parsed, **{rel: ([], []) for rel in deleted_files}},
+                    self.graph_db,
+                    file_state=file_state,
+                )
+                self._apply_graph_deltas(deltas)
+                self._save_snapshot()
             finally:
                 fcntl.flock(lock_file, fcntl.LOCK_UN)
 
@@ -433,26 +817,100 @@ class LensContext:
             if nid in old_index and n.hash != old_index[nid].hash
         ]
 
-        self._update_config(current_files)
+        self._update_config()
         return SyncResult(added=added, modified=modified, deleted=deleted)
 
-    def _load_fingerprints(self) -> dict[str, dict[str, float | int]]:
-        """Load file fingerprints from config."""
-        if not self.config_path.exists():
+    def _parse_files(
+        self,
+        files: list[Path],
+        id_lookup: Callable[[set[str]], set[str]] | None = None,
+    ) -> dict[str, tuple[list[Node], list]]:
+        """Parse files through the parse cache, keyed by relative path.
+
+        Args:
+            id_lookup: Finds node IDs of files outside this batch (see
+                ``MultiParser.iter_parsed_files``).
+
+        Raises:
+            RuntimeError: If a file fails to parse.
+        """
+        parsed: dict[str, tuple[list[Node], list]] = {}
+        for file_path, _, nodes, edges, error in self._parser.iter_parsed_files(
+            files, self.project_root, cache_db=self.parse_cache_db, id_lookup=id_lookup,
+            cache_version=LensContext.PARSER_VERSION,
+        ):
+            if error is not None:
+                raise RuntimeError(f"Failed to parse {file_path}: {error}")
+            parsed[str(file_path.relative_to(self.project_root))] = (nodes, edges)
+        return parsed
+
+    def file_scanner(self) -> FileScanner:
+        """Scanner for the project tree (see ``lenspr.scanner``).
+
+        Honours ``.gitignore`` and the ``exclude_patterns`` of config.json;
+        rebuilt whenever those patterns change.
+        """
+        try:
+            st = self.config_path.stat()
+            key: tuple[int, int] | None = (st.st_mtime_ns, st.st_size)
+        except OSError:
+            key = None
+        if self._scanner is None or self._scanner[0] != key:
+            patterns = load_exclude_patterns(self.config_path)
+            # config.json is rewritten by every sync: keep the scanner (and
+            # the directory stamps taken with it) while its patterns hold
+            if self._scanner is None or self._scanner[1] != patterns:
+                scanner = FileScanner(self.project_root, patterns)
+            else:
+                scanner = self._scanner[2]
+            self._scanner = (key, patterns, scanner)
+        return self._scanner[2]
+
+    def _scan_fingerprints(
+        self, stamps: dict[str, int] | None = None,
+    ) -> dict[str, dict[str, Any]]:
+        """Current mtime and size of every parseable file, by relative path.
+
+        Args:
+            stamps: If given, receives the scan's directory stamps.
+        """
+        extensions = set(self._parser.get_file_extensions())
+        return {
+            entry.path: {"mtime": entry.mtime, "size": entry.size}
+            for entry in self.file_scanner().scan(extensions, stamps=stamps)
+        }
+
+    def _fingerprint(self, file_path: Path) -> dict[str, Any] | None:
+        """Current fingerprint of one file, with its content hash (None if gone)."""
+        try:
+            st = file_path.stat()
+        except OSError:
+            return None
+        return {"mtime": st.st_mtime, "size": st.st_size, "hash": content_hash(file_path)}
+
+    def _load_fingerprints(self) -> dict[str, dict[str, Any]]:
+        """Fingerprints of the last sync: path -> {"mtime", "size", "hash"}.
+
+        Read from graph.db's file_state table. Graphs synced before it
+        existed have theirs moved there from config.json's
+        ``file_fingerprints`` (without hashes).
+        """
+        if not self.graph_db.exists():
             return {}
+        fingerprints = database.load_file_state(self.graph_db)
+        if fingerprints or not self.config_path.exists():
+            return fingerprints
         try:
-            config = json.loads(self.config_path.read_text())
-            result: dict[str, dict[str, float | int]] = config.get(
-                "file_fingerprints", {}
-            )
-            return result
-        except (json.JSONDecodeError, KeyError):
+            legacy = json.loads(self.config_path.read_text()).get("file_fingerprints")
+        except (json.JSONDecodeError, AttributeError):
             return {}
+        if not isinstance(legacy, dict) or not legacy:
+            return {}
+        database.save_file_state(legacy, self.graph_db)
+        return database.load_file_state(self.graph_db)
 
-    def _update_config(
-        self, fingerprints: dict[str, dict[str, float | int]] | None = None
-    ) -> None:
-        """Update config.json with current state and file fingerprints."""
+    def _update_config(self) -> None:
+        """Update config.json with the sync time and parser version."""
         from datetime import datetime
 
         config: dict[str, object] = {}
@@ -464,41 +922,7 @@ class LensContext:
 
         config["last_sync"] = datetime.now(UTC).isoformat()
         config["parser_version"] = LensContext.PARSER_VERSION
-
-        if fingerprints is not None:
-            config["file_fingerprints"] = fingerprints
-        else:
-            # Always rebuild fingerprints from current files (full_sync)
-            extensions = set(self._parser.get_file_extensions())
-            fp: dict[str, dict[str, float | int]] = {}
-            skip_dirs = {
-                "__pycache__", ".git", ".lens", ".venv", "venv", "env",
-                "node_modules", "site-packages",
-            }
-            skip_toplevel_only = {"lib"}
-            venv_suffixes = ("-env", "-venv", "_env", "_venv")
-            for file_path in self.project_root.rglob("*"):
-                if not file_path.is_file():
-                    continue
-                skip = False
-                rel_parts = file_path.relative_to(self.project_root).parts
-                for idx, part in enumerate(rel_parts):
-                    if part in skip_dirs:
-                        skip = True
-                        break
-                    if part in skip_toplevel_only and idx == 0:
-                        skip = True
-                        break
-                    if any(part.endswith(s) for s in venv_suffixes):
-                        skip = True
-                        break
-                if skip:
-                    continue
-                if file_path.suffix not in extensions:
-                    continue
-                rel = str(file_path.relative_to(self.project_root))
-                stat = file_path.stat()
-                fp[rel] = {"mtime": stat.st_mtime, "size": stat.st_size}
-            config["file_fingerprints"] = fp
+        # Fingerprints live in graph.db's file_state table now
+        config.pop("file_fingerprints", None)
 
         self.config_path.write_text(json.dumps(config, indent=2))
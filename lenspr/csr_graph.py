@@ -0,0 +1,367 @@
+"""Array-backed (CSR) graph engine for traversal-heavy analyses.
+
+``CSRGraph`` is a read-only snapshot of a NetworkX ``DiGraph``: node IDs are
+interned to integers and forward/reverse adjacency is stored as compressed
+sparse row arrays (``array`` module, no NumPy dependency), with edge type
+and confidence as typed byte columns.  Traversals work on integer indices
+with a ``bytearray`` visited set and walk neighbour ranges as array slices.
+
+It implements the read-only subset of the ``DiGraph`` API that
+``lenspr.graph`` and the tool handlers use (``nodes``, ``edges``,
+``successors``, ``predecessors``, ``in`` ...), so those functions accept
+either backend.  Node and edge attribute dicts are shared with the source
+graph, not copied.
+"""
+
+from __future__ import annotations
+
+from array import array
+from collections import deque
+from collections.abc import Iterable, Iterator
+from typing import TYPE_CHECKING, Any
+
+from lenspr.models import EdgeConfidence, EdgeType
+
+if TYPE_CHECKING:
+    import networkx as nx
+
+# Typed edge columns: small-int codes for the enum values (0 = unknown)
+EDGE_KINDS: tuple[str, ...] = ("", *(t.value for t in EdgeType))
+CONFIDENCES: tuple[str, ...] = ("", *(c.value for c in EdgeConfidence))
+_KIND_CODES = {value: code for code, value in enumerate(EDGE_KINDS)}
+_CONFIDENCE_CODES = {value: code for code, value in enumerate(CONFIDENCES)}
+
+
+class CSRGraph:
+    """Immutable directed graph in compressed sparse row form."""
+
+    def __init__(
+        self,
+        ids: list[str],
+        node_attrs: list[dict],
+        edges: list[tuple[int, int, dict]],
+        graph_attrs: dict | None = None,
+    ) -> None:
+        """
+        Args:
+            ids: Node IDs; position is the node's integer index.
+            node_attrs: Attribute dict per node (same order as ``ids``).
+            edges: (source index, target index, attribute dict), at most one
+                per pair.
+            graph_attrs: Graph-level attributes (e.g. ``lean``).
+        """
+        n = len(ids)
+        self.ids = ids
+        self.index: dict[str, int] = {nid: i for i, nid in enumerate(ids)}
+        self.node_attrs = node_attrs
+        self.graph: dict = dict(graph_attrs or {})
+
+        # Forward CSR: edges sorted by source; edge attrs share that order
+        edges = sorted(edges, key=lambda e: (e[0], e[1]))
+        self.out_offsets = _offsets((e[0] for e in edges), n)
+        self.out_targets = array("l", (e[1] for e in edges))
+        self.edge_attrs = [e[2] for e in edges]
+        self.edge_kinds = array(
+            "B", (_KIND_CODES.get(e[2].get("type", ""), 0) for e in edges)
+        )
+        self.edge_confidence = array(
+            "B", (_CONFIDENCE_CODES.get(e[2].get("confidence", ""), 0) for e in edges)
+        )
+
+        # Reverse CSR: for each target, its sources and forward edge positions
+        by_target = sorted(range(len(edges)), key=lambda k: (edges[k][1], edges[k][0]))
+        self.in_offsets = _offsets((edges[k][1] for k in by_target), n)
+        self.in_sources = array("l", (edges[k][0] for k in by_target))
+        self.in_edge_pos = array("l", by_target)
+
+    @classmethod
+    def from_networkx(cls, graph: nx.DiGraph) -> CSRGraph:
+        """Snapshot a NetworkX DiGraph (attribute dicts are shared)."""
+        ids = list(graph.nodes)
+        index = {nid: i for i, nid in enumerate(ids)}
+        return cls(
+            ids,
+            [graph.nodes[nid] for nid in ids],
+            [(index[u], index[v], d) for u, v, d in graph.edges(data=True)],
+            graph.graph,
+        )
+
+    # -- DiGraph-compatible read API --
+
+    def __contains__(self, node_id: object) -> bool:
+        return node_id in self.index
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.ids)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @property
+    def nodes(self) -> _NodeView:
+        return _NodeView(self)
+
+    @property
+    def edges(self) -> _EdgeView:
+        return _EdgeView(self)
+
+    def number_of_nodes(self) -> int:
+        return len(self.ids)
+
+    def number_of_edges(self) -> int:
+        return len(self.out_targets)
+
+    def successors(self, node_id: str) -> Iterator[str]:
+        i = self._require(node_id)
+        ids = self.ids
+        return (ids[j] for j in self.out_targets[self.out_offsets[i]:self.out_offsets[i + 1]])
+
+    def predecessors(self, node_id: str) -> Iterator[str]:
+        i = self._require(node_id)
+        ids = self.ids
+        return (ids[j] for j in self.in_sources[self.in_offsets[i]:self.in_offsets[i + 1]])
+
+    def has_edge(self, u: str, v: str) -> bool:
+        return self._edge_pos(u, v) is not None
+
+    def in_degree(self, node_id: str) -> int:
+        i = self._require(node_id)
+        return int(self.in_offsets[i + 1] - self.in_offsets[i])
+
+    def out_degree(self, node_id: str) -> int:
+        i = self._require(node_id)
+        return int(self.out_offsets[i + 1] - self.out_offsets[i])
+
+    def edges_of_kind(self, kind: str) -> list[tuple[str, str]]:
+        """(source, target) pairs of every edge of one type, via the kind column."""
+        code = _KIND_CODES.get(kind)
+        if code is None:
+            return []
+        ids, offsets, targets = self.ids, self.out_offsets, self.out_targets
+        edge_kinds = self.edge_kinds
+        pairs = []
+        for i in range(len(ids)):
+            for k in range(offsets[i], offsets[i + 1]):
+                if edge_kinds[k] == code:
+                    pairs.append((ids[i], ids[targets[k]]))
+        return pairs
+
+    # -- Traversals --
+
+    def reachable(
+        self,
+        sources: Iterable[str],
+        reverse: bool = False,
+        kinds: Iterable[str] | None = None,
+    ) -> set[str]:
+        """Nodes reachable from any of ``sources`` (sources included).
+
+        One BFS with a shared visited set, however many sources there are.
+
+        Args:
+            reverse: Follow edges backwards (who reaches the sources).
+            kinds: Only follow edges of these types (``EdgeType`` values).
+        """
+        ids = self.ids
+        return {ids[i] for i in self._bfs(self._indices(sources), reverse, kinds)}
+
+    def bfs_layers(
+        self,
+        sources: Iterable[str],
+        reverse: bool = False,
+        max_depth: int | None = None,
+    ) -> list[list[str]]:
+        """Nodes by BFS distance from ``sources``; layer 0 is the sources."""
+        visited = bytearray(len(self.ids))
+        frontier = []
+        for i in self._indices(sources):
+            if not visited[i]:
+                visited[i] = 1
+                frontier.append(i)
+        offsets, targets = self._adjacency(reverse)
+        layers = []
+        depth = 0
+        while frontier:
+            layers.append([self.ids[i] for i in frontier])
+            if max_depth is not None and depth >= max_depth:
+                break
+            nxt = []
+            for i in frontier:
+                for j in targets[offsets[i]:offsets[i + 1]]:
+                    if not visited[j]:
+                        visited[j] = 1
+                        nxt.append(j)
+            frontier = nxt
+            depth += 1
+        return layers
+
+    def shortest_path(self, source: str, target: str) -> list[str]:
+        """Unweighted shortest path; raises like ``nx.shortest_path``."""
+        import networkx as nx
+
+        if source not in self.index or target not in self.index:
+            raise nx.NodeNotFound(f"Either source {source} or target {target} is not in G")
+        s, t = self.index[source], self.index[target]
+        parent = array("l", [-1]) * len(self.ids)
+        parent[s] = s
+        queue = deque([s])
+        offsets, targets = self.out_offsets, self.out_targets
+        while queue:
+            i = queue.popleft()
+            if i == t:
+                path = [t]
+                while path[-1] != s:
+                    path.append(parent[path[-1]])
+                return [self.ids[k] for k in reversed(path)]
+            for j in targets[offsets[i]:offsets[i + 1]]:
+                if parent[j] == -1:
+                    parent[j] = i
+                    queue.append(j)
+        raise nx.NetworkXNoPath(f"No path between {source} and {target}.")
+
+    # -- Internals --
+
+    def _bfs(
+        self, start: list[int], reverse: bool, kinds: Iterable[str] | None,
+    ) -> list[int]:
+        """Indices reachable from ``start`` (included), in discovery order."""
+        visited = bytearray(len(self.ids))
+        offsets, targets = self._adjacency(reverse)
+        allowed = None
+        if kinds is not None:
+            allowed = bytearray(len(EDGE_KINDS))
+            for kind in kinds:
+                allowed[_KIND_CODES.get(kind, 0)] = 1
+        edge_kinds = self.edge_kinds
+        in_edge_pos = self.in_edge_pos
+
+        order: list[int] = []
+        for i in start:
+            if not visited[i]:
+                visited[i] = 1
+                order.append(i)
+        # ``order`` doubles as the work queue: scan it until it stops growing
+        pos = 0
+        while pos < len(order):
+            i = order[pos]
+            pos += 1
+            lo, hi = offsets[i], offsets[i + 1]
+            if allowed is None:
+                for j in targets[lo:hi]:
+                    if not visited[j]:
+                        visited[j] = 1
+                        order.append(j)
+                continue
+            for k in range(lo, hi):
+                edge = in_edge_pos[k] if reverse else k
+                if allowed[edge_kinds[edge]]:
+                    j = targets[k]
+                    if not visited[j]:
+                        visited[j] = 1
+                        order.append(j)
+        return order
+
+    def _adjacency(self, reverse: bool) -> tuple[array, array]:
+        if reverse:
+            return self.in_offsets, self.in_sources
+        return self.out_offsets, self.out_targets
+
+    def _indices(self, node_ids: Iterable[str]) -> list[int]:
+        index = self.index
+        return [index[nid] for nid in node_ids if nid in index]
+
+    def _require(self, node_id: str) -> int:
+        try:
+            return self.index[node_id]
+        except KeyError:
+            import networkx as nx
+
+            raise nx.NetworkXError(f"The node {node_id} is not in the digraph.") from None
+
+    def _edge_pos(self, u: str, v: str) -> int | None:
+        i, j = self.index.get(u), self.index.get(v)
+        if i is None or j is None:
+            return None
+        lo, hi = self.out_offsets[i], self.out_offsets[i + 1]
+        # Targets within a row are sorted: binary search
+        targets = self.out_targets
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if targets[mid] < j:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < self.out_offsets[i + 1] and targets[lo] == j:
+            return int(lo)
+        return None
+
+
+class _NodeView:
+    """``G.nodes`` / ``G.nodes(data=True)`` / ``G.nodes[nid]`` for CSRGraph."""
+
+    def __init__(self, graph: CSRGraph) -> None:
+        self._graph = graph
+
+    def __call__(self, data: bool = False) -> Iterator[Any]:
+        if data:
+            return zip(self._graph.ids, self._graph.node_attrs, strict=True)
+        return iter(self._graph.ids)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._graph.ids)
+
+    def __len__(self) -> int:
+        return len(self._graph.ids)
+
+    def __contains__(self, node_id: object) -> bool:
+        return node_id in self._graph.index
+
+    def __getitem__(self, node_id: str) -> dict:
+        return self._graph.node_attrs[self._graph.index[node_id]]
+
+    def get(self, node_id: str, default: Any = None) -> Any:
+        i = self._graph.index.get(node_id)
+        return default if i is None else self._graph.node_attrs[i]
+
+
+class _EdgeView:
+    """``G.edges(data=True)`` / ``G.edges[u, v]`` for CSRGraph."""
+
+    def __init__(self, graph: CSRGraph) -> None:
+        self._graph = graph
+
+    def __call__(self, data: bool = False) -> Iterator[Any]:
+        g = self._graph
+        ids, offsets, targets = g.ids, g.out_offsets, g.out_targets
+        for i in range(len(ids)):
+            for k in range(offsets[i], offsets[i + 1]):
+                if data:
+                    yield ids[i], ids[targets[k]], g.edge_attrs[k]
+                else:
+                    yield ids[i], ids[targets[k]]
+
+    def __iter__(self) -> Iterator[Any]:
+        return self()
+
+    def __len__(self) -> int:
+        return len(self._graph.out_targets)
+
+    def __getitem__(self, pair: tuple[str, str]) -> dict:
+        pos = self._graph._edge_pos(*pair)
+        if pos is None:
+            raise KeyError(f"The edge {pair[0]}-{pair[1]} is not in the graph.")
+        return self._graph.edge_attrs[pos]
+
+    def get(self, pair: tuple[str, str], default: Any = None) -> Any:
+        pos = self._graph._edge_pos(*pair)
+        return default if pos is None else self._graph.edge_attrs[pos]
+
+
+def _offsets(sorted_keys: Iterable[int], n: int) -> array:
+    """Row offsets for ``n`` rows from the row key of each sorted entry."""
+    counts = array("l", [0]) * (n + 1)
+    for key in sorted_keys:
+        counts[key + 1] += 1
+    for i in range(n):
+        counts[i + 1] += counts[i]
+    return counts
@@ -2,15 +2,29 @@
 
 from __future__ import annotations
 
+import functools
+import hashlib
+import json
 import logging
 import sqlite3
+import threading
+import time
+import weakref
+import zlib
+from collections import OrderedDict
+from collections.abc import Iterable, Mapping
 from datetime import UTC
 from pathlib import Path
+from typing import Any
 
-from lenspr.models import Edge, Node
+from lenspr.models import Edge, GraphDelta, Node, NodeType
 
 logger = logging.getLogger(__name__)
 
+# Bound for "IN (?, ?, ...)" lists (SQLite's default variable limit is 999
+# on older builds).
+_MAX_SQL_PARAMS = 900
+
 # -- Schema definitions --
 
 _GRAPH_SCHEMA = """
@@ -35,7 +49,11 @@ CREATE TABLE IF NOT EXISTS nodes (
     semantic_outputs TEXT,
     annotation_hash TEXT,
     -- Pre-computed metrics (stored as JSON)
-    metrics TEXT
+    metrics TEXT,
+    -- Node.parent_id: ID one dotted level up (see get_child_nodes)
+    parent_id TEXT,
+    -- source_blobs key when source_code is stored as a file slice
+    source_blob TEXT
 );
 
 CREATE TABLE IF NOT EXISTS project_metrics (
@@ -64,6 +82,113 @@ CREATE INDEX IF NOT EXISTS idx_edges_to ON edges(to_node);
 CREATE INDEX IF NOT EXISTS idx_edges_type ON edges(type);
 """
 
+# Edge lookups by endpoint pair: runtime-edge merging and sync read-back
+_EDGE_PAIR_INDEX = (
+    "CREATE INDEX IF NOT EXISTS idx_edges_pair ON edges(from_node, to_node)"
+)
+
+# Every proper dotted suffix of every node ID ("a.b.c" -> "b.c", "c"), used to
+# normalize short import paths to full node IDs without loading the graph.
+# Kept as separate statements so they can run inside an open transaction.
+_SUFFIX_SCHEMA = (
+    """CREATE TABLE IF NOT EXISTS node_suffixes (
+        suffix TEXT NOT NULL,
+        node_id TEXT NOT NULL,
+        PRIMARY KEY (suffix, node_id)
+    ) WITHOUT ROWID""",
+    "CREATE INDEX IF NOT EXISTS idx_node_suffixes_node ON node_suffixes(node_id)",
+)
+
+# -- Source blobs --
+#
+# Node source is stored once per file: the module node's text (the whole
+# file), zlib-compressed in source_blobs under its SHA-256. Nodes whose
+# source is exactly their line range of that text keep source_code = '' and
+# point at it through nodes.source_blob; any other node stays inline.
+# Readers slice source back in Python (_rows_to_nodes); SQL that needs the
+# text goes through the lens_source() function (_source_sql).
+_SOURCE_BLOB_SCHEMA = (
+    """CREATE TABLE IF NOT EXISTS source_blobs (
+        hash TEXT PRIMARY KEY,
+        content BLOB NOT NULL
+    )""",
+    "CREATE INDEX IF NOT EXISTS idx_nodes_source_blob ON nodes(source_blob)",
+)
+
+
+def _source_sql(row: str) -> str:
+    """SQL expression for the full source of nodes row ``row`` (alias/new/old)."""
+    return (
+        f"CASE WHEN {row}.source_blob IS NULL THEN {row}.source_code"
+        f" ELSE lens_source({row}.source_blob,"
+        f" (SELECT content FROM source_blobs WHERE hash = {row}.source_blob),"
+        f" {row}.type, {row}.start_line, {row}.end_line) END"
+    )
+
+
+# Trigram full-text index over node IDs (see resolve_node_id) and the
+# searchable node text (see search_nodes). External-content table over the
+# node_sources view and kept current by triggers, so every writer (sync,
+# patches, deletes) maintains it without extra code. save_graph drops the
+# triggers and rebuilds the index in one pass instead, which also realigns
+# rowids if the database was ever VACUUMed.
+_FTS_COLUMNS = ("id", "name", "signature", "docstring", "source_code")
+_FTS_TRIGGERS = ("nodes_fts_ai", "nodes_fts_ad", "nodes_fts_au")
+_FTS_SCHEMA = (
+    f"""CREATE VIEW node_sources AS
+    SELECT nodes.rowid AS rowid, id, name, signature, docstring,
+           {_source_sql("nodes")} AS source_code
+    FROM nodes""",
+    """CREATE VIRTUAL TABLE IF NOT EXISTS nodes_fts USING fts5(
+        id, name, signature, docstring, source_code,
+        content='node_sources', content_rowid='rowid', tokenize='trigram'
+    )""",
+    f"""CREATE TRIGGER IF NOT EXISTS nodes_fts_ai AFTER INSERT ON nodes BEGIN
+        INSERT INTO nodes_fts (rowid, id, name, signature, docstring, source_code)
+        VALUES (new.rowid, new.id, new.name, new.signature, new.docstring,
+                {_source_sql("new")});
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS nodes_fts_ad AFTER DELETE ON nodes BEGIN
+        INSERT INTO nodes_fts (nodes_fts, rowid, id, name, signature, docstring,
+                               source_code)
+        VALUES ('delete', old.rowid, old.id, old.name, old.signature, old.docstring,
+                {_source_sql("old")});
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS nodes_fts_au
+    AFTER UPDATE OF id, type, name, signature, docstring, source_code, source_blob,
+                    start_line, end_line ON nodes BEGIN
+        INSERT INTO nodes_fts (nodes_fts, rowid, id, name, signature, docstring,
+                               source_code)
+        VALUES ('delete', old.rowid, old.id, old.name, old.signature, old.docstring,
+                {_source_sql("old")});
+        INSERT INTO nodes_fts (rowid, id, name, signature, docstring, source_code)
+        VALUES (new.rowid, new.id, new.name, new.signature, new.docstring,
+                {_source_sql("new")});
+    END""",
+)
+
+# bm25 column weights for ranking search hits: name > signature > docstring >
+# code (IDs are never searched by lens_search)
+_FTS_WEIGHTS = "0.0, 10.0, 5.0, 2.0, 1.0"
+
+# Write generation of graph.db: every writer below bumps it in its own
+# transaction, so an in-memory graph can tell whether it saw every write.
+_GRAPH_META_SCHEMA = """CREATE TABLE IF NOT EXISTS graph_meta (
+    key TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+)"""
+
+# Per-file fingerprints as of the last sync: what change detection compares
+# the tree against (mtime, size) and the content hash that lets a touched
+# but unchanged file skip reparsing. Written in the same transaction as the
+# nodes parsed from the file.
+_FILE_STATE_SCHEMA = """CREATE TABLE IF NOT EXISTS file_state (
+    path TEXT PRIMARY KEY,
+    mtime REAL NOT NULL,
+    size INTEGER NOT NULL,
+    hash TEXT
+) WITHOUT ROWID"""
+
 _HISTORY_SCHEMA = """
 CREATE TABLE IF NOT EXISTS changes (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -94,6 +219,16 @@ CREATE TABLE IF NOT EXISTS resolutions (
 );
 """
 
+_PARSE_CACHE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS parse_cache (
+    file_path TEXT PRIMARY KEY,
+    cache_key TEXT NOT NULL,
+    nodes TEXT NOT NULL,
+    edges TEXT NOT NULL,
+    state TEXT
+);
+"""
+
 _SESSION_SCHEMA = """
 CREATE TABLE IF NOT EXISTS notes (
     key TEXT PRIMARY KEY,
@@ -103,13 +238,71 @@ CREATE TABLE IF NOT EXISTS notes (
 """
 
 
-def _connect(db_path: Path) -> sqlite3.Connection:
-    """Create a connection with sensible defaults."""
+# Tuning for long-lived pooled connections (WAL makes synchronous=NORMAL safe:
+# a crash can drop the last commits but never corrupts the database)
+_POOLED_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-16384",
+    "PRAGMA temp_store=MEMORY",
+)
+
+# Open pools by database path (see ConnectionPool); entries vanish with the pool
+_POOLS: weakref.WeakValueDictionary[str, ConnectionPool] = weakref.WeakValueDictionary()
+
+
+class ConnectionPool:
+    """Thread-local, long-lived connections to a fixed set of databases.
+
+    While a pool is alive, ``_connect`` hands out its connection for the
+    calling thread instead of opening a new one, so pragmas run once per
+    connection and sqlite3's statement cache is reused across calls.
+    Connections are closed when their thread exits, on ``close()``, or when
+    the pool is garbage collected.
+    """
+
+    def __init__(self, db_paths: Iterable[Path], cached_statements: int = 256) -> None:
+        self._keys = [str(p) for p in db_paths]
+        self._cached_statements = cached_statements
+        self._local = threading.local()
+        for key in self._keys:
+            _POOLS[key] = self
+
+    def get(self, db_path: Path) -> sqlite3.Connection:
+        """This thread's connection to ``db_path``, opened on first use."""
+        conns: dict[str, sqlite3.Connection] = self._local.__dict__.setdefault("conns", {})
+        key = str(db_path)
+        conn = conns.get(key)
+        if conn is not None:
+            try:
+                conn.total_changes  # noqa: B018 - raises if a caller closed it
+            except sqlite3.ProgrammingError:
+                conn = None
+        if conn is None:
+            conn = _open(db_path, self._cached_statements)
+            for pragma in _POOLED_PRAGMAS:
+                conn.execute(pragma)
+            conns[key] = conn
+        # Callers may switch row_factory for bulk reads; reset it per checkout
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def close(self) -> None:
+        """Stop pooling these paths and close this thread's connections."""
+        for key in self._keys:
+            if _POOLS.get(key) is self:
+                del _POOLS[key]
+        for conn in self._local.__dict__.pop("conns", {}).values():
+            conn.close()
+
+
+def _open(db_path: Path, cached_statements: int = 128) -> sqlite3.Connection:
     try:
-        conn = sqlite3.connect(str(db_path))
+        conn = sqlite3.connect(str(db_path), cached_statements=cached_statements)
         conn.row_factory = sqlite3.Row
         conn.execute("PRAGMA journal_mode=WAL")
         conn.execute("PRAGMA foreign_keys=ON")
+        conn.create_function("lens_source", 5, _sql_source, deterministic=True)
         return conn
     except sqlite3.Error as e:
         raise sqlite3.OperationalError(
@@ -117,17 +310,43 @@ def _connect(db_path: Path) -> sqlite3.Connection:
         ) from e
 
 
+def _connect(db_path: Path) -> sqlite3.Connection:
+    """Create a connection with sensible defaults.
+
+    Returns the calling thread's pooled connection when a ``ConnectionPool``
+    covers ``db_path``. Use it as ``with _connect(path) as conn:`` and never
+    close it: the block commits (or rolls back) without closing.
+    """
+    pool = _POOLS.get(str(db_path))
+    if pool is not None:
+        return pool.get(db_path)
+    return _open(db_path)
+
+
+def connect(db_path: Path) -> sqlite3.Connection:
+    """Public ``_connect`` for modules that run their own queries."""
+    return _connect(db_path)
+
+
 def init_database(lens_dir: Path) -> None:
     """
     Initialize .lens/ directory with empty databases.
 
-    Creates graph.db, history.db, resolve_cache.db, and session.db with proper schemas.
+    Creates graph.db, history.db, resolve_cache.db, parse_cache.db and
+    session.db with proper schemas.
     """
     lens_dir.mkdir(parents=True, exist_ok=True)
 
     with _connect(lens_dir / "graph.db") as conn:
         conn.executescript(_GRAPH_SCHEMA)
+        conn.execute(_EDGE_PAIR_INDEX)
+        conn.execute(_GRAPH_META_SCHEMA)
+        conn.execute(_FILE_STATE_SCHEMA)
         _migrate_annotations(conn)
+        _ensure_suffix_index(conn)
+        _ensure_parent_index(conn)
+        _ensure_source_blobs(conn)
+        _ensure_fts(conn)
 
     with _connect(lens_dir / "history.db") as conn:
         conn.executescript(_HISTORY_SCHEMA)
@@ -136,6 +355,9 @@ def init_database(lens_dir: Path) -> None:
     with _connect(lens_dir / "resolve_cache.db") as conn:
         conn.executescript(_RESOLVE_CACHE_SCHEMA)
 
+    with _connect(lens_dir / "parse_cache.db") as conn:
+        conn.executescript(_PARSE_CACHE_SCHEMA)
+
     with _connect(lens_dir / "session.db") as conn:
         conn.executescript(_SESSION_SCHEMA)
 
@@ -168,32 +390,54 @@ def _migrate_history(conn: sqlite3.Connection) -> None:
 
 
 
-def save_graph(nodes: list[Node], edges: list[Edge], db_path: Path) -> None:
+def save_graph(
+    nodes: list[Node],
+    edges: list[Edge],
+    db_path: Path,
+    file_state: Mapping[str, Mapping[str, Any]] | None = None,
+) -> None:
     """
     Persist nodes and edges to SQLite.
 
     Clears existing data and writes fresh — used during full reparse.
+
+    Args:
+        file_state: If given, replaces every file fingerprint (see
+            ``save_file_state``) in the same transaction.
     """
     try:
         with _connect(db_path) as conn:
+            _bump_generation(conn)
+            if file_state is not None:
+                _write_file_state(conn, file_state, replace=True)
             # Preserve runtime-only edges across syncs.
             # Static/both edges are re-created from the fresh parse.
             # Runtime edges (source='runtime') are only produced by the tracer.
             conn.execute("DELETE FROM edges WHERE source != 'runtime'")
+            # Bulk rewrite: skip the per-row index triggers, re-index once below
+            for trigger in _FTS_TRIGGERS:
+                conn.execute(f"DROP TRIGGER IF EXISTS {trigger}")
             conn.execute("DELETE FROM nodes")
+            _ensure_suffix_index(conn)
+            _ensure_parent_index(conn)
+            _ensure_source_blobs(conn)
+            conn.execute("DELETE FROM node_suffixes")
+            conn.execute("DELETE FROM source_blobs")
 
             conn.executemany(
                 """INSERT INTO nodes
                 (id, type, name, qualified_name, file_path, start_line, end_line,
                  source_code, docstring, signature, hash, metadata,
                  summary, role, side_effects, semantic_inputs, semantic_outputs,
-                 annotation_hash, metrics)
+                 annotation_hash, metrics, parent_id, source_blob)
                 VALUES (:id, :type, :name, :qualified_name, :file_path, :start_line,
                         :end_line, :source_code, :docstring, :signature, :hash, :metadata,
                         :summary, :role, :side_effects, :semantic_inputs, :semantic_outputs,
-                        :annotation_hash, :metrics)""",
-                [n.to_dict() for n in nodes],
+                        :annotation_hash, :metrics, :parent_id, :source_blob)""",
+                _node_rows(conn, nodes),
             )
+            _insert_suffixes(conn, (n.id for n in nodes))
+            _rebuild_fts(conn)
 
             conn.executemany(
                 """INSERT INTO edges
@@ -210,73 +454,91 @@ def save_graph(nodes: list[Node], edges: list[Edge], db_path: Path) -> None:
 
 def save_runtime_edges(
     edges: list[tuple[str, str, int]], db_path: Path,
-) -> dict[str, int]:
+) -> dict[str, Any]:
     """Upsert runtime edges without wiping static edges.
 
     For each runtime edge:
     - If a matching static edge exists (same from_node, to_node) → upgrade source to 'both'
+    - If a matching runtime edge exists → update its call count
     - If no matching edge → insert with source='runtime', confidence='resolved'
 
+    The merge is set-based: traced edges are bulk-loaded into a temp table
+    and matched, upgraded and inserted with a handful of statements over
+    the (from_node, to_node) index, so 100k+ traced edges stay cheap.
+
     Args:
         edges: List of (from_node_id, to_node_id, call_count) tuples.
         db_path: Path to graph.db.
 
     Returns:
-        Dict with counts: {"new_runtime": N, "upgraded_to_both": N, "total": N}
+        Dict with counts and merge time: {"new_runtime": N,
+        "upgraded_to_both": N, "total": N, "merge_time_ms": T}
     """
-    import json
-    import uuid
-
-    new_count = 0
-    upgraded_count = 0
-
+    start = time.perf_counter()
     with _connect(db_path) as conn:
-        for from_node, to_node, call_count in edges:
-            # Check if a static edge already exists
-            existing = conn.execute(
-                "SELECT id, source FROM edges WHERE from_node = ? AND to_node = ? LIMIT 1",
-                (from_node, to_node),
-            ).fetchone()
-
-            if existing:
-                eid, source = existing
-                if source == "static":
-                    # Upgrade static → both
-                    conn.execute(
-                        "UPDATE edges SET source = 'both', "
-                        "metadata = json_set(COALESCE(metadata, '{}'), '$.runtime_calls', ?) "
-                        "WHERE id = ?",
-                        (call_count, eid),
-                    )
-                    upgraded_count += 1
-                elif source == "runtime":
-                    # Update call count
-                    conn.execute(
-                        "UPDATE edges SET "
-                        "metadata = json_set(COALESCE(metadata, '{}'), '$.runtime_calls', ?) "
-                        "WHERE id = ?",
-                        (call_count, eid),
-                    )
-            else:
-                # Insert new runtime-only edge
-                edge_id = f"rt_{uuid.uuid4().hex[:12]}"
-                conn.execute(
-                    """INSERT INTO edges
-                    (id, from_node, to_node, type, line_number, column,
-                     confidence, source, untracked_reason, metadata)
-                    VALUES (?, ?, ?, 'calls', NULL, NULL,
-                            'resolved', 'runtime', '', ?)""",
-                    (edge_id, from_node, to_node,
-                     json.dumps({"runtime_calls": call_count})),
-                )
-                new_count += 1
+        _bump_generation(conn)
+        conn.execute(_EDGE_PAIR_INDEX)
+        conn.execute("DROP TABLE IF EXISTS temp.runtime_edges")
+        conn.execute(
+            """CREATE TEMP TABLE runtime_edges (
+                from_node TEXT NOT NULL,
+                to_node TEXT NOT NULL,
+                calls INTEGER,
+                edge_rowid INTEGER,
+                PRIMARY KEY (from_node, to_node)
+            ) WITHOUT ROWID"""
+        )
+        # Repeated pairs: the last call count wins
+        conn.executemany(
+            "INSERT OR REPLACE INTO runtime_edges (from_node, to_node, calls)"
+            " VALUES (?, ?, ?)",
+            edges,
+        )
+        # Match each pair to its first stored edge
+        conn.execute(
+            """UPDATE runtime_edges SET edge_rowid = (
+                SELECT min(rowid) FROM edges
+                WHERE edges.from_node = runtime_edges.from_node
+                  AND edges.to_node = runtime_edges.to_node
+            )"""
+        )
+        conn.execute("CREATE INDEX temp.idx_runtime_edges_rowid ON runtime_edges(edge_rowid)")
+
+        set_calls = (
+            "metadata = json_set(COALESCE(metadata, '{}'), '$.runtime_calls',"
+            " (SELECT calls FROM runtime_edges WHERE edge_rowid = edges.rowid))"
+        )
+        matched = "rowid IN (SELECT edge_rowid FROM runtime_edges)"
+        upgraded_count = conn.execute(
+            f"UPDATE edges SET source = 'both', {set_calls}"
+            f" WHERE {matched} AND source = 'static'"
+        ).rowcount
+        conn.execute(
+            f"UPDATE edges SET {set_calls} WHERE {matched} AND source = 'runtime'"
+        )
+        new_count = conn.execute(
+            """INSERT INTO edges
+            (id, from_node, to_node, type, line_number, column,
+             confidence, source, untracked_reason, metadata)
+            SELECT 'rt_' || lower(hex(randomblob(6))), from_node, to_node, 'calls',
+                   NULL, NULL, 'resolved', 'runtime', '',
+                   json_object('runtime_calls', calls)
+            FROM runtime_edges WHERE edge_rowid IS NULL"""
+        ).rowcount
+        conn.execute("DROP TABLE runtime_edges")
 
     total = new_count + upgraded_count
+    merge_time_ms = round((time.perf_counter() - start) * 1000, 1)
     logger.info(
-        "save_runtime_edges: %d new, %d upgraded to 'both' (%d total)",
-        new_count, upgraded_count, total,
+        "save_runtime_edges: %d new, %d upgraded to 'both' (%d total) in %.1f ms",
+        new_count, upgraded_count, total, merge_time_ms,
     )
-    return {"new_runtime": new_count, "upgraded_to_both": upgraded_count, "total": total}
+    return {
+        "new_runtime": new_count,
+        "upgraded_to_both": upgraded_count,
+        "total": total,
+        "merge_time_ms": merge_time_ms,
+    }
 
 
 def get_all_node_ids(db_path: Path) -> set[str]:
@@ -286,12 +548,305 @@ def get_all_node_ids(db_path: Path) -> set[str]:
         return {row[0] for row in rows}
 
 
+def get_existing_node_ids(ids: set[str], db_path: Path) -> set[str]:
+    """Return the subset of ``ids`` that are node IDs in the graph."""
+    found: set[str] = set()
+    candidates = list(ids)
+    with _connect(db_path) as conn:
+        for start in range(0, len(candidates), _MAX_SQL_PARAMS):
+            chunk = candidates[start:start + _MAX_SQL_PARAMS]
+            placeholders = ",".join("?" * len(chunk))
+            rows = conn.execute(
+                f"SELECT id FROM nodes WHERE id IN ({placeholders})", chunk
+            ).fetchall()
+            found.update(row[0] for row in rows)
+    return found
+
+
+def id_suffixes(node_id: str) -> list[str]:
+    """Proper dotted suffixes of a node ID: ``a.b.c`` -> ``["b.c", "c"]``."""
+    parts = node_id.split(".")
+    return [".".join(parts[i:]) for i in range(1, len(parts))]
+
+
+def lookup_node_suffixes(suffixes: set[str], db_path: Path) -> dict[str, str | None]:
+    """Match short IDs against the persistent suffix index.
+
+    Returns:
+        {suffix: node_id} for suffixes of exactly one node, {suffix: None}
+        for ambiguous ones. Suffixes matching no node are omitted.
+    """
+    result: dict[str, str | None] = {}
+    candidates = list(suffixes)
+    with _connect(db_path) as conn:
+        _ensure_suffix_index(conn)
+        for start in range(0, len(candidates), _MAX_SQL_PARAMS):
+            chunk = candidates[start:start + _MAX_SQL_PARAMS]
+            placeholders = ",".join("?" * len(chunk))
+            rows = conn.execute(
+                f"SELECT suffix, MIN(node_id), COUNT(*) FROM node_suffixes"
+                f" WHERE suffix IN ({placeholders}) GROUP BY suffix",
+                chunk,
+            ).fetchall()
+            for suffix, node_id, count in rows:
+                result[suffix] = node_id if count == 1 else None
+    return result
+
+
+def _insert_suffixes(conn: sqlite3.Connection, node_ids: Iterable[str]) -> None:
+    conn.executemany(
+        "INSERT OR IGNORE INTO node_suffixes (suffix, node_id) VALUES (?, ?)",
+        ((suffix, nid) for nid in node_ids for suffix in id_suffixes(nid)),
+    )
+
+
+def _node_row(node: Node) -> dict[str, Any]:
+    """Insert parameters for a nodes row (``Node.to_dict`` plus parent_id)."""
+    return {**node.to_dict(), "parent_id": node.parent_id, "source_blob": None}
+
+
+# Decompressed source blobs by hash, as (text, lines). Blobs are immutable,
+# so entries never go stale; the lock covers pooled connections in threads.
+_BLOB_CACHE: OrderedDict[str, tuple[str, list[str]]] = OrderedDict()
+_BLOB_CACHE_SIZE = 256
+_BLOB_CACHE_LOCK = threading.Lock()
+
+
+def _blob_text(blob_hash: str, content: bytes) -> tuple[str, list[str]]:
+    with _BLOB_CACHE_LOCK:
+        entry = _BLOB_CACHE.get(blob_hash)
+        if entry is not None:
+            _BLOB_CACHE.move_to_end(blob_hash)
+            return entry
+    text = zlib.decompress(content).decode("utf-8")
+    entry = (text, text.splitlines())
+    with _BLOB_CACHE_LOCK:
+        _BLOB_CACHE[blob_hash] = entry
+        if len(_BLOB_CACHE) > _BLOB_CACHE_SIZE:
+            _BLOB_CACHE.popitem(last=False)
+    return entry
+
+
+def _slice_source(blob: tuple[str, list[str]], node_type: str, start: int, end: int) -> str:
+    """A node's source from its file blob (parsers slice lines the same way)."""
+    text, lines = blob
+    return text if node_type == NodeType.MODULE.value else "\n".join(lines[start - 1:end])
+
+
+def _sql_source(
+    blob_hash: str, content: bytes | None, node_type: str, start: int, end: int,
+) -> str | None:
+    """SQL function ``lens_source``: source of a blob-backed nodes row."""
+    if content is None:
+        return None
+    return _slice_source(_blob_text(blob_hash, content), node_type, start, end)
+
+
+def _node_rows(conn: sqlite3.Connection, nodes: Iterable[Node]) -> list[dict[str, Any]]:
+    """Insert parameters for ``nodes``, storing file-backed source as blobs.
+
+    Each file's module node supplies the blob; nodes whose source is their
+    exact line slice of it are stored as references.
+    """
+    nodes = list(nodes)
+    blobs: dict[str, tuple[str, tuple[str, list[str]]]] = {}
+    new_blobs: list[tuple[str, bytes]] = []
+    for node in nodes:
+        if node.type != NodeType.MODULE or not node.source_code or node.file_path in blobs:
+            continue
+        try:
+            data = node.source_code.encode("utf-8")
+        except UnicodeEncodeError:
+            continue
+        blob_hash = hashlib.sha256(data).hexdigest()
+        blobs[node.file_path] = (blob_hash, (node.source_code, node.source_code.splitlines()))
+        new_blobs.append((blob_hash, zlib.compress(data)))
+    conn.executemany(
+        "INSERT OR IGNORE INTO source_blobs (hash, content) VALUES (?, ?)", new_blobs,
+    )
+
+    rows = []
+    for node in nodes:
+        row = _node_row(node)
+        blob = blobs.get(node.file_path)
+        if blob is not None and node.source_code == _slice_source(
+            blob[1], node.type.value, node.start_line, node.end_line
+        ):
+            row["source_code"] = ""
+            row["source_blob"] = blob[0]
+        rows.append(row)
+    return rows
+
+
+def _prune_source_blobs(conn: sqlite3.Connection, hashes: Iterable[str | None]) -> None:
+    """Delete the blobs among ``hashes`` that no node references any more."""
+    conn.executemany(
+        """DELETE FROM source_blobs WHERE hash = ?
+           AND NOT EXISTS (SELECT 1 FROM nodes WHERE source_blob = ?)""",
+        [(h, h) for h in set(hashes) if h],
+    )
+
+
+def _load_blobs(
+    conn: sqlite3.Connection, hashes: set[str],
+) -> dict[str, tuple[str, list[str]]]:
+    blobs: dict[str, tuple[str, list[str]]] = {}
+    with _BLOB_CACHE_LOCK:
+        for blob_hash in hashes:
+            entry = _BLOB_CACHE.get(blob_hash)
+            if entry is not None:
+                blobs[blob_hash] = entry
+    missing = [h for h in hashes if h not in blobs]
+    for start in range(0, len(missing), _MAX_SQL_PARAMS):
+        chunk = missing[start:start + _MAX_SQL_PARAMS]
+        placeholders = ",".join("?" * len(chunk))
+        for blob_hash, content in conn.execute(
+            f"SELECT hash, content FROM source_blobs WHERE hash IN ({placeholders})", chunk,
+        ):
+            blobs[blob_hash] = _blob_text(blob_hash, content)
+    return blobs
+
+
+def _rows_to_nodes(conn: sqlite3.Connection, rows: Iterable[Any]) -> list[Node]:
+    """Nodes from ``nodes`` rows, with blob-backed source sliced back in."""
+    dicts = [dict(r) for r in rows]
+    wanted = {d["source_blob"] for d in dicts if d.get("source_blob")}
+    if wanted:
+        blobs = _load_blobs(conn, wanted)
+        for d in dicts:
+            blob = blobs.get(d.get("source_blob") or "")
+            if blob is not None:
+                d["source_code"] = _slice_source(blob, d["type"], d["start_line"], d["end_line"])
+    return [Node.from_dict(d) for d in dicts]
+
+
+def _ensure_source_blobs(conn: sqlite3.Connection) -> None:
+    """Move file-backed node source into source_blobs for older graphs."""
+    exists = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = 'idx_nodes_source_blob'"
+    ).fetchone()
+    if exists:
+        return
+    columns = {row[1] for row in conn.execute("PRAGMA table_info(nodes)")}
+    if "source_blob" not in columns:
+        conn.execute("ALTER TABLE nodes ADD COLUMN source_blob TEXT")
+    for statement in _SOURCE_BLOB_SCHEMA:
+        conn.execute(statement)
+    # The full-text index reads source through the blobs: drop it here and
+    # let _ensure_fts rebuild it rather than re-index row by row
+    _drop_fts(conn)
+    nodes = _rows_to_nodes(conn, conn.execute("SELECT * FROM nodes"))
+    conn.executemany(
+        "UPDATE nodes SET source_code = :source_code, source_blob = :source_blob"
+        " WHERE id = :id",
+        [row for row in _node_rows(conn, nodes) if row["source_blob"]],
+    )
+
+
+def _ensure_parent_index(conn: sqlite3.Connection) -> None:
+    """Add and backfill nodes.parent_id for graphs built before it existed."""
+    exists = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = 'idx_nodes_parent'"
+    ).fetchone()
+    if exists:
+        return
+    columns = {row[1] for row in conn.execute("PRAGMA table_info(nodes)")}
+    if "parent_id" not in columns:
+        conn.execute("ALTER TABLE nodes ADD COLUMN parent_id TEXT")
+        conn.executemany(
+            "UPDATE nodes SET parent_id = ? WHERE id = ?",
+            [
+                (nid.rsplit(".", 1)[0], nid)
+                for (nid,) in conn.execute("SELECT id FROM nodes WHERE id LIKE '%.%'")
+            ],
+        )
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_nodes_parent ON nodes(parent_id)")
+
+
+def _ensure_suffix_index(conn: sqlite3.Connection) -> None:
+    """Create and backfill node_suffixes for graphs built before it existed."""
+    exists = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'node_suffixes'"
+    ).fetchone()
+    if exists:
+        return
+    for statement in _SUFFIX_SCHEMA:
+        conn.execute(statement)
+    _insert_suffixes(conn, (row[0] for row in conn.execute("SELECT id FROM nodes")))
+
+
+def _ensure_fts(conn: sqlite3.Connection) -> bool:
+    """Create and backfill nodes_fts; False if SQLite lacks FTS5 trigram."""
+    row = conn.execute(
+        "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'nodes_fts'"
+    ).fetchone()
+    if row and "'node_sources'" in row[0]:
+        return True
+    return _rebuild_fts(conn)
+
+
+def _drop_fts(conn: sqlite3.Connection) -> None:
+    for trigger in _FTS_TRIGGERS:
+        conn.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+    conn.execute("DROP TABLE IF EXISTS nodes_fts")
+    conn.execute("DROP VIEW IF EXISTS node_sources")
+
+
+@functools.cache
+def _fts_supported() -> bool:
+    """Whether this SQLite build has FTS5 with the trigram tokenizer."""
+    try:
+        sqlite3.connect(":memory:").execute(
+            "CREATE VIRTUAL TABLE t USING fts5(x, tokenize='trigram')"
+        )
+    except sqlite3.OperationalError as e:
+        logger.debug("Full-text index unavailable, search falls back to LIKE: %s", e)
+        return False
+    return True
+
+
+def _rebuild_fts(conn: sqlite3.Connection) -> bool:
+    """(Re)create nodes_fts and its triggers, then index every node."""
+    if not _fts_supported():
+        return False
+    _ensure_source_blobs(conn)
+    _drop_fts(conn)
+    for statement in _FTS_SCHEMA:
+        conn.execute(statement)
+    conn.execute("INSERT INTO nodes_fts (nodes_fts) VALUES ('rebuild')")
+    return True
+
+
+# Cross-language edges produced by the mappers. Incremental syncs keep them:
+# they are only recreated during a full sync, when the mappers run.
+_MAPPER_EDGE_TYPES = (
+    "calls_api", "handles_route",
+    "reads_table", "writes_table", "migrates",
+    "depends_on", "exposes_port", "uses_env",
+)
+
+
+# Columns sync_file refreshes on existing nodes; annotation columns are
+# left alone so annotations survive re-parsing.
+_SYNC_UPDATE_COLUMNS = (
+    "type", "name", "qualified_name", "file_path", "start_line", "end_line",
+    "source_code", "docstring", "signature", "hash", "metadata", "metrics",
+    "parent_id", "source_blob",
+)
+_SYNC_UPDATE_SET = ", ".join(f"{c} = excluded.{c}" for c in _SYNC_UPDATE_COLUMNS)
+_SYNC_UPDATE_CHANGED = "({}) IS NOT ({})".format(
+    ", ".join(f"nodes.{c}" for c in _SYNC_UPDATE_COLUMNS),
+    ", ".join(f"excluded.{c}" for c in _SYNC_UPDATE_COLUMNS),
+)
+
+
 def sync_file(
     file_path: str,
     new_nodes: list[Node],
     new_edges: list[Edge],
     db_path: Path,
-) -> dict[str, int]:
+    file_state: Mapping[str, Mapping[str, Any] | None] | None = None,
+) -> GraphDelta:
     """Granular sync: update nodes/edges for a single file using node-hash diffing.
 
     Only outgoing edges from nodes whose hash changed are refreshed.
@@ -304,115 +859,301 @@ def sync_file(
         new_nodes: Freshly parsed nodes for this file.
         new_edges: Freshly parsed edges for this file.
         db_path: Path to graph.db.
+        file_state: Fingerprints to store in the same transaction (see
+            ``sync_files``).
 
     Returns:
-        Dict with counts: added, modified, deleted, unchanged, edges_refreshed.
+        GraphDelta describing the changes, with counts: added, modified,
+        deleted, unchanged, edges_refreshed.
     """
-    new_index = {n.id: n for n in new_nodes}
-    new_node_ids = set(new_index.keys())
+    return sync_files({file_path: (new_nodes, new_edges)}, db_path, file_state)[0]
 
+
+def sync_files(
+    files: Mapping[str, tuple[list[Node], list[Edge]]],
+    db_path: Path,
+    file_state: Mapping[str, Mapping[str, Any] | None] | None = None,
+) -> list[GraphDelta]:
+    """``sync_file`` for many files in one write transaction.
+
+    A branch switch touching hundreds of files commits (and fsyncs) once
+    instead of once per file. ID sets go through a temp table rather than
+    ``IN (...)`` placeholder lists, so no file is too large for one
+    statement.
+
+    Args:
+        files: Relative file path -> (new nodes, new edges); a file with no
+            nodes is removed from the graph.
+        db_path: Path to graph.db.
+        file_state: Fingerprints to store in the same transaction (see
+            ``save_file_state``), so they never describe content the graph
+            does not hold.
+
+    Returns:
+        One GraphDelta per file, in ``files`` order. Each advances the write
+        generation by one, exactly as separate ``sync_file`` calls would.
+    """
     with _connect(db_path) as conn:
-        # 1. Load old node IDs and hashes for this file
-        old_rows = conn.execute(
-            "SELECT id, hash FROM nodes WHERE file_path = ?", (file_path,)
-        ).fetchall()
-        old_hashes = {row[0]: row[1] for row in old_rows}
-        old_node_ids = set(old_hashes.keys())
-
-        # 2. Classify nodes by hash diff
-        added_ids = new_node_ids - old_node_ids
-        deleted_ids = old_node_ids - new_node_ids
-        modified_ids = {
-            nid for nid in (old_node_ids & new_node_ids)
-            if old_hashes[nid] != new_index[nid].hash
-        }
-        unchanged_ids = (old_node_ids & new_node_ids) - modified_ids
-        changed_ids = added_ids | modified_ids  # need edge refresh
-
-        # 3. Delete outgoing edges from changed/deleted nodes.
-        #    Preserve mapper-produced cross-language edges (calls_api,
-        #    reads_table, writes_table, etc.) — these are only recreated
-        #    during full sync when the mappers run.
-        _MAPPER_EDGE_TYPES = (
-            "calls_api", "handles_route",
-            "reads_table", "writes_table", "migrates",
-            "depends_on", "exposes_port", "uses_env",
+        if file_state:
+            _write_file_state(conn, file_state)
+        _ensure_parent_index(conn)
+        _ensure_source_blobs(conn)
+        _ensure_fts(conn)
+        _ensure_suffix_index(conn)
+        conn.execute("DROP TABLE IF EXISTS temp.sync_ids")
+        conn.execute("CREATE TEMP TABLE sync_ids (id TEXT PRIMARY KEY) WITHOUT ROWID")
+        deltas = [
+            _sync_file(conn, file_path, new_nodes, new_edges)
+            for file_path, (new_nodes, new_edges) in files.items()
+        ]
+        conn.execute("DROP TABLE sync_ids")
+    logger.debug("sync_files: %d files in one transaction", len(deltas))
+    return deltas
+
+
+def _stage_sync_ids(conn: sqlite3.Connection, ids: Iterable[str]) -> None:
+    """Replace the contents of the ``sync_ids`` temp table with ``ids``."""
+    conn.execute("DELETE FROM sync_ids")
+    conn.executemany("INSERT INTO sync_ids (id) VALUES (?)", ((i,) for i in ids))
+
+
+def _sync_file(
+    conn: sqlite3.Connection,
+    file_path: str,
+    new_nodes: list[Node],
+    new_edges: list[Edge],
+) -> GraphDelta:
+    """Apply one file's node-hash diff inside ``sync_files``' transaction."""
+    new_index = {n.id: n for n in new_nodes}
+    new_node_ids = set(new_index.keys())
+    base_generation = _bump_generation(conn)
+
+    # 1. Load old node IDs and hashes for this file
+    old_rows = conn.execute(
+        "SELECT id, hash, source_blob FROM nodes WHERE file_path = ?", (file_path,)
+    ).fetchall()
+    old_hashes = {row[0]: row[1] for row in old_rows}
+    old_blobs = {row[2] for row in old_rows}
+    old_node_ids = set(old_hashes.keys())
+
+    # 2. Classify nodes by hash diff
+    added_ids = new_node_ids - old_node_ids
+    deleted_ids = old_node_ids - new_node_ids
+    modified_ids = {
+        nid for nid in (old_node_ids & new_node_ids)
+        if old_hashes[nid] != new_index[nid].hash
+    }
+    unchanged_ids = (old_node_ids & new_node_ids) - modified_ids
+    changed_ids = added_ids | modified_ids  # need edge refresh
+
+    # 3. Delete outgoing edges from changed/deleted nodes, except the
+    #    mapper-produced ones (_MAPPER_EDGE_TYPES).
+    ids_to_clear = changed_ids | deleted_ids
+    # Endpoint pairs of every deleted or inserted edge, for the delta
+    affected_pairs: set[tuple[str, str]] = set()
+    if ids_to_clear:
+        _stage_sync_ids(conn, ids_to_clear)
+        type_placeholders = ",".join("?" * len(_MAPPER_EDGE_TYPES))
+        where = (
+            "from_node IN (SELECT id FROM sync_ids)"
+            f" AND type NOT IN ({type_placeholders})"
         )
-        ids_to_clear = changed_ids | deleted_ids
-        if ids_to_clear:
-            placeholders = ",".join("?" * len(ids_to_clear))
-            type_placeholders = ",".join("?" * len(_MAPPER_EDGE_TYPES))
-            conn.execute(
-                f"DELETE FROM edges WHERE from_node IN ({placeholders})"
-                f" AND type NOT IN ({type_placeholders})",
-                list(ids_to_clear) + list(_MAPPER_EDGE_TYPES),
+        affected_pairs.update(
+            (row[0], row[1]) for row in conn.execute(
+                f"SELECT from_node, to_node FROM edges WHERE {where}", _MAPPER_EDGE_TYPES,
             )
+        )
+        conn.execute(f"DELETE FROM edges WHERE {where}", _MAPPER_EDGE_TYPES)
 
+    if deleted_ids:
+        _stage_sync_ids(conn, deleted_ids)
         # 4. Delete stale incoming edges to deleted nodes
-        if deleted_ids:
-            placeholders = ",".join("?" * len(deleted_ids))
-            conn.execute(
-                f"DELETE FROM edges WHERE to_node IN ({placeholders})",
-                list(deleted_ids),
+        affected_pairs.update(
+            (row[0], row[1]) for row in conn.execute(
+                "SELECT from_node, to_node FROM edges"
+                " WHERE to_node IN (SELECT id FROM sync_ids)"
             )
+        )
+        conn.execute("DELETE FROM edges WHERE to_node IN (SELECT id FROM sync_ids)")
 
-        # 5. Delete removed nodes
-        if deleted_ids:
-            placeholders = ",".join("?" * len(deleted_ids))
-            conn.execute(
-                f"DELETE FROM nodes WHERE id IN ({placeholders})",
-                list(deleted_ids),
-            )
+        # 5. Delete removed nodes (and their suffix index rows)
+        conn.execute("DELETE FROM nodes WHERE id IN (SELECT id FROM sync_ids)")
+        conn.execute(
+            "DELETE FROM node_suffixes WHERE node_id IN (SELECT id FROM sync_ids)"
+        )
+    _insert_suffixes(conn, added_ids)
+
+    # 6. Upsert nodes — INSERT new, UPDATE existing.
+    #    ON CONFLICT preserves annotation columns (summary, role,
+    #    side_effects, semantic_inputs, semantic_outputs, annotation_hash)
+    #    and leaves rows that did not change untouched, so they cost no
+    #    index or full-text trigger writes.
+    if new_nodes:
+        conn.executemany(
+            f"""INSERT INTO nodes
+            (id, type, name, qualified_name, file_path, start_line, end_line,
+             source_code, docstring, signature, hash, metadata,
+             summary, role, side_effects, semantic_inputs, semantic_outputs,
+             annotation_hash, metrics, parent_id, source_blob)
+            VALUES (:id, :type, :name, :qualified_name, :file_path, :start_line,
+                    :end_line, :source_code, :docstring, :signature, :hash, :metadata,
+                    :summary, :role, :side_effects, :semantic_inputs, :semantic_outputs,
+                    :annotation_hash, :metrics, :parent_id, :source_blob)
+            ON CONFLICT(id) DO UPDATE SET {_SYNC_UPDATE_SET}
+            WHERE {_SYNC_UPDATE_CHANGED}""",
+            _node_rows(conn, new_nodes),
+        )
+    _prune_source_blobs(conn, old_blobs)
+
+    # 7. Insert edges for changed/added nodes only
+    changed_edges = [e for e in new_edges if e.from_node in changed_ids]
+    if changed_edges:
+        conn.executemany(
+            """INSERT INTO edges
+            (id, from_node, to_node, type, line_number, column, confidence, source,
+             untracked_reason, metadata)
+            VALUES (:id, :from_node, :to_node, :type, :line_number, :column,
+                    :confidence, :source, :untracked_reason, :metadata)""",
+            [e.to_dict() for e in changed_edges],
+        )
+    affected_pairs.update((e.from_node, e.to_node) for e in changed_edges)
+
+    # 8. Read back the resulting state for the in-memory graph
+    delta = GraphDelta(
+        removed_node_ids=sorted(deleted_ids),
+        base_generation=base_generation,
+        counts={
+            "added": len(added_ids),
+            "modified": len(modified_ids),
+            "deleted": len(deleted_ids),
+            "unchanged": len(unchanged_ids),
+            "edges_refreshed": len(changed_edges),
+        },
+    )
+    if new_nodes:
+        rows = conn.execute(
+            "SELECT * FROM nodes WHERE file_path = ?", (file_path,)
+        ).fetchall()
+        delta.nodes = _rows_to_nodes(
+            conn, [r for r in rows if r["id"] in new_index]
+        )
+    for from_node, to_node in sorted(affected_pairs):
+        # load_graph reads edges in rowid order and build_graph keeps
+        # the last edge per pair, so the highest rowid wins.
+        row = conn.execute(
+            "SELECT * FROM edges WHERE from_node = ? AND to_node = ?"
+            " ORDER BY rowid DESC LIMIT 1",
+            (from_node, to_node),
+        ).fetchone()
+        delta.edges[(from_node, to_node)] = (
+            Edge.from_dict(dict(row)) if row is not None else None
+        )
 
-        # 6. Upsert nodes — INSERT new, UPDATE existing.
-        #    ON CONFLICT preserves annotation columns (summary, role,
-        #    side_effects, semantic_inputs, semantic_outputs, annotation_hash).
-        if new_nodes:
-            conn.executemany(
-                """INSERT INTO nodes
-                (id, type, name, qualified_name, file_path, start_line, end_line,
-                 source_code, docstring, signature, hash, metadata,
-                 summary, role, side_effects, semantic_inputs, semantic_outputs,
-                 annotation_hash, metrics)
-                VALUES (:id, :type, :name, :qualified_name, :file_path, :start_line,
-                        :end_line, :source_code, :docstring, :signature, :hash, :metadata,
-                        :summary, :role, :side_effects, :semantic_inputs, :semantic_outputs,
-                        :annotation_hash, :metrics)
-                ON CONFLICT(id) DO UPDATE SET
-                    type = excluded.type,
-                    name = excluded.name,
-                    qualified_name = excluded.qualified_name,
-                    file_path = excluded.file_path,
-                    start_line = excluded.start_line,
-                    end_line = excluded.end_line,
-                    source_code = excluded.source_code,
-                    docstring = excluded.docstring,
-                    signature = excluded.signature,
-                    hash = excluded.hash,
-                    metadata = excluded.metadata,
-                    metrics = excluded.metrics""",
-                [n.to_dict() for n in new_nodes],
-            )
+    return delta
 
-        # 7. Insert edges for changed/added nodes only
-        changed_edges = [e for e in new_edges if e.from_node in changed_ids]
-        if changed_edges:
-            conn.executemany(
-                """INSERT INTO edges
-                (id, from_node, to_node, type, line_number, column, confidence, source,
-                 untracked_reason, metadata)
-                VALUES (:id, :from_node, :to_node, :type, :line_number, :column,
-                        :confidence, :source, :untracked_reason, :metadata)""",
-                [e.to_dict() for e in changed_edges],
-            )
 
-    return {
-        "added": len(added_ids),
-        "modified": len(modified_ids),
-        "deleted": len(deleted_ids),
-        "unchanged": len(unchanged_ids),
-        "edges_refreshed": len(changed_edges),
-    }
+def _bump_generation(conn: sqlite3.Connection) -> int:
+    """Advance graph.db's write generation inside ``conn``'s transaction.
+
+    Returns the generation before the bump.
+    """
+    conn.execute(_GRAPH_META_SCHEMA)
+    row = conn.execute(
+        """INSERT INTO graph_meta (key, value) VALUES ('generation', 1)
+           ON CONFLICT(key) DO UPDATE SET value = value + 1
+           RETURNING value"""
+    ).fetchone()
+    return int(row[0]) - 1
+
+
+def get_graph_generation(db_path: Path) -> int:
+    """Current write generation of graph.db (0 if it was never bumped)."""
+    with _connect(db_path) as conn:
+        conn.execute(_GRAPH_META_SCHEMA)
+        row = conn.execute(
+            "SELECT value FROM graph_meta WHERE key = 'generation'"
+        ).fetchone()
+    return int(row[0]) if row else 0
+
+
+def load_file_state(db_path: Path) -> dict[str, dict[str, Any]]:
+    """File fingerprints of the last sync: path -> {"mtime", "size", "hash"}."""
+    with _connect(db_path) as conn:
+        conn.execute(_FILE_STATE_SCHEMA)
+        return {
+            row[0]: {"mtime": row[1], "size": row[2], "hash": row[3]}
+            for row in conn.execute("SELECT path, mtime, size, hash FROM file_state")
+        }
+
+
+def save_file_state(
+    file_state: Mapping[str, Mapping[str, Any] | None],
+    db_path: Path,
+    replace: bool = False,
+) -> None:
+    """Store file fingerprints without touching the graph.
+
+    Args:
+        file_state: Relative path -> {"mtime", "size", "hash"} ("hash" may
+            be missing or None when unknown); None deletes the entry.
+        replace: Drop every entry not in ``file_state`` first.
+    """
+    with _connect(db_path) as conn:
+        _write_file_state(conn, file_state, replace)
+
+
+def _write_file_state(
+    conn: sqlite3.Connection,
+    file_state: Mapping[str, Mapping[str, Any] | None],
+    replace: bool = False,
+) -> None:
+    conn.execute(_FILE_STATE_SCHEMA)
+    if replace:
+        conn.execute("DELETE FROM file_state")
+    else:
+        conn.executemany(
+            "DELETE FROM file_state WHERE path = ?",
+            [(path,) for path, fp in file_state.items() if fp is None],
+        )
+    conn.executemany(
+        "INSERT OR REPLACE INTO file_state (path, mtime, size, hash) VALUES (?, ?, ?, ?)",
+        [
+            (path, fp["mtime"], fp["size"], fp.get("hash"))
+            for path, fp in file_state.items() if fp is not None
+        ],
+    )
+
+
+def has_nodes(db_path: Path) -> bool:
+    """Whether graph.db holds any node."""
+    with _connect(db_path) as conn:
+        return bool(conn.execute("SELECT EXISTS (SELECT 1 FROM nodes)").fetchone()[0])
+
+
+def get_graph_counts(db_path: Path) -> dict[str, int]:
+    """Node, edge and file totals of the graph built from graph.db.
+
+    Counted in SQLite, without loading the graph: edge endpoints missing
+    from ``nodes`` count as nodes and parallel edges count once, as in the
+    DiGraph, and files are those with a non-method node (as in
+    ``graph.get_structure``).
+    """
+    with _connect(db_path) as conn:
+        nodes = conn.execute(
+            """SELECT COUNT(*) FROM (
+                   SELECT id FROM nodes
+                   UNION SELECT from_node FROM edges
+                   UNION SELECT to_node FROM edges
+               )"""
+        ).fetchone()[0]
+        edges = conn.execute(
+            "SELECT COUNT(*) FROM (SELECT DISTINCT from_node, to_node FROM edges)"
+        ).fetchone()[0]
+        files = conn.execute(
+            "SELECT COUNT(DISTINCT file_path) FROM nodes"
+            " WHERE file_path != '' AND type != 'method'"
+        ).fetchone()[0]
+    return {"nodes": nodes, "edges": edges, "files": files}
 
 
 def load_graph(db_path: Path) -> tuple[list[Node], list[Edge]]:
@@ -421,8 +1162,7 @@ def load_graph(db_path: Path) -> tuple[list[Node], list[Edge]]:
         # Ensure annotation columns exist (migration for existing DBs)
         _migrate_annotations(conn)
 
-        rows = conn.execute("SELECT * FROM nodes").fetchall()
-        nodes = [Node.from_dict(dict(r)) for r in rows]
+        nodes = _rows_to_nodes(conn, conn.execute("SELECT * FROM nodes"))
 
         rows = conn.execute("SELECT * FROM edges").fetchall()
         edges = [Edge.from_dict(dict(r)) for r in rows]
@@ -430,23 +1170,151 @@ def load_graph(db_path: Path) -> tuple[list[Node], list[Edge]]:
     return nodes, edges
 
 
+# Node columns read back by Node.from_dict (get_nodes_by_ids projection)
+_NODE_COLUMNS = (
+    "id", "type", "name", "qualified_name", "file_path", "start_line", "end_line",
+    "source_code", "docstring", "signature", "hash", "metadata", "summary", "role",
+    "side_effects", "semantic_inputs", "semantic_outputs", "annotation_hash", "metrics",
+)
+
+# Column order of load_graph_lean rows (see graph.build_lean_graph).
+LEAN_NODE_COLUMNS = (
+    "id", "type", "name", "qualified_name", "file_path", "start_line", "end_line",
+    "signature", "has_docstring", "exports_all",
+)
+LEAN_EDGE_COLUMNS = (
+    "from_node", "to_node", "type", "confidence", "source", "line_number",
+    "untracked_reason",
+)
+
+
+def load_graph_lean(db_path: Path) -> tuple[list[tuple], list[tuple]]:
+    """Load graph structure without source, docstrings, metadata or annotations.
+
+    Flags derived from the heavy columns are computed in SQL, so their text
+    never reaches Python.
+
+    Returns:
+        (node rows, edge rows) as tuples in ``LEAN_NODE_COLUMNS`` /
+        ``LEAN_EDGE_COLUMNS`` order; edges in table order.
+    """
+    with _connect(db_path) as conn:
+        _ensure_source_blobs(conn)
+        conn.row_factory = None
+        nodes = conn.execute(
+            f"""SELECT id, type, name, qualified_name, file_path, start_line, end_line,
+                      signature,
+                      docstring IS NOT NULL AND docstring != '',
+                      type = 'module' AND instr({_source_sql("nodes")}, '__all__') > 0
+               FROM nodes"""
+        ).fetchall()
+        edges = conn.execute(
+            """SELECT from_node, to_node, type, confidence, source, line_number,
+                      untracked_reason
+               FROM edges"""
+        ).fetchall()
+    return nodes, edges
+
+
+def find_nodes_containing(
+    db_path: Path,
+    needles: tuple[str, ...],
+    types: tuple[str, ...] | None = None,
+) -> set[str]:
+    """IDs of nodes whose source contains any of ``needles``.
+
+    The substring test runs in SQL, so source text never reaches Python.
+
+    Args:
+        db_path: Path to graph.db.
+        needles: Substrings to look for (case-sensitive, OR-ed).
+        types: Restrict to these node types; None means all types.
+    """
+    if not needles:
+        return set()
+    query = "SELECT id FROM nodes WHERE (" + " OR ".join(
+        [f"instr({_source_sql('nodes')}, ?) > 0"] * len(needles)
+    ) + ")"
+    params: list[str] = list(needles)
+    if types:
+        query += f" AND type IN ({','.join('?' * len(types))})"
+        params.extend(types)
+    with _connect(db_path) as conn:
+        _ensure_source_blobs(conn)
+        conn.row_factory = None
+        return {row[0] for row in conn.execute(query, params)}
+
+
 def get_node(node_id: str, db_path: Path) -> Node | None:
     """Retrieve a single node by ID."""
     with _connect(db_path) as conn:
-        row = conn.execute("SELECT * FROM nodes WHERE id = ?", (node_id,)).fetchone()
-        if row:
-            return Node.from_dict(dict(row))
+        rows = conn.execute("SELECT * FROM nodes WHERE id = ?", (node_id,)).fetchall()
+        if rows:
+            return _rows_to_nodes(conn, rows)[0]
     return None
 
 
+def get_nodes_by_ids(
+    node_ids: Iterable[str],
+    db_path: Path,
+    include_source: bool = True,
+) -> dict[str, Node]:
+    """Fetch many nodes over one connection, in chunked ``IN`` queries.
+
+    Args:
+        node_ids: IDs to look up; unknown IDs are left out of the result.
+        db_path: Path to graph.db.
+        include_source: Also read ``source_code``. Without it the column is
+            never loaded and returned nodes carry an empty source (their
+            ``hash`` is still the stored one).
+
+    Returns:
+        {node_id: Node} for the IDs that exist.
+    """
+    ids = list(dict.fromkeys(node_ids))
+    if not ids:
+        return {}
+    columns = "*" if include_source else ", ".join(
+        c for c in _NODE_COLUMNS if c != "source_code"
+    )
+    result: dict[str, Node] = {}
+    with _connect(db_path) as conn:
+        for start in range(0, len(ids), _MAX_SQL_PARAMS):
+            chunk = ids[start:start + _MAX_SQL_PARAMS]
+            placeholders = ",".join("?" * len(chunk))
+            rows = conn.execute(
+                f"SELECT {columns} FROM nodes WHERE id IN ({placeholders})", chunk
+            ).fetchall()
+            if include_source:
+                result.update((n.id, n) for n in _rows_to_nodes(conn, rows))
+                continue
+            for row in rows:
+                data = dict(row)
+                data["source_code"] = ""
+                result[data["id"]] = Node.from_dict(data)
+    logger.debug(
+        "get_nodes_by_ids: %d ids, %d found, %d queries",
+        len(ids), len(result), -(-len(ids) // _MAX_SQL_PARAMS),
+    )
+    return result
+
+
 def get_nodes(
     db_path: Path,
     type_filter: str | None = None,
     file_filter: str | None = None,
     name_filter: str | None = None,
+    include_source: bool = True,
 ) -> list[Node]:
-    """List nodes with optional filters."""
-    query = "SELECT * FROM nodes WHERE 1=1"
+    """List nodes with optional filters.
+
+    Without ``include_source`` the source column is never loaded and the
+    returned nodes carry an empty source.
+    """
+    columns = "*" if include_source else ", ".join(
+        c for c in _NODE_COLUMNS if c != "source_code"
+    )
+    query = f"SELECT {columns} FROM nodes WHERE 1=1"
     params: list = []
 
     if type_filter:
@@ -463,7 +1331,37 @@ def get_nodes(
 
     with _connect(db_path) as conn:
         rows = conn.execute(query, params).fetchall()
-        return [Node.from_dict(dict(r)) for r in rows]
+        if include_source:
+            return _rows_to_nodes(conn, rows)
+        return [Node.from_dict({**r, "source_code": ""}) for r in map(dict, rows)]
+
+
+def get_child_nodes(
+    parent_id: str,
+    db_path: Path,
+    types: tuple[str, ...] | None = None,
+) -> list[Node]:
+    """Direct children of a node (IDs exactly one dotted level deeper).
+
+    Args:
+        parent_id: ID of the enclosing class or module.
+        db_path: Path to graph.db.
+        types: Restrict to these node types; None means all types.
+
+    Returns:
+        Child nodes ordered by start line.
+    """
+    query = "SELECT * FROM nodes WHERE parent_id = ?"
+    params: list[str] = [parent_id]
+    if types:
+        query += f" AND type IN ({','.join('?' * len(types))})"
+        params.extend(types)
+    query += " ORDER BY start_line"
+
+    with _connect(db_path) as conn:
+        _ensure_parent_index(conn)
+        rows = conn.execute(query, params).fetchall()
+        return _rows_to_nodes(conn, rows)
 
 
 def get_edges(
@@ -496,21 +1394,37 @@ def get_edges(
 def update_node_source(node_id: str, new_source: str, new_hash: str, db_path: Path) -> bool:
     """Update a node's source code and hash in the database."""
     with _connect(db_path) as conn:
+        _bump_generation(conn)
+        _ensure_source_blobs(conn)
+        row = conn.execute(
+            "SELECT source_blob FROM nodes WHERE id = ?", (node_id,)
+        ).fetchone()
         cursor = conn.execute(
-            "UPDATE nodes SET source_code = ?, hash = ? WHERE id = ?",
+            "UPDATE nodes SET source_code = ?, source_blob = NULL, hash = ? WHERE id = ?",
             (new_source, new_hash, node_id),
         )
+        if row is not None:
+            _prune_source_blobs(conn, [row[0]])
         return cursor.rowcount > 0
 
 
 def delete_node(node_id: str, db_path: Path) -> bool:
     """Delete a node and its connected edges."""
     with _connect(db_path) as conn:
+        _bump_generation(conn)
+        _ensure_source_blobs(conn)
         conn.execute(
             "DELETE FROM edges WHERE from_node = ? OR to_node = ?",
             (node_id, node_id),
         )
+        row = conn.execute(
+            "SELECT source_blob FROM nodes WHERE id = ?", (node_id,)
+        ).fetchone()
         cursor = conn.execute("DELETE FROM nodes WHERE id = ?", (node_id,))
+        if row is not None:
+            _prune_source_blobs(conn, [row[0]])
+        _ensure_suffix_index(conn)
+        conn.execute("DELETE FROM node_suffixes WHERE node_id = ?", (node_id,))
         return cursor.rowcount > 0
 
 
@@ -533,6 +1447,7 @@ def save_annotation(
             return False
 
         current_hash = row["hash"]
+        _bump_generation(conn)
 
         # Update annotations
         cursor = conn.execute(
@@ -629,12 +1544,13 @@ def resolve_node_id(
 ) -> tuple[str | None, list[str]]:
     """Resolve a fuzzy query to an exact node_id.
 
-    Strategy chain (stops at first match):
-      1. Exact match:   WHERE id = ?
-      2. Suffix match:  WHERE id LIKE '%.<query>'
+    Strategy chain (stops at first match), each step an index lookup:
+      1. Exact match:    nodes primary key
+      2. Suffix match:   node_suffixes (dotted tails of every ID)
          (e.g. "auth.login" -> "backend.routers.auth.login")
-      3. Contains match: WHERE id LIKE '%<query>%'
-      4. Name match:    WHERE name = ?             (e.g. "login" → node whose name == "login")
+      3. Contains match: trigram index over IDs (LIKE scan for queries
+         shorter than 3 characters)
+      4. Name match:     idx_nodes_name (e.g. "login" → node whose name == "login")
 
     Returns:
         (resolved_id, [])           — unique match found
@@ -648,9 +1564,11 @@ def resolve_node_id(
             return row[0], []
 
         # 2. Suffix match (qualified tail, e.g. "auth.login")
+        _ensure_suffix_index(conn)
         rows = conn.execute(
-            "SELECT id FROM nodes WHERE id LIKE ? ORDER BY length(id)",
-            (f"%.{query}",),
+            """SELECT node_id FROM node_suffixes WHERE suffix = ?
+               ORDER BY length(node_id), node_id""",
+            (query,),
         ).fetchall()
         ids = [r[0] for r in rows]
         if len(ids) == 1:
@@ -659,10 +1577,19 @@ def resolve_node_id(
             return None, ids[:max_suggestions]
 
         # 3. Contains match
-        rows = conn.execute(
-            "SELECT id FROM nodes WHERE id LIKE ? ORDER BY length(id)",
-            (f"%{query}%",),
-        ).fetchall()
+        if len(query) >= 3 and _ensure_fts(conn):
+            rows = conn.execute(
+                """SELECT nodes.id FROM nodes_fts
+                   JOIN nodes ON nodes.rowid = nodes_fts.rowid
+                   WHERE nodes_fts MATCH ?
+                   ORDER BY length(nodes.id), nodes.id""",
+                ("id : " + _fts_phrase(query),),
+            ).fetchall()
+        else:
+            rows = conn.execute(
+                "SELECT id FROM nodes WHERE id LIKE ? ORDER BY length(id), id",
+                (f"%{query}%",),
+            ).fetchall()
         ids = [r[0] for r in rows]
         if len(ids) == 1:
             return ids[0], []
@@ -671,7 +1598,7 @@ def resolve_node_id(
 
         # 4. Name match (unqualified function name)
         rows = conn.execute(
-            "SELECT id FROM nodes WHERE name = ? ORDER BY length(id)",
+            "SELECT id FROM nodes WHERE name = ? ORDER BY length(id), id",
             (query,),
         ).fetchall()
         ids = [r[0] for r in rows]
@@ -683,28 +1610,162 @@ def resolve_node_id(
     return None, []
 
 
-def search_nodes(query: str, db_path: Path, search_in: str = "all") -> list[Node]:
-    """Search nodes by name, code, or docstring."""
-    conditions = []
-    params = []
-    pattern = f"%{query}%"
+def _fts_phrase(text: str) -> str:
+    """Quote ``text`` as one FTS5 phrase (a substring match under trigram)."""
+    return '"' + text.replace('"', '""') + '"'
 
-    if search_in in ("name", "all"):
-        conditions.append("name LIKE ?")
-        params.append(pattern)
-    if search_in in ("code", "all"):
-        conditions.append("source_code LIKE ?")
-        params.append(pattern)
-    if search_in in ("docstring", "all"):
-        conditions.append("docstring LIKE ?")
-        params.append(pattern)
 
-    where = " OR ".join(conditions)
-    sql = f"SELECT * FROM nodes WHERE {where} ORDER BY file_path, start_line"
+def search_nodes(
+    query: str, db_path: Path, search_in: str = "all", limit: int | None = None,
+) -> list[Node]:
+    """Search nodes by name, code, or docstring.
+
+    Case-insensitive substring match. Queries of 3+ characters use the
+    trigram index and come back ranked: exact name matches first, then by
+    bm25 with names weighted above signatures, docstrings and code.
+    Shorter queries fall back to a LIKE scan ordered by location.
+
+    Args:
+        query: Text to look for.
+        search_in: "name", "code", "docstring" or "all" (also signatures).
+        limit: Maximum number of nodes to return (None = all).
+    """
+    columns = {
+        "name": ["name"],
+        "code": ["source_code"],
+        "docstring": ["docstring"],
+    }.get(search_in, list(_FTS_COLUMNS[1:]))
+    sql_limit = -1 if limit is None else limit
 
     with _connect(db_path) as conn:
-        rows = conn.execute(sql, params).fetchall()
-        return [Node.from_dict(dict(r)) for r in rows]
+        if len(query) >= 3 and _ensure_fts(conn):
+            rows = conn.execute(
+                f"""SELECT nodes.* FROM nodes_fts
+                    JOIN nodes ON nodes.rowid = nodes_fts.rowid
+                    WHERE nodes_fts MATCH ?
+                    ORDER BY nodes.name = ? COLLATE NOCASE DESC,
+                             bm25(nodes_fts, {_FTS_WEIGHTS}), nodes.id
+                    LIMIT ?""",
+                (
+                    "{" + " ".join(columns) + "} : " + _fts_phrase(query),
+                    query,
+                    sql_limit,
+                ),
+            ).fetchall()
+        else:
+            _ensure_source_blobs(conn)
+            where = " OR ".join(
+                f"{_source_sql('nodes') if col == 'source_code' else col} LIKE ?"
+                for col in columns
+            )
+            rows = conn.execute(
+                f"""SELECT * FROM nodes WHERE {where}
+                    ORDER BY file_path, start_line LIMIT ?""",
+                [f"%{query}%"] * len(columns) + [sql_limit],
+            ).fetchall()
+        return _rows_to_nodes(conn, rows)
+
+
+def find_files_containing(db_path: Path, text: str) -> set[str] | None:
+    """Files whose indexed source contains ``text`` (case-insensitive).
+
+    A superset filter for grep-style scans: module nodes carry the whole
+    file, so a file missing from the result cannot contain ``text``.
+    Returns None when the index cannot answer (``text`` shorter than 3
+    characters or no FTS5 support).
+    """
+    if len(text) < 3:
+        return None
+    with _connect(db_path) as conn:
+        if not _ensure_fts(conn):
+            return None
+        rows = conn.execute(
+            """SELECT DISTINCT nodes.file_path FROM nodes_fts
+               JOIN nodes ON nodes.rowid = nodes_fts.rowid
+               WHERE nodes_fts MATCH ?""",
+            ("source_code : " + _fts_phrase(text),),
+        ).fetchall()
+    return {row[0] for row in rows}
+
+
+# -- Parse cache --
+
+def get_parse_cache_entries(
+    keys: dict[str, str], db_path: Path,
+) -> dict[str, tuple[list[dict], list[dict], Any]]:
+    """Look up cached per-file parse results.
+
+    Args:
+        keys: Mapping of relative file path -> current cache key.
+
+    Returns:
+        {file_path: (node_dicts, edge_dicts, parser_state)} for every file
+        whose stored key matches.  Stale entries are ignored.
+    """
+    if not keys:
+        return {}
+    hits: dict[str, tuple[list[dict], list[dict], Any]] = {}
+    paths = list(keys)
+    with _connect(db_path) as conn:
+        conn.executescript(_PARSE_CACHE_SCHEMA)
+        for start in range(0, len(paths), _MAX_SQL_PARAMS):
+            chunk = paths[start:start + _MAX_SQL_PARAMS]
+            placeholders = ",".join("?" * len(chunk))
+            for row in conn.execute(
+                f"""SELECT file_path, cache_key, nodes, edges, state FROM parse_cache
+                    WHERE file_path IN ({placeholders})""",
+                chunk,
+            ):
+                if keys[row["file_path"]] != row["cache_key"]:
+                    continue
+                state = json.loads(row["state"]) if row["state"] else None
+                hits[row["file_path"]] = (
+                    json.loads(row["nodes"]), json.loads(row["edges"]), state,
+                )
+    return hits
+
+
+def save_parse_cache_entries(
+    entries: list[tuple[str, str, list[dict], list[dict], Any]], db_path: Path,
+) -> None:
+    """Store per-file parse results, replacing older entries for the same file.
+
+    Args:
+        entries: (file_path, cache_key, node_dicts, edge_dicts, parser_state).
+    """
+    if not entries:
+        return
+    with _connect(db_path) as conn:
+        conn.executescript(_PARSE_CACHE_SCHEMA)
+        conn.executemany(
+            """INSERT OR REPLACE INTO parse_cache
+               (file_path, cache_key, nodes, edges, state)
+               VALUES (?, ?, ?, ?, ?)""",
+            [
+                (
+                    path, key, json.dumps(nodes), json.dumps(edges),
+                    json.dumps(state) if state is not None else None,
+                )
+                for path, key, nodes, edges, state in entries
+            ],
+        )
+
+
+def prune_parse_cache(keep: set[str], db_path: Path) -> int:
+    """Drop cache entries for files not in ``keep``. Returns rows deleted."""
+    with _connect(db_path) as conn:
+        conn.executescript(_PARSE_CACHE_SCHEMA)
+        conn.execute("DROP TABLE IF EXISTS temp.keep_paths")
+        conn.execute("CREATE TEMP TABLE keep_paths (file_path TEXT PRIMARY KEY)")
+        conn.executemany(
+            "INSERT OR IGNORE INTO keep_paths VALUES (?)", ((p,) for p in keep),
+        )
+        cursor = conn.execute(
+            """DELETE FROM parse_cache
+               WHERE file_path NOT IN (SELECT file_path FROM keep_paths)"""
+        )
+        conn.execute("DROP TABLE keep_paths")
+    return cursor.rowcount
 
 
 # -- Resolution cache --
@@ -237,15 +237,16 @@ def _check_tsconfig(report: DoctorReport) -> None:
             )
     else:
         # Check if there are any TS files
-        ts_files = list(report.project_root.glob("**/*.ts"))
-        tsx_files = list(report.project_root.glob("**/*.tsx"))
-        if ts_files or tsx_files:
+        from lenspr.scanner import FileScanner
+
+        ts_files = FileScanner(report.project_root).scan({".ts", ".tsx"})
+        if ts_files:
             report.checks.append(
                 CheckResult(
                     name="tsconfig.json",
                     status="warning",
                     message="Not found",
-                    details=f"Found {len(ts_files) + len(tsx_files)} TypeScript files",
+                    details=f"Found {len(ts_files)} TypeScript files",
                     recommendation="Create tsconfig.json for better resolution",
                 )
             )
@@ -254,7 +255,6 @@ def _check_tsconfig(report: DoctorReport) -> None:
 def _check_jsconfig(report: DoctorReport) -> None:
     """Check for jsconfig.json."""
     jsconfig = report.project_root / "jsconfig.json"
-    tsconfig = report.project_root / "tsconfig.json"
 
     if jsconfig.exists():
         report.checks.append(
@@ -264,13 +264,7 @@ def _check_jsconfig(report: DoctorReport) -> None:
                 message="Found",
             )
         )
-    elif not tsconfig.exists():
-        # Check if there are any JS files
-        js_files = list(report.project_root.glob("**/*.js"))
-        jsx_files = list(report.project_root.glob("**/*.jsx"))
-        if js_files or jsx_files:
-            # This is informational, not a warning
-            pass  # JS files work without jsconfig
+    # Without either config, JS files still work: nothing to report
 
 
 def _check_node_modules(report: DoctorReport) -> None:
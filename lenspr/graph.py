@@ -1,10 +1,26 @@
-"""In-memory graph operations using NetworkX."""
+"""In-memory graph operations using NetworkX.
+
+Read-only analyses also accept a ``CSRGraph`` (see ``lenspr.csr_graph``),
+which implements the subset of the ``DiGraph`` API they use.
+
+NetworkX itself is imported by the functions that build or search a
+graph, so tool modules can import this one without paying for it.
+"""
 
 from __future__ import annotations
 
-import networkx as nx
+import sys
+from collections.abc import Iterable
+from typing import TYPE_CHECKING
+
+from lenspr.csr_graph import CSRGraph
+from lenspr.models import Edge, EdgeType, GraphDelta, Node, NodeType
+
+if TYPE_CHECKING:
+    import networkx as nx
 
-from lenspr.models import Edge, EdgeType, Node
+    # Either backend; analyses below only use the shared read API.
+    GraphLike = nx.DiGraph | CSRGraph
 
 
 def build_graph(nodes: list[Node], edges: list[Edge]) -> nx.DiGraph:
@@ -14,6 +30,8 @@ def build_graph(nodes: list[Node], edges: list[Edge]) -> nx.DiGraph:
     Node attributes include all Node fields.
     Edge attributes include all Edge fields.
     """
+    import networkx as nx
+
     G: nx.DiGraph = nx.DiGraph()
 
     for node in nodes:
@@ -31,7 +49,164 @@ def build_graph(nodes: list[Node], edges: list[Edge]) -> nx.DiGraph:
     return G
 
 
-def get_impact_zone(G: nx.DiGraph, node_id: str, depth: int = 2) -> dict:
+def build_lean_graph(node_rows: list[tuple], edge_rows: list[tuple]) -> nx.DiGraph:
+    """
+    Build a compact graph from ``database.load_graph_lean`` rows.
+
+    Nodes carry only structural attributes (ID, type, name, file, line span,
+    signature and the ``has_docstring`` / ``exports_all`` flags); source,
+    docstrings, metadata and annotations stay in SQLite and are read from
+    there on demand.  Edges keep type, confidence, source, line number and
+    untracked reason.  IDs, file paths and enum values are interned so the
+    adjacency dicts share one string object per value.
+    """
+    import networkx as nx
+
+    G: nx.DiGraph = nx.DiGraph(lean=True)
+
+    for row in node_rows:
+        attrs = _lean_node_attrs(*row)
+        G.add_node(attrs["id"], **attrs)
+
+    for from_node, to_node, *edge_attrs in edge_rows:
+        G.add_edge(
+            sys.intern(from_node),
+            sys.intern(to_node),
+            **_lean_edge_attrs(*edge_attrs),
+        )
+
+    return G
+
+
+def _lean_node_attrs(
+    node_id: str,
+    node_type: str,
+    name: str,
+    qualified_name: str,
+    file_path: str,
+    start_line: int,
+    end_line: int,
+    signature: str | None,
+    has_docstring: bool,
+    exports_all: bool,
+) -> dict:
+    return {
+        "id": sys.intern(node_id),
+        "type": sys.intern(node_type),
+        "name": name,
+        "qualified_name": qualified_name,
+        "file_path": sys.intern(file_path),
+        "start_line": start_line,
+        "end_line": end_line,
+        "signature": signature,
+        "has_docstring": bool(has_docstring),
+        "exports_all": bool(exports_all),
+    }
+
+
+def _lean_edge_attrs(
+    edge_type: str,
+    confidence: str,
+    source: str,
+    line_number: int | None,
+    untracked_reason: str | None,
+) -> dict:
+    return {
+        "type": sys.intern(edge_type),
+        "confidence": sys.intern(confidence),
+        "source": sys.intern(source),
+        "line_number": line_number,
+        "untracked_reason": untracked_reason,
+    }
+
+
+def _node_attrs(G: nx.DiGraph, node: Node) -> dict:
+    if not G.graph.get("lean"):
+        return node.to_dict()
+    return _lean_node_attrs(
+        node.id, node.type.value, node.name, node.qualified_name, node.file_path,
+        node.start_line, node.end_line, node.signature, bool(node.docstring),
+        node.type == NodeType.MODULE and "__all__" in node.source_code,
+    )
+
+
+def _edge_attrs(G: nx.DiGraph, edge: Edge) -> dict:
+    if not G.graph.get("lean"):
+        return edge.to_dict()
+    return _lean_edge_attrs(
+        edge.type.value, edge.confidence.value, edge.source.value,
+        edge.line_number, edge.untracked_reason,
+    )
+
+
+def estimate_graph_memory(G: nx.DiGraph) -> int:
+    """Approximate bytes held by the graph's adjacency and attribute dicts.
+
+    Counts each distinct object once, so interned strings shared across
+    nodes and edges are not double-counted.
+    """
+    seen: set[int] = set()
+    total = 0
+
+    def add(obj: object) -> None:
+        nonlocal total
+        if id(obj) not in seen:
+            seen.add(id(obj))
+            total += sys.getsizeof(obj)
+
+    for nid, data in G.nodes(data=True):
+        add(nid)
+        add(data)
+        for value in data.values():
+            add(value)
+    for adjacency in (G.succ, G.pred):
+        for nid, neighbours in adjacency.items():
+            add(neighbours)
+            for other, data in neighbours.items():
+                add(other)
+                add(data)
+                for value in data.values():
+                    add(value)
+    return total
+
+
+def apply_delta(G: nx.DiGraph, delta: GraphDelta) -> None:
+    """
+    Patch a graph built by ``build_graph`` or ``build_lean_graph`` with one
+    sync's changes.
+
+    Produces the same graph a full rebuild from the database would: removed
+    nodes that still have edges stay as attribute-less endpoints, and
+    endpoints left without attributes or edges are dropped.
+    """
+    touched: set[str] = set()
+
+    for node_id in delta.removed_node_ids:
+        if node_id in G:
+            G.nodes[node_id].clear()
+            touched.add(node_id)
+
+    for node in delta.nodes:
+        if node.id in G:
+            G.nodes[node.id].clear()
+        G.add_node(node.id, **_node_attrs(G, node))
+
+    for (from_node, to_node), edge in delta.edges.items():
+        if edge is None:
+            if G.has_edge(from_node, to_node):
+                G.remove_edge(from_node, to_node)
+            touched.update((from_node, to_node))
+        else:
+            if G.has_edge(from_node, to_node):
+                G.edges[from_node, to_node].clear()
+            G.add_edge(from_node, to_node, **_edge_attrs(G, edge))
+
+    for node_id in touched:
+        if node_id in G and not G.nodes[node_id] and G.degree(node_id) == 0:
+            G.remove_node(node_id)
+
+
+def get_impact_zone(G: GraphLike, node_id: str, depth: int = 2) -> dict:
     """
     Find all nodes that could be affected by changing a given node.
 
@@ -101,7 +276,7 @@ def get_impact_zone(G: nx.DiGraph, node_id: str, depth: int = 2) -> dict:
     }
 
 
-def get_dependency_tree(G: nx.DiGraph, node_id: str, max_depth: int = 3) -> dict:
+def get_dependency_tree(G: GraphLike, node_id: str, max_depth: int = 3) -> dict:
     """
     Get tree of what this node depends on (outgoing edges).
 
@@ -125,23 +300,24 @@ def get_dependency_tree(G: nx.DiGraph, node_id: str, max_depth: int = 3) -> dict
     return _build(node_id, max_depth, set())
 
 
-def find_dead_code(G: nx.DiGraph, entry_points: list[str]) -> list[str]:
+def find_dead_code(
+    G: GraphLike,
+    entry_points: list[str],
+    reachable: set[str] | None = None,
+) -> list[str]:
     """
     Find nodes not reachable from any entry point.
 
     Args:
         entry_points: Node IDs that are known entry points
                      (main(), API endpoints, CLI commands, test functions).
+        reachable: Precomputed ``reachable_from(G, entry_points)``, e.g. the
+                   copy cached by ``LensContext.get_reachable``.
     """
-    reachable: set[str] = set()
+    if reachable is None:
+        reachable = reachable_from(G, entry_points)
 
-    for ep in entry_points:
-        if ep in G:
-            reachable.update(nx.descendants(G, ep))
-            reachable.add(ep)
-
-    all_nodes = set(G.nodes)
-    unreachable = all_nodes - reachable
+    unreachable = set(G.nodes) - reachable
 
     # Filter: only return nodes that are actual code (not external modules)
     return [
@@ -150,23 +326,58 @@ def find_dead_code(G: nx.DiGraph, entry_points: list[str]) -> list[str]:
     ]
 
 
-def find_path(G: nx.DiGraph, from_id: str, to_id: str) -> list[str]:
+def reachable_from(G: GraphLike, sources: Iterable[str]) -> set[str]:
+    """Sources present in ``G`` plus every node reachable from them.
+
+    One traversal with a shared visited set, however many sources there
+    are, so overlapping subgraphs are walked once.
+    """
+    if isinstance(G, CSRGraph):
+        return G.reachable(sources)
+    succ = G.succ
+    seen = {s for s in sources if s in succ}
+    stack = list(seen)
+    while stack:
+        for nbr in succ[stack.pop()]:
+            if nbr not in seen:
+                seen.add(nbr)
+                stack.append(nbr)
+    return seen
+
+
+def find_path(G: GraphLike, from_id: str, to_id: str) -> list[str]:
     """Find shortest path between two nodes. Returns empty list if no path."""
+    import networkx as nx
+
     try:
+        if isinstance(G, CSRGraph):
+            return G.shortest_path(from_id, to_id)
         return list(nx.shortest_path(G, from_id, to_id))
     except (nx.NodeNotFound, nx.NetworkXNoPath):
         return []
 
 
+def descendants(G: GraphLike, node_id: str) -> set[str]:
+    """All nodes reachable from ``node_id``, excluding itself (``nx.descendants``)."""
+    if isinstance(G, CSRGraph):
+        return G.reachable([node_id]) - {node_id}
+    import networkx as nx
+
+    return nx.descendants(G, node_id)
 
 
-def detect_circular_imports(G: nx.DiGraph) -> list[list[str]]:
+def detect_circular_imports(G: GraphLike) -> list[list[str]]:
     """Find circular import chains in the graph."""
+    import networkx as nx
+
     # Build subgraph with only import edges
-    import_edges = [
-        (u, v) for u, v, d in G.edges(data=True)
-        if d.get("type") == EdgeType.IMPORTS.value
-    ]
+    if isinstance(G, CSRGraph):
+        import_edges = G.edges_of_kind(EdgeType.IMPORTS.value)
+    else:
+        import_edges = [
+            (u, v) for u, v, d in G.edges(data=True)
+            if d.get("type") == EdgeType.IMPORTS.value
+        ]
     import_graph = nx.DiGraph(import_edges)
 
     cycles = []
@@ -178,7 +389,7 @@ def detect_circular_imports(G: nx.DiGraph) -> list[list[str]]:
 
 
 def get_structure(
-    G: nx.DiGraph,
+    G: GraphLike,
     max_depth: int = 2,
     mode: str = "full",
     limit: int = 100,
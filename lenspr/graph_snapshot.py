@@ -0,0 +1,202 @@
+"""Binary snapshot of the lean graph for fast startup.
+
+Rebuilding the lean graph from graph.db means materialising every node and
+edge row through SQLite and re-interning its strings; on large projects
+that dominates the MCP server's first tool call.  A snapshot stores the
+same graph in a compact little-endian file that is memory-mapped and
+decoded with ``struct.iter_unpack``:
+
+- a header with a magic, the format version and the graph.db write
+  generation the graph reflects (see ``database.get_graph_generation``);
+- a string table: every distinct ID, name, path, signature and enum value,
+  UTF-8 encoded and NUL-separated, referenced by index everywhere else
+  (index 0 stands for None);
+- one fixed-width record per node (string indices, line span, flags) in
+  graph order, including attribute-less edge endpoints;
+- one fixed-width record per edge (endpoint node indices, string indices,
+  line number), grouped by source node in adjacency order.
+
+A snapshot is only used when its generation matches graph.db's, so any
+write the graph did not see makes the loader fall back to SQLite.
+"""
+
+from __future__ import annotations
+
+import gc
+import logging
+import mmap
+import os
+import struct
+import sys
+from pathlib import Path
+from typing import Any
+
+import networkx as nx
+
+logger = logging.getLogger(__name__)
+
+_MAGIC = b"LPRGRAPH"
+_VERSION = 1
+# magic, version, generation, string count, string table bytes, nodes, edges
+_HEADER = struct.Struct("<8sIQIIII")
+# id, type, name, qualified_name, file_path, signature, start, end, flags
+_NODE = struct.Struct("<6I2iI")
+# from, to (node indices), type, confidence, source, untracked_reason, line
+_EDGE = struct.Struct("<6Ii")
+
+_NO_LINE = -(2**31)  # line_number of None
+
+_HAS_ATTRS = 1
+_HAS_DOCSTRING = 2
+_EXPORTS_ALL = 4
+
+
+def write_snapshot(graph: nx.DiGraph, generation: int, path: Path) -> None:
+    """Write ``graph`` (a lean graph) to ``path`` atomically.
+
+    Args:
+        graph: Graph built by ``graph.build_lean_graph`` (or patched since).
+        generation: graph.db write generation ``graph`` reflects.
+        path: Snapshot file; replaced, never left half-written.
+    """
+    strings: dict[str, int] = {}  # string -> index; 0 is None
+
+    def ref(value: str | None) -> int:
+        if value is None:
+            return 0
+        index = strings.get(value)
+        if index is None:
+            index = strings[value] = len(strings) + 1
+        return index
+
+    node_index = {nid: i for i, nid in enumerate(graph)}
+    node_records = bytearray()
+    for nid, data in graph.nodes(data=True):
+        if not data:
+            node_records += _NODE.pack(ref(nid), 0, 0, 0, 0, 0, 0, 0, 0)
+            continue
+        flags = (
+            _HAS_ATTRS
+            | (_HAS_DOCSTRING if data.get("has_docstring") else 0)
+            | (_EXPORTS_ALL if data.get("exports_all") else 0)
+        )
+        node_records += _NODE.pack(
+            ref(nid), ref(data["type"]), ref(data["name"]), ref(data["qualified_name"]),
+            ref(data["file_path"]), ref(data["signature"]),
+            data["start_line"], data["end_line"], flags,
+        )
+
+    edge_records = bytearray()
+    for from_node, to_node, data in graph.edges(data=True):
+        line = data.get("line_number")
+        edge_records += _EDGE.pack(
+            node_index[from_node], node_index[to_node],
+            ref(data.get("type")), ref(data.get("confidence")), ref(data.get("source")),
+            ref(data.get("untracked_reason")),
+            _NO_LINE if line is None else line,
+        )
+
+    table = "\0".join(["", *strings]).encode("utf-8")
+    header = _HEADER.pack(
+        _MAGIC, _VERSION, generation, len(strings) + 1, len(table),
+        graph.number_of_nodes(), graph.number_of_edges(),
+    )
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with open(tmp, "wb") as f:
+        f.write(header)
+        f.write(table)
+        f.write(node_records)
+        f.write(edge_records)
+    os.replace(tmp, path)
+
+
+def read_snapshot(path: Path, generation: int) -> nx.DiGraph | None:
+    """Load the lean graph stored at ``path``.
+
+    Returns:
+        The graph, or None if there is no usable snapshot: missing,
+        corrupt, another format version, or written at a generation other
+        than ``generation``.
+    """
+    # Decoding allocates a dict per node and edge, none of them garbage:
+    # keep the cyclic collector from rescanning them as they pile up
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return _decode(mm, generation)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError, struct.error, UnicodeDecodeError, IndexError) as e:
+        logger.info("Ignoring unreadable graph snapshot %s: %s", path, e)
+        return None
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+
+def _decode(mm: mmap.mmap, generation: int) -> nx.DiGraph | None:
+    magic, version, snap_generation, n_strings, table_size, n_nodes, n_edges = (
+        _HEADER.unpack_from(mm, 0)
+    )
+    if magic != _MAGIC or version != _VERSION:
+        return None
+    if snap_generation != generation:
+        logger.debug(
+            "Graph snapshot at generation %d, graph.db at %d", snap_generation, generation,
+        )
+        return None
+    nodes_at = _HEADER.size + table_size
+    edges_at = nodes_at + n_nodes * _NODE.size
+    if len(mm) != edges_at + n_edges * _EDGE.size:
+        raise ValueError("truncated snapshot")
+
+    table = mm[_HEADER.size:nodes_at].decode("utf-8")
+    strings: list[Any] = [sys.intern(s) for s in table.split("\0")]
+    if len(strings) != n_strings:
+        raise ValueError("string table size mismatch")
+    strings[0] = None
+
+    ids: list[str] = []
+    node_items: list[tuple[str, dict[str, Any]]] = []
+    for nid, ntype, name, qname, file_path, signature, start, end, flags in (
+        _NODE.iter_unpack(mm[nodes_at:edges_at])
+    ):
+        node_id = strings[nid]
+        ids.append(node_id)
+        if not flags & _HAS_ATTRS:
+            node_items.append((node_id, {}))
+            continue
+        node_items.append((node_id, {
+            "id": node_id,
+            "type": strings[ntype],
+            "name": strings[name],
+            "qualified_name": strings[qname],
+            "file_path": strings[file_path],
+            "start_line": start,
+            "end_line": end,
+            "signature": strings[signature],
+            "has_docstring": bool(flags & _HAS_DOCSTRING),
+            "exports_all": bool(flags & _EXPORTS_ALL),
+        }))
+
+    graph: nx.DiGraph = nx.DiGraph(lean=True)
+    graph.add_nodes_from(node_items)
+    # Fill the adjacency dicts directly: add_edges_from re-checks both
+    # endpoints and copies every attribute dict, which is most of the cost
+    # of a load. Each edge's dict is shared by both directions, as in
+    # DiGraph itself; the graph is new, so there are no cached views to
+    # invalidate.
+    succ, pred = graph._succ, graph._pred  # type: ignore[attr-defined]
+    for u, v, etype, confidence, source, reason, line in _EDGE.iter_unpack(mm[edges_at:]):
+        from_node, to_node = ids[u], ids[v]
+        data = {
+            "type": strings[etype],
+            "confidence": strings[confidence],
+            "source": strings[source],
+            "line_number": None if line == _NO_LINE else line,
+            "untracked_reason": strings[reason],
+        }
+        succ[from_node][to_node] = data
+        pred[to_node][from_node] = data
+    return graph
@@ -0,0 +1,114 @@
+"""Per-file line-interval index over graph nodes.
+
+Answers "innermost node containing ``file:line``" with a binary search
+instead of a scan over every node in the graph.  Spans within a file are
+sorted by ``(start, -end)``; each span records its nearest enclosing span,
+so a lookup bisects to the last span starting at or before the line and
+walks outwards until one covers it.  Parsers emit properly nested spans
+(module > class > method), which makes that walk the nesting depth.
+
+Built from a ``DiGraph`` (or ``CSRGraph``) and refreshed per file when a
+sync patches the graph (see ``LensContext.get_line_index``).
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_right
+from collections.abc import Iterable
+from typing import Any
+
+
+class _FileSpans:
+    """Sorted node spans of one file with enclosing-span links."""
+
+    __slots__ = ("starts", "ends", "ids", "parents")
+
+    def __init__(self, spans: list[tuple[int, int, str]]) -> None:
+        spans.sort(key=lambda s: (s[0], -s[1], s[2]))
+        self.starts = [s[0] for s in spans]
+        self.ends = [s[1] for s in spans]
+        self.ids = [s[2] for s in spans]
+        self.parents: list[int] = []
+        stack: list[int] = []
+        for i, (_, end, _) in enumerate(spans):
+            while stack and self.ends[stack[-1]] < end:
+                stack.pop()
+            self.parents.append(stack[-1] if stack else -1)
+            stack.append(i)
+
+    def innermost(self, line: int) -> int:
+        i = bisect_right(self.starts, line) - 1
+        while i >= 0 and self.ends[i] < line:
+            i = self.parents[i]
+        return i
+
+
+class LineIndex:
+    """Innermost-node and overlap lookups by file path and line number."""
+
+    def __init__(self) -> None:
+        self._files: dict[str, _FileSpans] = {}
+        self._node_files: dict[str, str] = {}
+
+    @classmethod
+    def from_graph(cls, graph: Any) -> LineIndex:
+        index = cls()
+        by_file: dict[str, list[tuple[int, int, str]]] = {}
+        for nid, data in graph.nodes(data=True):
+            span = _span(nid, data)
+            if span is not None:
+                by_file.setdefault(data["file_path"], []).append(span)
+                index._node_files[nid] = data["file_path"]
+        index._files = {fp: _FileSpans(spans) for fp, spans in by_file.items()}
+        return index
+
+    def refresh(self, graph: Any, node_ids: Iterable[str]) -> None:
+        """Re-index the files that ``node_ids`` were in or are now in."""
+        candidates: dict[str, set[str]] = {}
+        for nid in node_ids:
+            old_file = self._node_files.pop(nid, None)
+            if old_file is not None:
+                candidates.setdefault(old_file, set())
+            new_file = graph.nodes[nid].get("file_path") if nid in graph else None
+            if new_file:
+                candidates.setdefault(new_file, set()).add(nid)
+
+        for file_path, added in candidates.items():
+            old = self._files.get(file_path)
+            spans = []
+            for nid in added.union(old.ids if old else ()):
+                data = graph.nodes[nid] if nid in graph else {}
+                span = _span(nid, data)
+                if span is not None and data["file_path"] == file_path:
+                    spans.append(span)
+                    self._node_files[nid] = file_path
+            if spans:
+                self._files[file_path] = _FileSpans(spans)
+            else:
+                self._files.pop(file_path, None)
+
+    def __contains__(self, file_path: object) -> bool:
+        """Whether any node of ``file_path`` is indexed."""
+        return file_path in self._files
+
+    def containing(self, file_path: str, line: int) -> str | None:
+        """ID of the smallest node in ``file_path`` whose span covers ``line``."""
+        spans = self._files.get(file_path)
+        if spans is None:
+            return None
+        i = spans.innermost(line)
+        return spans.ids[i] if i >= 0 else None
+
+    def overlapping(self, file_path: str, start: int, end: int) -> list[str]:
+        """IDs of nodes in ``file_path`` whose span intersects ``start..end``."""
+        spans = self._files.get(file_path)
+        if spans is None:
+            return []
+        stop = bisect_right(spans.starts, end)
+        return [spans.ids[i] for i in range(stop) if spans.ends[i] >= start]
+
+
+def _span(nid: str, data: dict) -> tuple[int, int, str] | None:
+    if not data.get("file_path"):
+        return None
+    return (data.get("start_line", 0), data.get("end_line", 0), nid)
@@ -8,9 +8,9 @@ import logging
 import sys
 import threading
 import time
+from collections.abc import Awaitable, Callable
 from pathlib import Path
-
-from mcp.server.fastmcp import FastMCP
+from typing import Any
 
 logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
 logger = logging.getLogger("lenspr.mcp")
@@ -159,8 +159,19 @@ def _start_watchdog_watcher(
     observer_cls: type,
     hot_reload: bool = False,
 ) -> None:
-    """Watchdog-based file watcher running in a daemon thread."""
+    """Watchdog-based file watcher running in a daemon thread.
+
+    Changed paths go to the context's change tracker, so reads between a
+    change and the debounced sync catch up on just those paths, and reads
+    with nothing reported skip the file scan entirely.
+    """
     import lenspr
+    from lenspr.staleness import ChangeTracker
+
+    ctx = lenspr._ctx
+    if ctx is not None and ctx.project_root != Path(project_path).resolve():
+        ctx = None  # Watching another tree: no graph to keep in sync
+    tracker = ctx.change_tracker if ctx is not None else ChangeTracker()
 
     # Debounce settings
     poll_interval_ms = 50  # Check every 50ms
@@ -170,40 +181,52 @@ def _start_watchdog_watcher(
         def __init__(self) -> None:
             self._pending_sync = False
             self._pending_reload = False
-            self._changed_files: set[str] = set()
             self._last_change_time: float = 0
             self._lock = threading.Lock()
 
+        def _track(self, path: str, is_directory: bool = False) -> None:
+            # Directories only arrive here when moved or deleted: sync_paths
+            # drops (or rescans) every file below them
+            if not (is_directory or _is_tracked_file(path)):
+                return
+            tracker.mark_dirty(path)
+            with self._lock:
+                self._pending_sync = True
+                self._last_change_time = time.time()
+                # Track if lenspr code changed (for hot-reload)
+                if hot_reload and _is_lenspr_file(path):
+                    self._pending_reload = True
+
         def on_modified(self, event: object) -> None:
-            if hasattr(event, "src_path"):
-                src_path = event.src_path  # type: ignore[union-attr]
-                if _is_tracked_file(src_path):
-                    with self._lock:
-                        self._pending_sync = True
-                        self._changed_files.add(src_path)
-                        self._last_change_time = time.time()
-                        # Track if lenspr code changed (for hot-reload)
-                        if hot_reload and _is_lenspr_file(src_path):
-                            self._pending_reload = True
+            if hasattr(event, "src_path") and not getattr(event, "is_directory", False):
+                self._track(event.src_path)  # type: ignore[union-attr]
 
         def on_created(self, event: object) -> None:
             self.on_modified(event)
 
         def on_deleted(self, event: object) -> None:
-            self.on_modified(event)
+            if hasattr(event, "src_path"):
+                self._track(event.src_path, getattr(event, "is_directory", False))  # type: ignore[union-attr]
+
+        def on_moved(self, event: object) -> None:
+            # A rename deletes the source and creates the destination
+            self.on_deleted(event)
+            if hasattr(event, "dest_path"):
+                self._track(event.dest_path, getattr(event, "is_directory", False))  # type: ignore[union-attr]
 
     handler = _SyncHandler()
     observer = observer_cls()
     observer.schedule(handler, project_path, recursive=True)
     observer.daemon = True
     observer.start()
+    if ctx is not None:
+        tracker.attach(observer.is_alive)
 
     def _sync_loop() -> None:
         while True:
             time.sleep(poll_interval_ms / 1000)  # 50ms poll interval
             should_sync = False
             should_reload = False
-            changed: set[str] = set()
 
             with handler._lock:
                 if handler._pending_sync:
@@ -212,8 +235,6 @@ def _start_watchdog_watcher(
                     if time_since_last >= debounce_ms:
                         handler._pending_sync = False
                         should_sync = True
-                        changed = handler._changed_files.copy()
-                        handler._changed_files.clear()
                 if handler._pending_reload:
                     handler._pending_reload = False
                     should_reload = True
@@ -227,10 +248,11 @@ def _start_watchdog_watcher(
                 except Exception:
                     logger.exception("Hot-reload failed")
 
-            # Then sync graph
-            if should_sync:
+            # Then sync graph: only the reported paths, no tree walk (a read
+            # may have caught up on them already)
+            if should_sync and ctx is not None:
                 try:
-                    result = lenspr.sync()
+                    result = ctx.sync_dirty()
                     total = (
                         len(result.added)
                         + len(result.modified)
@@ -238,11 +260,10 @@ def _start_watchdog_watcher(
                     )
                     if total > 0:
                         logger.info(
-                            "Auto-sync: +%d ~%d -%d (%d files changed)",
+                            "Auto-sync: +%d ~%d -%d",
                             len(result.added),
                             len(result.modified),
                             len(result.deleted),
-                            len(changed),
                         )
                         # Queue nodes for annotation
                         _add_pending_annotations(result.added + result.modified)
@@ -294,6 +315,18 @@ def _start_polling_watcher(project_path: str, hot_reload: bool = False) -> None:
     )
 
 
+def _progress_reporter(context: Any) -> Callable[[float, str], Awaitable[None]]:
+    """Progress callback sending notifications for the current tool call."""
+
+    async def report(elapsed: float, message: str) -> None:
+        try:
+            await context.report_progress(elapsed, message=message)
+        except Exception as e:  # no request context, or the client went away
+            logger.debug("Progress notification failed: %s", e)
+
+    return report
+
+
 def run_server(project_path: str, hot_reload: bool = False) -> None:
     """Initialize LensPR and start the MCP server on stdio.
 
@@ -301,7 +334,10 @@ def run_server(project_path: str, hot_reload: bool = False) -> None:
         project_path: Path to the project to analyze.
         hot_reload: Enable hot-reload of lenspr modules (for development).
     """
+    from mcp.server.fastmcp import FastMCP
+
     import lenspr
+    from lenspr.tool_executor import ProgressReporter, ToolExecutor
     from lenspr.tool_groups import load_tool_config, resolve_enabled_tools
     from lenspr.tools import enable_hot_reload
 
@@ -343,10 +379,16 @@ def run_server(project_path: str, hot_reload: bool = False) -> None:
         instructions=instructions,
     )
 
+    # Tools run on worker threads so a slow one does not block the others
+    executor = ToolExecutor(lenspr.get_context())
+
+    def _progress() -> ProgressReporter:
+        return _progress_reporter(mcp.get_context())
+
     def _tool(name: str):
         """Register tool only if its group is enabled; otherwise no-op."""
         if name in enabled_tools:
-            return mcp.tool()
+            return lambda fn: mcp.tool()(executor.wrap(name, fn, _progress))
         return lambda fn: fn
 
     # --- MCP Resources ---
@@ -508,16 +550,19 @@ def run_server(project_path: str, hot_reload: bool = False) -> None:
     def lens_search(
         query: str,
         search_in: str = "all",
+        limit: int = 50,
     ) -> str:
-        """Search nodes by name, code content, or docstring.
+        """Search nodes by name, code content, or docstring, best matches first.
 
         Args:
             query: Search query string.
             search_in: Where to search: name, code, docstring, or all.
+            limit: Maximum number of results to return.
         """
         return _tool_result("lens_search", {
             "query": query,
             "search_in": search_in,
+            "limit": limit,
         })
 
     @_tool("lens_get_structure")
@@ -1375,4 +1420,7 @@ def run_server(project_path: str, hot_reload: bool = False) -> None:
         return _tool_result("lens_trace_stats", {})
 
     logger.info("Starting LensPR MCP server for: %s", project_path)
-    mcp.run(transport="stdio")
+    try:
+        mcp.run(transport="stdio")
+    finally:
+        executor.shutdown(wait=False)
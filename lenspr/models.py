@@ -209,6 +209,11 @@ class Node:
         """Check if this node has any semantic annotations."""
         return self.summary is not None or self.role is not None
 
+    @property
+    def parent_id(self) -> str | None:
+        """ID one dotted level up (enclosing class/module), None at top level."""
+        return self.id.rsplit(".", 1)[0] if "." in self.id else None
+
     @property
     def is_annotation_stale(self) -> bool:
         """Check if annotation was made on older version of source."""
@@ -421,6 +426,29 @@ class SyncResult:
     added: list[Node] = field(default_factory=list)
     modified: list[Node] = field(default_factory=list)
     deleted: list[Node] = field(default_factory=list)
+    # Files whose mtime or size changed but whose content hash did not
+    # (git checkout, touch, a formatter that left them alone): not reparsed
+    touched_unchanged: int = 0
+
+
+@dataclass
+class GraphDelta:
+    """Changes one file's ``database.sync_file``/``sync_files`` sync made to graph.db.
+
+    Carries enough state to patch a live NetworkX graph in place
+    (``graph.apply_delta``) instead of reloading it.
+    """
+
+    # Current rows of the file's nodes (annotations included)
+    nodes: list[Node] = field(default_factory=list)
+    removed_node_ids: list[str] = field(default_factory=list)
+    # Every (from_node, to_node) pair the sync touched -> the edge that now
+    # wins for that pair on a full load (last row), or None if none is left
+    edges: dict[tuple[str, str], Edge | None] = field(default_factory=dict)
+    # added, modified, deleted, unchanged, edges_refreshed
+    counts: dict[str, int] = field(default_factory=dict)
+    # graph.db write generation before this sync (it leaves base + 1)
+    base_generation: int = 0
 
 
 @dataclass
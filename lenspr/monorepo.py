@@ -53,29 +53,11 @@ def find_packages(root_path: Path) -> MonorepoInfo:
     """
     info = MonorepoInfo()
 
-    # Skip these directories
-    skip_dirs = {
-        "node_modules",
-        ".git",
-        ".lens",
-        ".venv",
-        "venv",
-        "dist",
-        "build",
-        ".next",
-        ".nuxt",
-        "coverage",
-        "__pycache__",
-    }
-
-    def should_skip(path: Path) -> bool:
-        return any(part in skip_dirs for part in path.parts)
-
-    # Find all package.json files
-    for package_json in root_path.rglob("package.json"):
-        if should_skip(package_json.relative_to(root_path)):
-            continue
+    from lenspr.scanner import FileScanner
 
+    # Find all package.json files outside ignored directories
+    for entry in FileScanner(root_path).scan(names=["package.json"]):
+        package_json = root_path / entry.path
         package_dir = package_json.parent
         node_modules = package_dir / "node_modules"
 
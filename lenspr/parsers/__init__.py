@@ -1,17 +1,24 @@
-"""LensPR parsers: language-specific code-to-graph converters."""
+"""LensPR parsers: language-specific code-to-graph converters.
+
+The parser classes are imported on first access (see ``__getattr__``):
+the Python parser pulls in Jedi and the TypeScript parser tree-sitter.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
 
 from lenspr.parsers.base import BaseParser
-from lenspr.parsers.multi import MultiParser
-from lenspr.parsers.python_parser import PythonParser
 
-# Optional TypeScript parser (requires tree-sitter)
-try:
+if TYPE_CHECKING:
+    from lenspr.parsers.multi import MultiParser
+    from lenspr.parsers.python_parser import PythonParser
     from lenspr.parsers.typescript_parser import TypeScriptParser
 
-    TYPESCRIPT_AVAILABLE = True
-except ImportError:
-    TypeScriptParser = None  # type: ignore
-    TYPESCRIPT_AVAILABLE = False
+_LAZY_CLASSES = {
+    "MultiParser": "lenspr.parsers.multi",
+    "PythonParser": "lenspr.parsers.python_parser",
+}
 
 # Cached extensions for performance
 _cached_extensions: tuple[str, ...] | None = None
@@ -25,6 +32,8 @@ def get_supported_extensions() -> tuple[str, ...]:
     """
     global _cached_extensions
     if _cached_extensions is None:
+        from lenspr.parsers.multi import MultiParser
+
         parser = MultiParser()
         _cached_extensions = tuple(parser.get_file_extensions())
     return _cached_extensions
@@ -43,6 +52,21 @@ def is_supported_file(file_path: str) -> bool:
     return any(file_path.endswith(ext) for ext in extensions)
 
 
+def __getattr__(name: str) -> Any:
+    import importlib
+
+    if name in _LAZY_CLASSES:
+        return getattr(importlib.import_module(_LAZY_CLASSES[name]), name)
+    if name in ("TypeScriptParser", "TYPESCRIPT_AVAILABLE"):
+        # Optional TypeScript parser (requires tree-sitter)
+        try:
+            from lenspr.parsers.typescript_parser import TypeScriptParser
+        except ImportError:
+            return None if name == "TypeScriptParser" else False
+        return TypeScriptParser if name == "TypeScriptParser" else True
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = [
     "BaseParser",
     "MultiParser",
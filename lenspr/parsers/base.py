@@ -6,8 +6,10 @@ import logging
 from abc import ABC, abstractmethod
 from collections.abc import Callable
 from pathlib import Path
+from typing import Any
 
 from lenspr.models import Edge, Node, Resolution
+from lenspr.scanner import FileScanner
 
 # Progress callback type: (current_file_index, total_files, current_file_path)
 ProgressCallback = Callable[[int, int, str], None]
@@ -24,6 +26,10 @@ class BaseParser(ABC):
     and works through this abstraction.
     """
 
+    # Bump when parse_file output changes for the same input, so cached
+    # per-file parse results (.lens/parse_cache.db) are invalidated.
+    CACHE_VERSION = "1"
+
     @abstractmethod
     def parse_file(self, file_path: Path, root_path: Path) -> tuple[list[Node], list[Edge]]:
         """
@@ -79,52 +85,10 @@ class BaseParser(ABC):
         all_edges: list[Edge] = []
         extensions = set(self.get_file_extensions())
 
-        skip_dirs = {
-            "__pycache__",
-            ".git",
-            ".lens",
-            ".venv",
-            "venv",
-            "env",
-            "node_modules",
-            ".mypy_cache",
-            ".pytest_cache",
-            ".ruff_cache",
-            "dist",
-            "build",
-            ".eggs",
-            ".tox",
-            "site-packages",  # Skip installed packages
-        }
-
-        # Skip only at project root (src/lib/ is valid in React/Vite)
-        skip_toplevel_only = {"lib"}
-
-        # Also skip directories ending with common venv suffixes
-        venv_suffixes = ("-env", "-venv", "_env", "_venv")
-
-        def should_skip_path(path: Path) -> bool:
-            """Check if path should be skipped."""
-            for idx, part in enumerate(path.parts):
-                if part in skip_dirs:
-                    return True
-                if part in skip_toplevel_only and idx == 0:
-                    return True
-                # Skip directories with venv-like names
-                if any(part.endswith(suffix) for suffix in venv_suffixes):
-                    return True
-            return False
-
         # Collect files first for progress tracking
-        files_to_parse: list[Path] = []
-        for file_path in sorted(root_path.rglob("*")):
-            if not file_path.is_file():
-                continue
-            if should_skip_path(file_path):
-                continue
-            if file_path.suffix not in extensions:
-                continue
-            files_to_parse.append(file_path)
+        files_to_parse = [
+            root_path / entry.path for entry in FileScanner(root_path).scan(extensions)
+        ]
 
         total = len(files_to_parse)
 
@@ -142,6 +106,32 @@ class BaseParser(ABC):
 
         return all_nodes, all_edges
 
+    def get_cache_mode(self) -> str:
+        """
+        Describe resolver settings that affect parse_file output.
+
+        Part of the parse cache key, so results produced with a different
+        resolver (e.g. Pyright vs Jedi) are not reused.
+        """
+        return ""
+
+    def get_file_state(self, rel_path: str) -> Any:
+        """
+        Return JSON-serializable side state recorded while parsing a file.
+
+        Parsers that keep per-file state outside the returned nodes/edges
+        (e.g. export tables for cross-file resolution) expose it here so the
+        parse cache can persist it. Default: no state.
+        """
+        return None
+
+    def restore_file_state(self, rel_path: str, state: Any) -> None:
+        """
+        Re-apply side state for a file whose parse result came from cache.
+
+        Counterpart of ``get_file_state``. Default: nothing to restore.
+        """
+
     def resolve_edges(self, edges: list[Edge], root_path: Path) -> list[Edge]:
         """
         Post-parse edge resolution for cross-file references.
@@ -2,17 +2,120 @@
 
 from __future__ import annotations
 
+import hashlib
+import importlib.util
 import logging
+import os
+import sqlite3
 import time
+from collections.abc import Callable, Generator, Iterator
+from concurrent.futures import Future
+from fnmatch import fnmatchcase
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
+from lenspr import database
 from lenspr.models import Edge, EdgeConfidence, Node, Resolution
 from lenspr.parsers.base import BaseParser, ProgressCallback
-from lenspr.parsers.python_parser import PythonParser
+from lenspr.scanner import FileScanner
 from lenspr.stats import ParseStats, get_language_for_extension
 
+if TYPE_CHECKING:
+    from concurrent.futures import ProcessPoolExecutor
+
+    from lenspr.parsers.python_parser import PythonParser
+
 logger = logging.getLogger(__name__)
 
+JOBS_ENV_VAR = "LENSPR_JOBS"
+
+# Extensions of the language parsers, known without importing them
+_PYTHON_EXTENSIONS = (".py",)
+_TYPESCRIPT_EXTENSIONS = (".js", ".jsx", ".ts", ".tsx")
+_TREE_SITTER_MODULES = ("tree_sitter", "tree_sitter_javascript", "tree_sitter_typescript")
+
+# File names the SQL and infrastructure mapper passes of parse_project read
+_INFRA_FILE_PATTERNS = (
+    "*.sql", "docker-compose*.yml", "docker-compose*.yaml", "compose.yml", "compose.yaml",
+    ".env*", "Dockerfile*", "*.dockerfile",
+)
+
+
+def resolve_jobs(jobs: int | None = None) -> int:
+    """Return the number of parser worker processes to use.
+
+    An explicit ``jobs`` value wins over the ``LENSPR_JOBS`` environment
+    variable; the default is 1 (sequential parsing).  ``0`` or a negative
+    value means "one worker per CPU".
+    """
+    if jobs is None:
+        raw = os.environ.get(JOBS_ENV_VAR, "").strip()
+        if not raw:
+            return 1
+        try:
+            jobs = int(raw)
+        except ValueError:
+            logger.warning("Ignoring invalid %s=%r", JOBS_ENV_VAR, raw)
+            return 1
+    if jobs <= 0:
+        return os.cpu_count() or 1
+    return jobs
+
+
+# ---------------------------------------------------------------------------
+# Process-pool workers (parallel parse_project)
+# ---------------------------------------------------------------------------
+
+# Per-process parser and batch-wide known node IDs, set by _init_parse_worker.
+_worker_parser: PythonParser | None = None
+_worker_known_ids: set[str] = set()
+_worker_id_lookup: Callable[[set[str]], set[str]] | None = None
+
+
+def _init_parse_worker(
+    root_path: str,
+    known_ids: list[str],
+    id_lookup: Callable[[set[str]], set[str]] | None = None,
+) -> None:
+    """Pool initializer: build a Python parser bound to the project root."""
+    from lenspr.parsers.python_parser import PythonParser
+
+    global _worker_parser, _worker_known_ids, _worker_id_lookup
+    _worker_parser = PythonParser()
+    _worker_parser.set_project_root(Path(root_path))
+    _worker_known_ids = set(known_ids)
+    _worker_id_lookup = id_lookup
+
+
+def _parse_chunk_worker(
+    file_paths: list[str], root_path: str,
+) -> tuple[list[tuple[list[dict], list[dict], str | None]], dict[str, int]]:
+    """Parse a contiguous chunk of files in a worker process.
+
+    The chunk goes through ``PythonParser.iter_parse_files`` so it shares
+    one Jedi batch (memo + known-ID short-circuits).  Results cross the
+    process boundary in the compact ``to_dict`` form used for database
+    storage rather than as pickled dataclasses; per-file errors are returned
+    instead of raised so one bad file cannot abort the pool.
+
+    Returns:
+        (per-file results in input order, Jedi counters for this chunk).
+    """
+    assert _worker_parser is not None, "worker not initialized"
+    before = dict(_worker_parser.jedi_stats)
+    results = [
+        ([n.to_dict() for n in nodes], [e.to_dict() for e in edges], error)
+        for _, nodes, edges, error in _worker_parser.iter_parse_files(
+            [Path(p) for p in file_paths], Path(root_path), _worker_known_ids,
+            _worker_id_lookup,
+        )
+    ]
+    delta = {
+        key: value - before.get(key, 0)
+        for key, value in _worker_parser.jedi_stats.items()
+    }
+    return results, delta
+
 
 def normalize_edges_by_ids(
     edges: list[Edge], node_ids: set[str],
@@ -29,24 +132,68 @@ def normalize_edges_by_ids(
     # Build suffix index: suffix -> full_id (None if ambiguous)
     suffix_index: dict[str, str | None] = {}
     for nid in node_ids:
-        parts = nid.split(".")
-        # Start from 1 to skip the full ID (already in node_ids)
-        for i in range(1, len(parts)):
-            suffix = ".".join(parts[i:])
-            if suffix in suffix_index:
-                if suffix_index[suffix] != nid:
-                    suffix_index[suffix] = None  # ambiguous
-            else:
-                suffix_index[suffix] = nid
+        _add_suffixes(suffix_index, nid)
+
+    return _apply_suffix_index(
+        edges, lambda endpoint: endpoint not in node_ids, suffix_index,
+    )
 
+
+def normalize_edges_with_db(
+    edges: list[Edge], new_node_ids: set[str], db_path: Path,
+) -> int:
+    """Normalize edge endpoints against graph.db plus freshly parsed nodes.
+
+    Same result as :func:`normalize_edges_by_ids` over every node ID in the
+    graph plus ``new_node_ids``, but only the endpoints of ``edges`` are
+    looked up (in the persistent ``node_suffixes`` table), so a single-file
+    sync costs time proportional to that file rather than to the graph.
+
+    Returns:
+        Number of endpoints normalized.
+    """
+    endpoints = {e.to_node for e in edges} | {e.from_node for e in edges}
+    unknown = endpoints - new_node_ids
+    if unknown:
+        unknown -= database.get_existing_node_ids(unknown, db_path)
+    if not unknown:
+        return 0
+
+    suffix_index = database.lookup_node_suffixes(unknown, db_path)
+    for nid in new_node_ids:
+        _add_suffixes(suffix_index, nid, only=unknown)
+
+    return _apply_suffix_index(edges, unknown.__contains__, suffix_index)
+
+
+def _add_suffixes(
+    suffix_index: dict[str, str | None],
+    nid: str,
+    only: set[str] | None = None,
+) -> None:
+    for suffix in database.id_suffixes(nid):
+        if only is not None and suffix not in only:
+            continue
+        if suffix in suffix_index:
+            if suffix_index[suffix] != nid:
+                suffix_index[suffix] = None  # ambiguous
+        else:
+            suffix_index[suffix] = nid
+
+
+def _apply_suffix_index(
+    edges: list[Edge],
+    is_unknown: Callable[[str], bool],
+    suffix_index: dict[str, str | None],
+) -> int:
     normalized = 0
     for edge in edges:
-        if edge.to_node not in node_ids:
+        if is_unknown(edge.to_node):
             full_id = suffix_index.get(edge.to_node)
             if full_id is not None:
                 edge.to_node = full_id
                 normalized += 1
-        if edge.from_node not in node_ids:
+        if is_unknown(edge.from_node):
             full_id = suffix_index.get(edge.from_node)
             if full_id is not None:
                 edge.from_node = full_id
@@ -73,6 +220,14 @@ def normalize_edge_targets(
     return edges
 
 
+def _tree_sitter_installed() -> bool:
+    """Whether the TypeScript parser's optional dependencies are installed.
+
+    Only looks the packages up; importing them is left to the parser.
+    """
+    return all(importlib.util.find_spec(name) is not None for name in _TREE_SITTER_MODULES)
+
+
 class MultiParser(BaseParser):
     """
     Combines multiple language parsers into one.
@@ -82,36 +237,62 @@ class MultiParser(BaseParser):
     """
 
     def __init__(self) -> None:
-        self._parsers: list[BaseParser] = []
-        self._extension_map: dict[str, BaseParser] = {}
+        # Language parsers are built on first use: PythonParser imports Jedi
+        # and TypeScriptParser loads tree-sitter, which commands that only
+        # query the graph never need.
+        self._python: PythonParser | None = None
+        self._typescript: BaseParser | None = None
+        self._typescript_extensions: tuple[str, ...] = (
+            _TYPESCRIPT_EXTENSIONS if _tree_sitter_installed() else ()
+        )
+        if not self._typescript_extensions:
+            logger.debug(
+                "TypeScript parser not available (install with: pip install 'lenspr[typescript]')"
+            )
+        self._project_root: Path | None = None
 
-        # Always add Python parser
-        python_parser = PythonParser()
-        self._parsers.append(python_parser)
-        for ext in python_parser.get_file_extensions():
-            self._extension_map[ext] = python_parser
+    @property
+    def _python_parser(self) -> PythonParser:
+        if self._python is None:
+            from lenspr.parsers.python_parser import PythonParser
 
-        # Try to add TypeScript parser (optional)
-        try:
-            from lenspr.parsers.typescript_parser import TypeScriptParser
+            self._python = PythonParser()
+            if self._project_root is not None:
+                self._python.set_project_root(self._project_root)
+        return self._python
 
-            ts_parser = TypeScriptParser()
-            self._parsers.append(ts_parser)
-            for ext in ts_parser.get_file_extensions():
-                self._extension_map[ext] = ts_parser
+    def _typescript_parser(self) -> BaseParser | None:
+        if self._typescript is None and self._typescript_extensions:
+            try:
+                from lenspr.parsers.typescript_parser import TypeScriptParser
+
+                self._typescript = TypeScriptParser()
+            except ImportError as e:
+                logger.warning("TypeScript/JavaScript support disabled: %s", e)
+                self._typescript_extensions = ()
+                return None
             logger.info("TypeScript/JavaScript support enabled")
-        except ImportError:
-            logger.debug(
-                "TypeScript parser not available (install with: pip install 'lenspr[typescript]')"
-            )
+            if self._project_root is not None:
+                self._typescript.set_project_root(self._project_root)
+        return self._typescript
+
+    @property
+    def _parsers(self) -> list[BaseParser]:
+        """Language parsers built so far, Python first."""
+        return [p for p in (self._python, self._typescript) if p is not None]
 
     def get_file_extensions(self) -> list[str]:
         """Return all supported file extensions."""
-        return list(self._extension_map.keys())
+        return [*_PYTHON_EXTENSIONS, *self._typescript_extensions]
 
     def get_parser_for_file(self, file_path: Path) -> BaseParser | None:
-        """Get the appropriate parser for a file."""
-        return self._extension_map.get(file_path.suffix.lower())
+        """Get the appropriate parser for a file, building it if needed."""
+        ext = file_path.suffix.lower()
+        if ext in _PYTHON_EXTENSIONS:
+            return self._python_parser
+        if ext in self._typescript_extensions:
+            return self._typescript_parser()
+        return None
 
     def parse_file(
         self, file_path: Path, root_path: Path
@@ -136,7 +317,11 @@ class MultiParser(BaseParser):
         return parser.resolve_name(file_path, line, column, project_root)
 
     def set_project_root(self, root_path: Path) -> None:
-        """Set project root on all parsers that support it."""
+        """Set project root on all parsers that support it.
+
+        Parsers built later get it when they are created.
+        """
+        self._project_root = root_path
         for parser in self._parsers:
             if hasattr(parser, "set_project_root"):
                 parser.set_project_root(root_path)
@@ -146,6 +331,10 @@ class MultiParser(BaseParser):
         root_path: Path,
         progress_callback: ProgressCallback | None = None,
         collect_stats: bool = False,
+        jobs: int | None = None,
+        cache_db: Path | None = None,
+        cache_version: str = "",
+        scanner: FileScanner | None = None,
     ) -> tuple[list[Node], list[Edge], ParseStats | None]:
         """Parse project using all available parsers.
 
@@ -153,6 +342,14 @@ class MultiParser(BaseParser):
             root_path: Project root directory.
             progress_callback: Optional callback(current, total, file_path) for progress.
             collect_stats: If True, return detailed parsing statistics.
+            jobs: Number of parser processes (see ``resolve_jobs``).
+                None reads ``LENSPR_JOBS`` and defaults to sequential parsing.
+            cache_db: Optional parse cache database; unchanged files are
+                loaded from it instead of being re-parsed.
+            cache_version: Graph-level parser version (``LensContext.PARSER_VERSION``)
+                folded into every cache key, so bumping it invalidates the cache.
+            scanner: File scanner with the project's ignore rules; defaults
+                to one honouring only ``.gitignore``.
 
         Returns:
             Tuple of (nodes, edges, stats). Stats is None if collect_stats=False.
@@ -164,84 +361,32 @@ class MultiParser(BaseParser):
 
         all_nodes: list[Node] = []
         all_edges: list[Edge] = []
-        edges_by_parser: dict[BaseParser, list[Edge]] = {p: [] for p in self._parsers}
+        edges_by_parser: dict[BaseParser, list[Edge]] = {}
         extensions = set(self.get_file_extensions())
 
         # Initialize stats if collecting
         stats = ParseStats(project_root=root_path) if collect_stats else None
 
-        skip_dirs = {
-            "__pycache__",
-            ".git",
-            ".lens",
-            ".venv",
-            "venv",
-            "env",
-            "node_modules",
-            ".mypy_cache",
-            ".pytest_cache",
-            ".ruff_cache",
-            "dist",
-            "build",
-            ".eggs",
-            ".tox",
-            "site-packages",
-            ".next",  # Next.js
-            ".nuxt",  # Nuxt.js
-            ".output",  # Nuxt 3
-            "coverage",
-            "htmlcov",
-            ".nyc_output",
-            "out",  # Next.js static export
-        }
-
-        venv_suffixes = ("-env", "-venv", "_env", "_venv")
-
-        # Skip only at project root: "lib" is Python stdlib,
-        # but "src/lib/" is a standard React/Vite utility directory
-        skip_toplevel_only = {"lib"}
-
-        def should_skip_path(path: Path) -> bool:
-            for part in path.parts:
-                if part in skip_dirs:
-                    return True
-                if any(part.endswith(suffix) for suffix in venv_suffixes):
-                    return True
-            return False
-
-        # Collect files and track skipped directories
+        # Collect files in one scan: code files for the parsers, plus the
+        # SQL and infrastructure files the mapper passes below read
+        scanner = scanner or FileScanner(root_path)
+        infra_files: dict[str, list[Path]] = {pattern: [] for pattern in _INFRA_FILE_PATTERNS}
         files_to_parse: list[Path] = []
-        skipped_counts: dict[str, int] = {}  # dir_name -> ALL file count (code + non-code)
+        skipped_counts: dict[str, int] = {}  # dir_name -> pruned directories
         total_file_count = 0
 
-        for file_path in sorted(root_path.rglob("*")):
-            if not file_path.is_file():
-                continue
-
+        for rel, entry in scanner.walk(skipped_counts):
             total_file_count += 1
-
-            # Check if in skipped directory
-            skip_reason = None
-            rel_parts = file_path.relative_to(root_path).parts
-            for idx, part in enumerate(rel_parts):
-                if part in skip_dirs:
-                    skip_reason = part
-                    break
-                if part in skip_toplevel_only and idx == 0:
-                    skip_reason = part
-                    break
-                if any(part.endswith(suffix) for suffix in venv_suffixes):
-                    skip_reason = part
-                    break
-
-            if skip_reason:
-                skipped_counts[skip_reason] = skipped_counts.get(skip_reason, 0) + 1
-                continue
-
-            if file_path.suffix.lower() not in extensions:
+            file_path = root_path / rel
+            name = entry.name
+            for pattern, matches in infra_files.items():
+                if fnmatchcase(name, pattern):
+                    matches.append(file_path)
+
+            ext = os.path.splitext(name)[1].lower()
+            if ext not in extensions:
                 # Track unparsed file types
-                if stats and file_path.suffix:
-                    ext = file_path.suffix.lower()
+                if stats and ext:
                     stats.unparsed_extensions[ext] = (
                         stats.unparsed_extensions.get(ext, 0) + 1
                     )
@@ -256,39 +401,67 @@ class MultiParser(BaseParser):
                 stats.add_skipped_dir(dir_name, count)
 
         total = len(files_to_parse)
+        jedi_before = dict(self._python_parser.jedi_stats)
+        parsed_files = self.iter_parsed_files(
+            files_to_parse, root_path, resolve_jobs(jobs), cache_db,
+            cache_version=cache_version,
+        )
 
-        for i, file_path in enumerate(files_to_parse):
+        for i, (file_path, parser, nodes, edges, error) in enumerate(parsed_files):
             if progress_callback:
                 progress_callback(i + 1, total, str(file_path))
 
+            if parser is None:
+                continue
+
             ext = file_path.suffix.lower()
             language, ext_display = get_language_for_extension(ext)
 
-            try:
-                parser = self.get_parser_for_file(file_path)
-                if parser is None:
-                    continue
-
-                nodes, edges = parser.parse_file(file_path, root_path)
-                all_nodes.extend(nodes)
-                edges_by_parser[parser].extend(edges)
-
-                # Collect stats (before resolution - stats track raw parsed edges)
+            if error is not None:
+                logger.warning("Failed to parse %s: %s", file_path, error)
                 if stats:
                     stats.add_file(file_path, language, ext_display)
-                    stats.add_nodes(nodes, language, ext_display)
-                    stats.add_edges(edges, language, ext_display)
+                    stats.add_parse_error(language, str(file_path), error)
+                continue
 
-            except Exception as e:
-                logger.warning("Failed to parse %s: %s", file_path, e)
-                if stats:
-                    stats.add_file(file_path, language, ext_display)
-                    stats.add_parse_error(language, str(file_path), str(e))
+            all_nodes.extend(nodes)
+            edges_by_parser.setdefault(parser, []).extend(edges)
+
+            # Collect stats (before resolution - stats track raw parsed edges)
+            if stats:
+                stats.add_file(file_path, language, ext_display)
+                stats.add_nodes(nodes, language, ext_display)
+                stats.add_edges(edges, language, ext_display)
+
+        jedi_delta = {
+            key: value - jedi_before.get(key, 0)
+            for key, value in self._python_parser.jedi_stats.items()
+        }
+        goto_saved = jedi_delta.get("goto_saved_known", 0) + jedi_delta.get("goto_saved_memo", 0)
+        if jedi_delta:
+            logger.info(
+                "Jedi: %d goto calls, %d saved (%d known node IDs, %d memoized)",
+                jedi_delta.get("goto_calls", 0), goto_saved,
+                jedi_delta.get("goto_saved_known", 0), jedi_delta.get("goto_saved_memo", 0),
+            )
+        if stats:
+            stats.jedi_goto_calls = jedi_delta.get("goto_calls", 0)
+            stats.jedi_goto_saved = goto_saved
+
+        # Forget cached results for files that no longer exist
+        if cache_db is not None:
+            try:
+                database.prune_parse_cache(
+                    {str(f.relative_to(root_path)) for f in files_to_parse}, cache_db,
+                )
+            except sqlite3.Error as e:
+                logger.debug("Parse cache prune skipped: %s", e)
 
         # Second pass: resolve edges using each parser's cross-file resolution
-        for parser, edges in edges_by_parser.items():
-            if edges:
-                resolved = parser.resolve_edges(edges, root_path)
+        for parser in self._parsers:
+            parser_edges = edges_by_parser.get(parser)
+            if parser_edges:
+                resolved = parser.resolve_edges(parser_edges, root_path)
                 all_edges.extend(resolved)
 
         # Third pass: normalize edge targets to match actual node IDs
@@ -321,9 +494,7 @@ class MultiParser(BaseParser):
 
             # Parse raw .sql files (migrations, seeds, etc.)
             sql_file_count = 0
-            for sql_file in sorted(root_path.rglob("*.sql")):
-                if should_skip_path(sql_file):
-                    continue
+            for sql_file in infra_files["*.sql"]:
                 sql_mapper.parse_sql_file(sql_file, root_path)
                 sql_file_count += 1
             sql_file_nodes = sql_mapper.get_sql_file_nodes()
@@ -354,21 +525,15 @@ class MultiParser(BaseParser):
                 "compose.yml", "compose.yaml",
             ]
             for pattern in compose_patterns:
-                for compose_path in sorted(root_path.rglob(pattern)):
-                    if compose_path.is_file() and not should_skip_path(
-                        compose_path.relative_to(root_path)
-                    ):
-                        infra_mapper.parse_compose(compose_path)
-                        compose_count += 1
+                for compose_path in infra_files[pattern]:
+                    infra_mapper.parse_compose(compose_path)
+                    compose_count += 1
 
             # Parse .env files (recursive for monorepos)
             env_count = 0
-            for env_file in sorted(root_path.rglob(".env*")):
-                if env_file.is_file() and not should_skip_path(
-                    env_file.relative_to(root_path)
-                ):
-                    infra_mapper.parse_env_file(env_file)
-                    env_count += 1
+            for env_file in infra_files[".env*"]:
+                infra_mapper.parse_env_file(env_file)
+                env_count += 1
 
             # Extract env var definitions from compose environment: sections
             from lenspr.resolvers.infra_mapper import EnvVarDef
@@ -389,14 +554,7 @@ class MultiParser(BaseParser):
 
             # Parse Dockerfiles
             dockerfile_count = 0
-            for df_path in sorted(root_path.rglob("Dockerfile*")):
-                if should_skip_path(df_path):
-                    continue
-                infra_mapper.parse_dockerfile(df_path, root_path)
-                dockerfile_count += 1
-            for df_path in sorted(root_path.rglob("*.dockerfile")):
-                if should_skip_path(df_path):
-                    continue
+            for df_path in infra_files["Dockerfile*"] + infra_files["*.dockerfile"]:
                 infra_mapper.parse_dockerfile(df_path, root_path)
                 dockerfile_count += 1
 
@@ -488,6 +646,191 @@ class MultiParser(BaseParser):
 
         return all_nodes, all_edges, stats
 
+    def cache_key(self, parser: BaseParser, data: bytes, cache_version: str = "") -> str:
+        """Parse cache key: content hash + parser versions + resolver mode."""
+        digest = hashlib.sha256(data).hexdigest()
+        return (
+            f"{digest}:{type(parser).__name__}:{parser.CACHE_VERSION}"
+            f":{cache_version}:{parser.get_cache_mode()}"
+        )
+
+    def iter_parsed_files(
+        self,
+        files: list[Path],
+        root_path: Path,
+        jobs: int = 1,
+        cache_db: Path | None = None,
+        known_ids: set[str] | None = None,
+        id_lookup: Callable[[set[str]], set[str]] | None = None,
+        cache_version: str = "",
+    ) -> Iterator[tuple[Path, BaseParser | None, list[Node], list[Edge], str | None]]:
+        """Parse ``files`` and yield results in input order.
+
+        Python files are parsed as a batch (``PythonParser.iter_parse_files``)
+        so Jedi work is shared across files.  With ``jobs > 1`` the batch is
+        split into contiguous chunks farmed out to a process pool.  Other
+        languages stay in this process: TypeScriptParser registers exports
+        with its cross-file resolver during ``parse_file``, and that state
+        must live where ``resolve_edges`` runs.  Results are always consumed in the given
+        file order, so the merged output does not depend on scheduling.
+
+        With ``cache_db`` set, files whose cache key (see ``cache_key``) is
+        unchanged are loaded from the parse cache instead of being parsed,
+        and fresh results are written back once iteration finishes.  Cached
+        edges are pre-normalization, exactly as ``parse_file`` returned them.
+        The key only covers the file's own bytes: cross-file resolutions
+        stored with it go stale when a dependency changes, until the file
+        itself changes or the cache is cleared (``lenspr init --force``).
+
+        ``known_ids`` are node IDs defined outside ``files`` (e.g. untouched
+        files during an incremental sync); like the batch's own IDs, edges
+        targeting them exactly are resolved without Jedi.  ``id_lookup``
+        serves the same purpose without materializing every ID (see
+        ``PythonParser.iter_parse_files``); it must be picklable when
+        ``jobs > 1``.
+
+        Yields:
+            (file_path, parser, nodes, edges, error) — ``parser`` is None for
+            unsupported files, ``error`` is set when parsing raised.
+        """
+        keys: dict[Path, str] = {}
+        cached: dict[str, tuple[list[dict], list[dict], Any]] = {}
+        if cache_db is not None:
+            for f in files:
+                parser = self.get_parser_for_file(f)
+                if parser is None:
+                    continue
+                try:
+                    keys[f] = self.cache_key(parser, f.read_bytes(), cache_version)
+                except OSError:
+                    continue
+            try:
+                cached = database.get_parse_cache_entries(
+                    {str(f.relative_to(root_path)): k for f, k in keys.items()},
+                    cache_db,
+                )
+            except (sqlite3.Error, ValueError) as e:
+                logger.warning("Parse cache unavailable, parsing all files: %s", e)
+            if cached:
+                logger.info("Parse cache: reusing %d of %d files", len(cached), len(files))
+
+        # Python files go through one batched AST + Jedi pass (see
+        # PythonParser.iter_parse_files); cached node IDs seed its
+        # known-ID short-circuit.
+        batch_known = list(known_ids or ())
+        batch_known += [d["id"] for node_dicts, _, _ in cached.values() for d in node_dicts]
+        py_files = [
+            f for f in files
+            if str(f.relative_to(root_path)) not in cached
+            and self.get_parser_for_file(f) is self._python_parser
+        ]
+        workers = min(jobs, len(py_files))
+
+        # file -> (chunk future, index in chunk) when running in the pool
+        pooled: dict[Path, tuple[Future, int]] = {}
+        executor: ProcessPoolExecutor | None = None
+        py_iter: (
+            Generator[tuple[Path, list[Node], list[Edge], str | None], None, None] | None
+        ) = None
+        if workers > 1:
+            logger.info("Parsing %d Python files with %d processes", len(py_files), workers)
+            from concurrent.futures import ProcessPoolExecutor
+            from multiprocessing import get_context
+
+            # "spawn" avoids forking a process that may hold threads/locks
+            # (MCP server watchers, SQLite connections).
+            executor = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=get_context("spawn"),
+                initializer=_init_parse_worker,
+                initargs=(str(root_path), batch_known, id_lookup),
+            )
+            # Contiguous chunks keep packages together, so most in-project
+            # targets hit the known-ID short-circuit inside a worker.
+            size = -(-len(py_files) // (workers * 4))
+            for start in range(0, len(py_files), size):
+                chunk = py_files[start:start + size]
+                future = executor.submit(
+                    _parse_chunk_worker, [str(f) for f in chunk], str(root_path),
+                )
+                for idx, f in enumerate(chunk):
+                    pooled[f] = (future, idx)
+        elif py_files:
+            py_iter = self._python_parser.iter_parse_files(
+                py_files, root_path, set(batch_known), id_lookup,
+            )
+
+        new_entries: list[tuple[str, str, list[dict], list[dict], Any]] = []
+        seen_futures: set[Future] = set()
+        try:
+            for file_path in files:
+                parser = self.get_parser_for_file(file_path)
+                if parser is None:
+                    yield file_path, None, [], [], None
+                    continue
+
+                rel_path = str(file_path.relative_to(root_path))
+                key = keys.get(file_path)
+
+                hit = cached.get(rel_path)
+                if hit is not None:
+                    node_dicts, edge_dicts, state = hit
+                    parser.restore_file_state(rel_path, state)
+                    nodes = [Node.from_dict(d) for d in node_dicts]
+                    edges = [Edge.from_dict(d) for d in edge_dicts]
+                    yield file_path, parser, nodes, edges, None
+                    continue
+
+                if file_path in pooled:
+                    future, idx = pooled[file_path]
+                    try:
+                        chunk_results, counters = future.result()
+                    except Exception as e:
+                        yield file_path, parser, [], [], str(e)
+                        continue
+                    if future not in seen_futures:
+                        seen_futures.add(future)
+                        totals = self._python_parser.jedi_stats
+                        for name, value in counters.items():
+                            totals[name] = totals.get(name, 0) + value
+                    node_dicts, edge_dicts, error = chunk_results[idx]
+                    if key is not None and error is None:
+                        new_entries.append((rel_path, key, node_dicts, edge_dicts, None))
+                    nodes = [Node.from_dict(d) for d in node_dicts]
+                    edges = [Edge.from_dict(d) for d in edge_dicts]
+                    yield file_path, parser, nodes, edges, error
+                    continue
+
+                if parser is self._python_parser and py_iter is not None:
+                    _, nodes, edges, error = next(py_iter)
+                    if error is not None:
+                        yield file_path, parser, [], [], error
+                        continue
+                else:
+                    try:
+                        nodes, edges = parser.parse_file(file_path, root_path)
+                    except Exception as e:
+                        yield file_path, parser, [], [], str(e)
+                        continue
+                if key is not None:
+                    # Serialize now: normalization later mutates edges in place
+                    new_entries.append((
+                        rel_path, key,
+                        [n.to_dict() for n in nodes], [e.to_dict() for e in edges],
+                        parser.get_file_state(rel_path),
+                    ))
+                yield file_path, parser, nodes, edges, None
+        finally:
+            if py_iter is not None:
+                py_iter.close()
+            if executor is not None:
+                executor.shutdown(wait=True, cancel_futures=True)
+            if cache_db is not None and new_entries:
+                try:
+                    database.save_parse_cache_entries(new_entries, cache_db)
+                except sqlite3.Error as e:
+                    logger.warning("Failed to update parse cache: %s", e)
+
     def _collect_warnings(self, stats: ParseStats, root_path: Path) -> None:
         """Collect warnings based on project analysis."""
         # Check for JS/TS projects (including monorepos)
@@ -557,6 +900,6 @@ class MultiParser(BaseParser):
     def supported_languages(self) -> list[str]:
         """Return list of supported languages."""
         languages = ["Python"]
-        if any(ext in self._extension_map for ext in [".ts", ".tsx", ".js", ".jsx"]):
+        if self._typescript_extensions:
             languages.append("TypeScript/JavaScript")
         return languages
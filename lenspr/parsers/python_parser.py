@@ -6,6 +6,7 @@ import ast
 import logging
 import os
 import uuid
+from collections.abc import Callable, Generator
 from pathlib import Path
 
 import jedi
@@ -193,6 +194,14 @@ class _ImportTable:
     def add_star_import(self, module: str) -> None:
         self.star_imports.append(module)
 
+    def is_explicit(self, name: str) -> bool:
+        """True if ``name`` resolves through an explicit (non-star) import.
+
+        Such targets are fully qualified module paths whose meaning does not
+        depend on the call site, unlike star-import guesses.
+        """
+        return name in self.names or name.split(".", 1)[0] in self.names
+
     def resolve(self, name: str) -> tuple[str, EdgeConfidence] | None:
         """Try to resolve a local name to a qualified name.
 
@@ -241,6 +250,9 @@ class CodeGraphVisitor(ast.NodeVisitor):
         self.nodes: list[Node] = []
         self.edges: list[Edge] = []
         self.import_table = _ImportTable()
+        # IDs of edges whose target came from an explicit import (see
+        # _ImportTable.is_explicit) — safe to memoize across files.
+        self.qualified_edges: set[str] = set()
         self._scope_stack: list[str] = [module_id]
         self._class_stack: list[str] = []
 
@@ -569,18 +581,19 @@ class CodeGraphVisitor(ast.NodeVisitor):
                 target = call_name
                 confidence = EdgeConfidence.INFERRED
 
-            self.edges.append(
-                Edge(
-                    id=_edge_id(),
-                    from_node=caller_id,
-                    to_node=target,
-                    type=EdgeType.CALLS,
-                    line_number=node.lineno,
-                    column=col_offset,
-                    confidence=confidence,
-                    source=EdgeSource.STATIC,
-                )
+            edge = Edge(
+                id=_edge_id(),
+                from_node=caller_id,
+                to_node=target,
+                type=EdgeType.CALLS,
+                line_number=node.lineno,
+                column=col_offset,
+                confidence=confidence,
+                source=EdgeSource.STATIC,
             )
+            if resolved and self.import_table.is_explicit(call_name):
+                self.qualified_edges.add(edge.id)
+            self.edges.append(edge)
 
     def _extract_type_annotations(
         self, func_node: ast.FunctionDef | ast.AsyncFunctionDef, node_id: str
@@ -608,18 +621,19 @@ class CodeGraphVisitor(ast.NodeVisitor):
                 resolved = self.import_table.resolve(name)
                 target = resolved[0] if resolved else name
                 confidence = resolved[1] if resolved else EdgeConfidence.INFERRED
-                self.edges.append(
-                    Edge(
-                        id=_edge_id(),
-                        from_node=node_id,
-                        to_node=target,
-                        type=EdgeType.USES,
-                        line_number=ann.lineno,
-                        column=col_offset,
-                        confidence=confidence,
-                        source=EdgeSource.STATIC,
-                    )
+                edge = Edge(
+                    id=_edge_id(),
+                    from_node=node_id,
+                    to_node=target,
+                    type=EdgeType.USES,
+                    line_number=ann.lineno,
+                    column=col_offset,
+                    confidence=confidence,
+                    source=EdgeSource.STATIC,
                 )
+                if resolved and self.import_table.is_explicit(name):
+                    self.qualified_edges.add(edge.id)
+                self.edges.append(edge)
 
     def _extract_names_from_annotation(self, node: ast.expr) -> list[str]:
         """Recursively extract type names from an annotation AST node."""
@@ -793,6 +807,152 @@ class CodeGraphVisitor(ast.NodeVisitor):
         return "statements"
 
 
+class JediBatchResolver:
+    """
+    Upgrades INFERRED edges to RESOLVED/EXTERNAL with Jedi, sharing work
+    across the files of one batch (typically a full project parse).
+
+    - Edges whose target came from an explicit import and already is a
+      known in-project node ID are marked RESOLVED without calling Jedi
+      (goto would follow the same import to the same definition).
+    - Import-qualified targets (``pkg.mod.func`` via an explicit import) mean
+      the same thing in every file, so each is resolved once per batch and
+      memoized as ``target -> definition``.
+    - Each file gets at most one ``jedi.Script``, created only if some edge
+      still needs ``goto``.
+    """
+
+    def __init__(
+        self, project: jedi.Project | None, known_ids: set[str] | None = None,
+    ) -> None:
+        self._project = project
+        self._known_ids = known_ids if known_ids is not None else set()
+        self._memo: dict[str, str] = {}
+        self.goto_calls = 0
+        self.saved_known = 0
+        self.saved_memo = 0
+
+    def stats(self) -> dict[str, int]:
+        """Counters: goto calls made and goto calls avoided (by reason)."""
+        return {
+            "goto_calls": self.goto_calls,
+            "goto_saved_known": self.saved_known,
+            "goto_saved_memo": self.saved_memo,
+        }
+
+    def resolve_file(
+        self, edges: list[Edge], file_path: str, qualified: set[str] | None = None,
+    ) -> None:
+        """Resolve one file's edges in place.
+
+        Args:
+            qualified: IDs of edges whose target came from an explicit
+                import; only these results are memoized for other files.
+        """
+        qualified = qualified or set()
+        script: jedi.Script | None = None
+        source_lines: list[str] = []
+
+        for edge in edges:
+            if edge.confidence != EdgeConfidence.INFERRED:
+                continue
+            if edge.type not in (EdgeType.CALLS, EdgeType.USES):
+                continue
+            if edge.line_number is None:
+                continue
+
+            # Check if target is stdlib/builtin first
+            if _is_external(edge.to_node):
+                edge.confidence = EdgeConfidence.EXTERNAL
+                continue
+
+            # Only import-qualified targets: a bare name that happens to equal
+            # a node ID (e.g. local variable ``worker`` vs module ``worker``)
+            # still needs goto.
+            is_qualified = edge.id in qualified
+            if is_qualified and edge.to_node in self._known_ids:
+                edge.confidence = EdgeConfidence.RESOLVED
+                self.saved_known += 1
+                continue
+
+            memo_key = edge.to_node if is_qualified else None
+            if memo_key is not None and memo_key in self._memo:
+                self._apply(edge, self._memo[memo_key])
+                self.saved_memo += 1
+                continue
+
+            if script is None:
+                try:
+                    script = jedi.Script(path=file_path, project=self._project)
+                    source_lines = Path(file_path).read_text().splitlines()
+                except Exception:
+                    return
+
+            try:
+                resolved_id = self._goto(script, source_lines, edge)
+            except Exception:
+                continue
+
+            if resolved_id and resolved_id != ".":
+                self._apply(edge, resolved_id)
+                if memo_key is not None:
+                    self._memo[memo_key] = resolved_id
+
+    def _goto(self, script: jedi.Script, source_lines: list[str], edge: Edge) -> str | None:
+        """Find the definition an edge points at; returns its full name."""
+        assert edge.line_number is not None
+        # Use actual column if available, otherwise try 0 then 4
+        col = edge.column if edge.column is not None else 0
+        self.goto_calls += 1
+        names = script.goto(edge.line_number, col)
+        if not names and edge.column is None:
+            self.goto_calls += 1
+            names = script.goto(edge.line_number, 4)
+        if not names:
+            return None
+
+        # For attribute access (e.g., storage.save()), the column points to
+        # the first part (storage), but jedi resolves better at the attribute
+        # position (save). Try to find and resolve the attribute.
+        d = names[0]
+        # If jedi resolved to the receiver (module, self param, variable)
+        # rather than the attribute, try resolving at the attribute position.
+        needs_attr_resolution = (
+            "." in edge.to_node
+            and edge.line_number <= len(source_lines)
+            and d.type in ("module", "param", "statement")
+        )
+        if needs_attr_resolution:
+            line = source_lines[edge.line_number - 1]
+            # Find the method/attribute name in the line
+            last_part = edge.to_node.split(".")[-1]
+            # Try to find the method name in the line
+            method_pos = line.find(f".{last_part}")
+            if method_pos >= 0:
+                attr_col = method_pos + 1  # Skip the dot
+                self.goto_calls += 1
+                attr_names = script.goto(edge.line_number, attr_col)
+                if attr_names:
+                    d = attr_names[0]
+
+        # Prefer full_name which follows imports correctly,
+        # fall back to module_name.name
+        if d.full_name:
+            return str(d.full_name)
+        module = d.module_name or ""
+        name = d.name or ""
+        return f"{module}.{name}" if module else name
+
+    @staticmethod
+    def _apply(edge: Edge, resolved_id: str) -> None:
+        edge.to_node = resolved_id
+        # Check if resolved target is external
+        if _is_external(resolved_id):
+            edge.confidence = EdgeConfidence.EXTERNAL
+        else:
+            edge.confidence = EdgeConfidence.RESOLVED
+
+
 class PythonParser(BaseParser):
     """
     Python language parser using ast for structure and jedi for name resolution.
@@ -801,10 +961,15 @@ class PythonParser(BaseParser):
     def __init__(self) -> None:
         self._jedi_project: jedi.Project | None = None
         self._pyright_resolver = None  # PyrightResolver | None
+        # Cumulative JediBatchResolver counters from iter_parse_files
+        self.jedi_stats: dict[str, int] = {}
 
     def get_file_extensions(self) -> list[str]:
         return [".py"]
 
+    def get_cache_mode(self) -> str:
+        return "pyright" if self._pyright_resolver is not None else "jedi"
+
     def set_project_root(self, root_path: Path) -> None:
         """Initialize resolvers: Pyright (opt-in) or Jedi (default).
 
@@ -834,6 +999,85 @@ class PythonParser(BaseParser):
 
     def parse_file(self, file_path: Path, root_path: Path) -> tuple[list[Node], list[Edge]]:
         """Parse a single Python file into nodes and edges."""
+        parsed = self._parse_ast(file_path, root_path)
+        if parsed is None:
+            return [], []
+        nodes, edges, qualified = parsed
+        self._resolve_file_edges(edges, file_path, qualified, None)
+        return nodes, edges
+
+    def iter_parse_files(
+        self,
+        files: list[Path],
+        root_path: Path,
+        known_ids: set[str] | None = None,
+        id_lookup: Callable[[set[str]], set[str]] | None = None,
+    ) -> Generator[tuple[Path, list[Node], list[Edge], str | None], None, None]:
+        """Parse many files with one shared resolution stage.
+
+        Runs the AST pass over every file first, then resolves all INFERRED
+        edges through a single ``JediBatchResolver``: import-qualified
+        targets that are node IDs of the batch (or ``known_ids``) skip Jedi,
+        and other import-qualified targets are looked up once per batch.
+        Both shortcuts only apply to targets built from an explicit import,
+        which ``goto`` would follow to the same definition, so results match
+        ``parse_file`` however files are grouped into batches.
+
+        ``id_lookup`` maps candidate targets to the subset that are node IDs
+        elsewhere (e.g. in graph.db); it is called once after the AST pass,
+        as a cheaper alternative to passing every ID in ``known_ids``.
+
+        Yields:
+            (file_path, nodes, edges, error) in input order.
+        """
+        ids: set[str] = set(known_ids or ())
+        asts: list[tuple[Path, tuple[list[Node], list[Edge], set[str]] | None, str | None]] = []
+        for file_path in files:
+            try:
+                parsed = self._parse_ast(file_path, root_path)
+            except Exception as e:
+                asts.append((file_path, None, str(e)))
+                continue
+            if parsed is not None:
+                ids.update(n.id for n in parsed[0])
+            asts.append((file_path, parsed, None))
+
+        if id_lookup is not None:
+            candidates = {
+                e.to_node
+                for _, parsed, _ in asts if parsed is not None
+                for e in parsed[1]
+                if e.confidence == EdgeConfidence.INFERRED
+                and e.id in parsed[2] and e.to_node not in ids
+            }
+            if candidates:
+                ids.update(id_lookup(candidates))
+
+        resolver = JediBatchResolver(self._jedi_project, ids)
+        try:
+            for file_path, parsed, error in asts:
+                if parsed is None:
+                    yield file_path, [], [], error
+                    continue
+                nodes, edges, qualified = parsed
+                try:
+                    self._resolve_file_edges(edges, file_path, qualified, resolver)
+                except Exception as e:
+                    yield file_path, [], [], str(e)
+                    continue
+                yield file_path, nodes, edges, None
+        finally:
+            for key, value in resolver.stats().items():
+                self.jedi_stats[key] = self.jedi_stats.get(key, 0) + value
+            logger.debug("Jedi batch: %s", resolver.stats())
+
+    def _parse_ast(
+        self, file_path: Path, root_path: Path
+    ) -> tuple[list[Node], list[Edge], set[str]] | None:
+        """AST pass: nodes, unresolved edges and import-qualified edge IDs.
+
+        Returns None for files with syntax errors.
+        """
         try:
             source = file_path.read_text(encoding="utf-8")
         except UnicodeDecodeError:
@@ -844,7 +1088,7 @@ class PythonParser(BaseParser):
             tree = ast.parse(source, filename=str(file_path))
         except SyntaxError as e:
             logger.warning("Syntax error in %s: %s", file_path, e)
-            return [], []
+            return None
 
         module_id = _module_id_from_path(file_path, root_path)
         rel_path = str(file_path.relative_to(root_path))
@@ -871,96 +1115,36 @@ class PythonParser(BaseParser):
         visitor.extract_blocks(tree)
 
         # Combine: module node + visitor-found nodes
-        all_nodes = [module_node] + visitor.nodes
-        all_edges = visitor.edges
+        return [module_node] + visitor.nodes, visitor.edges, visitor.qualified_edges
+
+    def _resolve_file_edges(
+        self,
+        edges: list[Edge],
+        file_path: Path,
+        qualified: set[str],
+        resolver: JediBatchResolver | None,
+    ) -> None:
+        """Resolution pass: upgrade INFERRED edges to RESOLVED.
 
-        # Resolution pass: upgrade INFERRED edges to RESOLVED
-        # Prefer Pyright (better type inference), fall back to Jedi
+        Prefer Pyright (better type inference), fall back to Jedi.
+        """
         if self._pyright_resolver is not None:
             try:
                 self._pyright_resolver.resolve_edges(
-                    all_edges, str(file_path), settle_time=0.5
+                    edges, str(file_path), settle_time=0.5
                 )
+                return
             except Exception as e:
                 logger.warning("Pyright resolution failed, falling back to Jedi: %s", e)
-                if self._jedi_project is not None:
-                    self._resolve_edges_with_jedi(all_edges, str(file_path))
-        elif self._jedi_project is not None:
-            self._resolve_edges_with_jedi(all_edges, str(file_path))
-
-        return all_nodes, all_edges
+        if self._jedi_project is None:
+            return
+        if resolver is None:
+            resolver = JediBatchResolver(self._jedi_project)
+        resolver.resolve_file(edges, str(file_path), qualified)
 
     def _resolve_edges_with_jedi(self, edges: list[Edge], file_path: str) -> None:
         """Use jedi to upgrade INFERRED edges to RESOLVED or EXTERNAL."""
-        try:
-            script = jedi.Script(path=file_path, project=self._jedi_project)
-            source_lines = Path(file_path).read_text().splitlines()
-        except Exception:
-            return
-
-        for edge in edges:
-            if edge.confidence != EdgeConfidence.INFERRED:
-                continue
-            if edge.type not in (EdgeType.CALLS, EdgeType.USES):
-                continue
-            if edge.line_number is None:
-                continue
-
-            # Check if target is stdlib/builtin first
-            if _is_external(edge.to_node):
-                edge.confidence = EdgeConfidence.EXTERNAL
-                continue
-
-            try:
-                # Use actual column if available, otherwise try 0 then 4
-                col = edge.column if edge.column is not None else 0
-                names = script.goto(edge.line_number, col)
-                if not names and edge.column is None:
-                    names = script.goto(edge.line_number, 4)
-
-                # For attribute access (e.g., storage.save()), the column points to
-                # the first part (storage), but jedi resolves better at the attribute
-                # position (save). Try to find and resolve the attribute.
-                resolved_id = None
-                if names:
-                    d = names[0]
-                    # If jedi resolved to the receiver (module, self param, variable)
-                    # rather than the attribute, try resolving at the attribute position.
-                    needs_attr_resolution = (
-                        "." in edge.to_node
-                        and edge.line_number <= len(source_lines)
-                        and d.type in ("module", "param", "statement")
-                    )
-                    if needs_attr_resolution:
-                        line = source_lines[edge.line_number - 1]
-                        # Find the method/attribute name in the line
-                        last_part = edge.to_node.split(".")[-1]
-                        # Try to find the method name in the line
-                        method_pos = line.find(f".{last_part}")
-                        if method_pos >= 0:
-                            attr_col = method_pos + 1  # Skip the dot
-                            attr_names = script.goto(edge.line_number, attr_col)
-                            if attr_names:
-                                d = attr_names[0]
-
-                    # Prefer full_name which follows imports correctly,
-                    # fall back to module_name.name
-                    if d.full_name:
-                        resolved_id = d.full_name
-                    else:
-                        module = d.module_name or ""
-                        name = d.name or ""
-                        resolved_id = f"{module}.{name}" if module else name
-
-                if resolved_id and resolved_id != ".":
-                    edge.to_node = resolved_id
-                    # Check if resolved target is external
-                    if _is_external(resolved_id):
-                        edge.confidence = EdgeConfidence.EXTERNAL
-                    else:
-                        edge.confidence = EdgeConfidence.RESOLVED
-            except Exception:
-                continue
+        JediBatchResolver(self._jedi_project).resolve_file(edges, file_path)
 
     def resolve_name(
         self, file_path: str, line: int, column: int, project_root: str
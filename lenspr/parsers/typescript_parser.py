@@ -78,10 +78,9 @@ class TypeScriptParser(BaseParser):
                 "tree-sitter not installed. Install with: pip install 'lenspr[typescript]'"
             )
 
-        # Initialize parsers for each language
-        self._js_parser = Parser(Language(ts_js.language()))
-        self._ts_parser = Parser(Language(ts_ts.language_typescript()))
-        self._tsx_parser = Parser(Language(ts_ts.language_tsx()))
+        # Per-language tree-sitter parsers ("js", "ts", "tsx"), built on
+        # first use: a project may never contain some of the three
+        self._ts_parsers: dict[str, Parser] = {}
 
         # Resolvers for cross-file resolution (initialized in set_project_root)
         self._python_resolver: TypeScriptResolver | None = None
@@ -90,6 +89,9 @@ class TypeScriptParser(BaseParser):
         self._use_node_resolver = use_node_resolver
         self._project_root: Path | None = None
 
+        # rel_path -> exports found by parse_file (persisted by the parse cache)
+        self._file_exports: dict[str, list[dict[str, Any]]] = {}
+
         # For backward compatibility
         self._resolver: TypeScriptResolver | None = None
 
@@ -140,12 +142,17 @@ class TypeScriptParser(BaseParser):
     def _get_parser(self, file_path: Path) -> Parser:
         """Get the appropriate parser for the file extension."""
         ext = file_path.suffix.lower()
-        if ext == ".tsx":
-            return self._tsx_parser
-        elif ext == ".ts":
-            return self._ts_parser
-        else:  # .js, .jsx
-            return self._js_parser
+        lang = ext[1:] if ext in (".ts", ".tsx") else "js"  # .js, .jsx
+        parser = self._ts_parsers.get(lang)
+        if parser is None:
+            if lang == "tsx":
+                language = ts_ts.language_tsx()
+            elif lang == "ts":
+                language = ts_ts.language_typescript()
+            else:
+                language = ts_js.language()
+            parser = self._ts_parsers[lang] = Parser(Language(language))
+        return parser
 
     def parse_file(
         self, file_path: Path, root_path: Path
@@ -189,13 +196,28 @@ class TypeScriptParser(BaseParser):
         all_edges = visitor.edges
 
         # Register exports with resolver if available
-        if self._resolver is not None:
-            exports = visitor.get_exports()
-            if exports:
-                self._resolver.register_exports(rel_path, exports)
+        exports = visitor.get_exports()
+        if exports:
+            self._file_exports[rel_path] = exports
+        else:
+            self._file_exports.pop(rel_path, None)
+        if self._resolver is not None and exports:
+            self._resolver.register_exports(rel_path, exports)
 
         return all_nodes, all_edges
 
+    def get_file_state(self, rel_path: str) -> Any:
+        """Exports of ``rel_path``, needed by the resolver on cache hits."""
+        return self._file_exports.get(rel_path)
+
+    def restore_file_state(self, rel_path: str, state: Any) -> None:
+        """Register cached exports as if the file had just been parsed."""
+        if not state:
+            return
+        self._file_exports[rel_path] = state
+        if self._resolver is not None:
+            self._resolver.register_exports(rel_path, state)
+
     def resolve_name(
         self, file_path: str, line: int, column: int, project_root: str
     ) -> Resolution:
@@ -0,0 +1,391 @@
+"""Project file scanner shared by parsing, sync and the file-walking tools.
+
+One ``os.scandir`` walk replaces the per-caller ``Path.rglob("*")`` loops,
+which listed and ``stat()``ed every file, including the ones inside
+``node_modules``, virtualenvs or data directories, before filtering them.
+Ignored directories are pruned before they are entered:
+
+- built-in skips: tool, cache and build directories (``SKIP_DIRS``),
+  virtualenv-like names and a top-level ``lib/``;
+- ``.gitignore`` files, at the root and in subdirectories, with git's
+  pattern rules (``!`` negation, ``/`` anchoring, ``**``, trailing ``/``);
+- the ``exclude_patterns`` list in ``.lens/config.json``, in the same
+  syntax, applied below the project's ``.gitignore`` files.
+
+Paths are reported relative to the project root, in sorted order.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import re
+from collections.abc import Collection, Iterable, Iterator, Sequence
+from fnmatch import fnmatchcase
+from pathlib import Path
+from typing import NamedTuple
+
+logger = logging.getLogger(__name__)
+
+# Directories never scanned, wherever they are
+SKIP_DIRS = frozenset({
+    "__pycache__", ".git", ".lens", ".venv", "venv", "env", "node_modules",
+    ".mypy_cache", ".pytest_cache", ".ruff_cache", "dist", "build", ".eggs",
+    ".tox", "site-packages",
+    ".next", ".nuxt", ".output", "coverage", "htmlcov", ".nyc_output",
+    "out",  # Next.js static export
+})
+# Skipped only at the project root: "lib" is Python stdlib, but "src/lib/"
+# is a standard React/Vite utility directory
+SKIP_TOPLEVEL_DIRS = frozenset({"lib"})
+VENV_SUFFIXES = ("-env", "-venv", "_env", "_venv")
+
+# Files that ignore patterns never hide: local env files are usually
+# untracked, but they are where the env mappers find variable definitions
+ALWAYS_SCANNED = (".env*",)
+
+CONFIG_KEY = "exclude_patterns"
+
+
+class FileEntry(NamedTuple):
+    """A scanned file: path relative to the root (``/``-separated) and stat."""
+
+    path: str
+    mtime: float
+    size: int
+    inode: int
+
+
+class _Rule(NamedTuple):
+    regex: re.Pattern[str]
+    negate: bool
+    dir_only: bool
+
+
+def _translate(pattern: str) -> str:
+    """Regex for a gitignore glob (no anchoring or negation handling)."""
+    out: list[str] = []
+    i, n = 0, len(pattern)
+    while i < n:
+        c = pattern[i]
+        if c == "*":
+            if pattern.startswith("**", i) and (i == 0 or pattern[i - 1] == "/"):
+                if pattern.startswith("/", i + 2):  # "**/": any leading dirs
+                    out.append("(?:.*/)?")
+                    i += 3
+                    continue
+                if i + 2 == n:  # trailing "/**": everything inside
+                    out.append(".*")
+                    i += 2
+                    continue
+            while i < n and pattern[i] == "*":
+                i += 1
+            out.append("[^/]*")
+            continue
+        if c == "?":
+            out.append("[^/]")
+        elif c == "[":
+            end = pattern.find("]", i + 2)
+            if end == -1:
+                out.append(re.escape(c))
+            else:
+                body = pattern[i + 1:end]
+                if body[0] == "!":
+                    body = "^" + body[1:]
+                out.append("[" + body.replace("\\", "\\\\") + "]")
+                i = end + 1
+                continue
+        elif c == "\\" and i + 1 < n:
+            i += 1
+            out.append(re.escape(pattern[i]))
+        else:
+            out.append(re.escape(c))
+        i += 1
+    return "".join(out)
+
+
+def compile_patterns(lines: Iterable[str]) -> list[_Rule]:
+    """Compile gitignore-style lines; blank lines and comments are skipped."""
+    rules: list[_Rule] = []
+    for line in lines:
+        line = line.rstrip("\r\n").rstrip(" ")
+        if not line or line.startswith("#"):
+            continue
+        negate = line.startswith("!")
+        if negate:
+            line = line[1:]
+        elif line.startswith(("\\!", "\\#")):
+            line = line[1:]
+        dir_only = line.endswith("/")
+        line = line.rstrip("/")
+        if not line:
+            continue
+        # A slash anywhere but at the end anchors the pattern to its base
+        anchored = "/" in line
+        regex = _translate(line.lstrip("/"))
+        if not anchored:
+            regex = "(?:.*/)?" + regex
+        try:
+            rules.append(_Rule(re.compile(regex + r"\Z", re.DOTALL), negate, dir_only))
+        except re.error:
+            logger.debug("Ignoring invalid ignore pattern %r", line)
+    return rules
+
+
+def load_exclude_patterns(config_path: Path) -> list[str]:
+    """The ``exclude_patterns`` list of a LensPR config.json ([] if unset)."""
+    import json
+
+    try:
+        config = json.loads(config_path.read_text())
+    except (OSError, ValueError):
+        return []
+    patterns = config.get(CONFIG_KEY) if isinstance(config, dict) else None
+    return [p for p in patterns if isinstance(p, str)] if isinstance(patterns, list) else []
+
+
+def _read_gitignore(path: str) -> list[_Rule]:
+    try:
+        with open(path, encoding="utf-8", errors="replace") as f:
+            return compile_patterns(f)
+    except OSError:
+        return []
+
+
+class FileScanner:
+    """Walks a project tree, pruning ignored directories before descending.
+
+    Args:
+        root: Project root.
+        exclude_patterns: Extra gitignore-style patterns, relative to
+            ``root`` (the ``exclude_patterns`` list of config.json).
+        gitignore: Honour ``.gitignore`` files (and ``.git/info/exclude``).
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        exclude_patterns: Iterable[str] = (),
+        gitignore: bool = True,
+    ) -> None:
+        self.root = root
+        self.gitignore = gitignore
+        self._base_rules = compile_patterns(exclude_patterns)
+        if gitignore:
+            self._base_rules += _read_gitignore(os.path.join(root, ".git", "info", "exclude"))
+        # Per-directory .gitignore rules for is_ignored(), read on demand
+        self._dir_rules: dict[str, list[_Rule]] = {}
+
+    def walk(
+        self,
+        skipped: dict[str, int] | None = None,
+        start: str = "",
+        stamps: dict[str, int] | None = None,
+    ) -> Iterator[tuple[str, os.DirEntry[str]]]:
+        """Yield ``(relative path, entry)`` for every file that is not ignored.
+
+        Directory symlinks are not followed. Nothing is ``stat()``ed.
+
+        Args:
+            skipped: If given, counts pruned directories by name.
+            start: Walk only this subdirectory (relative to the root);
+                nothing is yielded if it is ignored itself.
+            stamps: If given, receives the ``st_mtime_ns`` of every
+                directory scanned (taken before listing it, keyed by its
+                ``/``-terminated prefix, ``""`` for the root) and of every
+                ``.gitignore`` read (see ``lenspr.staleness``).
+        """
+        parts = [part for part in start.split("/") if part]
+        # (relative dir prefix, rules) from the root down to the current dir
+        layers: list[tuple[str, list[_Rule]]] = [("", self._base_rules)]
+        prefix = ""
+        for depth, part in enumerate(parts):
+            layers = self._with_gitignore(layers, prefix)
+            rel = prefix + part
+            if self._skip_dir(part, top_level=depth == 0) or _match(layers, rel, True):
+                return
+            prefix = rel + "/"
+        yield from self._walk(
+            os.path.join(self.root, *parts), prefix, layers, skipped, stamps,
+        )
+
+    def _walk(
+        self,
+        path: str,
+        prefix: str,
+        layers: list[tuple[str, list[_Rule]]],
+        skipped: dict[str, int] | None,
+        stamps: dict[str, int] | None,
+    ) -> Iterator[tuple[str, os.DirEntry[str]]]:
+        try:
+            if stamps is not None:
+                # Before listing: a file created meanwhile moves the stamp
+                stamps[prefix] = os.stat(path).st_mtime_ns
+            with os.scandir(path) as it:
+                entries = sorted(it, key=lambda e: e.name)
+        except OSError as e:
+            logger.debug("Cannot scan %s: %s", path, e)
+            return
+
+        if self.gitignore:
+            for entry in entries:
+                if entry.name == ".gitignore":
+                    if stamps is not None:
+                        try:
+                            stamps[prefix + ".gitignore"] = entry.stat().st_mtime_ns
+                        except OSError:
+                            pass
+                    rules = _read_gitignore(entry.path)
+                    if rules:
+                        layers = [*layers, (prefix, rules)]
+                    break
+
+        for entry in entries:
+            name = entry.name
+            rel = prefix + name
+            try:
+                is_dir = entry.is_dir(follow_symlinks=False)
+            except OSError:
+                continue
+            if is_dir:
+                if self._skip_dir(name, top_level=not prefix) or _match(layers, rel, True):
+                    if skipped is not None:
+                        skipped[name] = skipped.get(name, 0) + 1
+                    continue
+                yield from self._walk(entry.path, rel + "/", layers, skipped, stamps)
+                continue
+            try:
+                if not entry.is_file():
+                    continue
+            except OSError:
+                continue
+            if _match(layers, rel, False) and not _always_scanned(name):
+                continue
+            yield rel, entry
+
+    def scan(
+        self,
+        suffixes: Collection[str] | None = None,
+        names: Iterable[str] = (),
+        skipped: dict[str, int] | None = None,
+        start: str = "",
+        stamps: dict[str, int] | None = None,
+    ) -> list[FileEntry]:
+        """List the files that are not ignored, with their stat, in one pass.
+
+        Args:
+            suffixes: Keep files with one of these extensions (compared
+                lower-cased, e.g. ``{".py", ".ts"}``).
+            names: Keep files whose name matches one of these globs
+                (e.g. ``"Dockerfile*"``). With neither filter, every file
+                is kept.
+            skipped: If given, counts pruned directories by name.
+            start: Scan only this subdirectory (relative to the root).
+            stamps: If given, receives directory stamps (see ``walk``).
+        """
+        names = tuple(names)
+        entries: list[FileEntry] = []
+        for rel, entry in self.walk(skipped, start, stamps):
+            if suffixes is not None or names:
+                name = entry.name
+                if not (
+                    (suffixes is not None and os.path.splitext(name)[1].lower() in suffixes)
+                    or any(fnmatchcase(name, pattern) for pattern in names)
+                ):
+                    continue
+            try:
+                st = entry.stat()
+            except OSError:
+                continue  # Removed while scanning
+            entries.append(FileEntry(rel, st.st_mtime, st.st_size, st.st_ino))
+        return entries
+
+    def is_ignored(self, rel_path: str) -> bool:
+        """Whether a file at ``rel_path`` (relative to the root) is ignored.
+
+        Applies the same rules as ``walk`` to the file and each of its
+        parent directories, without scanning anything else.
+        """
+        parts = Path(rel_path).parts
+        layers: list[tuple[str, list[_Rule]]] = [("", self._base_rules)]
+        prefix = ""
+        for depth, part in enumerate(parts):
+            layers = self._with_gitignore(layers, prefix)
+            rel = prefix + part
+            if depth == len(parts) - 1:
+                return _match(layers, rel, False) and not _always_scanned(part)
+            if self._skip_dir(part, top_level=depth == 0) or _match(layers, rel, True):
+                return True
+            prefix = rel + "/"
+        return False
+
+    def _with_gitignore(
+        self, layers: list[tuple[str, list[_Rule]]], prefix: str,
+    ) -> list[tuple[str, list[_Rule]]]:
+        """``layers`` plus the ``.gitignore`` of directory ``prefix``, if any."""
+        if not self.gitignore:
+            return layers
+        rules = self._dir_rules.get(prefix)
+        if rules is None:
+            rules = self._dir_rules[prefix] = _read_gitignore(
+                os.path.join(self.root, prefix, ".gitignore")
+            )
+        return [*layers, (prefix, rules)] if rules else layers
+
+    @staticmethod
+    def _skip_dir(name: str, top_level: bool) -> bool:
+        return (
+            name in SKIP_DIRS
+            or (top_level and name in SKIP_TOPLEVEL_DIRS)
+            or name.endswith(VENV_SUFFIXES)
+        )
+
+
+def _match(layers: list[tuple[str, list[_Rule]]], rel: str, is_dir: bool) -> bool:
+    """Apply ignore rules to ``rel``: the last matching pattern decides."""
+    for prefix, rules in reversed(layers):
+        sub = rel[len(prefix):]
+        for rule in reversed(rules):
+            if (is_dir or not rule.dir_only) and rule.regex.match(sub):
+                return not rule.negate
+    return False
+
+
+def _always_scanned(name: str) -> bool:
+    return any(fnmatchcase(name, pattern) for pattern in ALWAYS_SCANNED)
+
+
+# Hashing threads: hashlib releases the GIL while hashing, and so does I/O
+HASH_WORKERS = min(8, os.cpu_count() or 1)
+
+
+def content_hash(path: str | os.PathLike[str]) -> str | None:
+    """BLAKE2b-128 (hex) of a file's bytes, or None if it cannot be read.
+
+    Streamed through a reused buffer rather than memory-mapped: a file
+    truncated while mapped (an editor saving) would raise SIGBUS.
+    """
+    import hashlib
+
+    try:
+        with open(path, "rb") as f:
+            return hashlib.file_digest(f, lambda: hashlib.blake2b(digest_size=16)).hexdigest()
+    except OSError:
+        return None
+
+def hash_files(
+    paths: Sequence[str | os.PathLike[str]], workers: int | None = None,
+) -> list[str | None]:
+    """``content_hash`` of each path, in order, on a thread pool.
+
+    Args:
+        workers: Hashing threads (default ``HASH_WORKERS``); 1 hashes
+            in the calling thread.
+    """
+    workers = min(workers or HASH_WORKERS, len(paths))
+    if workers <= 1:
+        return [content_hash(path) for path in paths]
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="lenspr-hash") as pool:
+        return list(pool.map(content_hash, paths))
@@ -0,0 +1,101 @@
+"""Staleness tracking: knowing whether the graph is behind the files.
+
+Two sources, from cheapest to most expensive:
+
+- ``ChangeTracker``: filled by a file watcher with the paths it saw change.
+  While the watcher is alive, "is the graph current?" is a comparison of
+  two counters, and catching up means syncing just the reported paths.
+- Directory stamps (``stamps_unchanged``): the mtimes of every scanned
+  directory (and ``.gitignore``) at the last full scan. Creating, deleting
+  or renaming a file changes its directory's mtime, so while no stamp
+  moved, the set of files is the one fingerprinted and only those files
+  need a ``stat()``; no directory is listed.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from collections.abc import Callable, Iterable
+from pathlib import Path
+
+
+class ChangeTracker:
+    """Paths reported changed by a file watcher, with a generation counter.
+
+    Every reported change bumps ``generation``; a completed sync records
+    the generation it covered in ``synced_generation``. The graph is
+    current when both match, which stays true for an in-flight sync until
+    it finishes (readers then wait on the context's lock).
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._dirty: set[str] = set()
+        self._rescan = False
+        self._is_alive: Callable[[], bool] | None = None
+        self.generation = 0
+        self.synced_generation = 0
+
+    def attach(self, is_alive: Callable[[], bool]) -> None:
+        """Start trusting a watcher; ``is_alive`` reports whether it runs.
+
+        Changes made before the watcher started were never reported, so
+        the first catch-up is a full incremental sync.
+        """
+        with self._lock:
+            self._is_alive = is_alive
+            self._rescan = True
+            self.generation += 1
+
+    def detach(self) -> None:
+        """Stop trusting the watcher (readers fall back to scanning)."""
+        with self._lock:
+            self._is_alive = None
+
+    def is_watching(self) -> bool:
+        is_alive = self._is_alive
+        return is_alive is not None and bool(is_alive())
+
+    def is_clean(self) -> bool:
+        """No change reported since the last completed sync."""
+        return self.generation == self.synced_generation
+
+    def mark_dirty(self, path: str) -> None:
+        with self._lock:
+            self._dirty.add(path)
+            self.generation += 1
+
+    def take(self) -> tuple[set[str], bool, int]:
+        """Claim the pending changes for a sync.
+
+        Returns:
+            (paths, rescan, generation): the reported paths, whether a
+            full incremental sync is needed instead, and the generation
+            to pass to ``mark_synced`` once the sync succeeded.
+        """
+        with self._lock:
+            paths, self._dirty = self._dirty, set()
+            rescan, self._rescan = self._rescan, False
+            return paths, rescan, self.generation
+
+    def restore(self, paths: Iterable[str], rescan: bool) -> None:
+        """Put back changes whose sync failed, so the next one retries them."""
+        with self._lock:
+            self._dirty.update(paths)
+            self._rescan = self._rescan or rescan
+
+    def mark_synced(self, generation: int) -> None:
+        with self._lock:
+            self.synced_generation = max(self.synced_generation, generation)
+
+
+def stamps_unchanged(root: Path, stamps: dict[str, int]) -> bool:
+    """Whether every stamped path (relative to ``root``) keeps its mtime_ns."""
+    for rel, mtime_ns in stamps.items():
+        try:
+            if os.stat(os.path.join(root, rel)).st_mtime_ns != mtime_ns:
+                return False
+        except OSError:
+            return False
+    return True
@@ -54,12 +54,14 @@ class ParseStats:
 
     project_root: Path
     languages: dict[str, LanguageStats] = field(default_factory=dict)
-    skipped_dirs: dict[str, int] = field(default_factory=dict)  # dir_name -> file_count
+    skipped_dirs: dict[str, int] = field(default_factory=dict)  # dir_name -> pruned dirs
     unparsed_extensions: dict[str, int] = field(default_factory=dict)  # ext -> file_count
     infra_files: dict[str, int] = field(default_factory=dict)  # label -> file_count
     warnings: list[str] = field(default_factory=list)
     total_time_ms: float = 0.0
-    total_project_files: int = 0  # All files found (code + non-code + in skipped dirs)
+    total_project_files: int = 0  # All files scanned (code + non-code)
+    jedi_goto_calls: int = 0  # Jedi goto() calls made while parsing
+    jedi_goto_saved: int = 0  # goto() calls avoided by batch resolution (known IDs + memo)
 
     @property
     def total_files(self) -> int:
@@ -114,9 +116,9 @@ class ParseStats:
             confidence = edge.confidence.value
             lang_stats.edge_counts[confidence] = lang_stats.edge_counts.get(confidence, 0) + 1
 
-    def add_skipped_dir(self, dir_name: str, file_count: int = 1) -> None:
-        """Track skipped directory."""
-        self.skipped_dirs[dir_name] = self.skipped_dirs.get(dir_name, 0) + file_count
+    def add_skipped_dir(self, dir_name: str, count: int = 1) -> None:
+        """Track directories pruned from the scan, by name."""
+        self.skipped_dirs[dir_name] = self.skipped_dirs.get(dir_name, 0) + count
 
     def add_warning(self, warning: str) -> None:
         """Add a warning message."""
@@ -186,7 +188,7 @@ def format_stats_report(stats: ParseStats) -> str:
     lines.append(f"  {'Total:'.ljust(24)}{stats.total_files:>6} files")
 
     if stats.total_skipped > 0:
-        lines.append(f"  {'Skipped:'.ljust(24)}{stats.total_skipped:>6} files")
+        lines.append(f"  {'Skipped:'.ljust(24)}{stats.total_skipped:>6} dirs")
 
     lines.append("")
 
@@ -222,6 +224,12 @@ def format_stats_report(stats: ParseStats) -> str:
         if unresolved > 0:
             lines.append(f"    Unresolved: {unresolved:>5} (dynamic)")
 
+    if stats.jedi_goto_calls or stats.jedi_goto_saved:
+        lines.append(
+            f"  Jedi goto calls: {stats.jedi_goto_calls} "
+            f"({stats.jedi_goto_saved} saved by batch resolution)"
+        )
+
     lines.append("")
 
     # Infrastructure files processed by mappers
@@ -0,0 +1,152 @@
+"""Thread pools that run MCP tool calls off the server's event loop.
+
+FastMCP awaits tools on a single event loop, so a synchronous handler
+blocks every other request until it returns. ``ToolExecutor`` hands each
+call to a pool chosen by the tool's kind:
+
+- read tools run concurrently, each inside ``LensContext.graph_reader()``
+  so a sync never patches the graph they hold (it swaps in a copy);
+- long-running tools (test runs, tracing, external scanners) get a small
+  pool of their own so they cannot starve reads, and report progress
+  while they run;
+- write tools go through a single thread, one at a time in arrival order.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import os
+import time
+from collections.abc import Awaitable, Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from lenspr.context import LensContext
+
+# Tools that change source files, the graph or .lens state
+WRITE_TOOLS = frozenset({
+    "lens_update_node",
+    "lens_patch_node",
+    "lens_add_node",
+    "lens_delete_node",
+    "lens_rename",
+    "lens_batch",
+    "lens_save_annotation",
+    "lens_batch_save_annotations",
+    "lens_session_write",
+    "lens_session_handoff",
+    "lens_arch_rule_add",
+    "lens_arch_rule_delete",
+})
+
+# Read tools that spawn subprocesses or walk the whole project
+LONG_RUNNING_TOOLS = frozenset({
+    "lens_run_tests",
+    "lens_trace",
+    "lens_security_scan",
+    "lens_dep_audit",
+    "lens_vibecheck",
+    "lens_test_coverage",
+})
+
+READ_WORKERS = max(2, min(8, os.cpu_count() or 1))
+LONG_RUNNING_WORKERS = 2
+# Seconds between progress notifications of a long-running tool
+PROGRESS_INTERVAL = 5.0
+
+# Sends one progress notification: (seconds elapsed, message)
+ProgressReporter = Callable[[float, str], Awaitable[None]]
+
+
+def tool_kind(name: str) -> str:
+    """Which pool runs ``name``: "write", "long" or "read"."""
+    if name in WRITE_TOOLS:
+        return "write"
+    if name in LONG_RUNNING_TOOLS:
+        return "long"
+    return "read"
+
+
+class ToolExecutor:
+    """Runs tool functions on the read, long-running and writer pools."""
+
+    def __init__(
+        self,
+        ctx: LensContext,
+        read_workers: int = READ_WORKERS,
+        long_running_workers: int = LONG_RUNNING_WORKERS,
+        progress_interval: float = PROGRESS_INTERVAL,
+    ) -> None:
+        self._ctx = ctx
+        self.progress_interval = progress_interval
+        self._pools = {
+            "read": ThreadPoolExecutor(read_workers, thread_name_prefix="lenspr-read"),
+            "long": ThreadPoolExecutor(
+                long_running_workers, thread_name_prefix="lenspr-long",
+            ),
+            # A single thread is the writer queue
+            "write": ThreadPoolExecutor(1, thread_name_prefix="lenspr-write"),
+        }
+
+    def submit(self, name: str, fn: Callable[..., Any], /, **kwargs: Any) -> Future[Any]:
+        """Schedule ``fn(**kwargs)`` on the pool for tool ``name``."""
+        kind = tool_kind(name)
+        if kind == "write":
+            return self._pools[kind].submit(fn, **kwargs)
+        return self._pools[kind].submit(self._read, fn, kwargs)
+
+    def _read(self, fn: Callable[..., Any], kwargs: dict[str, Any]) -> Any:
+        with self._ctx.graph_reader():
+            return fn(**kwargs)
+
+    async def run(
+        self,
+        name: str,
+        fn: Callable[..., Any],
+        kwargs: dict[str, Any],
+        progress: ProgressReporter | None = None,
+    ) -> Any:
+        """Run ``fn(**kwargs)`` for tool ``name`` without blocking the loop.
+
+        Long-running tools call ``progress`` every ``progress_interval``
+        seconds until they finish. Cancelling the awaiting task does not
+        stop a call that already started; its result is dropped.
+        """
+        future = asyncio.wrap_future(self.submit(name, fn, **kwargs))
+        if progress is None or tool_kind(name) != "long":
+            return await future
+
+        start = time.monotonic()
+        while True:
+            done, _ = await asyncio.wait({future}, timeout=self.progress_interval)
+            if done:
+                return future.result()
+            elapsed = time.monotonic() - start
+            await progress(elapsed, f"{name} running for {elapsed:.0f}s")
+
+    def wrap(
+        self,
+        name: str,
+        fn: Callable[..., Any],
+        progress: Callable[[], ProgressReporter | None] | None = None,
+    ) -> Callable[..., Awaitable[Any]]:
+        """Async version of tool function ``fn``, with its signature.
+
+        Args:
+            name: Tool name, selects the pool.
+            fn: Synchronous tool function taking keyword arguments.
+            progress: Called inside the request to get its progress
+                reporter (the request context only exists there).
+        """
+
+        @functools.wraps(fn)
+        async def run_tool(**kwargs: Any) -> Any:
+            return await self.run(name, fn, kwargs, progress() if progress else None)
+
+        return run_tool
+
+    def shutdown(self, wait: bool = True) -> None:
+        for pool in self._pools.values():
+            pool.shutdown(wait=wait)
@@ -2,92 +2,11 @@
 
 from __future__ import annotations
 
+import importlib
 from collections.abc import Callable
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from lenspr.models import ToolResponse
-from lenspr.tools.analysis import (
-    handle_check_impact,
-    handle_dead_code,
-    handle_dependencies,
-    handle_diff,
-    handle_find_usages,
-    handle_health,
-    handle_validate_change,
-)
-from lenspr.tools.annotation import (
-    handle_annotate,
-    handle_annotate_batch,
-    handle_annotation_stats,
-    handle_batch_save_annotations,
-    handle_save_annotation,
-)
-from lenspr.tools.arch import (
-    handle_class_metrics,
-    handle_compare_classes,
-    handle_components,
-    handle_largest_classes,
-    handle_project_metrics,
-)
-from lenspr.tools.explain import (
-    handle_explain,
-)
-from lenspr.tools.git import (
-    handle_blame,
-    handle_commit_scope,
-    handle_node_history,
-    handle_recent_changes,
-)
-from lenspr.tools.modification import (
-    handle_add_node,
-    handle_batch,
-    handle_delete_node,
-    handle_patch_node,
-    handle_rename,
-    handle_update_node,
-)
-from lenspr.tools.navigation import (
-    handle_context,
-    handle_get_connections,
-    handle_get_node,
-    handle_get_structure,
-    handle_grep,
-    handle_list_nodes,
-    handle_search,
-)
-from lenspr.tools.resolvers import (
-    handle_api_map,
-    handle_db_map,
-    handle_env_map,
-)
-from lenspr.tools.safety import (
-    handle_arch_check,
-    handle_arch_rule_add,
-    handle_arch_rule_delete,
-    handle_arch_rule_list,
-    handle_dep_audit,
-    handle_nfr_check,
-    handle_security_scan,
-    handle_test_coverage,
-    handle_vibecheck,
-)
-from lenspr.tools.schemas import LENS_TOOLS
-from lenspr.tools.session import (
-    handle_session_handoff,
-    handle_session_read,
-    handle_session_write,
-)
-from lenspr.tools.temporal import (
-    handle_hotspots,
-    handle_node_timeline,
-)
-from lenspr.tools.testing import (
-    handle_run_tests,
-)
-from lenspr.tools.trace import (
-    handle_trace,
-    handle_trace_stats,
-)
 
 if TYPE_CHECKING:
     from lenspr.context import LensContext
@@ -244,6 +163,23 @@ _HANDLER_MAP: dict[str, tuple[str, str]] = {
     "lens_trace_stats": ("lenspr.tools.trace", "handle_trace_stats"),
 }
 
+
+def __getattr__(name: str) -> Any:
+    """Resolve the handler re-exports (and ``LENS_TOOLS``) on first access.
+
+    Tool modules are imported when a handler is first looked up rather than
+    with the package, so dispatching one tool does not load all of them.
+    """
+    if name == "LENS_TOOLS":
+        from lenspr.tools.schemas import LENS_TOOLS
+
+        return LENS_TOOLS
+    for module_name, func_name in _HANDLER_MAP.values():
+        if func_name == name:
+            return getattr(importlib.import_module(module_name), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 # Hot-reload mode: when True, handlers are unconditionally reloaded each call.
 # By default, mtime-based reload handles the common case automatically.
 _hot_reload_enabled: bool = False
@@ -5,8 +5,11 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Any
 
 from lenspr import database, graph
-from lenspr.models import ToolResponse
+from lenspr.models import Node, ToolResponse
 from lenspr.tools.entry_points import (
+    ENTRY_POINT_PATTERNS,
+    CheckField,
+    MatchOp,
     collect_entry_points,
     collect_public_api,
     expand_entry_points,
@@ -26,7 +29,7 @@ def handle_check_impact(params: dict, ctx: LensContext) -> ToolResponse:
     if err:
         return err
     depth = params.get("depth", 2)
-    impact = graph.get_impact_zone(nx_graph, node_id, depth)
+    impact = graph.get_impact_zone(ctx.get_csr_graph(), node_id, depth)
 
     # Calculate severity based on impact
     total_affected = impact.get("total_affected", 0)
@@ -113,8 +116,7 @@ def handle_validate_change(params: dict, ctx: LensContext) -> ToolResponse:
 
     proactive_warnings = get_proactive_warnings(node_id, new_source, ctx)
     validation = validate_full(new_source, node)
-    nx_graph = ctx.get_graph()
-    impact = graph.get_impact_zone(nx_graph, node_id, depth=2)
+    impact = graph.get_impact_zone(ctx.get_csr_graph(), node_id, depth=2)
     all_warnings = proactive_warnings + validation.warnings
 
     return ToolResponse(
@@ -142,14 +144,6 @@ def handle_validate_change(params: dict, ctx: LensContext) -> ToolResponse:
 
 def handle_diff(params: dict, ctx: LensContext) -> ToolResponse:
     """Compare current filesystem against graph DB without syncing."""
-    parser = ctx._parser
-    extensions = set(parser.get_file_extensions())
-    skip_dirs = {
-        "__pycache__", ".git", ".lens", ".venv", "venv", "env",
-        "node_modules", ".mypy_cache", ".pytest_cache", ".ruff_cache",
-        "dist", "build", ".eggs", ".tox",
-    }
-
     old_nodes, _ = database.load_graph(ctx.graph_db)
     old_by_file: dict[str, list[dict[str, Any]]] = {}
     for n in old_nodes:
@@ -158,15 +152,8 @@ def handle_diff(params: dict, ctx: LensContext) -> ToolResponse:
         })
     old_files = set(old_by_file.keys())
 
-    current_files: set[str] = set()
-    for file_path in sorted(ctx.project_root.rglob("*")):
-        if not file_path.is_file():
-            continue
-        if any(part in skip_dirs for part in file_path.parts):
-            continue
-        if file_path.suffix not in extensions:
-            continue
-        current_files.add(str(file_path.relative_to(ctx.project_root)))
+    current = ctx._scan_fingerprints()
+    current_files = set(current)
 
     fingerprints = ctx._load_fingerprints()
 
@@ -175,12 +162,10 @@ def handle_diff(params: dict, ctx: LensContext) -> ToolResponse:
     modified_files: list[str] = []
 
     for rel in sorted(current_files & old_files):
-        file_path = ctx.project_root / rel
-        stat = file_path.stat()
         old_fp = fingerprints.get(rel, {})
         if (
-            stat.st_mtime != old_fp.get("mtime")
-            or stat.st_size != old_fp.get("size")
+            current[rel]["mtime"] != old_fp.get("mtime")
+            or current[rel]["size"] != old_fp.get("size")
         ):
             modified_files.append(rel)
 
@@ -219,7 +204,9 @@ def handle_health(params: dict, ctx: LensContext) -> ToolResponse:
             continue
         project_nodes += 1
         nodes_by_type[ntype] = nodes_by_type.get(ntype, 0) + 1
-        if ntype in ("function", "method", "class") and not data.get("docstring"):
+        # Lean graphs (the default) carry a flag instead of the docstring
+        has_docstring = data.get("has_docstring", bool(data.get("docstring")))
+        if ntype in ("function", "method", "class") and not has_docstring:
             nodes_without_docstring += 1
 
     total_edges = nx_graph.number_of_edges()
@@ -247,7 +234,7 @@ def handle_health(params: dict, ctx: LensContext) -> ToolResponse:
             reason = data.get("untracked_reason", "")
             unresolved_edges.append({"from": u, "to": v, "reason": reason})
 
-    cycles = graph.detect_circular_imports(nx_graph)
+    cycles = graph.detect_circular_imports(ctx.get_csr_graph())
 
     internal_confidence_pct = (
         (internal_resolved / internal_total * 100) if internal_total > 0 else 100.0
@@ -285,6 +272,14 @@ def handle_health(params: dict, ctx: LensContext) -> ToolResponse:
             "circular_imports": cycles,
             "unresolved_edges": unresolved_edges[:20],
             "unresolved_count": len(unresolved_edges),
+            "graph_memory": {
+                "mode": "lean" if nx_graph.graph.get("lean") else "full",
+                "estimated_mb": round(graph.estimate_graph_memory(nx_graph) / 2**20, 1),
+                "load_seconds": (
+                    round(ctx.graph_load_seconds, 3)
+                    if ctx.graph_load_seconds is not None else None
+                ),
+            },
         },
     )
 
@@ -440,19 +435,31 @@ def handle_dead_code(params: dict, ctx: LensContext) -> ToolResponse:
     """
     ctx.ensure_synced()
     nx_graph = ctx.get_graph()
+    csr_graph = ctx.get_csr_graph()
 
     entry_points: list[str] = params.get("entry_points", [])
     mode = params.get("mode", "summary")
     file_filter = params.get("file_path")
 
     if not entry_points:
+        # A lean graph holds no source text: match source patterns in SQL
+        source_hits = (
+            {
+                p: database.find_nodes_containing(ctx.graph_db, p.values, p.type_filter)
+                for p in ENTRY_POINT_PATTERNS
+                if p.field is CheckField.SOURCE and p.op is MatchOp.CONTAINS
+            }
+            if nx_graph.graph.get("lean") else None
+        )
         public_api = collect_public_api(nx_graph)
-        entry_set = collect_entry_points(nx_graph)
+        entry_set = collect_entry_points(nx_graph, source_hits=source_hits)
         entry_set.update(public_api)
-        entry_set = expand_entry_points(nx_graph, entry_set)
+        entry_set = expand_entry_points(csr_graph, entry_set)
         entry_points = list(entry_set)
 
-    dead_code = graph.find_dead_code(nx_graph, entry_points)
+    dead_code = graph.find_dead_code(
+        csr_graph, entry_points, reachable=ctx.get_reachable(entry_points)
+    )
 
     dead_by_file: dict[str, list[dict]] = {}
     for nid in dead_code:
@@ -521,10 +528,13 @@ def handle_dead_code(params: dict, ctx: LensContext) -> ToolResponse:
 
 
 def _find_usages_for_node(
-    node_id: str, nx_graph, db_path: str, include_tests: bool = True,
+    node_id: str, nx_graph, node: Node | None, include_tests: bool = True,
 ) -> dict | None:
-    """Find usages for a single node. Returns dict or None if not found."""
-    node = database.get_node(node_id, db_path)
+    """Find usages for a single node. Returns dict or None if not found.
+
+    ``node`` is the target as fetched by the caller (None if it does not
+    exist), so batch lookups share one query.
+    """
     if not node:
         return None
 
@@ -608,10 +618,17 @@ def handle_find_usages(params: dict, ctx: LensContext) -> ToolResponse:
     if node_ids:
         results = []
         not_found = []
+        actual_ids = []
         for nid in node_ids:
             resolved, _ = resolve_or_fail(nid, ctx)
-            actual_id = resolved if resolved else nid
-            result = _find_usages_for_node(actual_id, nx_graph, ctx.graph_db, include_tests)
+            actual_ids.append(resolved if resolved else nid)
+        nodes_by_id = database.get_nodes_by_ids(
+            actual_ids, ctx.graph_db, include_source=False
+        )
+        for nid, actual_id in zip(node_ids, actual_ids, strict=True):
+            result = _find_usages_for_node(
+                actual_id, nx_graph, nodes_by_id.get(actual_id), include_tests
+            )
             if result:
                 results.append(result)
             else:
@@ -641,7 +658,9 @@ def handle_find_usages(params: dict, ctx: LensContext) -> ToolResponse:
     if err:
         return err
 
-    result = _find_usages_for_node(node_id, nx_graph, ctx.graph_db, include_tests)
+    result = _find_usages_for_node(
+        node_id, nx_graph, database.get_node(node_id, ctx.graph_db), include_tests
+    )
     if not result:
         return ToolResponse(
             success=False,
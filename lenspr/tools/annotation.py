@@ -161,6 +161,7 @@ def handle_annotate_batch(params: dict, ctx: LensContext) -> ToolResponse:
         ctx.graph_db,
         type_filter=type_filter,
         file_filter=file_path,
+        include_source=False,
     )
 
     # Filter to annotatable types
@@ -226,6 +227,9 @@ def handle_batch_save_annotations(params: dict, ctx: LensContext) -> ToolRespons
 
     saved = []
     errors = []
+    nodes_by_id = database.get_nodes_by_ids(
+        (ann["node_id"] for ann in annotations if ann.get("node_id")), ctx.graph_db
+    )
 
     for ann in annotations:
         node_id = ann.get("node_id")
@@ -243,7 +247,7 @@ def handle_batch_save_annotations(params: dict, ctx: LensContext) -> ToolRespons
             continue
 
         # Check node exists
-        node = database.get_node(node_id, ctx.graph_db)
+        node = nodes_by_id.get(node_id)
         if not node:
             errors.append({
                 "node_id": node_id,
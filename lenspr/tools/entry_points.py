@@ -11,7 +11,7 @@ over the graph nodes.
 
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Mapping
 from dataclasses import dataclass
 from enum import Enum
 from typing import TYPE_CHECKING
@@ -19,6 +19,8 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     import networkx as nx
 
+    from lenspr.graph import GraphLike
+
 
 # ---------------------------------------------------------------------------
 # Data structures
@@ -386,15 +388,16 @@ def matches_pattern(
 def collect_public_api(nx_graph: nx.DiGraph) -> set[str]:
     """Collect node IDs exported via ``__all__`` in any module.
 
-    Scans all module nodes for ``__all__`` in their source, then marks
-    their direct children (one level deep) as public API entry points.
+    Scans all module nodes for ``__all__`` in their source (or the
+    ``exports_all`` flag of lean graphs), then marks their direct children
+    (one level deep) as public API entry points.
     """
     public_api: set[str] = set()
     for nid, data in nx_graph.nodes(data=True):
         if data.get("type") != "module":
             continue
-        source = data.get("source_code", "")
-        if "__all__" not in source:
+        exports_all = data.get("exports_all", "__all__" in data.get("source_code", ""))
+        if not exports_all:
             continue
         module_prefix = nid + "."
         for other_nid in nx_graph.nodes():
@@ -409,6 +412,7 @@ def collect_entry_points(
     nx_graph: nx.DiGraph,
     patterns: tuple[EntryPointPattern, ...] = ENTRY_POINT_PATTERNS,
     custom_predicates: dict[str, CustomPredicate] | None = None,
+    source_hits: Mapping[EntryPointPattern, set[str]] | None = None,
 ) -> set[str]:
     """Collect entry point node IDs by applying all patterns in one pass.
 
@@ -421,6 +425,10 @@ def collect_entry_points(
         custom_predicates: Extra predicate functions for patterns that
             don't fit the declarative model.  Defaults to the built-in
             ``_CUSTOM_PREDICATES``.
+        source_hits: Precomputed matches of ``CheckField.SOURCE`` patterns
+            (pattern -> matching node IDs), for graphs whose nodes do not
+            carry ``source_code`` (see ``graph.build_lean_graph`` and
+            ``database.find_nodes_containing``).
     """
     if custom_predicates is None:
         custom_predicates = _CUSTOM_PREDICATES
@@ -430,7 +438,11 @@ def collect_entry_points(
     for nid, data in nx_graph.nodes(data=True):
         # Declarative patterns
         for pattern in patterns:
-            if matches_pattern(pattern, data):
+            if source_hits is not None and pattern in source_hits:
+                if nid in source_hits[pattern]:
+                    entry_set.add(nid)
+                    break
+            elif matches_pattern(pattern, data):
                 entry_set.add(nid)
                 break
         else:
@@ -443,7 +455,7 @@ def collect_entry_points(
     return entry_set
 
 
-def expand_entry_points(nx_graph: nx.DiGraph, entry_set: set[str]) -> set[str]:
+def expand_entry_points(nx_graph: GraphLike, entry_set: set[str]) -> set[str]:
     """Graph-based post-processing: expand entry set with related nodes.
 
     Three expansions:
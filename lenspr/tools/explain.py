@@ -95,25 +95,32 @@ def _get_callers_context(
     if node_id not in graph:
         return callers
 
-    for pred_id in graph.predecessors(node_id):
-        pred_node = database.get_node(pred_id, ctx.graph_db)
-        if not pred_node:
-            continue
-
-        source_lines = (pred_node.source_code or "").splitlines()
-        callers.append({
-            "id": pred_id,
-            "name": pred_node.name,
-            "type": pred_node.type.value,
-            "file_path": pred_node.file_path,
-            "signature": pred_node.signature,
-            "source_preview": (
-                "\n".join(source_lines[:3])
-                + ("..." if len(source_lines) > 3 else "")
-            ),
-        })
-        if len(callers) >= limit:
-            break
+    # Fetch (with source) in windows of `limit`: enough for the preview
+    # without loading every caller of a hub
+    pred_ids = list(graph.predecessors(node_id))
+    window_size = max(limit, 1)
+    for start in range(0, len(pred_ids), window_size):
+        window = pred_ids[start:start + window_size]
+        pred_nodes = database.get_nodes_by_ids(window, ctx.graph_db)
+        for pred_id in window:
+            pred_node = pred_nodes.get(pred_id)
+            if not pred_node:
+                continue
+
+            source_lines = (pred_node.source_code or "").splitlines()
+            callers.append({
+                "id": pred_id,
+                "name": pred_node.name,
+                "type": pred_node.type.value,
+                "file_path": pred_node.file_path,
+                "signature": pred_node.signature,
+                "source_preview": (
+                    "\n".join(source_lines[:3])
+                    + ("..." if len(source_lines) > 3 else "")
+                ),
+            })
+            if len(callers) >= limit:
+                return callers
 
     return callers
 
@@ -126,8 +133,10 @@ def _get_callees_context(
     if node_id not in graph:
         return callees
 
-    for succ_id in graph.successors(node_id):
-        succ_node = database.get_node(succ_id, ctx.graph_db)
+    succ_ids = list(graph.successors(node_id))
+    succ_nodes = database.get_nodes_by_ids(succ_ids, ctx.graph_db, include_source=False)
+    for succ_id in succ_ids:
+        succ_node = succ_nodes.get(succ_id)
         if not succ_node:
             continue
 
@@ -439,10 +448,13 @@ def _extract_usage_examples(
 ) -> list[dict]:
     """Extract usage examples from caller source code."""
     examples = []
+    # Fetch full source from DB (not stored in response to keep it lean)
+    caller_nodes = database.get_nodes_by_ids(
+        [c["id"] for c in callers[:3]], ctx.graph_db
+    )
 
     for caller in callers[:3]:  # Limit to 3 examples
-        # Fetch full source from DB (not stored in response to keep it lean)
-        caller_node = database.get_node(caller["id"], ctx.graph_db)
+        caller_node = caller_nodes.get(caller["id"])
         source = caller_node.source_code if caller_node else ""
         if not source:
             continue
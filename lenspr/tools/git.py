@@ -302,31 +302,28 @@ def handle_commit_scope(params: dict, ctx: LensContext) -> ToolResponse:
     # Find nodes that overlap with changed ranges
     affected_nodes: list[dict[str, Any]] = []
     nx_graph = ctx.get_graph()
-
-    for nid, data in nx_graph.nodes(data=True):
-        node_file = data.get("file_path", "")
-        if node_file not in file_changes:
-            continue
-
-        node_start = data.get("start_line", 0)
-        node_end = data.get("end_line", 0)
-        node_type = data.get("type", "")
-
-        # Skip modules (too broad)
-        if node_type == "module":
-            continue
-
-        # Check if any changed range overlaps with this node
-        for change_start, change_end in file_changes[node_file]:
-            if node_start <= change_end and node_end >= change_start:
-                affected_nodes.append({
-                    "id": nid,
-                    "name": data.get("name", ""),
-                    "type": node_type,
-                    "file_path": node_file,
-                    "changed_lines": f"{change_start}-{change_end}",
-                })
-                break
+    line_index = ctx.get_line_index()
+
+    for node_file, ranges in file_changes.items():
+        # First changed range each overlapping node is hit by
+        first_range: dict[str, tuple[int, int]] = {}
+        for change_start, change_end in ranges:
+            for nid in line_index.overlapping(node_file, change_start, change_end):
+                first_range.setdefault(nid, (change_start, change_end))
+
+        for nid, (change_start, change_end) in first_range.items():
+            data = nx_graph.nodes[nid]
+            node_type = data.get("type", "")
+            # Skip modules (too broad)
+            if node_type == "module":
+                continue
+            affected_nodes.append({
+                "id": nid,
+                "name": data.get("name", ""),
+                "type": node_type,
+                "file_path": node_file,
+                "changed_lines": f"{change_start}-{change_end}",
+            })
 
     # Sort by file and type
     affected_nodes.sort(key=lambda x: (x["file_path"], x["type"], x["name"]))
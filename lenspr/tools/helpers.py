@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING
 
 from lenspr import database, graph
 from lenspr.models import ToolResponse
@@ -43,28 +43,22 @@ def resolve_or_fail(
 
 
 def find_containing_node(
-    nx_graph: Any, file_path: str, line_num: int
+    ctx: LensContext, file_path: str, line_num: int
 ) -> dict[str, str] | None:
-    """Find the most specific graph node containing a given line."""
-    best: dict[str, Any] | None = None
-    best_span = float("inf")
-
-    for nid, data in nx_graph.nodes(data=True):
-        if data.get("file_path") != file_path:
-            continue
-        start = data.get("start_line", 0)
-        end = data.get("end_line", 0)
-        if start <= line_num <= end:
-            span = end - start
-            if span < best_span:
-                best_span = span
-                best = {
-                    "id": nid,
-                    "name": data.get("name", ""),
-                    "type": data.get("type", ""),
-                }
-
-    return best
+    """Find the most specific graph node containing a given line.
+
+    Uses the context's per-file line index (``ctx.get_line_index``), so a
+    lookup costs a binary search rather than a scan over every node.
+    """
+    nid = ctx.get_line_index().containing(file_path, line_num)
+    if nid is None:
+        return None
+    data = ctx.get_graph().nodes[nid]
+    return {
+        "id": nid,
+        "name": data.get("name", ""),
+        "type": data.get("type", ""),
+    }
 
 
 def get_proactive_warnings(
@@ -118,7 +112,7 @@ def get_proactive_warnings(
     # Also check by naming convention
     if not has_tests:
         test_nodes = database.search_nodes(
-            f"test_{node_name}", ctx.graph_db, search_in="name"
+            f"test_{node_name}", ctx.graph_db, search_in="name", limit=1
         )
         has_tests = len(test_nodes) > 0
 
@@ -79,8 +79,7 @@ def handle_update_node(params: dict, ctx: LensContext) -> ToolResponse:
         )
 
     # Compute impact FIRST - BEFORE any changes
-    nx_graph = ctx.get_graph()
-    impact = graph.get_impact_zone(nx_graph, node_id, depth=2)
+    impact = graph.get_impact_zone(ctx.get_csr_graph(), node_id, depth=2)
 
     # Calculate severity for visibility
     total = impact.get("total_affected", 0)
@@ -456,28 +455,21 @@ def handle_rename(params: dict, ctx: LensContext) -> ToolResponse:
     needs_review: list[dict] = []
     extensions = get_supported_extensions()
 
-    for ext in extensions:
-        for src_file in ctx.project_root.rglob(f"*{ext}"):
-            rel = str(src_file.relative_to(ctx.project_root))
-            if rel in files_modified:
-                continue
-            # Skip common directories
-            if any(part in src_file.parts for part in (
-                "node_modules", "__pycache__", ".git", ".venv", "venv",
-                ".mypy_cache", ".pytest_cache", "dist", "build", ".lens"
-            )):
-                continue
-            try:
-                text = src_file.read_text(encoding="utf-8")
-            except Exception:
-                continue
-            for i, line in enumerate(text.splitlines(), 1):
-                if old_name in line:
-                    needs_review.append({
-                        "file": rel,
-                        "line": i,
-                        "context": line.strip(),
-                    })
+    for entry in ctx.file_scanner().scan(set(extensions)):
+        rel = entry.path
+        if rel in files_modified:
+            continue
+        try:
+            text = (ctx.project_root / rel).read_text(encoding="utf-8")
+        except Exception:
+            continue
+        for i, line in enumerate(text.splitlines(), 1):
+            if old_name in line:
+                needs_review.append({
+                    "file": rel,
+                    "line": i,
+                    "context": line.strip(),
+                })
 
     if needs_review:
         warnings.append(
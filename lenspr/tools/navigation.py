@@ -2,15 +2,19 @@
 
 from __future__ import annotations
 
+import logging
+import re
 from typing import TYPE_CHECKING, Any
 
 from lenspr import database, graph
-from lenspr.models import ToolResponse
+from lenspr.models import Node, ToolResponse
 from lenspr.tools.helpers import find_containing_node, resolve_or_fail
 
 if TYPE_CHECKING:
     from lenspr.context import LensContext
 
+logger = logging.getLogger(__name__)
+
 
 def handle_list_nodes(params: dict, ctx: LensContext) -> ToolResponse:
     """List all nodes, optionally filtered by type, file, or name."""
@@ -20,6 +24,7 @@ def handle_list_nodes(params: dict, ctx: LensContext) -> ToolResponse:
         type_filter=params.get("type"),
         file_filter=params.get("file_path"),
         name_filter=params.get("name"),
+        include_source=False,
     )
     return ToolResponse(
         success=True,
@@ -68,30 +73,20 @@ def handle_get_node(params: dict, ctx: LensContext) -> ToolResponse:
         total_lines = len((source or "").splitlines())
         source = None  # Don't return source for large containers
 
-        # Find direct children by ID prefix + depth.
-        # Children IDs look like: {node_id}.{child_name} (exactly one dot deeper).
-        prefix = node.id + "."
-        all_nodes = database.get_nodes(ctx.graph_db)
-        child_nodes = []
-        for n in all_nodes:
-            if not n.id.startswith(prefix):
-                continue
-            # Direct child: suffix has no dots (one level deeper)
-            suffix = n.id[len(prefix):]
-            if "." in suffix:
-                continue
-            if n.type.value in ("function", "method", "class"):
-                child_nodes.append({
-                    "id": n.id,
-                    "name": n.name,
-                    "type": n.type.value,
-                    "start_line": n.start_line,
-                    "end_line": n.end_line,
-                    "signature": n.signature,
-                })
-        # Sort by line number
-        child_nodes.sort(key=lambda c: c["start_line"] or 0)
-        children = child_nodes
+        # Direct children: IDs exactly one dotted level deeper (indexed parent_id)
+        children = [
+            {
+                "id": n.id,
+                "name": n.name,
+                "type": n.type.value,
+                "start_line": n.start_line,
+                "end_line": n.end_line,
+                "signature": n.signature,
+            }
+            for n in database.get_child_nodes(
+                node.id, ctx.graph_db, types=("function", "method", "class")
+            )
+        ]
 
         warnings.append(
             f"Large {node.type.value} ({total_lines} lines). "
@@ -147,10 +142,14 @@ def handle_get_connections(params: dict, ctx: LensContext) -> ToolResponse:
 
 
 def handle_search(params: dict, ctx: LensContext) -> ToolResponse:
-    """Search nodes by name or content."""
+    """Search nodes by name or content, best matches first."""
     ctx.ensure_synced()
     search_in = params.get("search_in", "all")
-    nodes = database.search_nodes(params["query"], ctx.graph_db, search_in)
+    limit = params.get("limit", 50)
+    # One extra row tells whether the result was cut off
+    nodes = database.search_nodes(params["query"], ctx.graph_db, search_in, limit + 1)
+    truncated = len(nodes) > limit
+    nodes = nodes[:limit]
     return ToolResponse(
         success=True,
         data={
@@ -165,6 +164,7 @@ def handle_search(params: dict, ctx: LensContext) -> ToolResponse:
                 for n in nodes
             ],
             "count": len(nodes),
+            "truncated": truncated,
         },
     )
 
@@ -204,33 +204,26 @@ def handle_context(params: dict, ctx: LensContext) -> ToolResponse:
             hint="Use lens_search or lens_list_nodes to find valid node IDs.",
         )
 
-    nx_graph = ctx.get_graph()
+    nx_graph = ctx.get_csr_graph()
 
     _CONTAINER_TYPES = ("class", "module")
     _LARGE_THRESHOLD = 10_000
 
     def _get_children(n_id: str) -> list[dict]:
-        """Find direct children of a container node by ID prefix."""
-        prefix = n_id + "."
-        all_nodes = database.get_nodes(ctx.graph_db)
-        result = []
-        for n in all_nodes:
-            if not n.id.startswith(prefix):
-                continue
-            suffix = n.id[len(prefix):]
-            if "." in suffix:
-                continue
-            if n.type.value in ("function", "method", "class"):
-                result.append({
-                    "id": n.id,
-                    "name": n.name,
-                    "type": n.type.value,
-                    "start_line": n.start_line,
-                    "end_line": n.end_line,
-                    "signature": n.signature,
-                })
-        result.sort(key=lambda c: c["start_line"] or 0)
-        return result
+        """Direct children of a container node (indexed parent_id lookup)."""
+        return [
+            {
+                "id": n.id,
+                "name": n.name,
+                "type": n.type.value,
+                "start_line": n.start_line,
+                "end_line": n.end_line,
+                "signature": n.signature,
+            }
+            for n in database.get_child_nodes(
+                n_id, ctx.graph_db, types=("function", "method", "class")
+            )
+        ]
 
     # Container nodes: return metadata + children instead of full source
     source = node.source_code
@@ -278,6 +271,27 @@ def handle_context(params: dict, ctx: LensContext) -> ToolResponse:
     callers: list[dict] = []
     callers_truncated = False
     max_related = 30  # Cap to prevent response size explosion
+    # Related nodes are fetched in batches (no source) as the BFS reaches them
+    fetched: dict[str, Node | None] = {}
+    node_queries = 0
+
+    def _related_node(
+        frontier: list[tuple[str, str]], pos: int, visited: set[str],
+    ) -> Node | None:
+        nonlocal node_queries
+        nid = frontier[pos][0]
+        if nid not in fetched:
+            batch = list(dict.fromkeys(
+                other for other, _ in frontier[pos:]
+                if other not in visited and other not in fetched
+            ))[:max_related]
+            batch = [nid, *(b for b in batch if b != nid)]
+            found = database.get_nodes_by_ids(batch, ctx.graph_db, include_source=False)
+            node_queries += 1
+            for b in batch:
+                fetched[b] = found.get(b)
+        return fetched[nid]
+
     if include_callers and node_id in nx_graph:
         visited: set[str] = set()
         frontier: list[tuple[str, str]] = [
@@ -285,14 +299,14 @@ def handle_context(params: dict, ctx: LensContext) -> ToolResponse:
         ]
         for _level in range(depth):
             next_frontier: list[tuple[str, str]] = []
-            for pred_id, via in frontier:
+            for pos, (pred_id, via) in enumerate(frontier):
                 if len(callers) >= max_related:
                     callers_truncated = True
                     break
                 if pred_id in visited:
                     continue
                 visited.add(pred_id)
-                pred_node = database.get_node(pred_id, ctx.graph_db)
+                pred_node = _related_node(frontier, pos, visited)
                 if not pred_node:
                     continue
                 edge_data = nx_graph.edges.get((pred_id, via), {})
@@ -327,14 +341,14 @@ def handle_context(params: dict, ctx: LensContext) -> ToolResponse:
         ]
         for _level in range(depth):
             next_frontier_out: list[tuple[str, str]] = []
-            for succ_id, via in frontier_out:
+            for pos, (succ_id, via) in enumerate(frontier_out):
                 if len(callees) >= max_related:
                     callees_truncated = True
                     break
                 if succ_id in visited_out:
                     continue
                 visited_out.add(succ_id)
-                succ_node = database.get_node(succ_id, ctx.graph_db)
+                succ_node = _related_node(frontier_out, pos, visited_out)
                 if not succ_node:
                     continue
                 edge_data = nx_graph.edges.get((via, succ_id), {})
@@ -365,21 +379,26 @@ def handle_context(params: dict, ctx: LensContext) -> ToolResponse:
         node_name = node.name
         # Strategy 1: Find test functions that call this node
         if node_id in nx_graph:
-            for pred_id in nx_graph.predecessors(node_id):
-                pred_data = nx_graph.nodes.get(pred_id, {})
-                pred_name = pred_data.get("name", "")
-                pred_file = pred_data.get("file_path", "")
-                if pred_name.startswith("test_") or pred_file.startswith("test_"):
-                    pred_node = database.get_node(pred_id, ctx.graph_db)
-                    if pred_node:
-                        test_info: dict[str, Any] = {
-                            "id": pred_node.id,
-                            "name": pred_node.name,
-                            "file_path": pred_node.file_path,
-                            "start_line": pred_node.start_line,
-                            "end_line": pred_node.end_line,
-                        }
-                        tests.append(test_info)
+            test_ids = [
+                pred_id for pred_id in nx_graph.predecessors(node_id)
+                if nx_graph.nodes[pred_id].get("name", "").startswith("test_")
+                or nx_graph.nodes[pred_id].get("file_path", "").startswith("test_")
+            ]
+            test_nodes_by_id = database.get_nodes_by_ids(
+                test_ids, ctx.graph_db, include_source=False
+            )
+            node_queries += bool(test_ids)
+            for pred_id in test_ids:
+                pred_node = test_nodes_by_id.get(pred_id)
+                if pred_node:
+                    test_info: dict[str, Any] = {
+                        "id": pred_node.id,
+                        "name": pred_node.name,
+                        "file_path": pred_node.file_path,
+                        "start_line": pred_node.start_line,
+                        "end_line": pred_node.end_line,
+                    }
+                    tests.append(test_info)
 
         # Strategy 2: Find test functions by naming convention
         test_nodes = database.search_nodes(
@@ -397,6 +416,11 @@ def handle_context(params: dict, ctx: LensContext) -> ToolResponse:
                 }
                 tests.append(tn_info)
 
+    logger.debug(
+        "lens_context %s: %d related nodes fetched in %d batched queries",
+        node_id, len(fetched), node_queries,
+    )
+
     result: dict[str, Any] = {"target": target}
     if include_callers:
         result["callers"] = callers
@@ -444,7 +468,7 @@ def handle_grep(params: dict, ctx: LensContext) -> ToolResponse:
     ctx.ensure_synced()
 
     import fnmatch
-    import re
+    from pathlib import Path
 
     from lenspr.parsers import is_supported_file
 
@@ -457,23 +481,32 @@ def handle_grep(params: dict, ctx: LensContext) -> ToolResponse:
     except re.error:
         regex = re.compile(re.escape(pattern_str))
 
-    nx_graph = ctx.get_graph()
     results: list[dict] = []
 
-    skip_dirs = {
-        "__pycache__", ".git", ".lens", ".venv", "venv", "env",
-        "node_modules", ".mypy_cache", ".pytest_cache", ".ruff_cache",
-        "dist", "build", ".eggs", ".tox",
-    }
+    # Prefilter with the full-text index: an indexed file whose source lacks
+    # the pattern's required literal cannot match, so it is never read.
+    literal = _required_literal(regex)
+    hits = database.find_files_containing(ctx.graph_db, literal) if literal else None
+    line_index = ctx.get_line_index()
+    fingerprints = ctx._load_fingerprints() if hits is not None and not file_glob else {}
+
+    if hits is not None and fingerprints:
+        # Every supported file is fingerprinted; the unindexed ones (parse
+        # failures) still have to be read
+        rel_paths = hits | {rel for rel in fingerprints if rel not in line_index}
+        files = [
+            ctx.project_root / rel
+            for rel in sorted(rel_paths, key=lambda r: Path(r).parts)
+        ]
+    else:
+        files = [ctx.project_root / rel for rel, _ in ctx.file_scanner().walk()]
 
-    for file_path in sorted(ctx.project_root.rglob("*")):
+    for file_path in files:
         if len(results) >= max_results:
             break
-        if not file_path.is_file():
-            continue
-        if any(part in skip_dirs for part in file_path.parts):
-            continue
         rel = str(file_path.relative_to(ctx.project_root))
+        if hits is not None and rel not in hits and rel in line_index:
+            continue
 
         # Filter by file type
         if file_glob is None:
@@ -496,7 +529,7 @@ def handle_grep(params: dict, ctx: LensContext) -> ToolResponse:
             if len(results) >= max_results:
                 break
             if regex.search(line_text):
-                containing_node = find_containing_node(nx_graph, rel, line_num)
+                containing_node = find_containing_node(ctx, rel, line_num)
                 match_info: dict[str, Any] = {
                     "file": rel,
                     "line": line_num,
@@ -517,3 +550,18 @@ def handle_grep(params: dict, ctx: LensContext) -> ToolResponse:
             "truncated": len(results) >= max_results,
         },
     )
+
+
+def _required_literal(regex: re.Pattern[str]) -> str:
+    """Longest literal run every match of ``regex`` contains ("" if none)."""
+    from re import _parser  # type: ignore[attr-defined]
+
+    best = run = ""
+    for op, arg in _parser.parse(regex.pattern, regex.flags):
+        if op is _parser.LITERAL:
+            run += chr(arg)
+            if len(run) > len(best):
+                best = run
+        else:
+            run = ""
+    return best
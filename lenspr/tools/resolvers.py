@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from fnmatch import fnmatchcase
 from typing import TYPE_CHECKING
 
 from lenspr import database
@@ -149,34 +150,27 @@ def handle_env_map(params: dict, ctx: LensContext) -> ToolResponse:
 
     mapper = InfraMapper()
 
-    skip_dirs = {
-        "__pycache__", ".git", ".lens", ".venv", "venv", "env",
-        "node_modules", ".mypy_cache", ".pytest_cache", "dist", "build",
-    }
-
-    def _skip(path: Path) -> bool:
-        return any(part in skip_dirs for part in path.parts)
-
-    # Find and parse .env files (recursive — monorepo support)
-    for env_file in sorted(project_root.rglob(".env*")):
-        if env_file.is_file() and not _skip(env_file.relative_to(project_root)):
-            mapper.parse_env_file(env_file)
-
-    # Find and parse docker-compose files (recursive)
+    # Find .env and docker-compose files in one scan (recursive — monorepo support)
     compose_patterns = [
         "docker-compose*.yml", "docker-compose*.yaml",
         "compose.yml", "compose.yaml",
     ]
-    seen_compose: set[Path] = set()
+    env_files: list[Path] = []
+    compose_files: dict[str, list[Path]] = {pattern: [] for pattern in compose_patterns}
+    for rel, file_entry in ctx.file_scanner().walk():
+        if fnmatchcase(file_entry.name, ".env*"):
+            env_files.append(project_root / rel)
+            continue
+        for pattern in compose_patterns:
+            if fnmatchcase(file_entry.name, pattern):
+                compose_files[pattern].append(project_root / rel)
+                break
+
+    for env_file in env_files:
+        mapper.parse_env_file(env_file)
     for pattern in compose_patterns:
-        for compose_file in sorted(project_root.rglob(pattern)):
-            if (
-                compose_file.is_file()
-                and compose_file not in seen_compose
-                and not _skip(compose_file.relative_to(project_root))
-            ):
-                seen_compose.add(compose_file)
-                mapper.parse_compose(compose_file)
+        for compose_file in compose_files[pattern]:
+            mapper.parse_compose(compose_file)
 
     # Extract env var definitions from compose environment: sections
     for svc in mapper._services.values():
@@ -375,7 +369,7 @@ def handle_infra_map(params: dict, ctx: LensContext) -> ToolResponse:
     raw_edges = database.get_edges_by_types(infra_edge_types, ctx.graph_db)
 
     # Get infrastructure nodes
-    all_nodes = database.get_nodes(ctx.graph_db)
+    all_nodes = database.get_nodes(ctx.graph_db, include_source=False)
     infra_nodes = [
         n for n in all_nodes
         if n.id.startswith(("infra.", "ci."))
@@ -7,6 +7,7 @@ import fnmatch
 import json as json_mod
 import re
 import uuid
+from bisect import bisect_left, bisect_right
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -188,8 +189,9 @@ def _map_cov_to_functions(
     """
     from pathlib import Path
 
-    # Build lookup: relative_file_path → {executed_lines}
-    file_coverage: dict[str, set[int]] = {}
+    # Build lookup: relative_file_path → sorted executed lines, so each
+    # function's hits are counted with two bisects instead of a set per node
+    file_coverage: dict[str, list[int]] = {}
     files_data = cov_data.get("files", {})
     for abs_path, info in files_data.items():
         # Convert absolute paths to relative
@@ -197,8 +199,7 @@ def _map_cov_to_functions(
             rel = str(Path(abs_path).relative_to(project_root))
         except ValueError:
             rel = abs_path
-        executed = set(info.get("executed_lines", []))
-        file_coverage[rel] = executed
+        file_coverage[rel] = sorted(set(info.get("executed_lines", [])))
 
     covered: list[dict] = []
     uncovered: list[dict] = []
@@ -214,22 +215,22 @@ def _map_cov_to_functions(
             continue
 
         fp = node.file_path or ""
-        executed = file_coverage.get(fp, set())
+        executed = file_coverage.get(fp, [])
         # Skip the `def` line — it's always "executed" on module import.
         # Only count body lines (start_line+1 .. end_line) as real coverage.
         # For one-liners (start == end), the def line is the only line.
         end = node.end_line or node.start_line
         body_start = node.start_line + 1 if end > node.start_line else node.start_line
-        node_lines = set(range(body_start, end + 1))
-        hit = node_lines & executed
+        lines_total = max(0, end - body_start + 1)
+        hit = bisect_right(executed, end) - bisect_left(executed, body_start)
 
-        if hit:
+        if hit > 0:
             covered.append({
                 "node_id": node.id,
                 "name": node.name,
                 "file": fp,
-                "lines_hit": len(hit),
-                "lines_total": len(node_lines),
+                "lines_hit": hit,
+                "lines_total": lines_total,
             })
         else:
             uncovered.append({
@@ -364,7 +365,9 @@ def handle_test_coverage(params: dict, ctx: LensContext) -> ToolResponse:
     mode = params.get("mode", "summary")
 
     ctx.ensure_synced()
-    nodes = database.get_nodes(ctx.graph_db, file_filter=file_path_filter)
+    nodes = database.get_nodes(
+        ctx.graph_db, file_filter=file_path_filter, include_source=False,
+    )
 
     # Try runtime coverage first
     cov_data = _try_pytest_cov(ctx)
@@ -527,7 +530,6 @@ def handle_security_scan(params: dict, ctx: LensContext) -> ToolResponse:
     except subprocess.TimeoutExpired:
         return ToolResponse(success=False, error="Security scan timed out (>120s).")
 
-    nx_graph = ctx.get_graph()
     issues_by_node: dict[str, list] = {}
 
     for issue in data.get("results", []):
@@ -538,8 +540,8 @@ def handle_security_scan(params: dict, ctx: LensContext) -> ToolResponse:
             rel_file = raw_file
 
         line = issue["line_number"]
-        node = find_containing_node(nx_graph, rel_file, line)
-        node_key = node.id if node else f"{rel_file}:{line}"
+        node = find_containing_node(ctx, rel_file, line)
+        node_key = node["id"] if node else f"{rel_file}:{line}"
 
         if node_key not in issues_by_node:
             issues_by_node[node_key] = []
@@ -827,7 +829,7 @@ def handle_arch_check(params: dict, ctx: LensContext) -> ToolResponse:
 
         elif rule_type == "required_test":
             pattern = rule.get("pattern", "")
-            all_nodes = database.get_nodes(ctx.graph_db)
+            all_nodes = database.get_nodes(ctx.graph_db, include_source=False)
             for node_obj in all_nodes:
                 if node_obj.type.value not in ("function", "method"):
                     continue
@@ -891,7 +893,7 @@ def handle_vibecheck(params: dict, ctx: LensContext) -> ToolResponse:
     """
     ctx.ensure_synced()
     nx_graph = ctx.get_graph()
-    all_nodes = database.get_nodes(ctx.graph_db)
+    all_nodes = database.get_nodes(ctx.graph_db, include_source=False)
 
     # Production functions only (exclude test files and eval/ scripts)
     func_nodes = [
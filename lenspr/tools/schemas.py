@@ -212,7 +212,11 @@ LENS_TOOLS: list[dict[str, Any]] = [
     },
     {
         "name": "lens_search",
-        "description": "Search nodes by name or content.",
+        "description": (
+            "Search nodes by name or content (case-insensitive substring). "
+            "Results are ranked: name matches first, then signatures, "
+            "docstrings and code."
+        ),
         "input_schema": {
             "type": "object",
             "properties": {
@@ -222,6 +226,10 @@ LENS_TOOLS: list[dict[str, Any]] = [
                     "enum": ["name", "code", "docstring", "all"],
                     "description": "Where to search. Default: all.",
                 },
+                "limit": {
+                    "type": "integer",
+                    "description": "Maximum number of results to return. Default: 50.",
+                },
             },
             "required": ["query"],
         },
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import sqlite3
 from collections import Counter
 from datetime import UTC
 from typing import TYPE_CHECKING
@@ -56,9 +55,7 @@ def handle_hotspots(params: dict, ctx: LensContext) -> ToolResponse:
     file_filter = params.get("file_path")
 
     # Query changes from history.db
-    conn = sqlite3.connect(str(ctx.history_db))
-    conn.row_factory = sqlite3.Row
-    try:
+    with database.connect(ctx.history_db) as conn:
         # Ensure columns added in later versions exist (Phase 7 migration)
         cols = {row[1] for row in conn.execute("PRAGMA table_info(changes)")}
         if "file_path" not in cols:
@@ -81,8 +78,6 @@ def handle_hotspots(params: dict, ctx: LensContext) -> ToolResponse:
 
         query += " ORDER BY timestamp DESC"
         rows = conn.execute(query, qparams).fetchall()
-    finally:
-        conn.close()
 
     if not rows:
         # Fallback: try git if no history.db data
@@ -124,6 +124,7 @@ def handle_trace(params: dict, ctx: LensContext) -> ToolResponse:
             "new_runtime": merge_result["new_runtime"],
             "upgraded_to_both": merge_result["upgraded_to_both"],
             "merged_total": merge_result["total"],
+            "merge_time_ms": merge_result["merge_time_ms"],
         },
     )
 
@@ -137,13 +138,9 @@ def handle_trace_stats(params: dict, ctx: LensContext) -> ToolResponse:
     Reads directly from graph.db for accuracy — NetworkX DiGraph deduplicates
     parallel edges, undercounting by ~30%.
     """
-    import sqlite3
-
     ctx.ensure_synced()
 
-    conn = sqlite3.connect(str(ctx.graph_db))
-    conn.row_factory = sqlite3.Row
-    try:
+    with database.connect(ctx.graph_db) as conn:
         rows = conn.execute(
             "SELECT source, COUNT(*) as cnt FROM edges GROUP BY source"
         ).fetchall()
@@ -184,8 +181,6 @@ def handle_trace_stats(params: dict, ctx: LensContext) -> ToolResponse:
              "runtime_connections": r["total"]}
             for r in top_rows
         ]
-    finally:
-        conn.close()
 
     static_only = source_counts.get("static", 0)
     runtime_only = source_counts.get("runtime", 0)
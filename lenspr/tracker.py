@@ -3,10 +3,10 @@
 from __future__ import annotations
 
 import json
-import sqlite3
 from datetime import UTC, datetime
 from pathlib import Path
 
+from lenspr.database import connect
 from lenspr.models import Change
 
 
@@ -34,8 +34,7 @@ def record_change(
     """
     timestamp = datetime.now(UTC).isoformat()
 
-    conn = sqlite3.connect(str(db_path))
-    try:
+    with connect(db_path) as conn:
         # Auto-migrate: ensure columns added in later versions exist
         cols = {row[1] for row in conn.execute("PRAGMA table_info(changes)")}
         if "reasoning" not in cols:
@@ -64,10 +63,7 @@ def record_change(
                 file_path,
             ),
         )
-        conn.commit()
         return cursor.lastrowid or 0
-    finally:
-        conn.close()
 
 
 def get_history(
@@ -98,9 +94,7 @@ def get_history(
     query += " ORDER BY id DESC LIMIT ?"
     params.append(limit)
 
-    conn = sqlite3.connect(str(db_path))
-    conn.row_factory = sqlite3.Row
-    try:
+    with connect(db_path) as conn:
         rows = conn.execute(query, params).fetchall()
         return [
             Change(
@@ -119,7 +113,5 @@ def get_history(
             )
             for row in rows
         ]
-    finally:
-        conn.close()
 
 
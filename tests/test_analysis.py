@@ -233,6 +233,16 @@ class TestHealth:
         assert result.success
         assert result.data["circular_imports"] == []
 
+    def test_reports_graph_memory(self, project: LensContext) -> None:
+        """Health reports the in-memory graph mode, size and load time."""
+        result = handle_health({}, project)
+
+        assert result.success
+        memory = result.data["graph_memory"]
+        assert memory["mode"] == "lean"
+        assert memory["estimated_mb"] >= 0
+        assert memory["load_seconds"] is not None
+
     def test_internal_edges_tracked(self, project: LensContext) -> None:
         """Internal edge stats are present and consistent."""
         result = handle_health({}, project)
@@ -187,6 +187,40 @@ class TestComputeAllMetrics:
         assert node_metrics[engine_id]["public_methods"] == 2
         assert node_metrics[engine_id]["private_methods"] == 0
 
+    def test_nested_class_methods_and_rank(self, tmp_path: Path) -> None:
+        """Methods of nested classes count towards the outer class."""
+        (tmp_path / "shapes.py").write_text(
+            "class Outer:\n"
+            "    def a(self):\n"
+            "        pass\n"
+            "\n"
+            "    class Inner:\n"
+            "        def b(self):\n"
+            "            pass\n"
+            "\n"
+            "        def c(self):\n"
+            "            pass\n"
+            "\n"
+            "class Other:\n"
+            "    def d(self):\n"
+            "        pass\n"
+        )
+        lens_dir = tmp_path / ".lens"
+        lens_dir.mkdir()
+        database.init_database(lens_dir)
+        ctx = LensContext(project_root=tmp_path, lens_dir=lens_dir)
+        ctx.full_sync()
+
+        nodes, edges = database.load_graph(ctx.graph_db)
+        node_metrics, _ = compute_all_metrics(nodes, edges)
+
+        assert node_metrics["shapes.Outer"]["method_count"] == 3
+        assert node_metrics["shapes.Outer.Inner"]["method_count"] == 2
+        assert node_metrics["shapes.Other"]["method_count"] == 1
+        # Ranks: share of classes with strictly fewer methods
+        assert node_metrics["shapes.Outer"]["percentile_rank"] == 66.7
+        assert node_metrics["shapes.Other"]["percentile_rank"] == 0.0
+
     def test_empty_project(self, tmp_path: Path) -> None:
         """Project with no classes → empty metrics."""
         (tmp_path / "app.py").write_text("def f(): pass\n")
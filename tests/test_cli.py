@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import os
 import subprocess
 import sys
 from pathlib import Path
@@ -48,6 +49,12 @@ class TestInit:
         result = run_cli("init", "--force", str(sample_project))
         assert result.returncode == 0
 
+    def test_init_jobs(self, sample_project: Path) -> None:
+        (sample_project / "other.py").write_text("def other():\n    return 1\n")
+        result = run_cli("init", "--jobs", "2", str(sample_project))
+        assert result.returncode == 0
+        assert "Nodes:" in result.stdout
+
 
 class TestSync:
     def test_sync_after_init(self, sample_project: Path) -> None:
@@ -56,12 +63,28 @@ class TestSync:
         assert result.returncode == 0
         assert "Sync complete" in result.stdout
 
+    def test_sync_reports_touched_unchanged_files(self, sample_project: Path) -> None:
+        run_cli("init", str(sample_project))
+        for path in sample_project.glob("*.py"):
+            st = path.stat()
+            os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+        result = run_cli("sync", str(sample_project))
+        assert result.returncode == 0
+        assert "+0 ~0 -0" in result.stdout
+        assert "touched files unchanged" in result.stdout
+
     def test_sync_full_flag(self, sample_project: Path) -> None:
         run_cli("init", str(sample_project))
         result = run_cli("sync", "--full", str(sample_project))
         assert result.returncode == 0
         assert "Sync complete" in result.stdout
 
+    def test_sync_full_jobs(self, sample_project: Path) -> None:
+        run_cli("init", str(sample_project))
+        result = run_cli("sync", "--full", "-j", "2", str(sample_project))
+        assert result.returncode == 0
+        assert "Sync complete" in result.stdout
+
 
 class TestStatus:
     def test_status_shows_stats(self, sample_project: Path) -> None:
@@ -1,6 +1,7 @@
 """Tests for LensContext: version stamps, graph lifecycle, threading, rollback."""
 
 import json
+import os
 import threading
 import time
 from unittest.mock import patch
@@ -169,7 +170,7 @@ class TestEnsureSyncedNoPendingChanges:
 class TestUpdateConfigWritesParserVersion:
     def test_writes_parser_version_to_config(self, ctx):
         """_update_config must persist PARSER_VERSION to config.json."""
-        ctx._update_config(fingerprints={})
+        ctx._update_config()
 
         config = json.loads(ctx.config_path.read_text())
         assert config["parser_version"] == LensContext.PARSER_VERSION
@@ -179,7 +180,7 @@ class TestUpdateConfigWritesParserVersion:
         lens_dir.joinpath("config.json").write_text(json.dumps({"parser_version": "0"}))
 
         c = LensContext(project_root=tmp_path, lens_dir=lens_dir)
-        c._update_config(fingerprints={})
+        c._update_config()
 
         config = json.loads(lens_dir.joinpath("config.json").read_text())
         assert config["parser_version"] == LensContext.PARSER_VERSION
@@ -296,11 +297,306 @@ class TestGraphLifecycle:
         )
 
 
+class TestSyncPaths:
+    def test_reparses_only_given_paths(self, full_project):
+        time.sleep(0.05)
+        root = full_project.project_root
+        (root / "app.py").write_text("def greet(name):\n    return name\n\ndef wave():\n    pass\n")
+        (root / "utils.py").write_text("def add(a, b):\n    return a - b\n")
+
+        result = full_project.sync_paths([root / "app.py"])
+
+        assert [n.id for n in result.added] == ["app.wave"]
+        assert not any(n.file_path == "utils.py" for n in result.modified)
+        # utils.py was not reported, so it is still pending
+        assert full_project.has_pending_changes()
+
+    def test_created_and_deleted_files(self, full_project):
+        root = full_project.project_root
+        (root / "extra.py").write_text("def extra():\n    pass\n")
+        (root / "utils.py").unlink()
+
+        result = full_project.sync_paths(["extra.py", "utils.py"])
+
+        assert "extra.extra" in {n.id for n in result.added}
+        assert "utils.add" in {n.id for n in result.deleted}
+        assert set(full_project._load_fingerprints()) == {"app.py", "extra.py"}
+        assert not full_project.has_pending_changes()
+
+    def test_deleted_directory_drops_files_below_it(self, full_project):
+        root = full_project.project_root
+        (root / "pkg").mkdir()
+        (root / "pkg" / "mod.py").write_text("def inner():\n    pass\n")
+        full_project.sync_paths([root / "pkg"])
+        assert "pkg.mod.inner" in full_project.get_graph()
+
+        (root / "pkg" / "mod.py").unlink()
+        (root / "pkg").rmdir()
+        result = full_project.sync_paths([root / "pkg"])
+
+        assert "pkg.mod.inner" in {n.id for n in result.deleted}
+        assert "pkg/mod.py" not in full_project._load_fingerprints()
+
+    def test_ignored_and_unsupported_paths_are_skipped(self, full_project):
+        root = full_project.project_root
+        (root / ".gitignore").write_text("scratch.py\n")
+        (root / "scratch.py").write_text("def tmp():\n    pass\n")
+        (root / "notes.txt").write_text("hi\n")
+
+        result = full_project.sync_paths(
+            [root / "scratch.py", root / "notes.txt", "/elsewhere/x.py"]
+        )
+
+        assert (result.added, result.modified, result.deleted) == ([], [], [])
+        assert "scratch.py" not in full_project._load_fingerprints()
+
+    def test_unchanged_file_is_not_reparsed(self, full_project):
+        with patch.object(full_project, "_sync_files_locked") as sync_files:
+            result = full_project.sync_paths([full_project.project_root / "app.py"])
+        sync_files.assert_not_called()
+        assert result.added == []
+
+
+class TestStalenessChecks:
+    def test_watched_and_clean_skips_the_scan(self, full_project):
+        full_project.change_tracker.attach(lambda: True)
+        full_project.ensure_synced()  # First catch-up after attaching
+
+        with patch.object(full_project, "has_pending_changes") as pending:
+            full_project.ensure_synced()
+        pending.assert_not_called()
+
+    def test_watched_changes_sync_only_reported_paths(self, full_project):
+        tracker = full_project.change_tracker
+        tracker.attach(lambda: True)
+        full_project.ensure_synced()
+        root = full_project.project_root
+        (root / "extra.py").write_text("def extra():\n    pass\n")
+        tracker.mark_dirty(str(root / "extra.py"))
+
+        with patch.object(full_project, "_scan_fingerprints") as scan:
+            full_project.ensure_synced()
+        scan.assert_not_called()
+        assert tracker.is_clean()
+        assert "extra.extra" in full_project.get_graph()
+
+    def test_dead_watcher_falls_back_to_scanning(self, full_project):
+        full_project.change_tracker.attach(lambda: False)
+        (full_project.project_root / "extra.py").write_text("def extra():\n    pass\n")
+        full_project.ensure_synced()
+        assert "extra.extra" in full_project.get_graph()
+
+    def test_unchanged_dirs_stat_known_files_only(self, full_project):
+        assert not full_project.has_pending_changes()  # Stamps the tree
+        time.sleep(0.05)
+        (full_project.project_root / "app.py").write_text("def greet():\n    pass\n")
+
+        with patch.object(full_project, "_scan_fingerprints") as scan:
+            assert full_project.has_pending_changes()
+        scan.assert_not_called()
+
+    def test_new_and_deleted_files_detected(self, full_project):
+        root = full_project.project_root
+        assert not full_project.has_pending_changes()
+        (root / "pkg").mkdir()
+        (root / "pkg" / "mod.py").write_text("x = 1\n")
+        assert full_project.has_pending_changes()
+        full_project.incremental_sync()
+        assert not full_project.has_pending_changes()
+
+        (root / "utils.py").unlink()
+        assert full_project.has_pending_changes()
+
+
+class TestFileState:
+    def test_fingerprints_stored_in_graph_db(self, full_project):
+        state = database.load_file_state(full_project.graph_db)
+        assert set(state) == {"app.py", "utils.py"}
+        assert len(state["app.py"]["hash"]) == 32
+        config = json.loads(full_project.config_path.read_text())
+        assert "file_fingerprints" not in config
+
+    def test_touched_but_unchanged_file_is_not_parsed(self, full_project):
+        app = full_project.project_root / "app.py"
+        st = app.stat()
+        os.utime(app, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+
+        with patch.object(full_project, "_parse_files") as parse:
+            result = full_project.incremental_sync()
+        parse.assert_not_called()
+        assert (result.added, result.modified, result.deleted) == ([], [], [])
+        assert result.touched_unchanged == 1
+        state = database.load_file_state(full_project.graph_db)
+        assert state["app.py"]["mtime"] == app.stat().st_mtime
+        assert not full_project.has_pending_changes()
+
+    def test_only_changed_content_is_parsed(self, full_project):
+        root = full_project.project_root
+        app, utils = root / "app.py", root / "utils.py"
+        st = app.stat()
+        os.utime(app, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+        utils.write_text("def add(a, b):\n    return b + a\n")
+
+        with patch.object(
+            full_project, "_parse_files", wraps=full_project._parse_files,
+        ) as parse:
+            result = full_project.incremental_sync()
+        [files] = parse.call_args.args
+        assert files == [utils]
+        assert "utils.add" in {n.id for n in result.modified}
+        assert result.touched_unchanged == 1
+
+    def test_reparse_file_updates_fingerprint(self, full_project):
+        app = full_project.project_root / "app.py"
+        app.write_text("def greet(name):\n    return name * 2\n")
+        full_project.reparse_file(app)
+        assert not full_project.has_pending_changes()
+
+    def test_legacy_config_fingerprints(self, full_project):
+        fingerprints = full_project._load_fingerprints()
+        database.save_file_state({}, full_project.graph_db, replace=True)
+        config = json.loads(full_project.config_path.read_text())
+        config["file_fingerprints"] = {
+            rel: {"mtime": fp["mtime"], "size": fp["size"]}
+            for rel, fp in fingerprints.items()
+        }
+        full_project.config_path.write_text(json.dumps(config))
+        assert set(full_project._load_fingerprints()) == {"app.py", "utils.py"}
+        assert database.load_file_state(full_project.graph_db)["app.py"]["hash"] is None
+
+        (full_project.project_root / "new.py").write_text("x = 1\n")
+        with patch.object(
+            full_project, "_parse_files", wraps=full_project._parse_files,
+        ) as parse:
+            full_project.incremental_sync()
+        [files] = parse.call_args.args
+        assert [f.name for f in files] == ["new.py"]
+        assert set(database.load_file_state(full_project.graph_db)) == {
+            "app.py", "utils.py", "new.py",
+        }
+        assert "file_fingerprints" not in json.loads(full_project.config_path.read_text())
+
+
+class TestParseCache:
+    def test_full_sync_reuses_unchanged_files(self, full_project):
+        """A second full sync parses only files whose content changed."""
+        from lenspr.parsers.python_parser import PythonParser
+
+        (full_project.project_root / "utils.py").write_text(
+            "def add(a, b):\n"
+            "    return b + a\n"
+        )
+        with patch.object(
+            PythonParser, "_parse_ast", autospec=True,
+            side_effect=PythonParser._parse_ast,
+        ) as spy:
+            result, _ = full_project.full_sync()
+
+        parsed = [call.args[1].name for call in spy.call_args_list]
+        assert parsed == ["utils.py"]
+        assert sorted(n.id for n in result.modified) == ["utils", "utils.add"]
+        assert "app.greet" in full_project.get_graph()
+
+    def test_incremental_sync_skips_touched_but_identical_file(self, full_project):
+        import os
+
+        from lenspr.parsers.python_parser import PythonParser
+
+        app = full_project.project_root / "app.py"
+        st = app.stat()
+        os.utime(app, (st.st_atime, st.st_mtime + 10))
+
+        with patch.object(
+            PythonParser, "_parse_ast", autospec=True,
+            side_effect=PythonParser._parse_ast,
+        ) as spy:
+            result = full_project.incremental_sync()
+
+        assert spy.call_count == 0
+        assert result.added == [] and result.modified == [] and result.deleted == []
+
+    def test_cache_key_depends_on_content_and_resolver(self, full_project):
+        mp = full_project._parser
+        parser = mp.get_parser_for_file(full_project.project_root / "app.py")
+
+        key = mp.cache_key(parser, b"x = 1\n")
+        assert key == mp.cache_key(parser, b"x = 1\n")
+        assert key != mp.cache_key(parser, b"x = 2\n")
+        with patch.object(parser, "get_cache_mode", return_value="pyright"):
+            assert key != mp.cache_key(parser, b"x = 1\n")
+        assert key != mp.cache_key(parser, b"x = 1\n", cache_version="3")
+
+    def test_parser_version_bump_bypasses_cache(self, full_project):
+        from lenspr.parsers.python_parser import PythonParser
+
+        with (
+            patch.object(LensContext, "PARSER_VERSION", "999"),
+            patch.object(
+                PythonParser, "_parse_ast", autospec=True,
+                side_effect=PythonParser._parse_ast,
+            ) as spy,
+        ):
+            full_project.full_sync()
+
+        parsed = sorted(call.args[1].name for call in spy.call_args_list)
+        assert parsed == ["app.py", "utils.py"]
+
+    def test_init_force_clears_parse_cache(self, full_project):
+        """Cached cross-file resolutions can be stale; --force must reparse."""
+        import lenspr
+        from lenspr.parsers.python_parser import PythonParser
+
+        with patch.object(
+            PythonParser, "_parse_ast", autospec=True,
+            side_effect=PythonParser._parse_ast,
+        ) as spy:
+            lenspr.init(str(full_project.project_root), force=True)
+
+        parsed = sorted(call.args[1].name for call in spy.call_args_list)
+        assert parsed == ["app.py", "utils.py"]
+
+
 # ---------------------------------------------------------------------------
 # Rollback / error resilience
 # ---------------------------------------------------------------------------
 
 
+class TestGraphSnapshot:
+    def test_syncs_write_snapshot_used_at_startup(self, full_project):
+        snapshot = full_project.snapshot_path
+        assert snapshot.exists()
+
+        fresh = LensContext(full_project.project_root, full_project.lens_dir)
+        with patch.object(database, "load_graph_lean") as load:
+            graph = fresh.get_graph()
+        load.assert_not_called()
+        assert set(graph.nodes) == set(full_project.get_graph().nodes)
+
+    def test_incremental_sync_refreshes_snapshot(self, full_project):
+        full_project.get_graph()
+        time.sleep(0.05)
+        (full_project.project_root / "utils.py").write_text(
+            "def add(a, b):\n    return a + b\n\ndef sub(a, b):\n    return a - b\n"
+        )
+        full_project.incremental_sync()
+
+        fresh = LensContext(full_project.project_root, full_project.lens_dir)
+        with patch.object(database, "load_graph_lean") as load:
+            assert "utils.sub" in fresh.get_graph()
+        load.assert_not_called()
+
+    def test_stale_snapshot_falls_back_to_db(self, full_project):
+        database.delete_node("utils.add", full_project.graph_db)
+
+        fresh = LensContext(full_project.project_root, full_project.lens_dir)
+        assert "utils.add" not in fresh.get_graph()
+        # ... and the rebuilt graph replaced the stale snapshot
+        again = LensContext(full_project.project_root, full_project.lens_dir)
+        with patch.object(database, "load_graph_lean") as load:
+            assert "utils.add" not in again.get_graph()
+        load.assert_not_called()
+
+
 class TestRollbackBehavior:
     def test_reparse_preserves_graph_on_parse_failure(self, full_project):
         """If parser.parse_file raises, the DB should retain the old graph."""
@@ -342,6 +638,192 @@ class TestRollbackBehavior:
         assert len(nodes_after) == count_before
 
 
+class TestGraphPatching:
+    """Syncs patch the cached graph in place; the result equals a rebuild."""
+
+    @pytest.fixture
+    def project(self, tmp_path):
+        (tmp_path / "utils.py").write_text(
+            "def helper():\n"
+            "    return 42\n"
+            "\n"
+            "def unused():\n"
+            "    return 0\n"
+        )
+        (tmp_path / "app.py").write_text(
+            "import os\n"
+            "from utils import helper\n"
+            "\n"
+            "def main():\n"
+            "    return helper() + len(os.getcwd())\n"
+        )
+        lens_dir = tmp_path / ".lens"
+        lens_dir.mkdir()
+        database.init_database(lens_dir)
+        ctx = LensContext(project_root=tmp_path, lens_dir=lens_dir)
+        ctx.full_sync()
+        return ctx
+
+    def _assert_matches_rebuild(self, ctx, graph):
+        from lenspr.graph import build_graph, build_lean_graph
+
+        if ctx.lean_graph:
+            rebuilt = build_lean_graph(*database.load_graph_lean(ctx.graph_db))
+        else:
+            rebuilt = build_graph(*database.load_graph(ctx.graph_db))
+        assert dict(graph.nodes(data=True)) == dict(rebuilt.nodes(data=True))
+        assert {(u, v): d for u, v, d in graph.edges(data=True)} == {
+            (u, v): d for u, v, d in rebuilt.edges(data=True)
+        }
+
+    def test_incremental_sync_patches_in_place(self, project):
+        graph = project.get_graph()
+        time.sleep(0.05)
+        (project.project_root / "app.py").write_text(
+            "from utils import helper\n"
+            "\n"
+            "def main():\n"
+            "    return helper()\n"
+            "\n"
+            "def extra():\n"
+            "    return main()\n"
+        )
+        (project.project_root / "utils.py").write_text(
+            "def helper():\n"
+            "    return 42\n"
+        )
+        project.incremental_sync()
+
+        assert project._graph is graph
+        assert "app.extra" in graph
+        assert "utils.unused" not in graph
+        self._assert_matches_rebuild(project, graph)
+
+    def test_reparse_removed_target_patches_in_place(self, project):
+        graph = project.get_graph()
+        (project.project_root / "utils.py").write_text(
+            "def other():\n"
+            "    return 0\n"
+        )
+        project.reparse_file(project.project_root / "utils.py")
+
+        assert project._graph is graph
+        assert not graph.has_edge("app.main", "utils.helper")
+        self._assert_matches_rebuild(project, graph)
+
+    def test_consecutive_syncs_keep_patching(self, project):
+        graph = project.get_graph()
+        for body in ("return 1", "return 2"):
+            (project.project_root / "utils.py").write_text(
+                f"def helper():\n    {body}\n"
+            )
+            project.reparse_file(project.project_root / "utils.py")
+            assert project._graph is graph
+        assert project._graph_generation == database.get_graph_generation(project.graph_db)
+
+    def test_full_graph_mode_patches_in_place(self, project):
+        project.lean_graph = False
+        project.invalidate_graph()
+        graph = project.get_graph()
+        assert "source_code" in graph.nodes["utils.helper"]
+
+        (project.project_root / "utils.py").write_text(
+            "def helper():\n"
+            "    return 7\n"
+        )
+        project.reparse_file(project.project_root / "utils.py")
+
+        assert project._graph is graph
+        self._assert_matches_rebuild(project, graph)
+
+    def test_rebuilds_when_db_changed_elsewhere(self, project):
+        """A write the graph never saw (e.g. another process) forces a rebuild."""
+        project.get_graph()
+        database.delete_node("utils.unused", project.graph_db)
+
+        project.reparse_file(project.project_root / "app.py")
+
+        assert project._graph is None
+        assert "utils.unused" not in project.get_graph()
+
+    def test_line_index_refreshed_by_patch(self, project):
+        index = project.get_line_index()
+        assert index.containing("utils.py", 5) == "utils.unused"
+
+        (project.project_root / "utils.py").write_text(
+            "def helper():\n"
+            "    return 42\n"
+        )
+        project.reparse_file(project.project_root / "utils.py")
+
+        assert project.get_line_index() is index
+        assert index.containing("utils.py", 2) == "utils.helper"
+        assert index.containing("utils.py", 5) is None
+
+    def test_patch_copies_graph_held_by_other_reader(self, project):
+        graph = project.get_graph()
+        index = project.get_line_index()
+        entered, release = threading.Event(), threading.Event()
+
+        def reader():
+            with project.graph_reader():
+                entered.set()
+                release.wait(timeout=10)
+
+        thread = threading.Thread(target=reader)
+        thread.start()
+        entered.wait(timeout=10)
+        try:
+            (project.project_root / "utils.py").write_text(
+                "def helper():\n"
+                "    return 42\n"
+            )
+            project.reparse_file(project.project_root / "utils.py")
+        finally:
+            release.set()
+            thread.join(timeout=10)
+
+        assert "utils.unused" in graph
+        assert index.containing("utils.py", 5) == "utils.unused"
+        patched = project.get_graph()
+        assert patched is not graph
+        assert "utils.unused" not in patched
+        assert project.get_line_index().containing("utils.py", 5) is None
+        self._assert_matches_rebuild(project, patched)
+
+    def test_own_reader_patches_in_place(self, project):
+        graph = project.get_graph()
+        with project.graph_reader(), project.graph_reader():
+            (project.project_root / "utils.py").write_text(
+                "def helper():\n"
+                "    return 42\n"
+            )
+            project.reparse_file(project.project_root / "utils.py")
+        assert project.get_graph() is graph
+        assert "utils.unused" not in graph
+        assert not project._graph_readers
+
+    def test_reachable_set_cached_until_graph_changes(self, project):
+        reachable = project.get_reachable(["app.main"])
+        assert {"app.main", "utils.helper"} <= reachable
+        assert "utils.unused" not in reachable
+        assert project.get_reachable(["app.main"]) is reachable
+        assert project.get_reachable(["utils.unused"]) == {"utils.unused"}
+
+        reachable = project.get_reachable(["app.main"])
+        (project.project_root / "app.py").write_text(
+            "from utils import helper, unused\n"
+            "\n"
+            "def main():\n"
+            "    return helper() + unused()\n"
+        )
+        project.reparse_file(project.project_root / "app.py")
+
+        updated = project.get_reachable(["app.main"])
+        assert updated is not reachable
+        assert "utils.unused" in updated
+
+
 # ---------------------------------------------------------------------------
 # Threading safety
 # ---------------------------------------------------------------------------
@@ -0,0 +1,161 @@
+"""Tests for the array-backed CSR graph engine."""
+
+import random
+
+import networkx as nx
+import pytest
+
+from lenspr.csr_graph import CSRGraph
+from lenspr.graph import (
+    descendants,
+    detect_circular_imports,
+    find_dead_code,
+    find_path,
+    get_dependency_tree,
+    get_impact_zone,
+    get_structure,
+)
+
+
+@pytest.fixture
+def nx_graph():
+    G = nx.DiGraph(lean=True)
+    for nid, ntype in [
+        ("main", "module"),
+        ("main.run", "function"),
+        ("service", "module"),
+        ("service.process", "function"),
+        ("service.validate", "function"),
+        ("service.Base", "class"),
+        ("service.Impl", "class"),
+        ("db.save", "function"),
+        ("unused.orphan", "function"),
+    ]:
+        G.add_node(nid, id=nid, type=ntype, name=nid.rsplit(".", 1)[-1],
+                   file_path=nid.split(".")[0] + ".py", signature="")
+    G.add_edge("main.run", "service.process", type="calls", confidence="resolved")
+    G.add_edge("service.process", "service.validate", type="calls", confidence="resolved")
+    G.add_edge("service.process", "db.save", type="calls", confidence="unresolved",
+               untracked_reason="dynamic")
+    G.add_edge("service.Impl", "service.Base", type="inherits", confidence="resolved")
+    G.add_edge("main", "service", type="imports", confidence="resolved")
+    G.add_edge("service", "main", type="imports", confidence="resolved")
+    G.add_edge("main.run", "os.getcwd", type="calls", confidence="external")
+    return G
+
+
+@pytest.fixture
+def csr(nx_graph):
+    return CSRGraph.from_networkx(nx_graph)
+
+
+class TestReadApi:
+    def test_matches_networkx(self, nx_graph, csr):
+        assert set(csr.nodes) == set(nx_graph.nodes)
+        assert len(csr) == nx_graph.number_of_nodes()
+        assert csr.number_of_edges() == nx_graph.number_of_edges()
+        assert dict(csr.nodes(data=True)) == dict(nx_graph.nodes(data=True))
+        assert sorted(csr.edges()) == sorted(nx_graph.edges())
+        for nid in nx_graph:
+            assert sorted(csr.successors(nid)) == sorted(nx_graph.successors(nid))
+            assert sorted(csr.predecessors(nid)) == sorted(nx_graph.predecessors(nid))
+            assert csr.in_degree(nid) == nx_graph.in_degree(nid)
+
+    def test_attribute_dicts_are_shared(self, nx_graph, csr):
+        assert csr.nodes["main.run"] is nx_graph.nodes["main.run"]
+        assert csr.edges["main.run", "service.process"] is nx_graph.edges[
+            "main.run", "service.process"
+        ]
+        assert csr.graph["lean"] is True
+
+    def test_missing_edges_and_nodes(self, csr):
+        assert not csr.has_edge("db.save", "main.run")
+        assert csr.edges.get(("db.save", "main.run"), {}) == {}
+        assert csr.nodes.get("missing", {}) == {}
+        with pytest.raises(KeyError):
+            csr.edges["db.save", "main.run"]
+        with pytest.raises(nx.NetworkXError):
+            list(csr.successors("missing"))
+
+    def test_typed_edge_columns(self, csr):
+        pos = csr._edge_pos("service.process", "db.save")
+        from lenspr.csr_graph import CONFIDENCES, EDGE_KINDS
+
+        assert EDGE_KINDS[csr.edge_kinds[pos]] == "calls"
+        assert CONFIDENCES[csr.edge_confidence[pos]] == "unresolved"
+
+    def test_edges_of_kind(self, csr):
+        assert sorted(csr.edges_of_kind("imports")) == [
+            ("main", "service"), ("service", "main"),
+        ]
+        assert csr.edges_of_kind("no_such_kind") == []
+
+
+class TestTraversals:
+    def test_multi_source_reachable(self, csr):
+        assert csr.reachable(["main.run", "service.Impl"]) == {
+            "main.run", "service.process", "service.validate", "db.save", "os.getcwd",
+            "service.Impl", "service.Base",
+        }
+
+    def test_reverse_and_kind_filter(self, csr):
+        assert csr.reachable(["db.save"], reverse=True) == {
+            "db.save", "service.process", "main.run",
+        }
+        assert csr.reachable(["main"], kinds=["imports"]) == {"main", "service"}
+        assert csr.reachable(["main.run"], kinds=["inherits"]) == {"main.run"}
+
+    def test_bfs_layers(self, csr):
+        assert csr.bfs_layers(["db.save"], reverse=True) == [
+            ["db.save"], ["service.process"], ["main.run"],
+        ]
+        assert csr.bfs_layers(["db.save"], reverse=True, max_depth=1) == [
+            ["db.save"], ["service.process"],
+        ]
+
+    def test_shortest_path(self, csr):
+        assert csr.shortest_path("main.run", "db.save") == [
+            "main.run", "service.process", "db.save",
+        ]
+        with pytest.raises(nx.NetworkXNoPath):
+            csr.shortest_path("db.save", "main.run")
+
+    def test_random_graph_parity(self):
+        rng = random.Random(7)
+        G = nx.DiGraph()
+        G.add_nodes_from(f"n{i}" for i in range(300))
+        for _ in range(900):
+            G.add_edge(f"n{rng.randrange(300)}", f"n{rng.randrange(300)}", type="calls")
+        csr = CSRGraph.from_networkx(G)
+
+        sources = [f"n{i}" for i in range(0, 300, 37)]
+        expected = set(sources).union(*(nx.descendants(G, s) for s in sources))
+        assert csr.reachable(sources) == expected
+        for nid in ("n0", "n5", "n99"):
+            assert descendants(csr, nid) == nx.descendants(G, nid)
+            for target in ("n1", "n250"):
+                assert len(find_path(csr, nid, target)) == len(find_path(G, nid, target))
+
+
+class TestGraphFunctionsOnCSR:
+    """lenspr.graph analyses give the same answers on either backend."""
+
+    def test_impact_zone(self, nx_graph, csr):
+        assert get_impact_zone(csr, "service.validate", depth=3) == get_impact_zone(
+            nx_graph, "service.validate", depth=3
+        )
+        assert get_impact_zone(csr, "db.save")["untracked_warnings"]
+
+    def test_dependency_tree(self, nx_graph, csr):
+        assert get_dependency_tree(csr, "main.run") == get_dependency_tree(nx_graph, "main.run")
+
+    def test_dead_code(self, nx_graph, csr):
+        assert find_dead_code(csr, ["main.run"]) == find_dead_code(nx_graph, ["main.run"])
+        assert "unused.orphan" in find_dead_code(csr, ["main.run"])
+        assert find_dead_code(csr, ["main.run", "missing"]) == find_dead_code(
+            nx_graph, ["main.run", "missing"]
+        )
+
+    def test_circular_imports_and_structure(self, nx_graph, csr):
+        assert detect_circular_imports(csr) == detect_circular_imports(nx_graph)
+        assert get_structure(csr) == get_structure(nx_graph)
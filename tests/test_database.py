@@ -1,21 +1,43 @@
 """Tests for SQLite database operations."""
 
+import re
 import sqlite3
 import tempfile
+import threading
+import zlib
+from dataclasses import replace
 from pathlib import Path
 
 import pytest
 
+from lenspr import database
 from lenspr.database import (
+    ConnectionPool,
     _connect,
     delete_node,
+    find_files_containing,
+    find_nodes_containing,
+    get_child_nodes,
     get_edges,
+    get_existing_node_ids,
+    get_graph_generation,
     get_node,
     get_nodes,
+    get_nodes_by_ids,
+    get_parse_cache_entries,
     init_database,
+    load_file_state,
     load_graph,
+    lookup_node_suffixes,
+    prune_parse_cache,
+    resolve_node_id,
+    save_file_state,
     save_graph,
+    save_parse_cache_entries,
+    save_runtime_edges,
     search_nodes,
+    sync_file,
+    sync_files,
     update_node_source,
 )
 from lenspr.models import Edge, EdgeType, Node, NodeType
@@ -73,6 +95,7 @@ class TestInitDatabase:
         assert (db_dir / "graph.db").exists()
         assert (db_dir / "history.db").exists()
         assert (db_dir / "resolve_cache.db").exists()
+        assert (db_dir / "parse_cache.db").exists()
 
 
 class TestSaveAndLoad:
@@ -122,6 +145,181 @@ class TestGetNodes:
         assert len(nodes) == 2
 
 
+class TestGetNodesByIds:
+    def test_fetches_existing_ids(self, db_dir, sample_nodes, sample_edges):
+        db = db_dir / "graph.db"
+        save_graph(sample_nodes, sample_edges, db)
+        found = get_nodes_by_ids(["app.helper", "missing", "app.main", "app.helper"], db)
+        assert set(found) == {"app.main", "app.helper"}
+        assert found["app.helper"].source_code == "def helper():\n    return 42"
+        assert get_nodes_by_ids([], db) == {}
+
+    def test_projection_without_source(self, db_dir, sample_nodes, sample_edges):
+        db = db_dir / "graph.db"
+        save_graph(sample_nodes, sample_edges, db)
+        found = get_nodes_by_ids(["app.helper"], db, include_source=False)
+        node = found["app.helper"]
+        assert node.source_code == ""
+        assert node.hash == sample_nodes[1].hash
+        assert node.name == "helper" and node.start_line == 7
+
+    def test_chunks_large_id_sets(self, db_dir, sample_nodes, sample_edges):
+        db = db_dir / "graph.db"
+        save_graph(sample_nodes, sample_edges, db)
+        ids = [f"missing.{i}" for i in range(2000)] + ["app.main"]
+        assert list(get_nodes_by_ids(ids, db, include_source=False)) == ["app.main"]
+
+
+class TestGetChildNodes:
+    @pytest.fixture
+    def class_nodes(self):
+        def node(nid, ntype, start):
+            return Node(
+                id=nid, type=ntype, name=nid.rsplit(".", 1)[-1], qualified_name=nid,
+                file_path="app.py", start_line=start, end_line=start + 1,
+                source_code=f"# {nid}",
+            )
+
+        return [
+            node("app", NodeType.MODULE, 1),
+            node("app.Cls", NodeType.CLASS, 2),
+            node("app.Cls.second", NodeType.METHOD, 9),
+            node("app.Cls.first", NodeType.METHOD, 4),
+            node("app.Cls.first.inner", NodeType.FUNCTION, 5),
+            node("app.Cls2", NodeType.CLASS, 20),
+        ]
+
+    def test_direct_children_in_line_order(self, db_dir, class_nodes):
+        db = db_dir / "graph.db"
+        save_graph(class_nodes, [], db)
+        assert [n.id for n in get_child_nodes("app.Cls", db)] == [
+            "app.Cls.first", "app.Cls.second",
+        ]
+        assert [n.id for n in get_child_nodes("app", db, types=("class",))] == [
+            "app.Cls", "app.Cls2",
+        ]
+        assert get_child_nodes("app.Cls2", db) == []
+
+    def test_sync_file_keeps_parent_ids(self, db_dir, class_nodes):
+        db = db_dir / "graph.db"
+        save_graph(class_nodes, [], db)
+        moved = Node(
+            id="app.Cls2.third", type=NodeType.METHOD, name="third",
+            qualified_name="app.Cls2.third", file_path="app.py",
+            start_line=21, end_line=22, source_code="def third(self): ...",
+        )
+        sync_file("app.py", [*class_nodes[:3], class_nodes[5], moved], [], db)
+        assert [n.id for n in get_child_nodes("app.Cls", db)] == ["app.Cls.second"]
+        assert [n.id for n in get_child_nodes("app.Cls2", db)] == ["app.Cls2.third"]
+
+    def test_backfills_databases_without_parent_column(self, db_dir, class_nodes):
+        db = db_dir / "graph.db"
+        save_graph(class_nodes, [], db)
+        with _connect(db) as conn:
+            conn.execute("DROP INDEX idx_nodes_parent")
+            conn.execute("ALTER TABLE nodes DROP COLUMN parent_id")
+
+        assert [n.id for n in get_child_nodes("app.Cls", db)] == [
+            "app.Cls.first", "app.Cls.second",
+        ]
+
+
+class TestSourceBlobs:
+    @pytest.fixture
+    def file_nodes(self):
+        text = "import os\n\n\ndef main():\n    return os.getcwd()\n\n\nclass Cls:\n    x = 1\n"
+        lines = text.splitlines()
+
+        def node(nid, ntype, start, end, source=None):
+            return Node(
+                id=nid, type=ntype, name=nid.rsplit(".", 1)[-1], qualified_name=nid,
+                file_path="app.py", start_line=start, end_line=end,
+                source_code=source if source is not None
+                else "\n".join(lines[start - 1:end]),
+            )
+
+        return [
+            node("app", NodeType.MODULE, 1, 9, source=text),
+            node("app.main", NodeType.FUNCTION, 4, 5),
+            node("app.Cls", NodeType.CLASS, 8, 9),
+            # Source that is not a slice of the file stays inline
+            node("app.Cls.x", NodeType.BLOCK, 9, 9, source="x = 1  # synthetic"),
+        ]
+
+    def test_roundtrip_and_storage(self, db_dir, file_nodes):
+        db = db_dir / "graph.db"
+        save_graph(file_nodes, [], db)
+
+        loaded, _ = load_graph(db)
+        assert {n.id: n.source_code for n in loaded} == {
+            n.id: n.source_code for n in file_nodes
+        }
+        assert get_node("app.main", db).source_code == file_nodes[1].source_code
+        with _connect(db) as conn:
+            blobs = conn.execute("SELECT hash, content FROM source_blobs").fetchall()
+            inline = dict(conn.execute(
+                "SELECT id, source_code FROM nodes WHERE source_blob IS NULL"
+            ).fetchall())
+        assert len(blobs) == 1
+        assert zlib.decompress(blobs[0]["content"]).decode() == file_nodes[0].source_code
+        assert inline == {"app.Cls.x": "x = 1  # synthetic"}
+
+    def test_sql_readers_see_blob_source(self, db_dir, file_nodes):
+        db = db_dir / "graph.db"
+        save_graph(file_nodes, [], db)
+        assert {n.id for n in search_nodes("getcwd", db, "code")} == {"app", "app.main"}
+        assert {n.id for n in search_nodes("os", db, "code")} == {"app", "app.main"}
+        assert find_nodes_containing(db, ("getcwd",), types=("function",)) == {"app.main"}
+        assert find_files_containing(db, "class Cls") == {"app.py"}
+        assert get_nodes(db, include_source=False)[0].source_code == ""
+
+    def test_writers_release_unused_blobs(self, db_dir, file_nodes):
+        db = db_dir / "graph.db"
+        save_graph(file_nodes, [], db)
+        edited = [
+            replace(n, source_code=n.source_code.replace("getcwd", "getpid"), hash="")
+            for n in file_nodes
+        ]
+        sync_file("app.py", edited, [], db)
+        assert get_node("app.main", db).source_code.endswith("os.getpid()")
+        assert [n.id for n in search_nodes("getcwd", db, "code")] == []
+
+        update_node_source("app.main", "def main():\n    pass", "h", db)
+        assert get_node("app.main", db).source_code == "def main():\n    pass"
+        assert [n.id for n in search_nodes("getpid", db, "code")] == ["app"]
+        with _connect(db) as conn:
+            assert conn.execute("SELECT count(*) FROM source_blobs").fetchone()[0] == 1
+
+        for nid in ("app", "app.Cls"):
+            delete_node(nid, db)
+        with _connect(db) as conn:
+            assert conn.execute("SELECT count(*) FROM source_blobs").fetchone()[0] == 0
+
+    def test_migrates_inline_databases(self, db_dir, file_nodes):
+        db = db_dir / "graph.db"
+        save_graph(file_nodes, [], db)
+        with _connect(db) as conn:
+            for trigger in ("nodes_fts_ai", "nodes_fts_ad", "nodes_fts_au"):
+                conn.execute(f"DROP TRIGGER {trigger}")
+            conn.execute("DROP TABLE nodes_fts")
+            conn.execute("DROP VIEW node_sources")
+            conn.execute("DROP INDEX idx_nodes_source_blob")
+            conn.execute("DROP TABLE source_blobs")
+            conn.execute("ALTER TABLE nodes DROP COLUMN source_blob")
+            conn.executemany(
+                "UPDATE nodes SET source_code = ? WHERE id = ?",
+                [(n.source_code, n.id) for n in file_nodes],
+            )
+
+        init_database(db_dir)
+        with _connect(db) as conn:
+            assert conn.execute(
+                "SELECT count(*) FROM nodes WHERE source_blob IS NOT NULL"
+            ).fetchone()[0] == 3
+        assert get_node("app", db).source_code == file_nodes[0].source_code
+        assert {n.id for n in search_nodes("getcwd", db, "code")} == {"app", "app.main"}
+
+
 class TestGetEdges:
     def test_outgoing(self, db_dir, sample_nodes, sample_edges):
         db = db_dir / "graph.db"
@@ -177,6 +375,144 @@ class TestSearch:
         assert len(results) == 1
         assert results[0].name == "helper"
 
+    def test_ranked_with_limit(self, db_dir, sample_nodes, sample_edges):
+        db = db_dir / "graph.db"
+        save_graph(sample_nodes, sample_edges, db)
+        assert [n.id for n in search_nodes("help", db)] == ["app.helper"]
+        assert len(search_nodes("def", db)) == 2
+        assert len(search_nodes("def", db, limit=1)) == 1
+        assert [n.id for n in search_nodes("MAIN", db, "name")] == ["app.main"]
+
+    def test_short_query_falls_back_to_like(self, db_dir, sample_nodes, sample_edges):
+        db = db_dir / "graph.db"
+        save_graph(sample_nodes, sample_edges, db)
+        assert [n.id for n in search_nodes("42", db, "code")] == ["app.helper"]
+        assert [n.id for n in search_nodes("ma", db, "name", limit=5)] == ["app.main"]
+
+    def test_index_follows_writes(self, db_dir, sample_nodes, sample_edges):
+        db = db_dir / "graph.db"
+        save_graph(sample_nodes, sample_edges, db)
+        save_graph(sample_nodes, sample_edges, db)
+        assert [n.id for n in search_nodes("return 42", db)] == ["app.helper"]
+        update_node_source("app.helper", "def helper():\n    return 'renamed'", "h2", db)
+        assert search_nodes("42", db, "code") == []
+        assert [n.id for n in search_nodes("renamed", db, "code")] == ["app.helper"]
+
+        delete_node("app.helper", db)
+        assert search_nodes("renamed", db, "code") == []
+
+        extra = Node(
+            id="app.extra", type=NodeType.FUNCTION, name="extra",
+            qualified_name="app.extra", file_path="app.py", start_line=12,
+            end_line=13, source_code="def extra():\n    return 'fresh'",
+        )
+        sync_file("app.py", [sample_nodes[0], extra], [], db)
+        assert [n.id for n in search_nodes("fresh", db, "code")] == ["app.extra"]
+
+    def test_index_backfilled_for_old_databases(self, db_dir, sample_nodes, sample_edges):
+        db = db_dir / "graph.db"
+        save_graph(sample_nodes, sample_edges, db)
+        with sqlite3.connect(db) as conn:
+            for trigger in ("nodes_fts_ai", "nodes_fts_ad", "nodes_fts_au"):
+                conn.execute(f"DROP TRIGGER {trigger}")
+            conn.execute("DROP TABLE nodes_fts")
+        assert [n.id for n in search_nodes("return 42", db, "code")] == ["app.helper"]
+
+    def test_find_files_containing(self, db_dir, sample_nodes, sample_edges):
+        db = db_dir / "graph.db"
+        save_graph(sample_nodes, sample_edges, db)
+        assert find_files_containing(db, "return 42") == {"app.py"}
+        assert find_files_containing(db, "RETURN 42") == {"app.py"}
+        assert find_files_containing(db, "nowhere") == set()
+        assert find_files_containing(db, "42") is None
+
+    def test_find_nodes_containing(self, db_dir, sample_nodes, sample_edges):
+        db = db_dir / "graph.db"
+        save_graph(sample_nodes, sample_edges, db)
+        assert find_nodes_containing(db, ("return 4", "nope")) == {"app.helper"}
+        assert find_nodes_containing(db, ("def ",), ("function",)) == {
+            "app.main", "app.helper",
+        }
+        assert find_nodes_containing(db, ("def ",), ("class",)) == set()
+        assert find_nodes_containing(db, ("DEF ",)) == set()
+        assert find_nodes_containing(db, ()) == set()
+
+
+def _func(node_id: str) -> Node:
+    return Node(
+        id=node_id, type=NodeType.FUNCTION, name=node_id.rsplit(".", 1)[-1],
+        qualified_name=node_id, file_path=node_id.split(".")[0] + ".py",
+        start_line=1, end_line=2, source_code=f"def {node_id.rsplit('.', 1)[-1]}(): ...",
+    )
+
+
+class TestResolveNodeId:
+    @pytest.fixture
+    def db(self, db_dir):
+        db = db_dir / "graph.db"
+        ids = [
+            "backend.routers.auth.login", "backend.routers.auth.logout",
+            "backend.services.users.create_user", "frontend.users.create_user",
+            "backend.services.billing.charge_card",
+        ]
+        save_graph([_func(nid) for nid in ids], [], db)
+        return db
+
+    def test_strategy_chain(self, db):
+        assert resolve_node_id("backend.routers.auth.login", db) == (
+            "backend.routers.auth.login", [],
+        )
+        assert resolve_node_id("auth.login", db) == ("backend.routers.auth.login", [])
+        assert resolve_node_id("create_user", db) == (None, [
+            "frontend.users.create_user", "backend.services.users.create_user",
+        ])
+        assert resolve_node_id("billing.charge", db) == (
+            "backend.services.billing.charge_card", [],
+        )
+        assert resolve_node_id("CHARGE_CARD", db) == (
+            "backend.services.billing.charge_card", [],
+        )
+        assert resolve_node_id("auth.log", db, max_suggestions=1) == (
+            None, ["backend.routers.auth.login"],
+        )
+        assert resolve_node_id("nothing_here", db) == (None, [])
+
+    def test_short_query_falls_back_to_like(self, db):
+        assert resolve_node_id("ca", db) == ("backend.services.billing.charge_card", [])
+
+    def test_lookups_never_scan_nodes(self, db):
+        """Every resolution query is answered from an index."""
+        pool = ConnectionPool([db])
+        statements: list[str] = []
+        try:
+            conn = pool.get(db)
+            conn.set_trace_callback(statements.append)
+            for query in ("auth.login", "create_user", "billing.charge", "nope_xyz"):
+                resolve_node_id(query, db)
+            conn.set_trace_callback(None)
+            plans = [
+                row[3]
+                for sql in statements if sql.lstrip().upper().startswith("SELECT")
+                for row in conn.execute(f"EXPLAIN QUERY PLAN {sql}")
+            ]
+        finally:
+            pool.close()
+        assert plans
+        assert not [p for p in plans if re.match(r"SCAN (nodes|node_suffixes)\b", p)]
+
+    def test_old_index_layout_replaced(self, db):
+        with sqlite3.connect(db) as conn:
+            for trigger in ("nodes_fts_ai", "nodes_fts_ad", "nodes_fts_au"):
+                conn.execute(f"DROP TRIGGER {trigger}")
+            conn.execute("DROP TABLE nodes_fts")
+            conn.execute(
+                "CREATE VIRTUAL TABLE nodes_fts USING fts5(name, content='nodes', "
+                "content_rowid='rowid', tokenize='trigram')"
+            )
+        assert resolve_node_id("billing.charge", db) == (
+            "backend.services.billing.charge_card", [],
+        )
+
 
 class TestConnect:
     def test_returns_connection_for_valid_path(self, tmp_path):
@@ -194,3 +530,315 @@ class TestConnect:
         bad_path = tmp_path / "nonexistent_dir" / "x" / "graph.db"
         with pytest.raises(sqlite3.OperationalError, match="Cannot open database at"):
             _connect(bad_path)
+
+
+class TestConnectionPool:
+    def test_reuses_connection_per_thread(self, db_dir):
+        db_path = db_dir / "graph.db"
+        pool = ConnectionPool([db_path])
+        try:
+            with _connect(db_path) as first:
+                first.row_factory = None
+            second = _connect(db_path)
+            assert second is first
+            assert second.row_factory is sqlite3.Row
+            assert second.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+        finally:
+            pool.close()
+        assert _connect(db_path) is not first
+
+    def test_threads_get_own_connections(self, db_dir):
+        db_path = db_dir / "graph.db"
+        pool = ConnectionPool([db_path])
+        seen: list[sqlite3.Connection] = []
+        try:
+            thread = threading.Thread(target=lambda: seen.append(pool.get(db_path)))
+            thread.start()
+            thread.join()
+            assert seen and seen[0] is not pool.get(db_path)
+        finally:
+            pool.close()
+
+    def test_reopens_after_caller_closes(self, db_dir, sample_nodes, sample_edges):
+        db_path = db_dir / "graph.db"
+        pool = ConnectionPool([db_path])
+        try:
+            _connect(db_path).close()
+            save_graph(sample_nodes, sample_edges, db_path)
+            assert get_node("app.main", db_path) is not None
+        finally:
+            pool.close()
+
+    def test_writes_visible_to_other_connections(self, db_dir, sample_nodes, sample_edges):
+        db_path = db_dir / "graph.db"
+        pool = ConnectionPool([db_path])
+        try:
+            save_graph(sample_nodes, sample_edges, db_path)
+        finally:
+            pool.close()
+        assert {n.id for n in get_nodes(db_path)} == {"app.main", "app.helper"}
+
+
+class TestNodeSuffixIndex:
+    def test_save_graph_indexes_suffixes(self, db_dir, sample_nodes, sample_edges):
+        db = db_dir / "graph.db"
+        save_graph(sample_nodes, sample_edges, db)
+        assert lookup_node_suffixes({"main", "helper", "missing"}, db) == {
+            "main": "app.main",
+            "helper": "app.helper",
+        }
+        assert get_existing_node_ids({"app.main", "main"}, db) == {"app.main"}
+
+    def test_ambiguous_suffix(self, db_dir, sample_nodes):
+        db = db_dir / "graph.db"
+        other = Node(
+            id="lib.main", type=NodeType.FUNCTION, name="main",
+            qualified_name="lib.main", file_path="lib.py",
+            start_line=1, end_line=2, source_code="def main():\n    pass",
+        )
+        save_graph([*sample_nodes, other], [], db)
+        assert lookup_node_suffixes({"main", "helper"}, db) == {
+            "main": None,
+            "helper": "app.helper",
+        }
+
+    def test_sync_file_and_delete_maintain_index(self, db_dir, sample_nodes):
+        db = db_dir / "graph.db"
+        save_graph(sample_nodes, [], db)
+        renamed = Node(
+            id="app.run", type=NodeType.FUNCTION, name="run",
+            qualified_name="app.run", file_path="app.py",
+            start_line=1, end_line=5, source_code="def run():\n    pass",
+        )
+        sync_file("app.py", [renamed, sample_nodes[1]], [], db)
+        assert lookup_node_suffixes({"main", "run", "helper"}, db) == {
+            "run": "app.run",
+            "helper": "app.helper",
+        }
+
+        delete_node("app.helper", db)
+        assert lookup_node_suffixes({"helper"}, db) == {}
+
+    def test_backfills_graph_without_index(self, db_dir, sample_nodes):
+        """Graphs built before the suffix table existed are indexed on first use."""
+        db = db_dir / "graph.db"
+        save_graph(sample_nodes, [], db)
+        with _connect(db) as conn:
+            conn.execute("DROP TABLE node_suffixes")
+        assert lookup_node_suffixes({"main"}, db) == {"main": "app.main"}
+
+
+class TestSyncFileDelta:
+    def test_delta_reports_nodes_and_edge_pairs(self, db_dir, sample_nodes, sample_edges):
+        db = db_dir / "graph.db"
+        save_graph(sample_nodes, sample_edges, db)
+
+        delta = sync_file("app.py", [sample_nodes[0]], [], db)
+
+        assert delta.counts["deleted"] == 1
+        assert delta.removed_node_ids == ["app.helper"]
+        assert [n.id for n in delta.nodes] == ["app.main"]
+        assert delta.edges == {("app.main", "app.helper"): None}
+
+    def test_writes_advance_generation(self, db_dir, sample_nodes, sample_edges):
+        db = db_dir / "graph.db"
+        assert get_graph_generation(db) == 0
+        save_graph(sample_nodes, sample_edges, db)
+        assert get_graph_generation(db) == 1
+
+        delta = sync_file("app.py", sample_nodes, sample_edges, db)
+        assert delta.base_generation == 1
+        assert get_graph_generation(db) == 2
+
+        delete_node("app.helper", db)
+        assert get_graph_generation(db) == 3
+
+
+class TestSyncFiles:
+    @staticmethod
+    def _module(path: str, n_funcs: int) -> list[Node]:
+        stem = path.removesuffix(".py")
+        return [
+            Node(
+                id=f"{stem}.f{i}", type=NodeType.FUNCTION, name=f"f{i}",
+                qualified_name=f"{stem}.f{i}", file_path=path, start_line=i + 1,
+                end_line=i + 1, source_code=f"def f{i}(): return {i}",
+            )
+            for i in range(n_funcs)
+        ]
+
+    def test_one_transaction_for_all_files(self, db_dir, sample_nodes, sample_edges):
+        db = db_dir / "graph.db"
+        save_graph(sample_nodes, sample_edges, db)
+        statements: list[str] = []
+        pool = ConnectionPool([db])
+        try:
+            _connect(db).set_trace_callback(statements.append)
+            deltas = sync_files({
+                "app.py": ([sample_nodes[0]], []),
+                "new.py": (self._module("new.py", 3), []),
+            }, db)
+        finally:
+            pool.close()
+
+        assert [d.base_generation for d in deltas] == [1, 2]
+        assert get_graph_generation(db) == 3
+        assert deltas[0].removed_node_ids == ["app.helper"]
+        assert deltas[1].counts["added"] == 3
+        assert sum(s.strip().upper() == "COMMIT" for s in statements) == 1
+        assert get_existing_node_ids({"app.helper", "new.f2"}, db) == {"new.f2"}
+
+    def test_large_id_sets(self, db_dir):
+        db = db_dir / "graph.db"
+        nodes = self._module("big.py", 2500)
+        save_graph(nodes, [], db)
+        [delta] = sync_files({"big.py": ([], [])}, db)
+        assert delta.counts["deleted"] == 2500
+        assert get_nodes(db) == []
+
+    def test_failure_rolls_back_every_file(self, db_dir, sample_nodes, monkeypatch):
+        db = db_dir / "graph.db"
+        save_graph(sample_nodes, [], db)
+        real_sync = database._sync_file
+
+        def failing(conn, file_path, *args):
+            if file_path == "bad.py":
+                raise RuntimeError("boom")
+            return real_sync(conn, file_path, *args)
+
+        monkeypatch.setattr(database, "_sync_file", failing)
+        with pytest.raises(RuntimeError):
+            sync_files({"app.py": ([], []), "bad.py": ([], [])}, db)
+        assert {n.id for n in get_nodes(db)} == {"app.main", "app.helper"}
+        assert get_graph_generation(db) == 1
+
+
+class TestFileState:
+    FP = {"mtime": 1.5, "size": 10, "hash": "abc"}
+
+    def test_save_update_and_delete(self, db_dir):
+        db = db_dir / "graph.db"
+        assert load_file_state(db) == {}
+        save_file_state({"a.py": self.FP, "b.py": {"mtime": 2.0, "size": 3}}, db)
+        assert load_file_state(db) == {
+            "a.py": self.FP, "b.py": {"mtime": 2.0, "size": 3, "hash": None},
+        }
+        save_file_state({"a.py": None, "c.py": self.FP}, db)
+        assert set(load_file_state(db)) == {"b.py", "c.py"}
+        save_file_state({"d.py": self.FP}, db, replace=True)
+        assert set(load_file_state(db)) == {"d.py"}
+
+    def test_save_graph_replaces_file_state(self, db_dir, sample_nodes):
+        db = db_dir / "graph.db"
+        save_file_state({"old.py": self.FP}, db)
+        save_graph(sample_nodes, [], db, file_state={"app.py": self.FP})
+        assert load_file_state(db) == {"app.py": self.FP}
+
+    def test_sync_files_writes_state_in_its_transaction(
+        self, db_dir, sample_nodes, monkeypatch,
+    ):
+        db = db_dir / "graph.db"
+        save_graph(sample_nodes, [], db, file_state={"app.py": self.FP})
+        sync_files(
+            {"app.py": ([], [])}, db,
+            file_state={"app.py": None, "new.py": {**self.FP, "hash": "new"}},
+        )
+        assert load_file_state(db) == {"new.py": {**self.FP, "hash": "new"}}
+
+        def failing(*args):
+            raise RuntimeError("boom")
+
+        monkeypatch.setattr(database, "_sync_file", failing)
+        with pytest.raises(RuntimeError):
+            sync_files({"new.py": ([], [])}, db, file_state={"new.py": None})
+        assert set(load_file_state(db)) == {"new.py"}
+
+
+class TestSaveRuntimeEdges:
+    def test_merge(self, db_dir, sample_nodes, sample_edges):
+        db = db_dir / "graph.db"
+        save_graph(sample_nodes, sample_edges, db)
+
+        result = save_runtime_edges([
+            ("app.main", "app.helper", 3),
+            ("app.helper", "os.getcwd", 1),
+            ("app.helper", "os.getcwd", 2),
+        ], db)
+        assert result["new_runtime"] == 1
+        assert result["upgraded_to_both"] == 1
+        assert result["total"] == 2
+        assert result["merge_time_ms"] >= 0
+
+        by_pair = {(e.from_node, e.to_node): e for e in get_edges("app.helper", db)}
+        assert by_pair["app.main", "app.helper"].source.value == "both"
+        assert by_pair["app.main", "app.helper"].metadata == {"runtime_calls": 3}
+        runtime = by_pair["app.helper", "os.getcwd"]
+        assert runtime.source.value == "runtime"
+        assert runtime.metadata == {"runtime_calls": 2}
+        assert runtime.id.startswith("rt_")
+
+        # A second trace updates counts in place instead of adding edges
+        result = save_runtime_edges([("app.helper", "os.getcwd", 7)], db)
+        assert result["new_runtime"] == result["upgraded_to_both"] == 0
+        [runtime] = get_edges("app.helper", db, direction="outgoing")
+        assert runtime.metadata == {"runtime_calls": 7}
+
+    def test_pair_lookups_use_index(self, db_dir):
+        with _connect(db_dir / "graph.db") as conn:
+            plan = conn.execute(
+                "EXPLAIN QUERY PLAN SELECT min(rowid) FROM edges"
+                " WHERE from_node = 'a' AND to_node = 'b'"
+            ).fetchall()
+        assert "idx_edges_pair" in " ".join(row[3] for row in plan)
+
+
+class TestParseCache:
+    def test_roundtrip_matching_key(self, db_dir, sample_nodes, sample_edges):
+        db = db_dir / "parse_cache.db"
+        save_parse_cache_entries(
+            [(
+                "app.py", "k1",
+                [n.to_dict() for n in sample_nodes],
+                [e.to_dict() for e in sample_edges],
+                [{"name": "main"}],
+            )],
+            db,
+        )
+        hits = get_parse_cache_entries({"app.py": "k1"}, db)
+        node_dicts, edge_dicts, state = hits["app.py"]
+        assert [Node.from_dict(d).id for d in node_dicts] == ["app.main", "app.helper"]
+        assert Edge.from_dict(edge_dicts[0]).to_node == "app.helper"
+        assert state == [{"name": "main"}]
+
+    def test_stale_key_is_a_miss(self, db_dir, sample_nodes):
+        db = db_dir / "parse_cache.db"
+        save_parse_cache_entries(
+            [("app.py", "k1", [n.to_dict() for n in sample_nodes], [], None)], db,
+        )
+        assert get_parse_cache_entries({"app.py": "k2"}, db) == {}
+        # Newer entry for the same file replaces the old one
+        save_parse_cache_entries([("app.py", "k2", [], [], None)], db)
+        assert get_parse_cache_entries({"app.py": "k1"}, db) == {}
+        assert get_parse_cache_entries({"app.py": "k2"}, db)["app.py"] == ([], [], None)
+
+    def test_prune(self, db_dir):
+        db = db_dir / "parse_cache.db"
+        save_parse_cache_entries(
+            [("a.py", "ka", [], [], None), ("b.py", "kb", [], [], None)], db,
+        )
+        assert prune_parse_cache({"a.py"}, db) == 1
+        assert set(get_parse_cache_entries({"a.py": "ka", "b.py": "kb"}, db)) == {"a.py"}
+
+    def test_lookup_chunks_large_key_sets(self, db_dir):
+        db = db_dir / "parse_cache.db"
+        save_parse_cache_entries(
+            [(f"m{i}.py", f"k{i}", [], [], None) for i in range(2000)], db,
+        )
+        keys = {f"m{i}.py": f"k{i}" for i in range(0, 2000, 2)}
+        keys["m1.py"] = "stale"
+        assert set(get_parse_cache_entries(keys, db)) == set(keys) - {"m1.py"}
+
+    def test_creates_table_in_pre_existing_lens_dir(self, tmp_path):
+        """Projects initialised before the cache existed get the table lazily."""
+        db = tmp_path / "parse_cache.db"
+        assert get_parse_cache_entries({"a.py": "k"}, db) == {}
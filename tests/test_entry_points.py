@@ -238,6 +238,23 @@ class TestCollectEntryPoints:
         assert "tests.test_app.test_create" in entries
         assert "app.main" not in entries  # main pattern excluded
 
+    def test_source_hits_for_lean_graph(self) -> None:
+        """Source patterns use ``source_hits`` when nodes lack source_code."""
+        G = nx.DiGraph()
+        G.add_node("app.deps.db_session", type="function", name="db_session",
+                    file_path="app/deps.py")
+        assert "app.deps.db_session" not in collect_entry_points(G)
+
+        fixture = next(
+            p for p in ENTRY_POINT_PATTERNS
+            if p.field is CheckField.SOURCE and "@pytest.fixture" in p.values
+        )
+        source_hits = {fixture: {"app.deps.db_session"}}
+        assert "app.deps.db_session" in collect_entry_points(G, source_hits=source_hits)
+        assert "app.deps.db_session" not in collect_entry_points(
+            G, source_hits={fixture: set()}
+        )
+
     def test_custom_predicates_disabled(self) -> None:
         """Passing empty custom_predicates disables them."""
         G = nx.DiGraph()
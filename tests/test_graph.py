@@ -1,14 +1,19 @@
 """Tests for NetworkX graph operations."""
 
+import networkx as nx
 import pytest
 
+from lenspr import database
 from lenspr.graph import (
     build_graph,
+    build_lean_graph,
     detect_circular_imports,
+    estimate_graph_memory,
     find_dead_code,
     find_path,
     get_dependency_tree,
     get_impact_zone,
+    reachable_from,
 )
 from lenspr.models import Edge, EdgeType, Node, NodeType
 
@@ -88,6 +93,23 @@ class TestDeadCode:
         assert "service.process" not in dead
         assert "db.save" not in dead
 
+    def test_multi_source_single_pass(self, sample_graph):
+        sources = ["main.run", "service.process", "main", "missing"]
+        assert reachable_from(sample_graph, sources) == {
+            "main.run", "main", "service", "service.process",
+            "service.validate", "db.save",
+        }
+        expected = {"main.run", "service.process", "main"}.union(
+            *(nx.descendants(sample_graph, s) for s in sources if s in sample_graph)
+        )
+        assert reachable_from(sample_graph, sources) == expected
+
+    def test_precomputed_reachable(self, sample_graph):
+        reachable = reachable_from(sample_graph, ["main.run"])
+        assert find_dead_code(sample_graph, ["main.run"], reachable=reachable) == (
+            find_dead_code(sample_graph, ["main.run"])
+        )
+
 
 class TestFindPath:
     def test_path_exists(self, sample_graph):
@@ -120,3 +142,42 @@ class TestCircularImports:
         G = build_graph(nodes, edges)
         cycles = detect_circular_imports(G)
         assert len(cycles) >= 1
+
+
+class TestLeanGraph:
+    @pytest.fixture
+    def graph_db(self, tmp_path):
+        nodes = [
+            Node(id="pkg", type=NodeType.MODULE, name="pkg", qualified_name="pkg",
+                 file_path="pkg/__init__.py", start_line=1, end_line=3,
+                 source_code="__all__ = ['run']\n" + "# padding\n" * 200),
+            Node(id="pkg.run", type=NodeType.FUNCTION, name="run", qualified_name="pkg.run",
+                 file_path="pkg/__init__.py", start_line=2, end_line=3,
+                 source_code="def run():\n" + "    pass\n" * 200,
+                 docstring="Run.", signature="def run()"),
+        ]
+        edges = [
+            Edge(id="e1", from_node="pkg.run", to_node="os.getcwd", type=EdgeType.CALLS),
+        ]
+        lens = tmp_path / ".lens"
+        database.init_database(lens)
+        database.save_graph(nodes, edges, lens / "graph.db")
+        return lens / "graph.db"
+
+    def test_keeps_structure_not_source(self, graph_db):
+        G = build_lean_graph(*database.load_graph_lean(graph_db))
+
+        assert G.graph["lean"] is True
+        run = G.nodes["pkg.run"]
+        assert "source_code" not in run and "docstring" not in run
+        assert run["signature"] == "def run()"
+        assert run["has_docstring"] is True
+        assert G.nodes["pkg"]["exports_all"] is True
+        assert G.edges["pkg.run", "os.getcwd"]["type"] == "calls"
+        assert G.nodes["os.getcwd"] == {}
+
+    def test_smaller_than_full_graph(self, graph_db):
+        lean = build_lean_graph(*database.load_graph_lean(graph_db))
+        full = build_graph(*database.load_graph(graph_db))
+
+        assert estimate_graph_memory(lean) < estimate_graph_memory(full)
@@ -0,0 +1,79 @@
+"""Tests for the binary lean-graph snapshot."""
+
+import networkx as nx
+import pytest
+
+from lenspr.graph import build_lean_graph
+from lenspr.graph_snapshot import read_snapshot, write_snapshot
+
+
+@pytest.fixture
+def lean_graph():
+    node_rows = [
+        ("app", "module", "app", "app", "app.py", 1, 9, None, True, True),
+        ("app.main", "function", "main", "app.main", "app.py", 3, 5,
+         "def main() -> None", False, False),
+        ("app.Grüße", "class", "Grüße", "app.Grüße", "app.py", 7, 9, "", True, False),
+    ]
+    edge_rows = [
+        ("app.main", "app.Grüße", "calls", "resolved", "static", 4, ""),
+        ("app.main", "os.getcwd", "calls", "external", "runtime", None, None),
+        ("app", "app.main", "contains", "resolved", "both", 3, "dynamic"),
+    ]
+    return build_lean_graph(node_rows, edge_rows)
+
+
+def _as_data(graph):
+    return (
+        list(graph.nodes(data=True)),
+        sorted((u, v, tuple(sorted(d.items(), key=str))) for u, v, d in graph.edges(data=True)),
+        graph.graph,
+    )
+
+
+class TestSnapshot:
+    def test_roundtrip(self, tmp_path, lean_graph):
+        path = tmp_path / "graph.snapshot"
+        write_snapshot(lean_graph, 7, path)
+
+        loaded = read_snapshot(path, 7)
+        assert _as_data(loaded) == _as_data(lean_graph)
+        # Endpoint-only nodes keep no attributes, and the edge attribute dicts
+        # are shared between both directions, as in a built graph
+        assert loaded.nodes["os.getcwd"] == {}
+        assert loaded.succ["app.main"]["os.getcwd"] is loaded.pred["os.getcwd"]["app.main"]
+        assert list(loaded.successors("app.main")) == list(lean_graph.successors("app.main"))
+
+    def test_empty_graph(self, tmp_path):
+        path = tmp_path / "graph.snapshot"
+        write_snapshot(nx.DiGraph(lean=True), 1, path)
+        loaded = read_snapshot(path, 1)
+        assert loaded.number_of_nodes() == 0
+        assert loaded.graph == {"lean": True}
+
+    def test_other_generation_is_ignored(self, tmp_path, lean_graph):
+        path = tmp_path / "graph.snapshot"
+        write_snapshot(lean_graph, 7, path)
+        assert read_snapshot(path, 8) is None
+
+    @pytest.mark.parametrize("damage", ["truncate", "garbage", "empty"])
+    def test_unreadable_snapshot_is_ignored(self, tmp_path, lean_graph, damage):
+        path = tmp_path / "graph.snapshot"
+        write_snapshot(lean_graph, 7, path)
+        data = path.read_bytes()
+        path.write_bytes({
+            "truncate": data[:-5],
+            "garbage": b"x" * len(data),
+            "empty": b"",
+        }[damage])
+        assert read_snapshot(path, 7) is None
+
+    def test_missing_snapshot(self, tmp_path):
+        assert read_snapshot(tmp_path / "graph.snapshot", 1) is None
+
+    def test_write_replaces_atomically(self, tmp_path, lean_graph):
+        path = tmp_path / "graph.snapshot"
+        write_snapshot(lean_graph, 1, path)
+        write_snapshot(lean_graph, 2, path)
+        assert read_snapshot(path, 2) is not None
+        assert [p.name for p in tmp_path.iterdir()] == ["graph.snapshot"]
@@ -0,0 +1,118 @@
+"""Tests for the per-file line-interval index."""
+
+import random
+
+import networkx as nx
+
+from lenspr.csr_graph import CSRGraph
+from lenspr.line_index import LineIndex
+
+
+def _graph(spans):
+    G = nx.DiGraph()
+    for nid, file_path, start, end in spans:
+        G.add_node(nid, file_path=file_path, start_line=start, end_line=end)
+    return G
+
+
+def _brute_force(graph, file_path, line):
+    best, best_span = None, float("inf")
+    for nid, data in graph.nodes(data=True):
+        if data.get("file_path") != file_path:
+            continue
+        if data["start_line"] <= line <= data["end_line"]:
+            span = data["end_line"] - data["start_line"]
+            if span < best_span:
+                best, best_span = nid, span
+    return best
+
+
+def _nested_spans(rng, file_path, start, end, depth, prefix):
+    spans = [(prefix, file_path, start, end)]
+    line = start + 1
+    child = 0
+    while depth and line < end - 1:
+        length = rng.randint(1, max(1, (end - line) // 2))
+        if rng.random() < 0.7:
+            spans += _nested_spans(
+                rng, file_path, line, line + length, depth - 1, f"{prefix}.{child}"
+            )
+            child += 1
+        line += length + rng.randint(1, 3)
+    return spans
+
+
+class TestContaining:
+    def test_innermost_node(self):
+        G = _graph([
+            ("mod", "a.py", 1, 30),
+            ("mod.Cls", "a.py", 3, 20),
+            ("mod.Cls.method", "a.py", 5, 10),
+            ("mod.func", "a.py", 22, 30),
+            ("other", "b.py", 1, 5),
+        ])
+        index = LineIndex.from_graph(G)
+        assert index.containing("a.py", 7) == "mod.Cls.method"
+        assert index.containing("a.py", 15) == "mod.Cls"
+        assert index.containing("a.py", 21) == "mod"
+        assert index.containing("a.py", 25) == "mod.func"
+        assert index.containing("a.py", 31) is None
+        assert index.containing("c.py", 1) is None
+
+    def test_matches_brute_force_on_nested_spans(self):
+        rng = random.Random(3)
+        spans = _nested_spans(rng, "a.py", 1, 400, 4, "m")
+        spans += _nested_spans(rng, "b.py", 1, 100, 3, "n")
+        G = _graph(spans)
+        index = LineIndex.from_graph(G)
+        for file_path in ("a.py", "b.py"):
+            for line in range(0, 402):
+                assert index.containing(file_path, line) == _brute_force(
+                    G, file_path, line
+                )
+
+    def test_accepts_csr_graph(self):
+        G = _graph([("mod", "a.py", 1, 10), ("mod.f", "a.py", 2, 4)])
+        assert LineIndex.from_graph(CSRGraph.from_networkx(G)).containing("a.py", 3) == (
+            "mod.f"
+        )
+
+
+class TestOverlapping:
+    def test_nodes_intersecting_range(self):
+        G = _graph([
+            ("mod", "a.py", 1, 30),
+            ("mod.f", "a.py", 2, 5),
+            ("mod.g", "a.py", 7, 12),
+            ("mod.h", "a.py", 14, 20),
+        ])
+        index = LineIndex.from_graph(G)
+        assert sorted(index.overlapping("a.py", 5, 8)) == ["mod", "mod.f", "mod.g"]
+        assert index.overlapping("a.py", 31, 40) == []
+        assert index.overlapping("b.py", 1, 10) == []
+
+
+class TestRefresh:
+    def test_refresh_matches_rebuild(self):
+        G = _graph([
+            ("mod", "a.py", 1, 30),
+            ("mod.f", "a.py", 2, 5),
+            ("mod.g", "a.py", 7, 12),
+            ("util.h", "b.py", 1, 4),
+        ])
+        index = LineIndex.from_graph(G)
+
+        G.nodes["mod.g"].update(start_line=3, end_line=4)
+        G.nodes["mod.f"].clear()  # removed, kept as an edge endpoint
+        G.add_node("mod.k", file_path="a.py", start_line=8, end_line=9)
+        G.nodes["util.h"].update(file_path="c.py")
+        index.refresh(G, ["mod.g", "mod.f", "mod.k", "util.h"])
+
+        rebuilt = LineIndex.from_graph(G)
+        for file_path in ("a.py", "b.py", "c.py"):
+            for line in range(0, 32):
+                assert index.containing(file_path, line) == rebuilt.containing(
+                    file_path, line
+                )
+        assert index.containing("b.py", 2) is None
+        assert index.containing("c.py", 2) == "util.h"
@@ -185,6 +185,43 @@ class TestWatchdogHandler:
             assert handler._pending_sync is True
 
 
+    def test_moved_event_tracks_both_paths(self, project: LensContext) -> None:
+        """A rename reports the old and the new path to the change tracker."""
+        pytest.importorskip("watchdog")
+        from watchdog.events import FileSystemEventHandler
+
+        from lenspr.mcp_server import _start_watchdog_watcher
+
+        lenspr._ctx = project
+        root = str(project.project_root)
+        mock_observer_cls = MagicMock()
+        mock_observer = MagicMock()
+        mock_observer_cls.return_value = mock_observer
+
+        _start_watchdog_watcher(root, FileSystemEventHandler, mock_observer_cls)
+
+        handler = mock_observer.schedule.call_args[0][0]
+
+        handler.on_moved(SimpleNamespace(
+            src_path=f"{root}/old.py", dest_path=f"{root}/new.py", is_directory=False,
+        ))
+        handler.on_moved(SimpleNamespace(
+            src_path=f"{root}/pkg", dest_path=f"{root}/pkg2", is_directory=True,
+        ))
+
+        with handler._lock:
+            assert handler._pending_sync is True
+        tracker = project.change_tracker
+        assert tracker.is_watching()
+        assert not tracker.is_clean()
+        paths, rescan, _ = tracker.take()
+        assert paths == {
+            f"{root}/old.py", f"{root}/new.py", f"{root}/pkg", f"{root}/pkg2",
+        }
+        # Changes from before the watcher started were never reported
+        assert rescan is True
+
+
 class TestAutoSync:
     """Test that file changes trigger graph re-sync."""
 
@@ -234,6 +271,21 @@ class TestAutoSync:
         g = project.get_graph()
         assert "helper.helper_fn" not in g
 
+    def test_sync_paths_handles_rename(self, project: LensContext) -> None:
+        """Syncing both sides of a rename moves the file's nodes."""
+        lenspr._ctx = project
+
+        old = project.project_root / "app.py"
+        new = project.project_root / "main.py"
+        old.rename(new)
+        result = lenspr.sync_paths([str(old), str(new)])
+
+        assert {n.id for n in result.added} >= {"main.greet"}
+        assert {n.id for n in result.deleted} >= {"app.greet"}
+        g = project.get_graph()
+        assert "main.greet" in g
+        assert "app.greet" not in g
+
     def test_incremental_sync_resolves_local_calls(self, project: LensContext) -> None:
         """New file with local function calls gets resolved edges via incremental sync."""
         from lenspr import database
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import re
 from pathlib import Path
 
 import pytest
@@ -9,6 +10,7 @@ import pytest
 from lenspr import database
 from lenspr.context import LensContext
 from lenspr.tools.navigation import (
+    _required_literal,
     handle_context,
     handle_get_connections,
     handle_get_node,
@@ -296,6 +298,17 @@ class TestSearch:
         for name in names:
             assert "User" in name or "user" in name.lower()
 
+    def test_name_matches_rank_first_and_limit(self, project: LensContext) -> None:
+        """Name hits outrank code hits; limit cuts the ranked list."""
+        result = handle_search({"query": "create_user"}, project)
+        assert result.data["results"][0]["id"] == "service.create_user"
+        assert result.data["truncated"] is False
+
+        result = handle_search({"query": "create_user", "limit": 1}, project)
+        assert result.data["count"] == 1
+        assert result.data["truncated"] is True
+        assert result.data["results"][0]["id"] == "service.create_user"
+
     def test_no_matches_returns_empty(self, project: LensContext) -> None:
         """Query with no results → empty results, still success."""
         result = handle_search(
@@ -469,6 +482,45 @@ class TestContext:
         # list_users has no test calling it, so should get a warning
         assert "test_warning" in result.data
 
+    def test_hub_callers_fetched_in_batches(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Related nodes come from a few batched queries, not one per node."""
+        (tmp_path / "hub.py").write_text("def hub():\n    return 1\n")
+        (tmp_path / "users.py").write_text(
+            "from hub import hub\n\n"
+            + "".join(f"def user_{i}():\n    return hub()\n\n" for i in range(40))
+        )
+        lens_dir = tmp_path / ".lens"
+        lens_dir.mkdir()
+        database.init_database(lens_dir)
+        ctx = LensContext(project_root=tmp_path, lens_dir=lens_dir)
+        ctx.full_sync()
+
+        real_get_node = database.get_node
+        real_bulk = database.get_nodes_by_ids
+        calls = {"single": 0, "bulk": 0}
+
+        def counting_get_node(*args, **kwargs):
+            calls["single"] += 1
+            return real_get_node(*args, **kwargs)
+
+        def counting_bulk(*args, **kwargs):
+            calls["bulk"] += 1
+            return real_bulk(*args, **kwargs)
+
+        monkeypatch.setattr(database, "get_node", counting_get_node)
+        monkeypatch.setattr(database, "get_nodes_by_ids", counting_bulk)
+
+        result = handle_context({"node_id": "hub.hub", "depth": 2}, ctx)
+
+        assert result.success
+        assert result.data["caller_count"] == 30
+        assert result.data["callers_truncated"]
+        assert sum(c["id"].startswith("users.user_") for c in result.data["callers"]) >= 29
+        assert calls["single"] == 1  # the target itself
+        assert calls["bulk"] <= 3
+
 
 # ---------------------------------------------------------------------------
 # handle_grep
@@ -539,3 +591,49 @@ class TestGrep:
 
         assert result.success
         # Should not raise — falls back to re.escape
+
+    def test_index_prefilter_skips_files_without_literal(
+        self, project: LensContext, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Only files whose indexed source has the literal are read."""
+        read: list[str] = []
+        original = Path.read_text
+
+        def spy(self: Path, *args: object, **kwargs: object) -> str:
+            read.append(self.name)
+            return original(self, *args, **kwargs)  # type: ignore[arg-type]
+
+        project.ensure_synced()
+        monkeypatch.setattr(Path, "read_text", spy)
+        result = handle_grep({"pattern": r"return User\(\w+\)"}, project)
+
+        assert [m["file"] for m in result.data["results"]] == ["service.py"]
+        assert "service.py" in read
+        assert "models.py" not in read
+        assert "test_service.py" not in read
+
+    def test_unparsed_file_still_searched(self, project: LensContext) -> None:
+        """Files the index lacks (syntax errors) are still grepped."""
+        (project.project_root / "broken.py").write_text(
+            "def broken(:\n    marker_in_broken_file = 1\n"
+        )
+        result = handle_grep({"pattern": "marker_in_broken_file"}, project)
+
+        assert [m["file"] for m in result.data["results"]] == ["broken.py"]
+        assert "node_id" not in result.data["results"][0]
+
+
+class TestRequiredLiteral:
+    @pytest.mark.parametrize(
+        ("pattern", "expected"),
+        [
+            ("def create_user", "def create_user"),
+            (r"def \w+_user", "_user"),
+            (r"return User\(name\)", "return User(name)"),
+            ("colou?r_name", "r_name"),
+            ("foo|barbaz", ""),
+            (r"\d+", ""),
+        ],
+    )
+    def test_longest_required_run(self, pattern: str, expected: str) -> None:
+        assert _required_literal(re.compile(pattern)) == expected
@@ -4,8 +4,14 @@ from pathlib import Path
 
 import pytest
 
+from lenspr import database
 from lenspr.models import Edge, EdgeConfidence, EdgeType, Node, NodeType
-from lenspr.parsers.multi import MultiParser, normalize_edge_targets
+from lenspr.parsers.multi import (
+    MultiParser,
+    normalize_edge_targets,
+    normalize_edges_by_ids,
+    normalize_edges_with_db,
+)
 from lenspr.parsers.python_parser import PythonParser
 
 FIXTURES = Path(__file__).parent / "fixtures" / "sample_project"
@@ -590,3 +596,233 @@ class TestEdgeNormalization:
             f"Expected edge to mypackage.a.helper from lazy import, got targets: "
             f"{[e.to_node for e in edges if 'helper' in e.to_node]}"
         )
+
+
+class TestNormalizeEdgesWithDb:
+    """normalize_edges_with_db matches a full in-memory normalization."""
+
+    def test_matches_full_normalization(self, tmp_path):
+        lens = tmp_path / ".lens"
+        database.init_database(lens)
+        db = lens / "graph.db"
+        database.save_graph(
+            [
+                _make_node("myproject.crawlers.integration.fetch_data"),
+                _make_node("pkg_a.utils.helper"),
+                _make_node("myproject.main.run"),
+            ],
+            [],
+            db,
+        )
+        new_ids = {"pkg_b.utils.helper", "myproject.api.serve"}
+
+        def edges():
+            return [
+                _make_edge("myproject.main.run", "crawlers.integration.fetch_data"),
+                _make_edge("api.serve", "utils.helper"),  # ambiguous across DB + new
+                _make_edge("main.run", "os.path.join"),
+                _make_edge("myproject.api.serve", "pkg_a.utils.helper"),
+            ]
+
+        expected = edges()
+        full_ids = database.get_all_node_ids(db) | new_ids
+        normalize_edges_by_ids(expected, full_ids)
+
+        actual = edges()
+        assert normalize_edges_with_db(actual, new_ids, db) == 3
+        assert [(e.from_node, e.to_node) for e in actual] == [
+            (e.from_node, e.to_node) for e in expected
+        ]
+        assert actual[1].to_node == "utils.helper"
+        assert actual[2].from_node == "myproject.main.run"
+
+
+class TestParallelParseProject:
+    """parse_project(jobs=N) farms Python files out to a process pool."""
+
+    @staticmethod
+    def _edge_key(e):
+        return (e.from_node, e.to_node, e.type.value, e.line_number, e.confidence.value)
+
+    def test_parallel_matches_sequential(self, tmp_path):
+        pkg = tmp_path / "mypackage"
+        pkg.mkdir()
+        (pkg / "__init__.py").write_text("")
+        (pkg / "a.py").write_text("def helper():\n    return 42\n")
+        (pkg / "b.py").write_text(
+            "from mypackage.a import helper\n\n"
+            "def caller():\n"
+            "    return helper()\n"
+        )
+        (pkg / "c.py").write_text("class C:\n    def m(self):\n        return 1\n")
+
+        seq_nodes, seq_edges, _ = MultiParser().parse_project(tmp_path, jobs=1)
+        par_nodes, par_edges, _ = MultiParser().parse_project(tmp_path, jobs=2)
+
+        # Same nodes in the same (sorted file) order
+        assert [n.id for n in par_nodes] == [n.id for n in seq_nodes]
+        assert [n.hash for n in par_nodes] == [n.hash for n in seq_nodes]
+        assert sorted(map(self._edge_key, par_edges)) == sorted(
+            map(self._edge_key, seq_edges)
+        )
+        assert any(e.to_node == "mypackage.a.helper" for e in par_edges)
+
+    def test_parallel_records_parse_errors(self, tmp_path):
+        (tmp_path / "ok.py").write_text("def f():\n    pass\n")
+        # Syntax errors are swallowed by parse_file; this one raises
+        # (RecursionError during AST construction) inside the worker.
+        (tmp_path / "bad.py").write_text("x = " + "+".join(["1"] * 200_000) + "\n")
+
+        nodes, _, stats = MultiParser().parse_project(
+            tmp_path, collect_stats=True, jobs=2,
+        )
+        assert "ok.f" in {n.id for n in nodes}
+        assert stats is not None
+        assert stats.total_files == 2
+        errors = stats.languages["Python"].parse_errors
+        assert len(errors) == 1
+        assert errors[0].startswith(f"{tmp_path / 'bad.py'}: ")
+
+    def test_local_name_matching_module_is_batch_independent(self, tmp_path):
+        """A local variable named like a project module must not resolve to it."""
+        (tmp_path / "worker.py").write_text("def start():\n    return 1\n")
+        (tmp_path / "cli.py").write_text(
+            "import threading\n\n"
+            "def go():\n"
+            "    worker = threading.Thread(target=print)\n"
+            "    worker.start()\n"
+        )
+        (tmp_path / "zz.py").write_text("def other():\n    return 2\n")
+
+        _, seq_edges, _ = MultiParser().parse_project(tmp_path, jobs=1)
+        _, par_edges, _ = MultiParser().parse_project(tmp_path, jobs=2)
+
+        assert sorted(map(self._edge_key, par_edges)) == sorted(
+            map(self._edge_key, seq_edges)
+        )
+        go_calls = {e.to_node for e in seq_edges if e.from_node == "cli.go"}
+        assert "worker.start" not in go_calls
+
+    def test_progress_reported_in_file_order(self, tmp_path):
+        for name in ("a.py", "b.py", "c.py"):
+            (tmp_path / name).write_text("x = 1\n")
+
+        calls: list[tuple[int, int, str]] = []
+        MultiParser().parse_project(
+            tmp_path, progress_callback=lambda i, t, p: calls.append((i, t, p)), jobs=2,
+        )
+        assert [(i, t) for i, t, _ in calls] == [(1, 3), (2, 3), (3, 3)]
+        assert [Path(p).name for _, _, p in calls] == ["a.py", "b.py", "c.py"]
+
+
+class TestResolveJobs:
+    def test_default_is_sequential(self, monkeypatch):
+        from lenspr.parsers.multi import resolve_jobs
+
+        monkeypatch.delenv("LENSPR_JOBS", raising=False)
+        assert resolve_jobs() == 1
+
+    def test_env_var(self, monkeypatch):
+        from lenspr.parsers.multi import resolve_jobs
+
+        monkeypatch.setenv("LENSPR_JOBS", "4")
+        assert resolve_jobs() == 4
+        # Explicit value wins over the environment
+        assert resolve_jobs(2) == 2
+
+    def test_invalid_env_var_falls_back(self, monkeypatch):
+        from lenspr.parsers.multi import resolve_jobs
+
+        monkeypatch.setenv("LENSPR_JOBS", "lots")
+        assert resolve_jobs() == 1
+
+    def test_zero_means_all_cpus(self):
+        import os
+
+        from lenspr.parsers.multi import resolve_jobs
+
+        assert resolve_jobs(0) == (os.cpu_count() or 1)
+
+
+class TestJediBatchResolution:
+    """iter_parse_files shares Jedi work across files without changing results."""
+
+    @staticmethod
+    def _edge_key(e):
+        return (e.from_node, e.to_node, e.type.value, e.line_number, e.confidence.value)
+
+    @pytest.fixture
+    def project(self, tmp_path):
+        pkg = tmp_path / "pkg"
+        pkg.mkdir()
+        (pkg / "__init__.py").write_text("from pkg.impl import helper\n")
+        (pkg / "impl.py").write_text("def helper():\n    return 42\n")
+        (pkg / "b.py").write_text(
+            "from pkg import helper\n"
+            "from pkg.impl import helper as direct\n\n"
+            "def b():\n"
+            "    helper()\n"
+            "    return direct()\n"
+        )
+        (pkg / "c.py").write_text(
+            "from pkg import helper\n\n"
+            "def c():\n"
+            "    return helper()\n"
+        )
+        return tmp_path
+
+    def test_batch_matches_per_file_parse(self, project):
+        files = sorted(project.rglob("*.py"))
+
+        single = PythonParser()
+        single.set_project_root(project)
+        expected = []
+        for f in files:
+            _, edges = single.parse_file(f, project)
+            expected.extend(edges)
+
+        batch = PythonParser()
+        batch.set_project_root(project)
+        actual = []
+        for _, _, edges, error in batch.iter_parse_files(files, project):
+            assert error is None
+            actual.extend(edges)
+
+        assert sorted(map(self._edge_key, actual)) == sorted(map(self._edge_key, expected))
+
+    def test_reports_saved_goto_calls(self, project):
+        parser = PythonParser()
+        parser.set_project_root(project)
+        results = list(parser.iter_parse_files(sorted(project.rglob("*.py")), project))
+
+        calls = {
+            e.to_node for _, _, edges, _ in results for e in edges
+            if e.type == EdgeType.CALLS
+        }
+        assert "pkg.impl.helper" in calls
+        # "pkg.impl.helper" is a node of the batch -> no goto needed
+        assert parser.jedi_stats["goto_saved_known"] == 1
+        # "pkg.helper" (re-export) is resolved once in b.py, memoized for c.py
+        assert parser.jedi_stats["goto_saved_memo"] == 1
+        assert parser.jedi_stats["goto_calls"] == 1
+
+    def test_star_import_guesses_are_not_memoized(self, tmp_path):
+        from lenspr.parsers.python_parser import JediBatchResolver
+
+        (tmp_path / "a.py").write_text("from os.path import *\n\ndef f():\n    return g()\n")
+        parser = PythonParser()
+        parser.set_project_root(tmp_path)
+        nodes, edges, qualified = parser._parse_ast(tmp_path / "a.py", tmp_path)
+        call = next(e for e in edges if e.type == EdgeType.CALLS)
+        assert call.to_node == "os.path.g"
+        assert call.id not in qualified
+
+        resolver = JediBatchResolver(None)
+        assert resolver.stats() == {
+            "goto_calls": 0, "goto_saved_known": 0, "goto_saved_memo": 0,
+        }
+
+    def test_parse_project_records_goto_stats(self, project):
+        _, _, stats = MultiParser().parse_project(project, collect_stats=True)
+        assert stats is not None
+        assert stats.jedi_goto_saved >= 2
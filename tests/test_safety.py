@@ -9,6 +9,7 @@ import pytest
 from lenspr import database
 from lenspr.context import LensContext
 from lenspr.tools.safety import (
+    _map_cov_to_functions,
     handle_arch_check,
     handle_arch_rule_add,
     handle_arch_rule_delete,
@@ -216,6 +217,30 @@ class TestTestCoverage:
         pct = result.data["coverage_pct"]
         assert 0 <= pct <= 100
 
+    def test_map_cov_counts_body_lines(self, project: LensContext) -> None:
+        """pytest-cov lines map to functions by their body range."""
+        nodes = database.get_nodes(project.graph_db, file_filter="service.py")
+        by_name = {n.name: n for n in nodes}
+        fetch, process = by_name["fetch_data"], by_name["process"]
+        cov_data = {"files": {
+            str(project.project_root / "service.py"): {
+                # def lines only for fetch_data, two body lines of process
+                "executed_lines": [
+                    fetch.start_line, process.start_line,
+                    process.start_line + 1, process.end_line, process.end_line,
+                ],
+            },
+        }}
+
+        covered, uncovered = _map_cov_to_functions(
+            cov_data, nodes, str(project.project_root)
+        )
+
+        hit = {c["node_id"]: c for c in covered}
+        assert hit[process.id]["lines_hit"] == 2
+        assert hit[process.id]["lines_total"] == process.end_line - process.start_line
+        assert fetch.id in {u["node_id"] for u in uncovered}
+
 
 # ---------------------------------------------------------------------------
 # TestArchRules
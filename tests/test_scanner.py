@@ -0,0 +1,213 @@
+"""Tests for the shared project file scanner."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from lenspr.scanner import (
+    FileScanner,
+    compile_patterns,
+    content_hash,
+    hash_files,
+    load_exclude_patterns,
+)
+
+
+def write(root: Path, rel: str, content: str = "") -> Path:
+    path = root / rel
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content)
+    return path
+
+
+def paths(scanner: FileScanner, **kwargs) -> list[str]:
+    return [entry.path for entry in scanner.scan(**kwargs)]
+
+
+def ignored(patterns: list[str], rel: str, is_dir: bool = False) -> bool:
+    from lenspr.scanner import _match
+
+    return _match([("", compile_patterns(patterns))], rel, is_dir)
+
+
+class TestPatterns:
+    def test_basename_matches_at_any_depth(self):
+        assert ignored(["*.log"], "debug.log")
+        assert ignored(["*.log"], "a/b/debug.log")
+        assert not ignored(["*.log"], "debug.log.txt")
+
+    def test_slash_anchors_to_base(self):
+        assert ignored(["/build.py"], "build.py")
+        assert not ignored(["/build.py"], "src/build.py")
+        assert ignored(["docs/*.md"], "docs/a.md")
+        assert not ignored(["docs/*.md"], "x/docs/a.md")
+        assert not ignored(["docs/*.md"], "docs/sub/a.md")
+
+    def test_double_star(self):
+        assert ignored(["**/fixtures"], "fixtures", is_dir=True)
+        assert ignored(["**/fixtures"], "a/b/fixtures", is_dir=True)
+        assert ignored(["data/**"], "data/x/y.csv")
+        assert ignored(["a/**/z.txt"], "a/z.txt")
+        assert ignored(["a/**/z.txt"], "a/b/c/z.txt")
+
+    def test_dir_only(self):
+        assert ignored(["tmp/"], "tmp", is_dir=True)
+        assert not ignored(["tmp/"], "tmp")
+
+    def test_negation_last_match_wins(self):
+        patterns = ["*.py", "!keep.py"]
+        assert ignored(patterns, "drop.py")
+        assert not ignored(patterns, "keep.py")
+        assert ignored([*patterns, "keep.py"], "keep.py")
+
+    def test_comments_blanks_and_escapes(self):
+        rules = compile_patterns(["# comment", "", "   ", "\\#hash", "\\!bang"])
+        assert len(rules) == 2
+        assert ignored(["\\#hash"], "#hash")
+        assert ignored(["\\!bang"], "!bang")
+
+    def test_character_class(self):
+        assert ignored(["file[0-9].txt"], "file3.txt")
+        assert not ignored(["file[!0-9].txt"], "file3.txt")
+
+
+class TestScan:
+    @pytest.fixture
+    def project(self, tmp_path: Path) -> Path:
+        write(tmp_path, "main.py", "x = 1\n")
+        write(tmp_path, "pkg/mod.py")
+        write(tmp_path, "pkg/data.json")
+        write(tmp_path, "node_modules/dep/index.js")
+        write(tmp_path, "my-venv/lib.py")
+        write(tmp_path, "lib/stdlib.py")
+        write(tmp_path, "src/lib/util.ts")
+        return tmp_path
+
+    def test_sorted_relative_paths(self, project):
+        assert paths(FileScanner(project)) == [
+            "main.py", "pkg/data.json", "pkg/mod.py", "src/lib/util.ts",
+        ]
+
+    def test_prunes_and_counts_skipped_dirs(self, project):
+        skipped: dict[str, int] = {}
+        FileScanner(project).scan(skipped=skipped)
+        assert skipped == {"node_modules": 1, "my-venv": 1, "lib": 1}
+
+    def test_suffix_and_name_filters(self, project):
+        write(project, "Dockerfile.dev")
+        scanner = FileScanner(project)
+        assert paths(scanner, suffixes={".py"}) == ["main.py", "pkg/mod.py"]
+        assert paths(scanner, names=["Dockerfile*"]) == ["Dockerfile.dev"]
+        assert paths(scanner, suffixes={".ts"}, names=["*.json"]) == [
+            "pkg/data.json", "src/lib/util.ts",
+        ]
+
+    def test_entries_carry_stat(self, project):
+        entry = FileScanner(project).scan(suffixes={".py"})[0]
+        st = (project / "main.py").stat()
+        assert (entry.mtime, entry.size, entry.inode) == (st.st_mtime, st.st_size, st.st_ino)
+
+    def test_does_not_follow_dir_symlinks(self, project):
+        (project / "link").symlink_to(project / "pkg", target_is_directory=True)
+        assert not any(p.startswith("link/") for p in paths(FileScanner(project)))
+
+
+class TestGitignore:
+    def test_root_and_nested_gitignore(self, tmp_path):
+        write(tmp_path, ".gitignore", "generated/\n*.tmp\n")
+        write(tmp_path, "app.py")
+        write(tmp_path, "scratch.tmp")
+        write(tmp_path, "generated/out.py")
+        write(tmp_path, "sub/.gitignore", "/local.py\n!keep.tmp\n")
+        write(tmp_path, "sub/local.py")
+        write(tmp_path, "sub/keep.tmp")
+        write(tmp_path, "sub/deep/local.py")
+        write(tmp_path, "other/local.py")
+
+        assert paths(FileScanner(tmp_path), suffixes={".py", ".tmp"}) == [
+            "app.py", "other/local.py", "sub/deep/local.py", "sub/keep.tmp",
+        ]
+
+    def test_gitignore_can_be_disabled(self, tmp_path):
+        write(tmp_path, ".gitignore", "*.py\n")
+        write(tmp_path, "app.py")
+        assert paths(FileScanner(tmp_path, gitignore=False), suffixes={".py"}) == ["app.py"]
+
+    def test_git_info_exclude(self, tmp_path):
+        write(tmp_path, ".git/info/exclude", "secret.py\n")
+        write(tmp_path, "secret.py")
+        write(tmp_path, "app.py")
+        assert paths(FileScanner(tmp_path), suffixes={".py"}) == ["app.py"]
+
+    def test_env_files_are_always_scanned(self, tmp_path):
+        write(tmp_path, ".gitignore", ".env*\n")
+        write(tmp_path, ".env.local", "A=1\n")
+        assert paths(FileScanner(tmp_path)) == [".env.local", ".gitignore"]
+
+    def test_exclude_patterns_below_gitignore(self, tmp_path):
+        write(tmp_path, ".gitignore", "!vendor/keep.py\n")
+        write(tmp_path, "vendor/keep.py")
+        write(tmp_path, "vendor/drop.py")
+        write(tmp_path, "fixtures/big.py")
+        scanner = FileScanner(tmp_path, exclude_patterns=["vendor/*.py", "fixtures/"])
+        assert paths(scanner, suffixes={".py"}) == ["vendor/keep.py"]
+
+
+class TestIsIgnored:
+    def test_matches_walk(self, tmp_path):
+        write(tmp_path, ".gitignore", "build_out/\n")
+        write(tmp_path, "pkg/.gitignore", "*.gen.py\n")
+        scanner = FileScanner(tmp_path, exclude_patterns=["tmp/"])
+        assert not scanner.is_ignored("pkg/mod.py")
+        assert scanner.is_ignored("pkg/mod.gen.py")
+        assert scanner.is_ignored("build_out/x.py")
+        assert scanner.is_ignored("tmp/x.py")
+        assert scanner.is_ignored("node_modules/dep/index.js")
+        assert scanner.is_ignored("lib/x.py")
+        assert not scanner.is_ignored("src/lib/x.py")
+        assert not scanner.is_ignored(".env")
+
+
+class TestConfig:
+    def test_load_exclude_patterns(self, tmp_path):
+        config = tmp_path / "config.json"
+        assert load_exclude_patterns(config) == []
+        config.write_text("{not json")
+        assert load_exclude_patterns(config) == []
+        config.write_text(json.dumps({"exclude_patterns": ["a/", 3, "*.b"]}))
+        assert load_exclude_patterns(config) == ["a/", "*.b"]
+
+    def test_context_scanner_follows_config(self, tmp_path):
+        from lenspr.context import LensContext
+
+        write(tmp_path, "app.py")
+        write(tmp_path, "fixtures/big.py")
+        ctx = LensContext(tmp_path)
+        ctx.lens_dir.mkdir(exist_ok=True)
+        assert paths(ctx.file_scanner(), suffixes={".py"}) == ["app.py", "fixtures/big.py"]
+
+        ctx.config_path.write_text(json.dumps({"exclude_patterns": ["fixtures/"]}))
+        assert paths(ctx.file_scanner(), suffixes={".py"}) == ["app.py"]
+        assert "fixtures/big.py" not in ctx._scan_fingerprints()
+
+
+class TestHashing:
+    def test_content_hash(self, tmp_path):
+        a = write(tmp_path, "a.py", "x = 1\n")
+        b = write(tmp_path, "b.py", "x = 1\n")
+        empty = write(tmp_path, "empty.py")
+        assert content_hash(a) == content_hash(b)
+        assert len(content_hash(a) or "") == 32
+        assert content_hash(empty) != content_hash(a)
+        assert content_hash(tmp_path / "missing.py") is None
+
+    def test_hash_files_keeps_order(self, tmp_path):
+        paths = [write(tmp_path, f"f{i}.py", str(i) * (i * 5000)) for i in range(20)]
+        paths.insert(3, tmp_path / "missing.py")
+        expected = [content_hash(p) for p in paths]
+        assert hash_files(paths, workers=4) == expected
+        assert hash_files(paths, workers=1) == expected
+        assert hash_files([]) == []
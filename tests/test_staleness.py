@@ -0,0 +1,89 @@
+"""Tests for watcher change tracking and directory stamps."""
+
+from __future__ import annotations
+
+import os
+
+from lenspr.scanner import FileScanner
+from lenspr.staleness import ChangeTracker, stamps_unchanged
+
+
+class TestChangeTracker:
+    def test_clean_until_a_change_is_reported(self):
+        tracker = ChangeTracker()
+        assert tracker.is_clean()
+        tracker.mark_dirty("/p/a.py")
+        assert not tracker.is_clean()
+
+        paths, rescan, generation = tracker.take()
+        assert (paths, rescan) == ({"/p/a.py"}, False)
+        # Claimed but not synced yet: readers must still wait
+        assert not tracker.is_clean()
+        tracker.mark_synced(generation)
+        assert tracker.is_clean()
+
+    def test_change_during_sync_keeps_tracker_dirty(self):
+        tracker = ChangeTracker()
+        tracker.mark_dirty("a.py")
+        _, _, first = tracker.take()
+        tracker.mark_dirty("b.py")
+        tracker.mark_synced(first)
+        assert not tracker.is_clean()
+
+        paths, _, second = tracker.take()
+        assert paths == {"b.py"}
+        tracker.mark_synced(second)
+        tracker.mark_synced(first)  # A slower, older sync finishing last
+        assert tracker.is_clean()
+
+    def test_attach_requires_rescan(self):
+        tracker = ChangeTracker()
+        assert not tracker.is_watching()
+        alive = True
+        tracker.attach(lambda: alive)
+        assert tracker.is_watching()
+        assert not tracker.is_clean()
+        assert tracker.take()[1] is True
+        assert tracker.take()[1] is False
+
+        alive = False
+        assert not tracker.is_watching()
+        tracker.attach(lambda: True)
+        tracker.detach()
+        assert not tracker.is_watching()
+
+    def test_restore_after_failed_sync(self):
+        tracker = ChangeTracker()
+        tracker.attach(lambda: True)
+        tracker.mark_dirty("a.py")
+        paths, rescan, _ = tracker.take()
+        tracker.restore(paths, rescan)
+        assert tracker.take()[:2] == ({"a.py"}, True)
+
+
+class TestStamps:
+    def test_scan_stamps_dirs_and_gitignores(self, tmp_path):
+        (tmp_path / "pkg").mkdir()
+        (tmp_path / "pkg" / "mod.py").write_text("")
+        (tmp_path / ".gitignore").write_text("*.log\n")
+        stamps: dict[str, int] = {}
+        FileScanner(tmp_path).scan(stamps=stamps)
+        assert set(stamps) == {"", "pkg/", ".gitignore"}
+        assert stamps_unchanged(tmp_path, stamps)
+
+    def test_new_file_moves_its_directory_stamp(self, tmp_path):
+        (tmp_path / "pkg").mkdir()
+        stamps: dict[str, int] = {}
+        FileScanner(tmp_path).scan(stamps=stamps)
+        (tmp_path / "pkg" / "new.py").write_text("")
+        st = os.stat(tmp_path / "pkg")
+        if st.st_mtime_ns == stamps["pkg/"]:  # Coarse timestamps
+            os.utime(tmp_path / "pkg", ns=(st.st_atime_ns, st.st_mtime_ns + 1))
+        assert not stamps_unchanged(tmp_path, stamps)
+
+    def test_removed_directory(self, tmp_path):
+        (tmp_path / "pkg").mkdir()
+        stamps: dict[str, int] = {}
+        FileScanner(tmp_path).scan(stamps=stamps)
+        (tmp_path / "pkg").rmdir()
+        assert not stamps_unchanged(tmp_path, stamps)
@@ -0,0 +1,122 @@
+"""Startup import guards for the CLI, the MCP server and the package.
+
+Each check runs a fresh interpreter under ``python -X importtime`` and
+reads the modules it imported from the report on stderr, so a module-level
+import of a heavy dependency (NetworkX, Jedi, tree-sitter, the MCP SDK) or
+of every tool module shows up as a failure rather than as slower startup.
+"""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+HEAVY_MODULES = ("networkx", "jedi", "tree_sitter", "mcp")
+
+TOOL_MODULES = (
+    "lenspr.tools.analysis",
+    "lenspr.tools.modification",
+    "lenspr.tools.navigation",
+    "lenspr.tools.safety",
+    "lenspr.tools.schemas",
+)
+
+
+def import_times(code: str, *argv: str) -> dict[str, int]:
+    """Run ``code`` (or ``-m`` module with ``argv``) under ``-X importtime``.
+
+    Returns:
+        Imported module name -> cumulative import time in microseconds.
+    """
+    command = [sys.executable, "-X", "importtime"]
+    command += ["-m", *argv] if argv else ["-c", code]
+    result = subprocess.run(command, capture_output=True, text=True, timeout=60)
+    assert result.returncode == 0, result.stderr[-2000:]
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def assert_not_imported(times: dict[str, int], prefixes: tuple[str, ...]) -> None:
+    loaded = sorted(
+        name for name in times
+        if any(name == p or name.startswith(p + ".") for p in prefixes)
+    )
+    total_ms = sum(t for name, t in times.items() if "." not in name) / 1000
+    assert not loaded, f"imported {loaded} (startup {total_ms:.0f} ms)"
+
+
+@pytest.fixture
+def sample_project(tmp_path: Path) -> Path:
+    (tmp_path / "main.py").write_text("def hello():\n    return 'world'\n")
+    result = subprocess.run(
+        [sys.executable, "-m", "lenspr.cli", "init", str(tmp_path)],
+        capture_output=True, text=True, timeout=60,
+    )
+    assert result.returncode == 0, result.stderr
+    return tmp_path
+
+
+class TestPackageImports:
+    def test_import_lenspr(self):
+        times = import_times("import lenspr")
+        assert "lenspr" in times
+        assert_not_imported(times, (*HEAVY_MODULES, "lenspr.context", "lenspr.parsers.multi"))
+
+    def test_lens_context_resolves_lazily(self):
+        times = import_times("import lenspr; lenspr.LensContext")
+        assert "lenspr.context" in times
+        assert_not_imported(times, HEAVY_MODULES)
+
+    def test_import_tools_package(self):
+        times = import_times("import lenspr.tools")
+        assert_not_imported(times, (*HEAVY_MODULES, *TOOL_MODULES))
+
+    def test_handler_import_loads_only_its_module(self):
+        times = import_times("from lenspr.tools import handle_search")
+        # importlib.import_module bypasses -X importtime, so look for the
+        # navigation module's own imports
+        assert "lenspr.tools.helpers" in times
+        assert_not_imported(times, (*HEAVY_MODULES, "lenspr.tools.safety"))
+
+    def test_import_mcp_server(self):
+        times = import_times("import lenspr.mcp_server")
+        assert_not_imported(times, (*HEAVY_MODULES, *TOOL_MODULES))
+
+
+class TestParsersOnFirstUse:
+    def test_context_and_extensions_skip_parsers(self, tmp_path):
+        times = import_times(
+            "from pathlib import Path\n"
+            "from lenspr.context import LensContext\n"
+            "from lenspr.parsers import is_supported_file\n"
+            f"ctx = LensContext(Path({str(tmp_path)!r}))\n"
+            "assert '.py' in ctx._parser.get_file_extensions()\n"
+            "assert is_supported_file('app.py')\n"
+        )
+        assert_not_imported(times, (*HEAVY_MODULES, "lenspr.parsers.python_parser"))
+
+    def test_python_parser_built_for_python_file(self):
+        times = import_times(
+            "from pathlib import Path\n"
+            "from lenspr.parsers.multi import MultiParser\n"
+            "assert MultiParser().get_parser_for_file(Path('app.py')) is not None\n"
+        )
+        assert "jedi" in times
+
+
+class TestCliStartup:
+    def test_status(self, sample_project):
+        times = import_times("", "lenspr.cli", "status", str(sample_project))
+        assert_not_imported(times, HEAVY_MODULES)
+
+    def test_search(self, sample_project):
+        times = import_times("", "lenspr.cli", "search", str(sample_project), "hello")
+        assert_not_imported(times, (*HEAVY_MODULES, "lenspr.tools.safety"))
@@ -0,0 +1,184 @@
+"""Tests for the MCP tool executor: pools, writer queue, progress."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from lenspr.tool_executor import (
+    LONG_RUNNING_TOOLS,
+    WRITE_TOOLS,
+    ToolExecutor,
+    tool_kind,
+)
+from lenspr.tool_groups import TOOL_GROUPS
+
+
+class FakeContext:
+    """Records which threads are inside graph_reader()."""
+
+    def __init__(self) -> None:
+        self.readers: set[str] = set()
+
+    def graph_reader(self):
+        ctx = self
+
+        class Reader:
+            def __enter__(self):
+                ctx.readers.add(threading.current_thread().name)
+
+            def __exit__(self, *exc):
+                ctx.readers.discard(threading.current_thread().name)
+
+        return Reader()
+
+
+@pytest.fixture
+def executor():
+    executor = ToolExecutor(FakeContext(), read_workers=4, progress_interval=0.02)
+    yield executor
+    executor.shutdown()
+
+
+class TestToolKind:
+    def test_kinds(self):
+        assert tool_kind("lens_update_node") == "write"
+        assert tool_kind("lens_run_tests") == "long"
+        assert tool_kind("lens_get_node") == "read"
+
+    def test_classified_tools_exist(self):
+        known = {tool for group in TOOL_GROUPS.values() for tool in group["tools"]}
+        assert (WRITE_TOOLS | LONG_RUNNING_TOOLS) <= known
+        assert not WRITE_TOOLS & LONG_RUNNING_TOOLS
+
+
+class TestPools:
+    def test_reads_run_concurrently(self, executor):
+        barrier = threading.Barrier(3, timeout=5)
+
+        def read() -> str:
+            barrier.wait()
+            return threading.current_thread().name
+
+        futures = [executor.submit("lens_get_node", read) for _ in range(3)]
+        names = [f.result(timeout=10) for f in futures]
+        assert all(name.startswith("lenspr-read") for name in names)
+
+    def test_reads_hold_graph_reader(self, executor):
+        def read() -> set[str]:
+            return set(executor._ctx.readers)
+
+        (reader,) = executor.submit("lens_search", read).result(timeout=10)
+        assert reader.startswith("lenspr-read")
+        assert executor.submit("lens_patch_node", read).result(timeout=10) == set()
+
+    def test_writes_are_serialized_in_order(self, executor):
+        order: list[int] = []
+        active = [0]
+        overlap = []
+
+        def write(i: int) -> None:
+            active[0] += 1
+            overlap.append(active[0])
+            time.sleep(0.01)
+            order.append(i)
+            active[0] -= 1
+
+        futures = [executor.submit("lens_update_node", write, i=i) for i in range(5)]
+        for f in futures:
+            f.result(timeout=10)
+        assert order == [0, 1, 2, 3, 4]
+        assert max(overlap) == 1
+
+    def test_long_running_does_not_block_reads(self, executor):
+        release = threading.Event()
+        slow = executor.submit("lens_run_tests", release.wait, timeout=10)
+        try:
+            assert executor.submit("lens_get_node", lambda: "ok").result(timeout=5) == "ok"
+            assert not slow.done()
+        finally:
+            release.set()
+        assert slow.result(timeout=10) is True
+
+
+class TestAsync:
+    def test_long_running_reports_progress(self, executor):
+        reports: list[tuple[float, str]] = []
+
+        async def progress(elapsed: float, message: str) -> None:
+            reports.append((elapsed, message))
+
+        def slow() -> str:
+            time.sleep(0.15)
+            return "done"
+
+        result = asyncio.run(executor.run("lens_run_tests", slow, {}, progress))
+        assert result == "done"
+        assert reports
+        assert reports[0][1].startswith("lens_run_tests running for")
+        assert [e for e, _ in reports] == sorted(e for e, _ in reports)
+
+    def test_read_tools_do_not_report_progress(self, executor):
+        reports = []
+
+        async def progress(elapsed: float, message: str) -> None:
+            reports.append(message)
+
+        def slow() -> str:
+            time.sleep(0.1)
+            return "done"
+
+        assert asyncio.run(executor.run("lens_grep", slow, {}, progress)) == "done"
+        assert reports == []
+
+    def test_errors_propagate(self, executor):
+        def fail() -> None:
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError, match="boom"):
+            asyncio.run(executor.run("lens_get_node", fail, {}))
+
+    def test_slow_tool_does_not_block_loop(self, executor):
+        release = threading.Event()
+
+        async def main() -> list[str]:
+            done: list[str] = []
+
+            async def call(name, fn):
+                await executor.run(name, fn, {})
+                done.append(name)
+
+            slow = asyncio.create_task(call("lens_vibecheck", lambda: release.wait(10)))
+            await call("lens_get_node", lambda: None)
+            release.set()
+            await slow
+            return done
+
+        assert asyncio.run(main()) == ["lens_get_node", "lens_vibecheck"]
+
+
+class TestFastMCPRegistration:
+    def test_wrapped_tool_keeps_signature(self, executor):
+        fastmcp = pytest.importorskip("mcp.server.fastmcp")
+        server = fastmcp.FastMCP("test")
+
+        def lens_get_node(node_id: str, depth: int | None = None) -> str:
+            """Get a node."""
+            return f"{node_id}:{depth}"
+
+        server.tool()(executor.wrap("lens_get_node", lens_get_node))
+
+        async def main():
+            tools = await server.list_tools()
+            result = await server.call_tool("lens_get_node", {"node_id": "app.main"})
+            return tools, result
+
+        tools, result = asyncio.run(main())
+        assert tools[0].name == "lens_get_node"
+        assert tools[0].description == "Get a node."
+        assert tools[0].inputSchema["required"] == ["node_id"]
+        assert set(tools[0].inputSchema["properties"]) == {"node_id", "depth"}
+        assert result[0][0].text == "app.main:None"
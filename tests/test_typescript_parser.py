@@ -445,6 +445,36 @@ class TestMultiParser:
         assert ".tsx" in extensions
 
 
+class TestParseCacheState:
+    """Exports survive a parse-cache round trip."""
+
+    def test_cache_hit_restores_exports(self, tmp_project: Path) -> None:
+        from lenspr.parsers.multi import MultiParser
+
+        (tmp_project / "utils.ts").write_text(
+            "export function helper() { return 1; }\n"
+        )
+        cache_db = tmp_project / "parse_cache.db"
+
+        first = MultiParser()
+        first.parse_project(tmp_project, cache_db=cache_db)
+        ts_first = first.get_parser_for_file(Path("x.ts"))
+        exports = ts_first.get_file_state("utils.ts")
+        assert [e["name"] for e in exports] == ["helper"]
+
+        second = MultiParser()
+        ts_second = second.get_parser_for_file(Path("x.ts"))
+        parse_calls = []
+        original = ts_second.parse_file
+        ts_second.parse_file = lambda *a: parse_calls.append(a) or original(*a)
+        nodes, _, _ = second.parse_project(tmp_project, cache_db=cache_db)
+
+        assert parse_calls == []
+        assert "utils.helper" in {n.id for n in nodes}
+        assert ts_second.get_file_state("utils.ts") == exports
+        assert ts_second.get_resolver_stats()["total_exports"] >= 1
+
+
 class TestEvalProjectBaseline:
     """Behavioral regression: parse the eval test project and verify counts.
 